@@ -1,24 +1,44 @@
 # calendars
 """Define NamedTuples to store information about a specific calendar system."""
 
+import io
 import uuid
+from collections.abc import Callable
+from enum import IntEnum
 from textwrap import indent
-from typing import Any, NamedTuple
+from typing import Any, ClassVar, NamedTuple, TextIO
 
 import numpy as np
+import numpy.typing as npt
 
 
 class CalendarMessage:
+    CYCLE: str = 'The {0} days of the {1} years in the cycle of calendar "{2}" do not match its days_in_cycle {3}.'
     DAY_RANGE: str = 'The day "{0}" is either less than 1 or greater than the number of days in month {1}: "{2}".'
     END: str = 'The date "{0}" goes beyond the end of the calendar "{1}".'
     BEGIN: str = 'The date "{0}" comes before the start of the calendar "{1}".'
     MONTH_RANGE: str = 'The month "{0}" is either less than 1 or greater than the number of months "{1}".'
+    NO_RULE: str = 'There are no conversion rules for the calendar "{0}".'
+    UNKNOWN: str = 'The calendar "{0}" is not one of the registered calendars: {1}.'
     ZERO: str = 'The year is 0, but there is no 0 year in the calendar.'
 
 
+class CalendarError(IntEnum):
+    """Codes for the reason a date failed `CalendarDefinition.validate_many`.
+
+    Each code corresponds to the message `CalendarDefinition.validate` raises.
+    """
+
+    NONE = 0
+    ZERO = 1
+    MONTH = 2
+    DAY = 3
+
+
 class Constants:
     BRACKETS: str = '[]'
     COMMA: str = ','
+    CONVERSION_CACHE_SIZE: int = 65536
     EMPTY: str = ''
     EOL: str = '\n'
     FLOAT_ZERO: float = 0.0
@@ -29,6 +49,7 @@ CALSCALE:GREGORIAN
 VERSION:2.0
 """
     ICS_BEGIN_DAY: str = 'BEGIN:VEVENT'
+    ICS_BLOCK: int = 4096
     ICS_DAY_START: str = 'DTSTART;VALUE=DATE:'
     ICS_DAY_END: str = 'DTEND;VALUE=DATE:'
     ICS_DESCRIPTION: str = 'DESCRIPTION:'
@@ -38,6 +59,7 @@ VERSION:2.0
     ICS_SUMMARY: str = 'SUMMARY:'
     ICS_UID: str = 'UID:'
     INDENT: str = '    '
+    JDN_UNIX_EPOCH: int = 2440588
     LEFT_BRACKET: str = '['
     NAT: str = 'NaT'
     RIGHT_BRACKET: str = ']'
@@ -108,6 +130,38 @@ class LocationDefinition(NamedTuple):
     description: str = Constants.EMPTY
 
 
+class LeapRule(NamedTuple):
+    """How a calendar with a cycle of years adds a leap day.
+
+    Args:
+        isleap: Return which of an array of years are leap years.
+        month: The month receiving the leap day.
+    """
+
+    isleap: Callable[[npt.NDArray[np.int64]], npt.NDArray[np.bool_]]
+    month: int
+
+
+class CalendarTables(NamedTuple):
+    """Lookup tables for converting and validating dates of a calendar.
+
+    Row 0 of the month tables is for common years and row 1 for leap years.
+
+    Args:
+        month_days: The days in each month.  Column 0 is the empty month 0.
+        month_starts: The day of the year on which each month starts.
+            The last column is the number of days in the year.
+        cycle_starts: The day of the cycle on which each year of the cycle starts.
+            The last item is the number of days in the cycle.
+        cycle_leaps: Whether each year of the cycle is a leap year.
+    """
+
+    month_days: npt.NDArray[np.int64]
+    month_starts: npt.NDArray[np.int64]
+    cycle_starts: npt.NDArray[np.int64]
+    cycle_leaps: npt.NDArray[np.bool_]
+
+
 class CalendarDefinition(NamedTuple):
     """Frameword for definitions for specific calendars with methods to work with those calendars.
 
@@ -153,16 +207,17 @@ class CalendarDefinition(NamedTuple):
             year, month, day = self.from_iso(iso)
         if year == Constants.ZERO and not self.zero:
             raise ValueError(CalendarMessage.ZERO)
-        if month < Constants.ZERO or month > len(self.months) - 1:
+        if month < 1 or month > len(self.months) - 1:
             raise ValueError(
                 CalendarMessage.MONTH_RANGE.format(
                     str(month), str(len(self.months) - 1)
                 )
             )
-        if day < 0 or day > self.months[month].days:
+        max_days: int = self.days_in_month(month, year)
+        if day < 1 or day > max_days:
             raise ValueError(
                 CalendarMessage.DAY_RANGE.format(
-                    str(day), str(month), str(self.months[month].days)
+                    str(day), str(month), str(max_days)
                 )
             )
         # if date > self.end:
@@ -177,15 +232,128 @@ class CalendarDefinition(NamedTuple):
         #     )
         return True
 
-    def days_in_month(self, month: int) -> int:
-        """Return the number of days in a month."""
-        return self.months[month].days
+    def validate_many(
+        self, years: Any, months: Any, days: Any
+    ) -> tuple[npt.NDArray[np.bool_], npt.NDArray[np.int8]]:
+        """Validate arrays of years, months and days at once returning a mask of valid dates and error codes.
+
+        The checks are those of `validate`: the zero year, the range of the
+        month and the range of the day in the month of that year.
+        The first check a date fails gives its `CalendarError` code.
+
+        Examples:
+            >>> from calendars.gregorian_calendars import CalendarsGregorian
+            >>> from calendars.hebraic_calendars import CalendarsHebraic
+            >>> valid, codes = CalendarsGregorian.GREGORIAN.validate_many(
+            ...     [2000, 1900, 0, 2000, 2000], [2, 2, 1, 13, 0], [29, 29, 1, 1, 1]
+            ... )
+            >>> valid
+            array([ True, False, False, False, False])
+            >>> [CalendarError(code).name for code in codes]
+            ['NONE', 'DAY', 'ZERO', 'MONTH', 'MONTH']
+            >>> CalendarsHebraic.HEBREW.validate_many([5785, 5785], [2, 6], [30, 1])[0]
+            array([ True, False])
+
+        Args:
+            years: The years of the dates.
+            months: The months of the dates numbered as in the calendar definition.
+            days: The days of the months.
+
+        Returns:
+            A boolean mask of the valid dates and an int8 `CalendarError` code for each date.
+        """
+        year_array: npt.NDArray[np.int64] = np.asarray(years, dtype=np.int64)
+        month_array: npt.NDArray[np.int64] = np.asarray(months, dtype=np.int64)
+        day_array: npt.NDArray[np.int64] = np.asarray(days, dtype=np.int64)
+        tables: CalendarTables = self.tables()
+        codes: npt.NDArray[np.int8] = np.zeros(len(year_array), dtype=np.int8)
+
+        # Check the month before looking up the days in it.
+        month_ok: npt.NDArray[np.bool_] = (month_array >= 1) & (
+            month_array < len(self.months)
+        )
+        month_index: npt.NDArray[np.int64] = np.where(month_ok, month_array, 0)
+        cycle_years: npt.NDArray[np.int64] = year_array
+        if not self.zero:
+            cycle_years = np.where(year_array < 0, year_array + 1, year_array)
+        max_days: npt.NDArray[np.int64]
+        if self.name == Tables.HEBREW:
+            # Look up the months of each distinct year once.
+            distinct, inverse = np.unique(cycle_years, return_inverse=True)
+            max_days = Conversions.hebrew_month_days(distinct, self)[
+                inverse, month_index
+            ]
+        else:
+            leap: npt.NDArray[np.int64] = np.zeros(len(year_array), dtype=np.int64)
+            if self.name in Tables.rules:
+                leap = tables.cycle_leaps[
+                    (cycle_years - 1) % len(tables.cycle_leaps)
+                ].astype(np.int64)
+            max_days = tables.month_days[leap, month_index]
+        codes[(day_array < 1) | (day_array > max_days)] = CalendarError.DAY
+        codes[~month_ok] = CalendarError.MONTH
+        if not self.zero:
+            codes[year_array == Constants.ZERO] = CalendarError.ZERO
+        return codes == CalendarError.NONE, codes
+
+    def days_in_month(self, month: int, year: int | None = None) -> int:
+        """Return the number of days in a month.
+
+        If the year is given, the leap day of a leap year is counted.
+        The months of the Hebrew calendar depend on the length of its year.
+
+        Examples:
+            >>> from calendars.gregorian_calendars import CalendarsGregorian
+            >>> from calendars.hebraic_calendars import CalendarsHebraic
+            >>> CalendarsGregorian.GREGORIAN.days_in_month(2, 2000)
+            29
+            >>> CalendarsHebraic.HEBREW.days_in_month(2, 5785)
+            30
+
+        Args:
+            month: The number of the month.
+            year: The year of the month.
+        """
+        if year is None:
+            return self.months[month].days
+        if self.name == Tables.HEBREW:
+            if year < 0 and not self.zero:
+                year += 1
+            return int(
+                Conversions.hebrew_month_days(
+                    np.array([year], dtype=np.int64), self
+                )[0, month]
+            )
+        return int(self.tables().month_days[int(self.isleap(year)), month])
+
+    def tables(self) -> CalendarTables:
+        """Return the lookup tables of the calendar building them on first use.
+
+        Example:
+            >>> from calendars.julian_calendars import CalendarsJulian
+            >>> CalendarsJulian.JULIAN.tables().cycle_starts
+            array([   0,  365,  730, 1095, 1461])
+        """
+        return Tables.get(self)
 
     def days_in_year(self, days: int) -> int:
         return days
 
     def from_iso(self, iso: str) -> tuple[int, int, int]:
-        """Convert a Gregorian ISO 8601 date to this calendar's year, month and day."""
+        """Convert a Gregorian ISO 8601 date to this calendar's year, month and day.
+
+        Calendars without conversion rules read the year, month and day from the string.
+
+        Example:
+            >>> from calendars.julian_calendars import CalendarsJulian
+            >>> CalendarsJulian.JULIAN.from_iso('2000-01-01')
+            (1999, 12, 19)
+        """
+        if self.name in Tables.rules or self.name == Tables.HEBREW:
+            dates: CalendarDates = Conversions.from_day_numbers(
+                Conversions.day_numbers([iso]), self
+            )
+            return int(dates.years[0]), int(dates.months[0]), int(dates.days[0])
         year_month_day: list[str] = iso.split(Constants.HYPHEN)
         year: int = int(year_month_day[0])
         month: int = int(year_month_day[1])
@@ -203,61 +371,162 @@ class CalendarDefinition(NamedTuple):
             year, month, day = self.from_iso(iso)
         return f'{year!s}-{self.months[month]}-{day!s}'
 
-    def ics(self, start: str, end: str) -> str:
+    def ics(self, start: str, end: str, namespace: uuid.UUID | None = None) -> str:
         """Construct an ICS list of events from the days defined in the calendar.
 
         The days are represented as day-long events.  This allows one to
         see the calendar as aligned with the more common
-        universal calendar of the program.
+        universal calendar of the program.  See `ics_stream` for the events.
 
         Args:
             start: The first day for the ICS list of events.
             end: The last day for the ICS list of events.
+            namespace: The namespace of deterministic UUIDv5 event ids.
 
         Reference:
             [RFC 5545](https://datatracker.ietf.org/doc/html/rfc5545)
             [icalendar](https://icalendar.readthedocs.io/en/latest/)
         """
-        lines: str = Constants.ICS_BEGIN_CALENDAR
-        index: int = 1
-        day: str = start
-        end_day: str = end
-        for day_item in self.days:
-            summary: str = self.months[self.days[day_item.number].month].name
-            day_summary: str = self.days[index].summary
-            if day_summary != Constants.EMPTY:
-                summary = ''.join(
-                    [summary, Constants.ICS_SEPARATOR, day_summary]
-                )
-            lines = ''.join(
-                [
-                    lines,
-                    Constants.ICS_BEGIN_DAY,
-                    Constants.EOL,
-                    Constants.ICS_UID,
-                    str(uuid.uuid4()),
-                    Constants.EOL,
-                    Constants.ICS_DAY_START,
-                    day,
-                    Constants.EOL,
-                    Constants.ICS_DAY_END,
-                    end_day,
-                    Constants.EOL,
-                    Constants.ICS_SUMMARY,
-                    summary,
-                    Constants.EOL,
-                    Constants.ICS_DESCRIPTION,
-                    self.days[index].description,
-                    Constants.EOL,
-                    Constants.ICS_END_DAY,
-                    Constants.EOL,
-                ]
+        lines: io.StringIO = io.StringIO()
+        self.ics_stream(start, end, lines, namespace)
+        return lines.getvalue()
+
+    def ics_stream(
+        self,
+        start: str,
+        end: str,
+        fileobj: TextIO,
+        namespace: uuid.UUID | None = None,
+    ) -> int:
+        """Write an ICS list of events for each day from start to end to a file.
+
+        Each Gregorian day from `start` through `end` becomes a day-long event
+        whose summary is the date in this calendar followed by the summary or
+        name of the day if the calendar defines one.  The days are converted
+        in blocks of `Constants.ICS_BLOCK` and written as they are converted
+        so long ranges are not held in memory.
+
+        The event ids are random unless a namespace is given.  Then the id
+        is the UUIDv5 of the calendar name and the day number so exporting
+        the same days again produces the same file.
+
+        Example:
+            >>> import io
+            >>> import uuid
+            >>> from calendars.french_revolution_calendars import CalendarsFrenchRevolution
+            >>> file = io.StringIO()
+            >>> CalendarsFrenchRevolution.FRENCH_R.ics_stream(
+            ...     '1792-09-22', '1792-09-23', file, uuid.NAMESPACE_URL
+            ... )
+            2
+            >>> print(file.getvalue().splitlines()[8])
+            SUMMARY:1 Vendémiaire 1:Raisin
+
+        Args:
+            start: The ISO 8601 date of the first day.
+            end: The ISO 8601 date of the last day.
+            fileobj: The text file to write to.
+            namespace: The namespace of deterministic UUIDv5 event ids.
+
+        Returns:
+            The number of events written.
+
+        Reference:
+            [RFC 5545](https://datatracker.ietf.org/doc/html/rfc5545)
+        """
+        named: dict[int, DayDefinition] = {day.number: day for day in self.days}
+        first, last = Conversions.day_numbers([start, end]).tolist()
+        fileobj.write(Constants.ICS_BEGIN_CALENDAR)
+        for block in range(first, last + 1, Constants.ICS_BLOCK):
+            day_numbers: npt.NDArray[np.int64] = np.arange(
+                block, min(block + Constants.ICS_BLOCK, last + 1), dtype=np.int64
             )
-            index += 1
-        return ''.join([lines, Constants.ICS_END_CALENDAR])
+            dates: CalendarDates = Conversions.from_day_numbers(day_numbers, self)
+            firsts: npt.NDArray[np.int64] = np.ones_like(dates.years)
+            day_of_year: list[int] = (
+                day_numbers
+                - Conversions.to_day_numbers(dates.years, firsts, firsts, self)
+                + 1
+            ).tolist()
+            stamps: list[str] = [
+                stamp.replace(Constants.HYPHEN, Constants.EMPTY)
+                for stamp in np.datetime_as_string(
+                    (
+                        np.append(day_numbers, day_numbers[-1] + 1)
+                        - Constants.JDN_UNIX_EPOCH
+                    ).astype('datetime64[D]')
+                ).tolist()
+            ]
+            events: list[str] = []
+            for index, (number, year, month, day) in enumerate(
+                zip(
+                    day_numbers.tolist(),
+                    dates.years.tolist(),
+                    dates.months.tolist(),
+                    dates.days.tolist(),
+                    strict=True,
+                )
+            ):
+                summary: str = f'{day} {self.months[month].name} {year}'
+                description: str = Constants.EMPTY
+                if day_of_year[index] in named:
+                    day_definition: DayDefinition = named[day_of_year[index]]
+                    day_summary: str = day_definition.summary or day_definition.name
+                    if day_summary != Constants.EMPTY:
+                        summary = ''.join(
+                            [summary, Constants.ICS_SEPARATOR, day_summary]
+                        )
+                    description = day_definition.description
+                uid: uuid.UUID = (
+                    uuid.uuid4()
+                    if namespace is None
+                    else uuid.uuid5(namespace, f'{self.name}:{number}')
+                )
+                events.append(
+                    ''.join(
+                        [
+                            Constants.ICS_BEGIN_DAY,
+                            Constants.EOL,
+                            Constants.ICS_UID,
+                            str(uid),
+                            Constants.EOL,
+                            Constants.ICS_DAY_START,
+                            stamps[index],
+                            Constants.EOL,
+                            Constants.ICS_DAY_END,
+                            stamps[index + 1],
+                            Constants.EOL,
+                            Constants.ICS_SUMMARY,
+                            summary,
+                            Constants.EOL,
+                            Constants.ICS_DESCRIPTION,
+                            description,
+                            Constants.EOL,
+                            Constants.ICS_END_DAY,
+                            Constants.EOL,
+                        ]
+                    )
+                )
+            fileobj.write(''.join(events))
+        fileobj.write(Constants.ICS_END_CALENDAR)
+        return max(last - first + 1, 0)
 
     def isleap(self, year: int) -> bool:
-        """Test if a year is a leap year with the default test for the Gregorian calendar."""
+        """Test if a year is a leap year.
+
+        Calendars with a cycle of years look the year up in the table of the cycle.
+        Others use the default test for the Gregorian calendar.
+
+        Example:
+            >>> from calendars.gregorian_calendars import CalendarsGregorian
+            >>> CalendarsGregorian.GREGORIAN.isleap(1900)
+            False
+        """
+        if self.name in Tables.rules:
+            tables: CalendarTables = self.tables()
+            if year < 0 and not self.zero:
+                year += 1
+            return bool(tables.cycle_leaps[(year - 1) % len(tables.cycle_leaps)])
         return year % 4 == 0 and year % 400 != 0
 
     def describe(
@@ -368,3 +637,367 @@ new_calendar = CalendarDefinition(
                 Constants.INDENT * tabs,
             )
         )
+
+
+class Tables:
+    """Build and cache the lookup tables of calendar definitions.
+
+    The tables of a calendar are built from its months and the leap rule
+    named after it the first time they are needed and are kept until `clear`.
+    A calendar without a leap rule has the same common and leap years
+    and a cycle of one year.
+    """
+
+    HEBREW: str = 'Hebrew'
+    rules: ClassVar[dict[str, LeapRule]] = {
+        'Gregorian': LeapRule(
+            lambda years: (years % 4 == 0)
+            & ((years % 100 != 0) | (years % 400 == 0)),
+            2,
+        ),
+        'Julian': LeapRule(lambda years: years % 4 == 0, 2),
+        'French Revolution': LeapRule(lambda years: (years + 1) % 4 == 0, 13),
+    }
+    cache: ClassVar[dict[int, tuple[CalendarDefinition, CalendarTables]]] = {}
+
+    @staticmethod
+    def count(value: Any) -> int:
+        """Return the number in a `YearDefinition` field whether or not it is a timedelta64."""
+        if isinstance(value, np.timedelta64):
+            return int(value.astype(np.int64))
+        return int(value)
+
+    @staticmethod
+    def build(calendar: CalendarDefinition) -> CalendarTables:
+        """Construct the lookup tables of a calendar.
+
+        Example:
+            >>> from calendars.calendars import Tables
+            >>> from calendars.french_revolution_calendars import CalendarsFrenchRevolution
+            >>> Tables.build(CalendarsFrenchRevolution.FRENCH_R).month_starts[:, -2:]
+            array([[360, 365],
+                   [360, 366]])
+
+        Args:
+            calendar: The calendar whose tables are built.
+        """
+        days: npt.NDArray[np.int64] = np.array(
+            [month.days for month in calendar.months], dtype=np.int64
+        )
+        month_days: npt.NDArray[np.int64] = np.stack([days, days])
+        cycle_leaps: npt.NDArray[np.bool_] = np.zeros(1, dtype=bool)
+        days_in_cycle: int = int(days.sum())
+        rule: LeapRule | None = Tables.rules.get(calendar.name)
+        if rule is not None:
+            month_days[1, rule.month] += 1
+            years_in_cycle: int = Tables.count(calendar.years.years_in_cycle)
+            days_in_cycle = Tables.count(calendar.years.days_in_cycle)
+            cycle_leaps = rule.isleap(
+                np.arange(1, years_in_cycle + 1, dtype=np.int64)
+            )
+        cycle_starts: npt.NDArray[np.int64] = np.concatenate(
+            [[0], np.cumsum(month_days[cycle_leaps.astype(np.int64), :].sum(axis=1))]
+        )
+        if cycle_starts[-1] != days_in_cycle:
+            raise ValueError(
+                CalendarMessage.CYCLE.format(
+                    str(cycle_starts[-1]),
+                    str(len(cycle_leaps)),
+                    calendar.name,
+                    str(days_in_cycle),
+                )
+            )
+        month_starts: npt.NDArray[np.int64] = np.concatenate(
+            [np.zeros((2, 1), dtype=np.int64), np.cumsum(month_days[:, 1:], axis=1)],
+            axis=1,
+        )
+        return CalendarTables(month_days, month_starts, cycle_starts, cycle_leaps)
+
+    @staticmethod
+    def get(calendar: CalendarDefinition) -> CalendarTables:
+        """Return the cached lookup tables of a calendar building them if needed.
+
+        Args:
+            calendar: The calendar whose tables are returned.
+        """
+        entry: tuple[CalendarDefinition, CalendarTables] | None = Tables.cache.get(
+            id(calendar)
+        )
+        if entry is None or entry[0] is not calendar:
+            entry = (calendar, Tables.build(calendar))
+            Tables.cache[id(calendar)] = entry
+        return entry[1]
+
+    @staticmethod
+    def clear() -> None:
+        """Remove all cached lookup tables."""
+        Tables.cache.clear()
+
+
+class CalendarDates(NamedTuple):
+    """The years, months and days of an array of dates in one calendar.
+
+    Years before the epoch of a calendar without a zero year count down from -1.
+    """
+
+    years: npt.NDArray[np.int64]
+    months: npt.NDArray[np.int64]
+    days: npt.NDArray[np.int64]
+
+
+class Conversions:
+    """Convert between day numbers and dates of several calendars at once.
+
+    A day number is the Julian day number, the count of days since
+    1 January 4713 BCE in the Julian calendar.  The `epoch_day` of a calendar
+    is the ISO 8601 date of the first day of its year 1.
+
+    The Gregorian, Julian and French Revolution calendars repeat a cycle of
+    years given by their `YearDefinition`.  A date is found by dividing the
+    days since the epoch by `days_in_cycle` and locating the year in a table
+    of the years in the cycle.  The Hebrew calendar counts the months since
+    its epoch in cycles of `months_in_cycle` months in `years_in_cycle` years.
+    """
+
+    @staticmethod
+    def epoch(calendar: CalendarDefinition) -> int:
+        """Return the day number of the first day of year 1 of the calendar.
+
+        Example:
+            >>> from calendars.calendars import Conversions
+            >>> from calendars.gregorian_calendars import CalendarsGregorian
+            >>> Conversions.epoch(CalendarsGregorian.GREGORIAN)
+            1721426
+        """
+        return (
+            int(calendar.epoch_day.astype('datetime64[D]').astype(np.int64))
+            + Constants.JDN_UNIX_EPOCH
+        )
+
+    @staticmethod
+    def day_numbers(dates: Any) -> npt.NDArray[np.int64]:
+        """Return the day numbers of an array of ISO 8601 dates or day numbers.
+
+        Example:
+            >>> from calendars.calendars import Conversions
+            >>> Conversions.day_numbers(['2000-01-01', '1970-01-01'])
+            array([2451545, 2440588])
+
+        Args:
+            dates: ISO 8601 strings, datetime64 values or integer day numbers.
+        """
+        values: npt.NDArray[Any] = np.asarray(dates)
+        if values.dtype.kind in 'iu':
+            return values.astype(np.int64)
+        return (
+            values.astype('datetime64[D]').astype(np.int64)
+            + Constants.JDN_UNIX_EPOCH
+        )
+
+    @staticmethod
+    def hebrew_elapsed_days(
+        years: npt.NDArray[np.int64], calendar: CalendarDefinition
+    ) -> npt.NDArray[np.int64]:
+        """Return the days from the epoch to the molad of Tishrei of each Hebrew year.
+
+        Args:
+            years: The Hebrew years.
+            calendar: The Hebrew calendar definition.
+        """
+        months_in_cycle: int = Tables.count(calendar.years.months_in_cycle)
+        years_in_cycle: int = Tables.count(calendar.years.years_in_cycle)
+        months: npt.NDArray[np.int64] = (
+            months_in_cycle * years - (months_in_cycle - 1)
+        ) // years_in_cycle
+        parts: npt.NDArray[np.int64] = 12084 + 13753 * months
+        days: npt.NDArray[np.int64] = 29 * months + parts // 25920
+        return np.where((3 * (days + 1)) % 7 < 3, days + 1, days)
+
+    @staticmethod
+    def hebrew_new_years(
+        years: npt.NDArray[np.int64], calendar: CalendarDefinition
+    ) -> npt.NDArray[np.int64]:
+        """Return the day number of 1 Tishrei of each Hebrew year.
+
+        Example:
+            >>> import numpy as np
+            >>> from calendars.calendars import Conversions
+            >>> from calendars.hebraic_calendars import CalendarsHebraic
+            >>> Conversions.hebrew_new_years(np.array([5785]), CalendarsHebraic.HEBREW)
+            array([2460587])
+
+        Args:
+            years: The Hebrew years.
+            calendar: The Hebrew calendar definition.
+        """
+        previous: npt.NDArray[np.int64] = Conversions.hebrew_elapsed_days(years - 1, calendar)
+        current: npt.NDArray[np.int64] = Conversions.hebrew_elapsed_days(years, calendar)
+        following: npt.NDArray[np.int64] = Conversions.hebrew_elapsed_days(years + 1, calendar)
+        delay: npt.NDArray[np.int64] = np.select(
+            [following - current == 356, current - previous == 382], [2, 1], 0
+        )
+        return Conversions.epoch(calendar) + current + delay
+
+    @staticmethod
+    def hebrew_month_days(
+        years: npt.NDArray[np.int64], calendar: CalendarDefinition
+    ) -> npt.NDArray[np.int64]:
+        """Return the days in each month of each Hebrew year.
+
+        The columns are the months of the calendar definition with the
+        empty month 0 first, as in `CalendarTables.month_days`.  Cheshvan and
+        Kislev vary with the length of the year and Adar I has no days in a
+        year without it.
+
+        Example:
+            >>> import numpy as np
+            >>> from calendars.calendars import Conversions
+            >>> from calendars.hebraic_calendars import CalendarsHebraic
+            >>> Conversions.hebrew_month_days(np.array([5784, 5785]), CalendarsHebraic.HEBREW)[:, :7]
+            array([[ 0, 30, 29, 29, 29, 30, 30],
+                   [ 0, 30, 30, 30, 29, 30,  0]])
+
+        Args:
+            years: The Hebrew years.
+            calendar: The Hebrew calendar definition.
+        """
+        lengths: npt.NDArray[np.int64] = Conversions.hebrew_new_years(
+            years + 1, calendar
+        ) - Conversions.hebrew_new_years(years, calendar)
+        days: npt.NDArray[np.int64] = np.tile(
+            np.array([month.days for month in calendar.months], dtype=np.int64),
+            (len(years), 1),
+        )
+        days[:, 2] = np.where(lengths % 10 == 5, 30, 29)
+        days[:, 3] = np.where(lengths % 10 == 3, 29, 30)
+        days[:, 6] = np.where(lengths > 380, days[:, 6], 0)
+        return days
+
+    @staticmethod
+    def hebrew_month_table(
+        years: npt.NDArray[np.int64], calendar: CalendarDefinition
+    ) -> npt.NDArray[np.int64]:
+        """Return the day of the year on which each month starts for each Hebrew year.
+
+        The months are those of the calendar definition starting with Tishrei.
+        See `hebrew_month_days` for the days in each month.
+
+        Args:
+            years: The Hebrew years.
+            calendar: The Hebrew calendar definition.
+        """
+        days: npt.NDArray[np.int64] = Conversions.hebrew_month_days(years, calendar)
+        return np.concatenate(
+            [np.zeros((len(years), 1), dtype=np.int64), np.cumsum(days[:, 1:], axis=1)],
+            axis=1,
+        )
+
+    @staticmethod
+    def from_day_numbers(
+        day_numbers: npt.NDArray[np.int64], calendar: CalendarDefinition
+    ) -> CalendarDates:
+        """Return the years, months and days of day numbers in one calendar.
+
+        Example:
+            >>> import numpy as np
+            >>> from calendars.calendars import Conversions
+            >>> from calendars.julian_calendars import CalendarsJulian
+            >>> Conversions.from_day_numbers(np.array([2451545]), CalendarsJulian.JULIAN)
+            CalendarDates(years=array([1999]), months=array([12]), days=array([19]))
+
+        Args:
+            day_numbers: The day numbers to convert.
+            calendar: The calendar to convert them to.
+        """
+        offsets: npt.NDArray[np.int64] = day_numbers - Conversions.epoch(calendar)
+        if calendar.name == Tables.HEBREW:
+            # Estimate the year from the mean length of the year and correct it.
+            years: npt.NDArray[np.int64] = (offsets * 98496) // 35975351 + 1
+            years = np.where(
+                Conversions.hebrew_new_years(years + 1, calendar) <= day_numbers,
+                years + 1,
+                years,
+            )
+            years = np.where(
+                Conversions.hebrew_new_years(years, calendar) > day_numbers,
+                years - 1,
+                years,
+            )
+            day_of_year: npt.NDArray[np.int64] = day_numbers - Conversions.hebrew_new_years(
+                years, calendar
+            )
+            starts: npt.NDArray[np.int64] = Conversions.hebrew_month_table(years, calendar)
+            months: npt.NDArray[np.int64] = (starts[:, :-1] <= day_of_year[:, None]).sum(axis=1)
+            days: npt.NDArray[np.int64] = (
+                day_of_year - np.take_along_axis(starts, months[:, None] - 1, 1)[:, 0] + 1
+            )
+        else:
+            # Locate the cycle and then the year in the cycle.
+            if calendar.name not in Tables.rules:
+                raise ValueError(CalendarMessage.NO_RULE.format(calendar.name))
+            tables: CalendarTables = calendar.tables()
+            days_in_cycle: int = int(tables.cycle_starts[-1])
+            cycles, remainders = np.divmod(offsets, days_in_cycle)
+            index: npt.NDArray[np.int64] = (
+                np.searchsorted(tables.cycle_starts, remainders, side='right') - 1
+            )
+            years = cycles * len(tables.cycle_leaps) + index + 1
+            day_of_year = remainders - tables.cycle_starts[index]
+
+            # Locate the month in the table for common or leap years.
+            table: npt.NDArray[np.int64] = tables.month_starts
+            leap: npt.NDArray[np.int64] = tables.cycle_leaps[index].astype(np.int64)
+            months = np.where(
+                leap == 1,
+                np.searchsorted(table[1], day_of_year, side='right'),
+                np.searchsorted(table[0], day_of_year, side='right'),
+            )
+            days = day_of_year - table[leap, months - 1] + 1
+        if not calendar.zero:
+            years = np.where(years <= 0, years - 1, years)
+        return CalendarDates(years, months, days)
+
+    @staticmethod
+    def to_day_numbers(
+        years: Any, months: Any, days: Any, calendar: CalendarDefinition
+    ) -> npt.NDArray[np.int64]:
+        """Return the day numbers of arrays of years, months and days in one calendar.
+
+        Example:
+            >>> from calendars.calendars import Conversions
+            >>> from calendars.french_revolution_calendars import CalendarsFrenchRevolution
+            >>> Conversions.to_day_numbers([1, 12], [1, 1], [1, 1], CalendarsFrenchRevolution.FRENCH_R)
+            array([2375840, 2379858])
+
+        Args:
+            years: The years of the dates.
+            months: The months of the dates numbered as in the calendar definition.
+            days: The days of the months.
+            calendar: The calendar of the dates.
+        """
+        year_array: npt.NDArray[np.int64] = np.asarray(years, dtype=np.int64)
+        month_array: npt.NDArray[np.int64] = np.asarray(months, dtype=np.int64)
+        day_array: npt.NDArray[np.int64] = np.asarray(days, dtype=np.int64)
+        if not calendar.zero:
+            year_array = np.where(year_array < 0, year_array + 1, year_array)
+        if calendar.name == Tables.HEBREW:
+            starts: npt.NDArray[np.int64] = Conversions.hebrew_month_table(year_array, calendar)
+            return (
+                Conversions.hebrew_new_years(year_array, calendar)
+                + np.take_along_axis(starts, month_array[:, None] - 1, 1)[:, 0]
+                + day_array
+                - 1
+            )
+        if calendar.name not in Tables.rules:
+            raise ValueError(CalendarMessage.NO_RULE.format(calendar.name))
+        tables: CalendarTables = calendar.tables()
+        cycles, index = np.divmod(year_array - 1, len(tables.cycle_leaps))
+        leap: npt.NDArray[np.int64] = tables.cycle_leaps[index].astype(np.int64)
+        return (
+            Conversions.epoch(calendar)
+            + cycles * int(tables.cycle_starts[-1])
+            + tables.cycle_starts[index]
+            + tables.month_starts[leap, month_array - 1]
+            + day_array
+            - 1
+        )
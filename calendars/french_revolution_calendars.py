@@ -15,7 +15,7 @@ from calendars.calendars import (
 class CalendarsFrenchRevolution:
     FRENCH_R = CalendarDefinition(
         name='French Revolution',
-        years=YearDefinition(np.timedelta64(0, 'Y'),np.timedelta64(0, 'M'),np.timedelta64(0, 'D')),
+        years=YearDefinition(np.timedelta64(4, 'Y'),np.timedelta64(4 * 13, 'M'),np.timedelta64((4 * 365) + 1, 'D')),
         months=[
             MonthDefinition(0, '', days=0, abbreviation=''), 
             MonthDefinition(1, 'Vendémiaire', symbol='', days=30, abbreviation='VEND'),
@@ -30,7 +30,7 @@ class CalendarsGregorian:
         years=YearDefinition(
             np.timedelta64(400, 'Y'), 
             np.timedelta64(400 * 12, 'M'), 
-            np.timedelta64((400 * 365) + 99, 'D'), 
+            np.timedelta64((400 * 365) + 97, 'D'), 
             np.timedelta64(4, 'Y'), 
             np.timedelta64(4 * 12, 'M'), 
             np.timedelta64((4 * 365) + 1, 'D')
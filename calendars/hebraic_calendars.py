@@ -15,22 +15,22 @@ from calendars.calendars import (
 class CalendarsHebraic:
     HEBREW = CalendarDefinition(
         name='Hebrew',
-        years=YearDefinition(19, 19 * 12, (19 * 365) + 4),
+        years=YearDefinition(19, 235, 6940),
         months=[
             MonthDefinition(0, '', days=0, abbreviation=''), 
-            MonthDefinition(1,'Tishrei', days=0, abbreviation='TSH'),
-            MonthDefinition(2,'Kislev', days=0, abbreviation='CSH'),
-            MonthDefinition(3,'Shevat', days=0, abbreviation='TSH'),
-            MonthDefinition(4,'Iyar', days=0, abbreviation='TSH'),
-            MonthDefinition(5,'Tammuz', days=0, abbreviation='TSH'),
-            MonthDefinition(6,'Elul', days=0, abbreviation='TSH'),
-            MonthDefinition(7,'Marcheshvan', days=0, abbreviation='TSH'),
-            MonthDefinition(8,'Tevet', days=0, abbreviation='TSH'),
-            MonthDefinition(9,'Adar', days=0, abbreviation='ADR'),
-            MonthDefinition(10,'Veadar', days=0, abbreviation='ADS'),
-            MonthDefinition(11,'Nisan', days=0, abbreviation='NSN'),
-            MonthDefinition(12,'Sivan', days=0, abbreviation='TSH'),
-            MonthDefinition(13,'Av', days=0, abbreviation='AAV'),
+            MonthDefinition(1,'Tishrei', days=30, abbreviation='TSH'),
+            MonthDefinition(2,'Cheshvan', days=29, abbreviation='CSH'),
+            MonthDefinition(3,'Kislev', days=30, abbreviation='KSL'),
+            MonthDefinition(4,'Tevet', days=29, abbreviation='TVT'),
+            MonthDefinition(5,'Shevat', days=30, abbreviation='SHV'),
+            MonthDefinition(6,'Adar I', days=30, abbreviation='ADR'),
+            MonthDefinition(7,'Adar', days=29, abbreviation='ADS'),
+            MonthDefinition(8,'Nisan', days=30, abbreviation='NSN'),
+            MonthDefinition(9,'Iyar', days=29, abbreviation='IYR'),
+            MonthDefinition(10,'Sivan', days=30, abbreviation='SVN'),
+            MonthDefinition(11,'Tammuz', days=29, abbreviation='TMZ'),
+            MonthDefinition(12,'Av', days=30, abbreviation='AAV'),
+            MonthDefinition(13,'Elul', days=29, abbreviation='ELL'),
         ],
         weeks=[],
         weekdays=[
@@ -44,9 +44,9 @@ class CalendarsHebraic:
         ],
         days=[],
         holidays=[],
-        epoch_year=np.datetime64('-3761-10-07', 'Y'),
-        epoch_month=np.datetime64('-3761-10-07', 'M'),
-        epoch_day=np.datetime64('-3761-10-07', 'D'),
+        epoch_year=np.datetime64('-3760-09-07', 'Y'),
+        epoch_month=np.datetime64('-3760-09-07', 'M'),
+        epoch_day=np.datetime64('-3760-09-07', 'D'),
         negative=False,
         zero=False,
         description='',
@@ -47,9 +47,10 @@ class CalendarsJulian:
         ],
         days=[],
         holidays=[],
-        epoch_year=np.datetime64('-4713-01-01T12:00:00', 'Y'),
-        epoch_month=np.datetime64('-4713-01-01T12:00:00', 'M'),
-        epoch_day=np.datetime64('-4713-01-01T12:00:00', 'D'),
+        epoch_year=np.datetime64('0000-12-30', 'Y'),
+        epoch_month=np.datetime64('0000-12-30', 'M'),
+        epoch_day=np.datetime64('0000-12-30', 'D'),
+        epoch_name='BC',
         zero=False,
         negative=True,
         description='',
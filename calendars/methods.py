@@ -1,44 +1,91 @@
 # methods.py
 """Calendar methods for computation, comparison and visualization of multiple calendars."""
 
+from typing import Any
+
 import numpy as np
+import numpy.typing as npt
 import pandas as pd  # type: ignore[import-untyped]
 
-from calendars.calendars import CalendarDefinition
+from calendars.calendars import CalendarDates, CalendarDefinition, Conversions
+from calendars.gregorian_calendars import CalendarsGregorian
 
 # from calendars.french_revolution_calendars import CalendarsFrenchRevolution
-# from calendars.gregorian_calendars import CalendarsGregorian
 # from calendars.hebraic_calendars import CalendarsHebraic
 # from calendars.julian_calendars import CalendarsJulian
 
+Integers = npt.NDArray[np.int64]
+
+
+class Methods(Conversions):
+    """Convert dates to several calendars at once and display them.
+
+    The conversions between day numbers and the dates of one calendar
+    are those of `Conversions`.
+    """
+
+    @staticmethod
+    def convert(
+        dates: Any, *args: CalendarDefinition
+    ) -> dict[str, CalendarDates]:
+        """Convert an array of dates to the years, months and days of several calendars.
+
+        Examples:
+            >>> from calendars.french_revolution_calendars import CalendarsFrenchRevolution
+            >>> from calendars.gregorian_calendars import CalendarsGregorian
+            >>> from calendars.hebraic_calendars import CalendarsHebraic
+            >>> from calendars.julian_calendars import CalendarsJulian
+            >>> from calendars.methods import Methods
+            >>> converted = Methods.convert(
+            ...     ['1792-09-22', '2024-10-03'],
+            ...     CalendarsGregorian.GREGORIAN,
+            ...     CalendarsJulian.JULIAN,
+            ...     CalendarsFrenchRevolution.FRENCH_R,
+            ...     CalendarsHebraic.HEBREW,
+            ... )
+            >>> converted['French Revolution'].years
+            array([  1, 233])
+            >>> converted['Hebrew']
+            CalendarDates(years=array([5553, 5785]), months=array([1, 1]), days=array([6, 1]))
+
+        Args:
+            dates: ISO 8601 strings, datetime64 values or integer day numbers.
+            args: The calendars to convert to.  The Gregorian calendar is used if there are none.
+        """
+        day_numbers: Integers = Methods.day_numbers(dates)
+        calendars: tuple[CalendarDefinition, ...] = args or (
+            CalendarsGregorian.GREGORIAN,
+        )
+        return {
+            calendar.name: Methods.from_day_numbers(day_numbers, calendar)
+            for calendar in calendars
+        }
 
-class Methods:
     @staticmethod
     def date_item(iso: str, calendar: CalendarDefinition) -> list[str]:
         """Calculate the calendar date from an ISO 8601 date.
-        
+
         Examples:
             The ISO 8601 date should be identical to the Gregorian calendar date.
-            >> from calendars.gregorian_calendars import CalendarsGregorian
-            >> from calendars.methods import Methods
-            >> Methods.date_item('2025-01-01', CalendarsGregorian.GREGORIAN)
+            >>> from calendars.gregorian_calendars import CalendarsGregorian
+            >>> from calendars.methods import Methods
+            >>> Methods.date_item('2025-01-01', CalendarsGregorian.GREGORIAN)
             ['Gregorian', '2025-01-01']
-        
+
         """
-        np_year: np.datetime64 = np.datetime64(iso, 'Y')
-        years: np.timedelta64 = np_year - calendar.epoch_year
-        np_month: np.datetime64 = np.datetime64(iso, 'M')
-        months: np.timedelta64 = np_month - calendar.epoch_month
-        np_day: np.datetime64 = np.datetime64(iso, 'Y')
-        days: np.timedelta64 = np_day - calendar.epoch_day
-        return [calendar.name, str(years)+str(months)+str(days)]
+        return Methods.date_list(iso, calendar)[0]
 
     @staticmethod
     def date_list(iso: str, *args: CalendarDefinition) -> list[list[str]]:
         """Construct a list of date and calendar names associated with the date."""
         items: list[list[str]] = []
-        for calendar in args:
-            items.append(Methods.date_item(iso, calendar))
+        for name, dates in Methods.convert([iso], *args).items():
+            items.append(
+                [
+                    name,
+                    f'{dates.years[0]:04d}-{dates.months[0]:02d}-{dates.days[0]:02d}',
+                ]
+            )
         return items
 
     @staticmethod
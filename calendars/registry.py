@@ -0,0 +1,130 @@
+# registry.py
+"""Find calendar definitions by name importing their modules on first use."""
+
+import importlib
+from functools import lru_cache
+from typing import ClassVar, NamedTuple
+
+import numpy as np
+
+from calendars.calendars import (
+    CalendarDefinition,
+    CalendarMessage,
+    Constants,
+    Conversions,
+)
+
+
+class CalendarLocation(NamedTuple):
+    """Where the definition of a calendar is found.
+
+    Args:
+        module: The module containing the class of definitions.
+        holder: The class with the definition as an attribute.
+        attribute: The name of the attribute.
+    """
+
+    module: str
+    holder: str
+    attribute: str
+
+
+class Registry:
+    """Look up calendar definitions by name and cache conversions to them.
+
+    A calendar is named by the attribute holding its definition, such as
+    `GREGORIAN` or `FRENCH_R`, which matches the calendar names of GEDCOM dates.
+    Its module is imported the first time the calendar is requested so
+    programs only pay for the calendars they use.  Every calendar registered
+    here can be converted with `date`.  Calendars defined elsewhere, such as
+    the template `CalendarsGregorian.GREGORIAN_EMPTY`, may be added with
+    `register`.
+
+    Examples:
+        >>> from calendars.registry import Registry
+        >>> Registry.get('FRENCH_R').name
+        'French Revolution'
+        >>> Registry.date(2460587, 'HEBREW')
+        (5785, 1, 1)
+    """
+
+    locations: ClassVar[dict[str, CalendarLocation]] = {
+        'FRENCH_R': CalendarLocation(
+            'calendars.french_revolution_calendars',
+            'CalendarsFrenchRevolution',
+            'FRENCH_R',
+        ),
+        'GREGORIAN': CalendarLocation(
+            'calendars.gregorian_calendars', 'CalendarsGregorian', 'GREGORIAN'
+        ),
+        'HEBREW': CalendarLocation(
+            'calendars.hebraic_calendars', 'CalendarsHebraic', 'HEBREW'
+        ),
+        'JULIAN': CalendarLocation(
+            'calendars.julian_calendars', 'CalendarsJulian', 'JULIAN'
+        ),
+    }
+    loaded: ClassVar[dict[str, CalendarDefinition]] = {}
+
+    @staticmethod
+    def names() -> list[str]:
+        """Return the names of the registered calendars without importing them."""
+        return sorted(Registry.locations)
+
+    @staticmethod
+    def register(name: str, location: CalendarLocation) -> None:
+        """Add a calendar to the registry or move an existing one.
+
+        Args:
+            name: The name used to look up the calendar.
+            location: Where the definition of the calendar is found.
+        """
+        Registry.locations[name] = location
+        Registry.loaded.pop(name, None)
+        Registry.date.cache_clear()
+
+    @staticmethod
+    def get(name: str) -> CalendarDefinition:
+        """Return the definition of a calendar importing its module if needed.
+
+        Args:
+            name: The name of the calendar.
+        """
+        calendar: CalendarDefinition | None = Registry.loaded.get(name)
+        if calendar is None:
+            if name not in Registry.locations:
+                raise ValueError(
+                    CalendarMessage.UNKNOWN.format(
+                        name, ', '.join(Registry.names())
+                    )
+                )
+            location: CalendarLocation = Registry.locations[name]
+            holder: type = getattr(
+                importlib.import_module(location.module), location.holder
+            )
+            calendar = getattr(holder, location.attribute)
+            Registry.loaded[name] = calendar
+        return calendar
+
+    @staticmethod
+    @lru_cache(maxsize=Constants.CONVERSION_CACHE_SIZE)
+    def date(day_number: int, name: str) -> tuple[int, int, int]:
+        """Return the year, month and day of a day number in a calendar.
+
+        Recent conversions are cached so rendering the same days again
+        does not repeat them.  Use `Methods.convert` for arrays of days.
+
+        Args:
+            day_number: The Julian day number of the date.
+            name: The name of the calendar.
+        """
+        dates = Conversions.from_day_numbers(
+            np.array([day_number], dtype=np.int64), Registry.get(name)
+        )
+        return int(dates.years[0]), int(dates.months[0]), int(dates.days[0])
+
+    @staticmethod
+    def clear() -> None:
+        """Forget the loaded calendars and the cached conversions."""
+        Registry.loaded.clear()
+        Registry.date.cache_clear()
@@ -26,14 +26,19 @@ class Column:
     CHART_LINE_STYLE: str = 'Chart Line Style'
     CHRONO_NAME: str = 'Chronogenealogy'
     CODE: str = 'Code'
+    DATE: str = 'Date'
     DATETIME: str = 'Date/Time'
     DURATION: str = 'Duration Years'
+    ENTRY: str = 'Entry'
+    FIELD: str = 'Field'
     ISSUE: str = 'Issue'
     SKEW: str = 'Skewness'
     LINE: str = 'Line'
     MEAN: str = 'Mean'
     MEDIAN: str = 'Median'
+    NUMERIC: str = 'Numeric Date'
     RESERVED: str = 'Reserved Keys'
+    SECTION: str = 'Section'
     STD: str = 'Standard Deviation'
     TEST_NAME: str = 'Test Name'
     VALUE: str = 'Value'
@@ -80,6 +85,7 @@ class Msg:
     BAD_CALENDAR: str = 'The calendar "{0}" is not recognized.'
     BAD_DATE: str = 'The date value "{0}" does not fit a {1} calendar.'
     BAD_LABEL: str = 'The date "{0}" contains an inappropriate label "{1}".'
+    BAD_LABELS: str = 'The dates contain the unrecognized labels {0}.'
     BAD_MONTH: str = 'The month "{1}" for calend "{0}" is not recognized.'
     CALENDARS_DONT_MATCH: str = 'The calendars "{0}" and "{1}" do not match.'
     CHALLENGE_BEGIN: str = 'Challenge "{0}" for the {1} chronologies has begun.'
@@ -17,7 +17,7 @@ from chronodata.constants import (
     Tag,
     Unit,
 )
-from chronodata.messages import Issue, Msg
+from chronodata.messages import Column, Issue, Msg
 
 
 @dataclass(frozen=True)
@@ -40,6 +40,8 @@ class Value:
     MONTH_NAMES: str = 'Month Names'
     MONTH_MAX_DAYS: str = 'Month Max Days'
     SECULAR: str = 'SECULAR'
+    pre_labels: ClassVar = [BC, BCE, BP]
+    post_labels: ClassVar = [AD, CE]
 
 
 @dataclass(frozen=True)
@@ -145,11 +147,20 @@ class Calendar:
         GREGORIAN,
         SECULAR,
     ]
+    same_epoch: ClassVar = [
+        GREGORIAN,
+        SECULAR,
+    ]
 
 
 class Base:
     """Load a chronology from a file or create an empty chronology."""
 
+    date_keys: ClassVar = [
+        (Key.PERIODS, [Key.BEGIN, Key.END]),
+        (Key.EVENTS, [Key.DATE]),
+    ]
+
     def __init__(
         self,
         name: str = '',
@@ -614,6 +625,127 @@ class Base:
             numericdate = np.datetime64(date)
         return numericdate
 
+    def to_datetime64_array(self, dates: Any) -> np.ndarray[Any, Any]:
+        """Convert an array of calendar dates to NumPy datetime64 values.
+
+        This is the array version of `to_datetime64`.  The labels
+        ` BC`, ` BCE` and ` BP` before the epoch and ` AD` and ` CE`
+        after it are removed.  Years before the epoch become
+        astronomical years so that `1 BC` is the year 0 and
+        `5 BC` is the year -4.  Dates without a label are unchanged.
+
+        Parameters
+        ----------
+        dates: Any
+            A pandas Series, NumPy array or list of calendar dates.
+
+        Returns
+        -------
+        np.ndarray
+            The datetime64 values of the dates in astronomical year numbering.
+
+        Examples
+        --------
+        >>> from chronodata.readwrite import Base
+        >>> Base().to_datetime64_array(['2024 AD', '0005-03-01 BC', '1 BCE'])
+        array(['2024-01-01', '-004-03-01', '0000-01-01'], dtype='datetime64[D]')
+        """
+        cleandates: np.ndarray[Any, Any] = np.strings.strip(
+            np.strings.upper(np.asarray(dates, dtype=np.str_))
+        )
+        if cleandates.size == 0:
+            return np.array([], dtype=f'datetime64[{Unit.DAY}]')
+        date, space, label = np.strings.partition(cleandates, String.SPACE)
+        labels: np.ndarray[Any, Any] = np.strings.add(space, label)
+        before: np.ndarray[Any, Any] = np.isin(labels, Value.pre_labels)
+        known: np.ndarray[Any, Any] = (
+            before | np.isin(labels, Value.post_labels) | (labels == String.EMPTY)
+        )
+        if not known.all():
+            raise ValueError(
+                Msg.BAD_LABELS.format(
+                    ', '.join(np.unique(labels[~known]).tolist())
+                )
+            )
+
+        # Rewrite the years before the epoch as astronomical years before
+        # parsing so the leap days of those years are valid.
+        year, hyphen, rest = np.strings.partition(date, String.HYPHEN)
+        years: np.ndarray[Any, Any] = 1 - np.where(before, year, '0').astype(
+            np.int64
+        )
+        astronomical: np.ndarray[Any, Any] = np.strings.add(
+            np.where(years < 0, String.NEGATIVE, String.EMPTY),
+            np.strings.zfill(np.abs(years).astype(np.str_), 4),
+        )
+        return np.where(
+            before,
+            np.strings.add(np.strings.add(astronomical, hyphen), rest),
+            date,
+        ).astype(np.datetime64)
+
+    def daysinyear_array(self, dates: Any) -> np.ndarray[Any, Any]:
+        """Count the days in the Gregorian year of each of an array of dates.
+
+        This is the array version of `daysinyear`.  The dates may be
+        datetime64 values in astronomical year numbering or calendar
+        dates with labels which are converted by `to_datetime64_array`.
+
+        Parameters
+        ----------
+        dates: Any
+            A pandas Series, NumPy array or list of dates.
+
+        Returns
+        -------
+        np.ndarray
+            The number of days, 365 or 366, in the year of each date.
+
+        Examples
+        --------
+        >>> from chronodata.readwrite import Base
+        >>> Base().daysinyear_array(['1900 AD', '2000 AD', '1 BC', '2 BC'])
+        array([365, 366, 366, 365])
+        """
+        values: np.ndarray[Any, Any] = np.asarray(dates)
+        if values.dtype.kind != 'M':
+            values = self.to_datetime64_array(values)
+        years: np.ndarray[Any, Any] = (
+            values.astype(f'datetime64[{Unit.YEAR}]').astype(np.int64)
+            + Value.DATETIME_EPOCH
+        )
+        leap: np.ndarray[Any, Any] = (years % 4 == 0) & (
+            (years % 100 != 0) | (years % 400 == 0)
+        )
+        return np.where(leap, 366, 365)
+
+    def numericdate_array(self, dates: Any) -> np.ndarray[Any, Any]:
+        """Convert an array of labelled dates to astronomical year numbering.
+
+        This is the array version of `numericdate`.  Each year before the
+        epoch is moved to its astronomical year keeping its month and day,
+        so the leap day of the year is accounted for without adding
+        the days of the year one date at a time.
+
+        Parameters
+        ----------
+        dates: Any
+            A pandas Series, NumPy array or list of calendar dates.
+
+        Returns
+        -------
+        np.ndarray
+            The datetime64 values of the dates with Year Zero being 0.
+
+        Examples
+        --------
+        >>> import pandas as pd
+        >>> from chronodata.readwrite import Base
+        >>> Base().numericdate_array(pd.Series(['0004-03-01 BC', '0001-12-31 BC']))
+        array(['-003-03-01', '0000-12-31'], dtype='datetime64[D]')
+        """
+        return self.to_datetime64_array(dates)
+
     # def stringdate(
     #     self, date: np.ndarray[Any, Any], unit: str = Unit.YEAR
     # ) -> np.ndarray[Any, np.dtype[Any]]:
@@ -634,49 +766,169 @@ class Base:
     # ) -> None:
     #     """Add a calendar to the dictionary."""
 
+    def get_calendar(self) -> dict[str, Any]:
+        """Return the dictionary of the calendar of the chronology.
+
+        A chronology started without a file stores only the name
+        of its calendar.  The dictionary is then looked up by name.
+        """
+        calendar: Any = self.chron[Key.CAL]
+        if isinstance(calendar, str):
+            for known in Calendar.calendars:
+                if known[Key.NAME] == calendar:
+                    return known
+            raise ValueError(Msg.BAD_CALENDAR.format(calendar))
+        return dict(calendar)
+
+    def date_frame(self) -> pd.DataFrame:
+        """Collect the dates of the periods and events in one table.
+
+        Each row holds where the date is stored, the labelled date
+        and its numeric value in astronomical year numbering from
+        `to_datetime64_array`.  The numeric column does not depend on
+        the calendar so it can be rendered in any calendar sharing
+        the epoch of the chronology's calendar with `render`.
+
+        Examples
+        --------
+        >>> from chronodata.readwrite import Base, Key
+        >>> chron = Base()
+        >>> chron.chron[Key.EVENTS] = {'Flood': {Key.DATE: '2348 BC'}}
+        >>> chron.date_frame()[Column.NUMERIC].dt.year.tolist()
+        [-2347]
+        """
+        sections: list[str] = []
+        entries: list[str] = []
+        fields: list[str] = []
+        dates: list[str] = []
+        for section, keys in Base.date_keys:
+            for entry, values in self.chron.get(section, {}).items():
+                for field in keys:
+                    if field in values:
+                        sections.append(section)
+                        entries.append(entry)
+                        fields.append(field)
+                        dates.append(values[field])
+        return pd.DataFrame(
+            {
+                Column.SECTION: sections,
+                Column.ENTRY: entries,
+                Column.FIELD: fields,
+                Column.DATE: dates,
+                Column.NUMERIC: self.to_datetime64_array(dates)
+                if dates
+                else np.array([], dtype=np.datetime64),
+            }
+        )
+
+    def relabel_array(
+        self, dates: Any, old: dict[str, Any], new: dict[str, Any]
+    ) -> np.ndarray[Any, Any]:
+        """Replace the epoch labels of an array of dates with those of another calendar.
+
+        Dates ending with the label before the epoch in the `old` calendar
+        receive the label before the epoch in the `new` calendar and likewise
+        for the label after the epoch.  Other dates are unchanged.  Only the
+        labels are compared so the dates need not be ISO 8601 dates.
+
+        Parameters
+        ----------
+        dates: Any
+            A pandas Series, NumPy array or list of labelled dates.
+        old: dict[str, Any]
+            The calendar whose labels the dates have.
+        new: dict[str, Any]
+            The calendar whose labels the dates will have.
+
+        Examples
+        --------
+        >>> from chronodata.readwrite import Base, Calendar
+        >>> Base().relabel_array(
+        ...     ['2024 AD', '44 BC', '1066', 'about 1000 BC'],
+        ...     Calendar.GREGORIAN,
+        ...     Calendar.SECULAR,
+        ... ).tolist()
+        ['2024 CE', '44 BCE', '1066', 'about 1000 BCE']
+        """
+        values: np.ndarray[Any, Any] = np.asarray(dates, dtype=np.str_)
+        relabelled: np.ndarray[Any, Any] = values
+        for key in [Key.PRE, Key.POST]:
+            if old[key] == String.EMPTY or values.size == 0:
+                continue
+            date, _, _ = np.strings.rpartition(values, old[key])
+            relabelled = np.where(
+                np.strings.endswith(values, old[key]),
+                np.strings.add(date, new[key]),
+                relabelled,
+            )
+        return relabelled
+
+    def render(self, calendar: dict[str, Any]) -> pd.DataFrame:
+        """Display the dates of the chronology in another calendar.
+
+        The chronology itself is not changed.  Use `to` to change it.
+
+        Parameters
+        ----------
+        calendar: dict[str, Any]
+            The calendar to display the dates in.
+        """
+        oldcal: dict[str, Any] = self.get_calendar()
+        if calendar[Key.NAME] != oldcal[Key.NAME] and (
+            calendar not in Calendar.same_epoch
+            or oldcal not in Calendar.same_epoch
+        ):
+            raise ValueError(
+                Msg.CALENDARS_DONT_MATCH.format(
+                    oldcal[Key.NAME], calendar[Key.NAME]
+                )
+            )
+        frame: pd.DataFrame = self.date_frame()
+        frame[Column.DATE] = self.relabel_array(
+            frame[Column.DATE], oldcal, calendar
+        )
+        return frame
+
     def to(self, calendar: dict[str, Any]) -> None:
         """Convert the calendar of the chronology to anther calendar.
 
+        The labels of all of the dates of the periods and events
+        are replaced at once by `relabel_array`.  The dates are not
+        parsed so dates such as `about 1000 BC` are relabelled too.
+
         Parameter
         ---------
         calendar: str
             The key of the calendar to convert the current calendar to.
         """
-
-        if calendar[Key.NAME] == self.chron[Key.CAL][Key.NAME]:
-            logging.info(Msg.HAS_CALENDAR.format(self.chron[Key.CAL][Key.NAME]))
+        oldcal: dict[str, Any] = self.get_calendar()
+        if calendar[Key.NAME] == oldcal[Key.NAME]:
+            logging.info(Msg.HAS_CALENDAR.format(oldcal[Key.NAME]))
+        elif calendar in Calendar.same_epoch and oldcal in Calendar.same_epoch:
+            targets: list[dict[str, Any]] = []
+            fields: list[str] = []
+            dates: list[str] = []
+            for section, keys in Base.date_keys:
+                for values in self.chron.get(section, {}).values():
+                    for field in keys:
+                        if field in values:
+                            targets.append(values)
+                            fields.append(field)
+                            dates.append(values[field])
+            for target, field, date in zip(
+                targets,
+                fields,
+                self.relabel_array(dates, oldcal, calendar).tolist(),
+                strict=True,
+            ):
+                target[field] = date
+            self.chron[Key.CAL] = dict(calendar)
+            self.post = calendar[Key.POST]
+            self.postlen = len(self.post)
+            self.pre = calendar[Key.PRE]
+            self.prelen = len(self.pre)
+            logging.info(Msg.CHANGED.format(calendar[Key.NAME]))
         else:
-            cals: list[dict[str, Any]] = [Calendar.GREGORIAN, Calendar.SECULAR]
-            oldcal: dict[str, Any] = self.chron[Key.CAL]
-            post: str = oldcal[Key.POST]
-            postlen: int = -len(post)
-            newcal = calendar
-            if calendar in cals and self.chron[Key.CAL] in cals:
-                self.chron[Key.CAL].update(newcal)
-                for i in self.chron[Key.PERIODS]:
-                    for k in [Key.BEGIN, Key.END]:
-                        if self.chron[Key.PERIODS][i][k][-postlen:] == post:
-                            new = self.chron[Key.PERIODS][i][k].replace(
-                                oldcal[post], newcal[post]
-                            )
-                        else:
-                            new = self.chron[Key.PERIODS][i][k].replace(
-                                oldcal[Key.PRE], newcal[Key.PRE]
-                            )
-                        self.chron[Key.PERIODS][i].update({k: new})
-                for i in self.chron[Key.EVENTS]:
-                    for k in [Key.DATE]:
-                        if self.chron[Key.EVENTS][i][k][postlen:] == post:
-                            new = self.chron[Key.EVENTS][i][k].replace(
-                                oldcal[Key.POST], newcal[Key.POST]
-                            )
-                        else:
-                            new = self.chron[Key.EVENTS][i][k].replace(
-                                oldcal[Key.PRE], newcal[Key.PRE]
-                            )
-                        self.chron[Key.EVENTS][i].update({k: new})
-                self.post = self.chron[Key.CAL][Key.POST]
-                self.postlen = len(self.post)
-                self.pre = self.chron[Key.CAL][Key.PRE]
-                self.prelen = len(self.pre)
-                logging.info(Msg.CHANGED.format(self.chron[Key.CAL][Key.NAME]))
+            logging.info(
+                Msg.CALENDARS_DONT_MATCH.format(oldcal[Key.NAME], calendar[Key.NAME])
+            )
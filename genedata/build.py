@@ -9,12 +9,20 @@ standard.
 import importlib
 import logging
 import re
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from typing import Any, NamedTuple
 
-from genedata.constants import Default
+from genedata.constants import Default, Kinship, Pedigree
+from genedata.duplicates import DuplicateCluster, DuplicateIndex
+from genedata.kinship import KinshipIndex, Relationship
+from genedata.names import NameIndex, NameMatch
+from genedata.places import PlaceIndex, PlaceMatch
+from genedata.stats import GedStatistics, GedSummary
+from genedata.timeline import TimelineEvent, TimelineIndex
 from genedata.messages import Msg
-from genedata.methods import Names, Query, Util
+from genedata.methods import Names, Payload, Query, Util, Validate
 from genedata.structure import (
     ExtensionAttributes,
     ExtensionXref,
@@ -26,6 +34,7 @@ from genedata.structure import (
     SourceXref,
     SubmitterXref,
     Void,
+    Xref,
 )
 
 
@@ -76,6 +85,7 @@ class Genealogy:
         self.tag_counter: int = 0
         self.ged_file: str = Default.EMPTY
         self.ged_ext_tags: list[list[Any]] = []
+        self.ged_ext_yamls: dict[str, str] = {}
         self.tag_uri: list[list[str]] = []
         if self.filename != Default.EMPTY:
             if self.archive == Default.EMPTY:
@@ -101,8 +111,7 @@ class Genealogy:
         )
         self.all_structure_tags: list[str] = Query.all_structure_tags(self.specification)
         if len(self.tag_uri) > 0:
-            for item in self.tag_uri:
-                self.document_tag(item[0], item[1])
+            self.document_tags([(item[0], item[1]) for item in self.tag_uri])
 
         # Load into the Genealogy's specification any extension tags from the file. Set tag counter.
 
@@ -138,6 +147,11 @@ class Genealogy:
         # | self.classes.RecordSubm
         # ] = []
         self.record_header: Any = None  # self.classes.Head | None = None
+        self.kinship_index: KinshipIndex | None = None
+        self.name_index: NameIndex | None = None
+        self.timeline_index: TimelineIndex | None = None
+        self.place_index: PlaceIndex | None = None
+        self.duplicate_index: DuplicateIndex | None = None
         # self.schma: str = Default.EMPTY
 
         # self.filename_type: str = self._get_filename_type(self.filename)
@@ -386,62 +400,130 @@ class Genealogy:
         References:
             [GEDCOM Extensions](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html#extensions)
         """
-        for tag_line in self.ged_ext_tags:
-            if tag_line[2] == yaml_file:
+        return self.document_tags([(tag, yaml_file)])[0]
+
+    def document_tags(
+        self, tags: list[tuple[str, str]]
+    ) -> list[ExtensionAttributes]:
+        """Add a batch of extension tags to the extension specifications.
+
+        This is the batch form of `document_tag`.  The yaml files are read
+        concurrently through the process-wide yaml cache so that files shared
+        by several genealogies are only parsed once.  All of the documented
+        extensions are added to the specification before any of their
+        attributes are queried so that extensions in the same batch may refer
+        to each other.
+
+        Examples:
+            >>> from genedata.build import Genealogy
+            >>> g = Genealogy()
+            >>> tags = g.document_tags(
+            ...     [
+            ...         ('_MYCAL', 'tests/data/good_calendar.yaml'),
+            ...         ('_MYMONTH', 'tests/data/good_month.yaml'),
+            ...     ]
+            ... )
+            >>> [tag.id for tag in tags]
+            [1, 2]
+
+            A yaml file may only be used once.
+            >>> yourtag = g.document_tags(
+            ...     [('_YOURTAG', 'tests/data/good_month.yaml')]
+            ... )
+            Traceback (most recent call last):
+            ValueError: The yaml file "tests/data/good_month.yaml" has already been used for another extension.
+
+        Args:
+            tags: A list of pairs of an extension tag and the location of the yaml
+                file documenting it.  See `document_tag` for a description of each.
+        """
+        batch: dict[str, str] = {}
+        for tag, yaml_file in tags:
+            if yaml_file in self.ged_ext_yamls or yaml_file in batch:
                 raise ValueError(Msg.YAML_FILE_HAS_BEEN_USED.format(yaml_file))
-        yaml_dict: dict[str, dict[str, Any]] = {}
-        yaml_type: str = Default.EMPTY
-        required: list[str] = []
-        single: list[str] = []
-        permitted: list[str] = []
-        payload: str = Default.EMPTY
-        enumset_key: str = Default.EMPTY
-        enum_tags: list[str] = []
-        supers: int = 0
-        superstructures: list[str] | None = None
-        supers_required: list[str] = []
-        supers_single: list[str] = []
-        tag_edited: str = tag.upper()
-        extension_key: str = Default.EMPTY
-        if tag_edited[0] != Default.UNDERLINE:
-            tag_edited = ''.join([Default.UNDERLINE, tag_edited])
-        documented: bool = True
-        try:
-            yaml_dict = Util.read_yaml(yaml_file)
-        except Exception:
-            logging.info(
-                Msg.CANNOT_READ_YAML_FILE.format(yaml_file, tag_edited)
+            batch[yaml_file] = tag
+        yaml_dicts: list[dict[str, Any] | None] = []
+        if len(tags) > 1:
+            with ThreadPoolExecutor() as pool:
+                yaml_dicts = list(pool.map(self._read_extension_yaml, tags))
+        else:
+            yaml_dicts = [self._read_extension_yaml(item) for item in tags]
+
+        # Update the specification once with every documented extension.
+        extension_keys: list[str] = []
+        for yaml_dict in yaml_dicts:
+            extension_key: str = Default.EMPTY
+            if yaml_dict is not None:
+                extension_key = Names.keyname(str(yaml_dict[Default.YAML_URI]))
+                self.specification[str(yaml_dict[Default.YAML_TYPE])].update(
+                    {extension_key: deepcopy(yaml_dict)}
+                )
+                if yaml_dict[Default.YAML_TYPE] in (
+                    Default.YAML_TYPE_CALENDAR,
+                    Default.YAML_TYPE_MONTH,
+                ):
+                    Validate.date_specs_changed()
+            extension_keys.append(extension_key)
+        self.all_structure_tags.extend(
+            [
+                tag
+                for (tag, _), yaml_dict in zip(tags, yaml_dicts, strict=True)
+                if yaml_dict is not None
+            ]
+        )
+
+        attributes: list[ExtensionAttributes] = []
+        for (tag, yaml_file), yaml_dict, extension_key in zip(
+            tags, yaml_dicts, extension_keys, strict=True
+        ):
+            self.tag_counter += 1
+            if yaml_dict is None:
+                attributes.append(
+                    ExtensionAttributes(
+                        id=self.tag_counter,
+                        key=Default.EMPTY,
+                        tag=tag,
+                        yaml_file=yaml_file,
+                        yaml_type=Default.EMPTY,
+                        required=[],
+                        single=[],
+                        permitted=[],
+                        enumset_key=Default.EMPTY,
+                        enum_tags=[],
+                        payload=Default.EMPTY,
+                        supers=0,
+                        superstructures=None,
+                        supers_required=[],
+                        supers_single=[],
+                    )
+                )
+                continue
+            yaml_type: str = str(yaml_dict[Default.YAML_TYPE])
+            required: list[str] = Query.required(
+                extension_key, self.specification
             )
-            documented = False
-        self.tag_counter += 1
-        if documented:
-            self.all_structure_tags.append(tag)
-            yaml_type = str(yaml_dict[Default.YAML_TYPE])
-            extension_key = Names.keyname(str(yaml_dict[Default.YAML_URI]))
-            # if extension_key in self.specification[yaml_type]:
-            #     raise ValueError(Msg.EXTENSION_EXISTS.format(extension_key, yaml_type))
-            self.specification[yaml_type].update({extension_key: yaml_dict})
-            # match yaml_type:
-            #     case Default.YAML_TYPE_STRUCTURE:
-            required = Query.required(extension_key, self.specification)
-            single = Query.singular(extension_key, self.specification)
-            permitted = Query.permitted(extension_key, self.specification)
-            payload = Query.payload(extension_key, self.specification)
-            supers = Query.supers_count(extension_key, self.specification)
-            superstructures = Query.superstructures(
+            single: list[str] = Query.singular(
                 extension_key, self.specification
             )
-            supers_required = Query.supers_required(
+            permitted: list[str] = Query.permitted(
                 extension_key, self.specification
             )
-            supers_single = Query.supers_singular(
+            payload: str = Query.payload(extension_key, self.specification)
+            supers: int = Query.supers_count(extension_key, self.specification)
+            superstructures: list[str] | None = Query.superstructures(
+                extension_key, self.specification
+            )
+            supers_required: list[str] = Query.supers_required(
+                extension_key, self.specification
+            )
+            supers_single: list[str] = Query.supers_singular(
                 extension_key, self.specification
             )
             logging.info(f'superstructures = {superstructures}')
-            # case Default.YAML_TYPE_ENUMERATION:
             enumset_key, enum_tags = Query.enum_key_tags(
                 extension_key, self.specification
             )
+            self.ged_ext_yamls[yaml_file] = tag
             self.ged_ext_tags.append(
                 [
                     str(self.tag_counter),
@@ -458,26 +540,49 @@ class Genealogy:
                     permitted,
                     enumset_key,
                     enum_tags,
-                    yaml_dict,
+                    deepcopy(yaml_dict),
                 ]
             )
-        return ExtensionAttributes(
-            id=self.tag_counter,
-            key=extension_key,
-            tag=tag,
-            yaml_file=yaml_file,
-            yaml_type=yaml_type,
-            required=required,
-            single=single,
-            permitted=permitted,
-            enumset_key=enumset_key,
-            enum_tags=enum_tags,
-            payload=payload,
-            supers=supers,
-            superstructures=superstructures,
-            supers_required=supers_required,
-            supers_single=supers_single,
-        )
+            attributes.append(
+                ExtensionAttributes(
+                    id=self.tag_counter,
+                    key=extension_key,
+                    tag=tag,
+                    yaml_file=yaml_file,
+                    yaml_type=yaml_type,
+                    required=required,
+                    single=single,
+                    permitted=permitted,
+                    enumset_key=enumset_key,
+                    enum_tags=enum_tags,
+                    payload=payload,
+                    payload_id=Payload.resolve(payload),
+                    supers=supers,
+                    superstructures=superstructures,
+                    supers_required=supers_required,
+                    supers_single=supers_single,
+                )
+            )
+        return attributes
+
+    @staticmethod
+    def _read_extension_yaml(item: tuple[str, str]) -> dict[str, Any] | None:
+        """Read the yaml file of an extension tag returning None if it cannot be read.
+
+        Args:
+            item: A pair of the extension tag and the location of its yaml file.
+        """
+        tag, yaml_file = item
+        try:
+            return Util.read_yaml_cached(yaml_file)
+        except Exception:
+            tag_edited: str = tag.upper()
+            if tag_edited[0] != Default.UNDERLINE:
+                tag_edited = ''.join([Default.UNDERLINE, tag_edited])
+            logging.info(
+                Msg.CANNOT_READ_YAML_FILE.format(yaml_file, tag_edited)
+            )
+            return None
 
     def stage(
         self,
@@ -500,6 +605,383 @@ class Genealogy:
             self.record_header = record
         else:
             self.records.append(record)
+            if self.kinship_index is not None:
+                self.kinship_index.add(record)
+            if self.name_index is not None:
+                self.name_index.add(record)
+            if self.timeline_index is not None:
+                self.timeline_index.add(record)
+            if self.place_index is not None:
+                self.place_index.add(record)
+            if self.duplicate_index is not None:
+                self.duplicate_index.add(record)
+
+    def kinship(self) -> KinshipIndex:
+        """Return the index of the parents, children and spouses of the staged individuals.
+
+        The index is built from the staged records the first time it is requested.
+        Records staged afterwards are added to it as they are staged.
+        >>> from genedata.build import Genealogy
+        >>> import genedata.classes70 as gc
+        >>> g = Genealogy()
+        >>> husband = g.individual_xref('husband')
+        >>> wife = g.individual_xref('wife')
+        >>> family = g.family_xref('family')
+        >>> g.stage(gc.RecordFam(family, [gc.FamHusb(husband), gc.FamWife(wife)]))
+        >>> g.kinship().spouses(wife)
+        ['@HUSBAND@']
+        """
+        if self.kinship_index is None:
+            self.kinship_index = KinshipIndex()
+            self.kinship_index.build(self.records)
+        return self.kinship_index
+
+    def ancestors(
+        self, xref: IndividualXref | str, max_gen: int | None = None
+    ) -> dict[str, int]:
+        """Return the ancestors of an individual with the generation of each.
+
+        Parents are generation 1, grandparents generation 2 and so on.
+        An ancestor reached through several lines is reported at the nearest.
+        >>> from genedata.build import Genealogy
+        >>> import genedata.classes70 as gc
+        >>> g = Genealogy()
+        >>> grandmother = g.individual_xref('grandmother')
+        >>> mother = g.individual_xref('mother')
+        >>> child = g.individual_xref('child')
+        >>> g.stage(gc.RecordFam(g.family_xref(), [gc.FamWife(grandmother), gc.Chil(mother)]))
+        >>> g.stage(gc.RecordFam(g.family_xref(), [gc.FamWife(mother), gc.Chil(child)]))
+        >>> g.ancestors(child)
+        {'@MOTHER@': 1, '@GRANDMOTHER@': 2}
+        >>> g.ancestors(child, max_gen=1)
+        {'@MOTHER@': 1}
+        >>> g.descendants(grandmother)
+        {'@MOTHER@': 1, '@CHILD@': 2}
+
+        Args:
+            xref: The identifier of the individual.
+            max_gen: The last generation to include or None for all of them.
+        """
+        return self.kinship().traverse(xref, Kinship.PARENT, max_gen)
+
+    def descendants(
+        self, xref: IndividualXref | str, max_gen: int | None = None
+    ) -> dict[str, int]:
+        """Return the descendants of an individual with the generation of each.
+
+        Children are generation 1, grandchildren generation 2 and so on.
+
+        Args:
+            xref: The identifier of the individual.
+            max_gen: The last generation to include or None for all of them.
+        """
+        return self.kinship().traverse(xref, Kinship.CHILD, max_gen)
+
+    def common_ancestors(
+        self,
+        first: IndividualXref | str,
+        second: IndividualXref | str,
+        memoize: bool = True,
+    ) -> list[str]:
+        """Return the ancestors shared by two individuals.
+
+        The ancestor sets are kept as bitsets until another record is staged
+        so repeated queries about the same individuals are fast.
+        >>> from genedata.build import Genealogy
+        >>> import genedata.classes70 as gc
+        >>> g = Genealogy()
+        >>> mother = g.individual_xref('mother')
+        >>> sister = g.individual_xref('sister')
+        >>> brother = g.individual_xref('brother')
+        >>> g.stage(gc.RecordFam(g.family_xref(), [gc.FamWife(mother), gc.Chil(sister), gc.Chil(brother)]))
+        >>> g.common_ancestors(sister, brother)
+        ['@MOTHER@']
+
+        Args:
+            first: The identifier of one individual.
+            second: The identifier of the other individual.
+            memoize: Whether to keep the ancestor sets for later queries.
+        """
+        return self.kinship().common_ancestors(first, second, memoize)
+
+    def relationships(
+        self,
+        first: IndividualXref | str,
+        second: IndividualXref | str,
+        exclude: tuple[Pedigree, ...] = (),
+        max_gen: int | None = None,
+    ) -> list[Relationship]:
+        """Return how the second individual is related to the first.
+
+        Each result names the relationship, counts the generations up to and
+        down from the nearest common ancestors and lists the shortest paths
+        through them.  Individuals related in more than one way, as happens
+        after pedigree collapse, have more than one result.
+        >>> from genedata.build import Genealogy
+        >>> import genedata.classes70 as gc
+        >>> g = Genealogy()
+        >>> grandfather = g.individual_xref('grandfather')
+        >>> grandmother = g.individual_xref('grandmother')
+        >>> aunt = g.individual_xref('aunt')
+        >>> father = g.individual_xref('father')
+        >>> me = g.individual_xref('me')
+        >>> g.stage(gc.RecordFam(g.family_xref(), [gc.FamHusb(grandfather), gc.FamWife(grandmother), gc.Chil(aunt), gc.Chil(father)]))
+        >>> g.stage(gc.RecordFam(g.family_xref(), [gc.FamHusb(father), gc.Chil(me)]))
+        >>> relationship = g.relationships(me, aunt)[0]
+        >>> relationship.label
+        'aunt or uncle'
+        >>> relationship.ancestors
+        ['@GRANDFATHER@', '@GRANDMOTHER@']
+        >>> relationship.paths[0]
+        ['@ME@', '@FATHER@', '@GRANDFATHER@', '@AUNT@']
+
+        Args:
+            first: The identifier of the first individual.
+            second: The identifier of the second individual.
+            exclude: Parent links with these PEDI values are not followed.
+            max_gen: The most generations to search above each individual.
+        """
+        return self.kinship().relationships(first, second, exclude, max_gen)
+
+    def names(self) -> NameIndex:
+        """Return the index of the personal names of the staged individuals.
+
+        The index is built from the staged records the first time it is requested.
+        Records staged afterwards are added to it as they are staged.
+        >>> from genedata.build import Genealogy
+        >>> import genedata.classes70 as gc
+        >>> g = Genealogy()
+        >>> jim = g.individual_xref('jim')
+        >>> g.stage(gc.RecordIndi(jim, gc.IndiName('Jim /Smith/', gc.Nick('Jimmy'))))
+        >>> g.names().people['jimmy'] == {0}
+        True
+        """
+        if self.name_index is None:
+            self.name_index = NameIndex()
+            self.name_index.build(self.records)
+        return self.name_index
+
+    def search_names(
+        self,
+        query: str,
+        limit: int = Default.NAME_SEARCH_LIMIT,
+        fuzzy: bool = True,
+    ) -> list[NameMatch]:
+        """Return the individuals whose names best match a query, best first.
+
+        Words of the query match names exactly, as the start of a name, by
+        sounding alike or, if `fuzzy` is set, by sharing most of their letters.
+        >>> from genedata.build import Genealogy
+        >>> import genedata.classes70 as gc
+        >>> g = Genealogy()
+        >>> jim = g.individual_xref('jim')
+        >>> jane = g.individual_xref('jane')
+        >>> g.stage(gc.RecordIndi(jim, gc.IndiName('Jim /Smith/')))
+        >>> g.stage(gc.RecordIndi(jane, gc.IndiName('Jane /Smyth/')))
+        >>> [match.name for match in g.search_names('smith')]
+        ['Jim Smith', 'Jane Smyth']
+        >>> g.search_names('ja')[0]
+        NameMatch(xref='@JANE@', name='Jane Smyth', score=0.8)
+
+        Args:
+            query: One or more words of a name in any case.
+            limit: The most individuals to return.
+            fuzzy: Whether to include names that only share trigrams.
+        """
+        return self.names().search(query, limit, fuzzy)
+
+    def timeline(self) -> TimelineIndex:
+        """Return the index of the dated events of the staged individuals and families.
+
+        The index is built from the staged records the first time it is requested.
+        Records staged afterwards are added to it as they are staged.
+        >>> from genedata.build import Genealogy
+        >>> import genedata.classes70 as gc
+        >>> g = Genealogy()
+        >>> g.stage(gc.RecordIndi(g.individual_xref('jim'), gc.Deat('', gc.Date('1900'))))
+        >>> g.timeline().kind_names
+        ['DEAT', 'LIFE']
+        """
+        if self.timeline_index is None:
+            self.timeline_index = TimelineIndex(self.specification)
+            self.timeline_index.build(self.records)
+        return self.timeline_index
+
+    def events(
+        self,
+        first: int | str,
+        last: int | str | None = None,
+        kinds: list[str] | None = None,
+    ) -> list[TimelineEvent]:
+        """Return the events overlapping a day or range of days in order of their start.
+
+        Days are Julian day numbers or GEDCOM dates, which cover every day they may mean.
+        >>> from genedata.build import Genealogy
+        >>> import genedata.classes70 as gc
+        >>> g = Genealogy()
+        >>> family = g.family_xref('family')
+        >>> g.stage(gc.RecordFam(family, gc.Marr('', gc.Date('12 JUN 1855'))))
+        >>> g.events('1850', '1859', ['MARR'])
+        [TimelineEvent(xref='@FAMILY@', kind='MARR', earliest=2398747, latest=2398747)]
+
+        Args:
+            first: The first day of the range.
+            last: The last day of the range, which defaults to the end of `first`.
+            kinds: The event tags to keep such as ['MARR'] or all if None.
+        """
+        return self.timeline().overlapping(first, last, kinds)
+
+    def alive(self, first: int | str, last: int | str | None = None) -> list[str]:
+        """Return the individuals whose lives overlap a day or range of days.
+
+        A life runs from the first birth, christening or baptism to the last
+        death, burial or cremation.  When one end is unknown the life is taken
+        to last `Default.LIFESPAN_DAYS`.
+        >>> from genedata.build import Genealogy
+        >>> import genedata.classes70 as gc
+        >>> g = Genealogy()
+        >>> g.stage(gc.RecordIndi(g.individual_xref('jim'), [gc.Birt('', gc.Date('1820')), gc.Deat('', gc.Date('1870'))]))
+        >>> g.stage(gc.RecordIndi(g.individual_xref('jane'), gc.Birt('', gc.Date('1860'))))
+        >>> g.alive('1850')
+        ['@JIM@']
+        >>> g.alive('1865')
+        ['@JIM@', '@JANE@']
+
+        Args:
+            first: The first day of the range.
+            last: The last day of the range, which defaults to the end of `first`.
+        """
+        return self.timeline().alive(first, last)
+
+    def places(self) -> PlaceIndex:
+        """Return the index of the mapped places of the events of the staged records.
+
+        The index is built from the staged records the first time it is requested.
+        Records staged afterwards are added to it as they are staged.
+        >>> from genedata.build import Genealogy
+        >>> import genedata.classes70 as gc
+        >>> g = Genealogy()
+        >>> place = gc.Plac('Boston', gc.Map([gc.Lati('N42.36'), gc.Long('W71.06')]))
+        >>> g.stage(gc.RecordIndi(g.individual_xref('jim'), gc.Birt('', place)))
+        >>> g.places().place_names
+        ['Boston']
+        """
+        if self.place_index is None:
+            self.place_index = PlaceIndex()
+            self.place_index.build(self.records)
+        return self.place_index
+
+    def near(
+        self, latitude: float | str, longitude: float | str, km: float
+    ) -> list[PlaceMatch]:
+        """Return the events at places within a distance of a point, nearest first.
+
+        Coordinates are decimal degrees as returned by `Input.to_decimal` or
+        LATI and LONG payloads.
+        >>> from genedata.build import Genealogy
+        >>> import genedata.classes70 as gc
+        >>> g = Genealogy()
+        >>> place = gc.Plac('Boston', gc.Map([gc.Lati('N42.36'), gc.Long('W71.06')]))
+        >>> g.stage(gc.RecordIndi(g.individual_xref('jim'), gc.Birt('', place)))
+        >>> [(match.xref, match.event, round(match.km)) for match in g.near('N41.82', 'W71.41', 100)]
+        [('@JIM@', 'BIRT', 67)]
+
+        Args:
+            latitude: The latitude of the point.
+            longitude: The longitude of the point.
+            km: The greatest great circle distance in kilometres.
+        """
+        return self.places().within(latitude, longitude, km)
+
+    def in_box(
+        self,
+        south: float | str,
+        west: float | str,
+        north: float | str,
+        east: float | str,
+    ) -> list[PlaceMatch]:
+        """Return the events at places inside a bounding box.
+
+        A box whose western edge is east of its eastern edge crosses the antimeridian.
+        >>> from genedata.build import Genealogy
+        >>> import genedata.classes70 as gc
+        >>> g = Genealogy()
+        >>> place = gc.Plac('Suva', gc.Map([gc.Lati('S18.14'), gc.Long('E178.44')]))
+        >>> g.stage(gc.RecordIndi(g.individual_xref('jim'), gc.Emig('', place)))
+        >>> [match.place for match in g.in_box(-20, 170, -10, -170)]
+        ['Suva']
+
+        Args:
+            south: The southern edge.
+            west: The western edge.
+            north: The northern edge.
+            east: The eastern edge.
+        """
+        return self.places().box(south, west, north, east)
+
+    def nearest_places(
+        self, latitude: float | str, longitude: float | str, count: int = 1
+    ) -> list[PlaceMatch]:
+        """Return the events at the nearest mapped places to a point, nearest first.
+
+        >>> from genedata.build import Genealogy
+        >>> import genedata.classes70 as gc
+        >>> g = Genealogy()
+        >>> boston = gc.Plac('Boston', gc.Map([gc.Lati('N42.36'), gc.Long('W71.06')]))
+        >>> paris = gc.Plac('Paris', gc.Map([gc.Lati('N48.86'), gc.Long('E2.35')]))
+        >>> g.stage(gc.RecordIndi(g.individual_xref('jim'), [gc.Birt('', boston), gc.Deat('', paris)]))
+        >>> [match.place for match in g.nearest_places(51.5, -0.13)]
+        ['Paris']
+
+        Args:
+            latitude: The latitude of the point.
+            longitude: The longitude of the point.
+            count: The number of distinct places to return.
+        """
+        return self.places().nearest(latitude, longitude, count)
+
+    def duplicates(self) -> DuplicateIndex:
+        """Return the index of the blocks and scores of possibly duplicate individuals.
+
+        The index is built from the staged records the first time it is requested.
+        Records staged afterwards are added to it as they are staged and are
+        scored against their blocks by the next query.
+        >>> from genedata.build import Genealogy
+        >>> import genedata.classes70 as gc
+        >>> g = Genealogy()
+        >>> g.stage(gc.RecordIndi(g.individual_xref('jim'), gc.IndiName('Jim /Smith/')))
+        >>> g.duplicates().blocks
+        {('S530', None): [0]}
+        """
+        if self.duplicate_index is None:
+            self.duplicate_index = DuplicateIndex(self.specification)
+            self.duplicate_index.build(self.records)
+        return self.duplicate_index
+
+    def duplicate_clusters(
+        self,
+        threshold: float = Default.DUPLICATE_THRESHOLD,
+        workers: int | None = None,
+    ) -> list[DuplicateCluster]:
+        """Return the groups of individuals that may be the same person, most confident first.
+
+        Individuals are only compared with those whose surname sounds the
+        same and who were born within about ten years of them.
+        >>> from genedata.build import Genealogy
+        >>> import genedata.classes70 as gc
+        >>> g = Genealogy()
+        >>> birth = gc.Birt('', [gc.Date('2 MAR 1850'), gc.Plac('Boston')])
+        >>> g.stage(gc.RecordIndi(g.individual_xref('jim'), [gc.IndiName('Jimmy /Smith/'), birth]))
+        >>> g.stage(gc.RecordIndi(g.individual_xref('jimmy'), [gc.IndiName('Jim /Smith/'), birth]))
+        >>> g.duplicate_clusters()
+        [DuplicateCluster(xrefs=['@JIM@', '@JIMMY@'], confidence=0.815)]
+
+        Args:
+            threshold: The lowest score joining two individuals.
+            workers: The number of processes scoring large batches of pairs,
+                which defaults to the number of processors.
+        """
+        return self.duplicates().clusters(threshold, workers)
 
     def show_ged(self) -> str:
         """Display the ged file constructed by this instance of the Genealogy class.
@@ -1137,14 +1619,13 @@ print(ged_file)
     def _set_xref(
         self, xref_list: list[str], xref: str, xref_name: str = ''
     ) -> None:
-        if xref in self.all_xrefs:
-            raise ValueError(Msg.XREF_EXISTS.format(xref, xref_name))
-        self.all_xrefs.update({xref: f'xref_{xref.replace(Default.ATSIGN, Default.EMPTY)}'})
-        if xref in xref_list:
+        # Every typed list holds the void pointer and a subset of the
+        # `all_xrefs` dictionary, so these find an identifier of any type.
+        if xref in self.all_xrefs or xref == Void.NAME:
             raise ValueError(Msg.XREF_EXISTS.format(xref, xref_name))
+        self.all_xrefs[xref] = f'xref_{xref.replace(Default.ATSIGN, Default.EMPTY)}'
         xref_list.append(xref)
 
-
     def _format_name(self, name: str = '', counter: str = '') -> str:
         return ''.join(
             [
@@ -1202,6 +1683,46 @@ print(ged_file)
         self._set_xref(xref_list, xref, xref_name)
         return xref
 
+    def _counters(
+        self,
+        xref_list: list[str],
+        xref_names: Iterable[str],
+        initial: bool = False,
+    ) -> list[str]:
+        """
+        Return a unique string for each of many names as `_counter` would.
+
+        The identifiers are checked against each other and those already
+        created before any is kept, so either all of them are created or,
+        if one already exists, none is and the counter is unchanged.
+
+        Exception:
+            ValueError if a name is used twice.
+
+        Parameters:
+
+        - `xref_list`: a list of string values one for each of the seven record types.
+        - `xref_names`: the names to identify the records with.  An empty name
+          is numbered by the counter.
+        - `initial`: a boolean whether to use each name as
+          an initial part of a numeric string. By default this is False.
+        """
+        counter: int = self.xref_counter
+        batch: dict[str, str] = {}
+        for xref_name in xref_names:
+            if xref_name == '' or initial:
+                xref: str = self._format_name(xref_name, str(counter))
+                counter += 1
+            else:
+                xref = self._format_name(xref_name)
+            if xref in self.all_xrefs or xref in batch or xref == Void.NAME:
+                raise ValueError(Msg.XREF_EXISTS.format(xref, xref_name))
+            batch[xref] = f'xref_{xref.replace(Default.ATSIGN, Default.EMPTY)}'
+        self.xref_counter = counter
+        self.all_xrefs.update(batch)
+        xref_list.extend(batch)
+        return list(batch)
+
     def family_xref(
         self, xref_name: str = '', initial: bool = False
     ) -> FamilyXref:
@@ -1261,6 +1782,42 @@ print(ged_file)
         )
         return FamilyXref(family_xref)
 
+    def family_xrefs(
+        self, xref_names: Iterable[str], initial: bool = False
+    ) -> list[FamilyXref]:
+        """
+        Create a FamilyXref identifier for each of many names at once.
+
+        Each name gives the identifier `family_xref` would give it and an
+        empty name is numbered by the counter.  If any identifier already
+        exists none of them is created.
+
+        Args:
+            xref_names: The names for the identifiers.
+            initial (bool, optional): Whether to use each name as an initial
+                value with an integer following. Defaults to False.
+
+        Returns:
+            list[FamilyXref]: The unique identifiers in the order of the names.
+
+        Examples:
+            >>> from genedata.build import Genealogy
+            >>> a = Genealogy()
+            >>> [str(xref) for xref in a.family_xrefs(['', ''])]
+            ['@1@', '@2@']
+            >>> a.family_xrefs(['smith', 'smith'])
+            Traceback (most recent call last):
+            ValueError: The identifier "@SMITH@" built from "smith" already exists.
+
+        See Also:
+            - `family_xref`: create a typed identifier for a family record.
+            - `individual_xrefs`: create typed identifiers for many individual records.
+        """
+        return [
+            FamilyXref(xref)
+            for xref in self._counters(self.family_xreflist, xref_names, initial)
+        ]
+
     def individual_xref(
         self, xref_name: str = '', initial: bool = False
     ) -> IndividualXref:
@@ -1326,6 +1883,48 @@ print(ged_file)
         )
         return IndividualXref(individual_xref)
 
+    def individual_xrefs(
+        self, xref_names: Iterable[str], initial: bool = False
+    ) -> list[IndividualXref]:
+        """
+        Create an IndividualXref identifier for each of many names at once.
+
+        Each name gives the identifier `individual_xref` would give it and an
+        empty name is numbered by the counter.  If any identifier already
+        exists none of them is created.
+
+        Args:
+            xref_names: The names for the identifiers.
+            initial (bool, optional): Whether to use each name as an initial
+                value with an integer following. Defaults to False.
+
+        Returns:
+            list[IndividualXref]: The unique identifiers in the order of the names.
+
+        Examples:
+            >>> from genedata.build import Genealogy
+            >>> a = Genealogy()
+            >>> [str(xref) for xref in a.individual_xrefs(['joe', 'jane', ''])]
+            ['@JOE@', '@JANE@', '@1@']
+            >>> [str(xref) for xref in a.individual_xrefs(['I'] * 2, True)]
+            ['@I2@', '@I3@']
+            >>> a.individual_xrefs(['jim', 'joe'])
+            Traceback (most recent call last):
+            ValueError: The identifier "@JOE@" built from "joe" already exists.
+            >>> a.individual_xref('jim')
+            IndividualXref('@JIM@')
+
+        See Also:
+            - `individual_xref`: create a typed identifier for an individual record.
+            - `family_xrefs`: create typed identifiers for many family records.
+        """
+        return [
+            IndividualXref(xref)
+            for xref in self._counters(
+                self.individual_xreflist, xref_names, initial
+            )
+        ]
+
     def multimedia_xref(
         self, xref_name: str = '', initial: bool = False
     ) -> MultimediaXref:
@@ -1701,13 +2300,12 @@ print(ged_file)
         return ExtensionXref(extension_xref)
 
     def _gather(self, records: list[Any], xref_list: list[str]) -> str:
-        destination = ''
-        unique_list: list[str] = []
+        destination: list[str] = []
+        unique: set[str] = set()
         for record in records:
-            # if record.xref.fullname not in unique_list:
-            if record.value.fullname not in unique_list:
-                unique_list.append(record.value.fullname)
-                destination = ''.join([destination, record.ged()])
+            if record.value.fullname not in unique:
+                unique.add(record.value.fullname)
+                destination.append(record.ged())
             else:
                 raise ValueError(
                     Msg.DUPLICATE_RECORD.format(record.value.fullname)
@@ -1715,11 +2313,11 @@ print(ged_file)
         missing = [
             xref
             for xref in xref_list
-            if xref not in unique_list and xref != Void.NAME
+            if xref not in unique and xref != Void.NAME
         ]
         if len(missing) > 0:
             raise ValueError(Msg.MISSING.format(missing))
-        return destination
+        return ''.join(destination)
 
     def families(self, records: list[Any]) -> None:
         """Collect and store all family records for the genealogy.
@@ -2115,5 +2713,102 @@ print(ged_file)
                 name if a pandas DataFrame were used to display the dictionary."""
         return Query.record_counts(
             self.ged_file,
+            self.specification,
             column=column,
         )
+
+    def stats(self, file: str = Default.EMPTY) -> GedSummary:
+        """Return the statistics of the loaded ged file or of another file.
+
+        The lines are counted in one pass.  A file named here is read one line at a
+        time so files too large to load can be summarized.
+        >>> from genedata.build import Genealogy
+        >>> g = Genealogy()
+        >>> g.ged_file = '0 HEAD\\n1 GEDC\\n2 VERS 7.0\\n0 @I1@ INDI\\n1 FAMS @F1@\\n0 @F1@ FAM\\n0 TRLR'
+        >>> summary = g.stats()
+        >>> summary.records
+        {'FAM': 1, 'INDI': 1, 'OBJE': 0, 'REPO': 0, 'SNOTE': 0, 'SOUR': 0, 'SUBM': 0}
+        >>> summary.tags[1], summary.xrefs, summary.pointers
+        ({'FAMS': 1, 'GEDC': 1}, 2, 1)
+
+        Args:
+            file: The name of a ged file to read instead of the loaded one.
+        """
+        statistics: GedStatistics = GedStatistics(
+            GedStatistics.spec_record_types(self.specification)
+        )
+        if file != Default.EMPTY:
+            return statistics.file(file).summary()
+        return statistics.text(self.ged_file).summary()
+
+    def date_intervals(self) -> dict[str, list[Any]]:
+        """Return the interval of Julian day numbers of every staged date as columns.
+
+        Each row is a `Date`, `DateExact`, `DataEvenDate` or `HeadDate` structure
+        in the header or a staged record.  Open ends of intervals are None.
+        >>> from genedata.build import Genealogy
+        >>> import genedata.classes70 as gc
+        >>> g = Genealogy()
+        >>> indi_xref = g.individual_xref('1')
+        >>> g.stage(gc.RecordIndi(indi_xref, gc.Birt('', gc.Date('BEF 1900'))))
+        >>> g.date_intervals()
+        {'Record': ['@1@'], 'Structure': ['Date'], 'Earliest': [None], 'Latest': [2415020], 'Qualifier': ['BEF'], 'Calendar': ['GREGORIAN']}
+
+        This would be better formatted if the dictionary were passed through pandas.
+        >>> import pandas as pd
+        >>> pd.DataFrame(g.date_intervals())
+          Record Structure Earliest   Latest Qualifier   Calendar
+        0    @1@      Date     None  2415020       BEF  GREGORIAN
+        """
+        columns: dict[str, list[Any]] = {
+            Default.COLUMN_RECORD: [],
+            Default.COLUMN_STRUCTURE: [],
+            Default.COLUMN_EARLIEST: [],
+            Default.COLUMN_LATEST: [],
+            Default.COLUMN_QUALIFIER: [],
+            Default.COLUMN_CALENDAR: [],
+        }
+        records: list[Any] = self.records
+        if self.record_header is not None:
+            records = [self.record_header, *self.records]
+        for record in records:
+            name: str = record.tag
+            if isinstance(record.value, Xref):
+                name = record.value.fullname
+            for class_name, interval in record.intervals(self.specification):
+                columns[Default.COLUMN_RECORD].append(name)
+                columns[Default.COLUMN_STRUCTURE].append(class_name)
+                columns[Default.COLUMN_EARLIEST].append(interval.earliest)
+                columns[Default.COLUMN_LATEST].append(interval.latest)
+                columns[Default.COLUMN_QUALIFIER].append(interval.qualifier)
+                columns[Default.COLUMN_CALENDAR].append(interval.calendar)
+        return columns
+
+    def to_frames(self) -> dict[str, Any]:
+        """Return the staged records as tidy pandas DataFrames keyed by table name.
+
+        The tables are `individuals`, `names`, `families`, `members`, `events`,
+        `sources` and `citations`.  They are built in one pass over the records
+        from lists of column values and may be saved with `DataFrame.to_parquet`
+        or `DataFrame.to_feather`.  Pandas is only imported when this is called.
+        >>> from genedata.build import Genealogy
+        >>> import genedata.classes70 as gc
+        >>> g = Genealogy()
+        >>> jim = g.individual_xref('jim')
+        >>> family = g.family_xref('family')
+        >>> g.stage(gc.RecordIndi(jim, [gc.IndiName('Jim /Smith/'), gc.Fams(family)]))
+        >>> g.stage(gc.RecordFam(family, [gc.FamHusb(jim), gc.Marr('', [gc.Date('1865'), gc.Plac('Boston')])]))
+        >>> frames = g.to_frames()
+        >>> frames['members']
+             Family Individual  Role Pedigree    Record
+        0  @FAMILY@      @JIM@  FAMS     None     @JIM@
+        1  @FAMILY@      @JIM@  HUSB     None  @FAMILY@
+        >>> frames['events'][['Record', 'Event', 'Date', 'Earliest', 'Place']]
+             Record Event  Date  Earliest   Place
+        0  @FAMILY@  MARR  1865   2402238  Boston
+        """
+        from genedata.frames import Frames  # noqa: PLC0415
+
+        frames: Frames = Frames(self.specification)
+        frames.build(self.records)
+        return frames.frames()
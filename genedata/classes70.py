@@ -189,9 +189,11 @@ __all__ = [    # noqa: RUF022
 ]
 
 import logging
-from typing import Any
+from typing import Any, ClassVar
 
+from genedata.constants import PayloadType
 from genedata.messages import Msg
+from genedata.methods import Validate
 from genedata.structure import (
     BaseStructure,
     FamilyXref,
@@ -231,6 +233,7 @@ class Abbr(BaseStructure):
     - [GEDCOM ABBR Structure](https://gedcom.io/terms/v7/ABBR)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -249,6 +252,16 @@ class Abbr(BaseStructure):
             class_name='Abbr',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Addr(BaseStructure):
     '''Store, validate and format the ADDR structure. 
@@ -370,6 +383,7 @@ class Addr(BaseStructure):
     - [GEDCOM ADDR Structure](https://gedcom.io/terms/v7/ADDR)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -388,6 +402,16 @@ class Addr(BaseStructure):
             class_name='Addr',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Adr1', 'Adr2', 'Adr3', 'City', 'Ctry', 'Post', 'Stae'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Adr1', 'Adr2', 'Adr3', 'City', 'Ctry', 'Post', 'Stae'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class AdopFamc(BaseStructure):
     '''Store, validate and format the FAMC structure. 
@@ -428,6 +452,7 @@ class AdopFamc(BaseStructure):
     - [GEDCOM FAMC Structure](https://gedcom.io/terms/v7/ADOP-FAMC)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.FAMILY_XREF
     
     def __init__(self, value: FamilyXref, subs: Any = None) -> None:
         super().__init__(
@@ -446,6 +471,16 @@ class AdopFamc(BaseStructure):
             class_name='AdopFamc',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['FamcAdop'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['FamcAdop'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        self._validate_xref(FamilyXref, Msg.NOT_FAMILY_XREF, str)
+    
 
 class Adop(BaseStructure):
     '''Store, validate and format the ADOP structure. 
@@ -508,6 +543,7 @@ class Adop(BaseStructure):
     - [GEDCOM ADOP Structure](https://gedcom.io/terms/v7/ADOP)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.Y_OR_NULL
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -526,6 +562,16 @@ class Adop(BaseStructure):
             class_name='Adop',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'AdopFamc', 'Age', 'Agnc', 'Caus', 'Date', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'AdopFamc', 'Age', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.y_or_null(self.value, self.class_name)
+    
 
 class Adr1(BaseStructure):
     '''Store, validate and format the ADR1 structure. 
@@ -563,6 +609,7 @@ class Adr1(BaseStructure):
     - [GEDCOM ADR1 Structure](https://gedcom.io/terms/v7/ADR1)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -582,6 +629,16 @@ class Adr1(BaseStructure):
         )
         logging.info(Msg.DEPRECATION_WARNING.format(self.class_name))
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Adr2(BaseStructure):
     '''Store, validate and format the ADR2 structure. 
@@ -619,6 +676,7 @@ class Adr2(BaseStructure):
     - [GEDCOM ADR2 Structure](https://gedcom.io/terms/v7/ADR2)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -638,6 +696,16 @@ class Adr2(BaseStructure):
         )
         logging.info(Msg.DEPRECATION_WARNING.format(self.class_name))
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Adr3(BaseStructure):
     '''Store, validate and format the ADR3 structure. 
@@ -675,6 +743,7 @@ class Adr3(BaseStructure):
     - [GEDCOM ADR3 Structure](https://gedcom.io/terms/v7/ADR3)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -694,6 +763,16 @@ class Adr3(BaseStructure):
         )
         logging.info(Msg.DEPRECATION_WARNING.format(self.class_name))
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Age(BaseStructure):
     '''Store, validate and format the AGE structure. 
@@ -766,6 +845,7 @@ class Age(BaseStructure):
     - [GEDCOM AGE Structure](https://gedcom.io/terms/v7/AGE)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.AGE
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -784,6 +864,16 @@ class Age(BaseStructure):
             class_name='Age',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Phrase'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Phrase'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.age(self.value, self.class_name)
+    
 
 class Agnc(BaseStructure):
     '''Store, validate and format the AGNC structure. 
@@ -866,6 +956,7 @@ class Agnc(BaseStructure):
     - [GEDCOM AGNC Structure](https://gedcom.io/terms/v7/AGNC)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -884,6 +975,16 @@ class Agnc(BaseStructure):
             class_name='Agnc',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Alia(BaseStructure):
     '''Store, validate and format the ALIA structure. 
@@ -931,6 +1032,7 @@ class Alia(BaseStructure):
     - [GEDCOM ALIA Structure](https://gedcom.io/terms/v7/ALIA)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.INDIVIDUAL_XREF
     
     def __init__(self, value: IndividualXref, subs: Any = None) -> None:
         super().__init__(
@@ -949,6 +1051,16 @@ class Alia(BaseStructure):
             class_name='Alia',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Phrase'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Phrase'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        self._validate_xref(IndividualXref, Msg.NOT_INDIVIDUAL_XREF, str)
+    
 
 class Anci(BaseStructure):
     '''Store, validate and format the ANCI structure. 
@@ -977,6 +1089,7 @@ class Anci(BaseStructure):
     - [GEDCOM ANCI Structure](https://gedcom.io/terms/v7/ANCI)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.SUBMITTER_XREF
     
     def __init__(self, value: SubmitterXref) -> None:
         super().__init__(
@@ -995,6 +1108,16 @@ class Anci(BaseStructure):
             class_name='Anci',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        self._validate_xref(SubmitterXref, Msg.NOT_SUBMITTER_XREF, str)
+    
 
 class Anul(BaseStructure):
     '''Store, validate and format the ANUL structure. 
@@ -1056,6 +1179,7 @@ class Anul(BaseStructure):
     - [GEDCOM ANUL Structure](https://gedcom.io/terms/v7/ANUL)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.Y_OR_NULL
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -1074,6 +1198,16 @@ class Anul(BaseStructure):
             class_name='Anul',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Agnc', 'Caus', 'Date', 'Husb', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type', 'Wife'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Husb', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Wife', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.y_or_null(self.value, self.class_name)
+    
 
 class Asso(BaseStructure):
     '''Store, validate and format the ASSO structure. 
@@ -1221,6 +1355,7 @@ class Asso(BaseStructure):
     - [GEDCOM ASSO Structure](https://gedcom.io/terms/v7/ASSO)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.INDIVIDUAL_XREF
     
     def __init__(self, value: IndividualXref, subs: Any) -> None:
         super().__init__(
@@ -1239,6 +1374,16 @@ class Asso(BaseStructure):
             class_name='Asso',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset(['Role'])
+    single_set: ClassVar[frozenset[str]] = frozenset(['Phrase', 'Role'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Note', 'Phrase', 'Role', 'Snote', 'Sour'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        self._validate_xref(IndividualXref, Msg.NOT_INDIVIDUAL_XREF, str)
+    
 
 class Auth(BaseStructure):
     '''Store, validate and format the AUTH structure. 
@@ -1269,6 +1414,7 @@ class Auth(BaseStructure):
     - [GEDCOM AUTH Structure](https://gedcom.io/terms/v7/AUTH)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -1287,6 +1433,16 @@ class Auth(BaseStructure):
             class_name='Auth',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Bapl(BaseStructure):
     '''Store, validate and format the BAPL structure. 
@@ -1330,6 +1486,7 @@ class Bapl(BaseStructure):
     - [GEDCOM BAPL Structure](https://gedcom.io/terms/v7/BAPL)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.NONE
     
     def __init__(self, subs: Any = None) -> None:
         super().__init__(
@@ -1348,6 +1505,15 @@ class Bapl(BaseStructure):
             class_name='Bapl',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Date', 'Plac', 'Temp', 'OrdStat'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Date', 'Note', 'Plac', 'Snote', 'Sour', 'Temp', 'OrdStat'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+    
 
 class Bapm(BaseStructure):
     '''Store, validate and format the BAPM structure. 
@@ -1408,6 +1574,7 @@ class Bapm(BaseStructure):
     - [GEDCOM BAPM Structure](https://gedcom.io/terms/v7/BAPM)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.Y_OR_NULL
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -1426,6 +1593,16 @@ class Bapm(BaseStructure):
             class_name='Bapm',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Caus', 'Date', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.y_or_null(self.value, self.class_name)
+    
 
 class Barm(BaseStructure):
     '''Store, validate and format the BARM structure. 
@@ -1486,6 +1663,7 @@ class Barm(BaseStructure):
     - [GEDCOM BARM Structure](https://gedcom.io/terms/v7/BARM)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.Y_OR_NULL
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -1504,6 +1682,16 @@ class Barm(BaseStructure):
             class_name='Barm',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Caus', 'Date', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.y_or_null(self.value, self.class_name)
+    
 
 class Basm(BaseStructure):
     '''Store, validate and format the BASM structure. 
@@ -1565,6 +1753,7 @@ class Basm(BaseStructure):
     - [GEDCOM BASM Structure](https://gedcom.io/terms/v7/BASM)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.Y_OR_NULL
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -1583,6 +1772,16 @@ class Basm(BaseStructure):
             class_name='Basm',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Caus', 'Date', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.y_or_null(self.value, self.class_name)
+    
 
 class Birt(BaseStructure):
     '''Store, validate and format the BIRT structure. 
@@ -1644,6 +1843,7 @@ class Birt(BaseStructure):
     - [GEDCOM BIRT Structure](https://gedcom.io/terms/v7/BIRT)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.Y_OR_NULL
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -1662,6 +1862,16 @@ class Birt(BaseStructure):
             class_name='Birt',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Caus', 'Date', 'Famc', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Famc', 'Fax', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.y_or_null(self.value, self.class_name)
+    
 
 class Bles(BaseStructure):
     '''Store, validate and format the BLES structure. 
@@ -1723,6 +1933,7 @@ class Bles(BaseStructure):
     - [GEDCOM BLES Structure](https://gedcom.io/terms/v7/BLES)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.Y_OR_NULL
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -1741,6 +1952,16 @@ class Bles(BaseStructure):
             class_name='Bles',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Caus', 'Date', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.y_or_null(self.value, self.class_name)
+    
 
 class Buri(BaseStructure):
     '''Store, validate and format the BURI structure. 
@@ -1809,6 +2030,7 @@ class Buri(BaseStructure):
     - [GEDCOM BURI Structure](https://gedcom.io/terms/v7/BURI)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.Y_OR_NULL
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -1827,6 +2049,16 @@ class Buri(BaseStructure):
             class_name='Buri',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Caus', 'Date', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.y_or_null(self.value, self.class_name)
+    
 
 class Caln(BaseStructure):
     '''Store, validate and format the CALN structure. 
@@ -1862,6 +2094,7 @@ class Caln(BaseStructure):
     - [GEDCOM CALN Structure](https://gedcom.io/terms/v7/CALN)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -1880,6 +2113,16 @@ class Caln(BaseStructure):
             class_name='Caln',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Medi'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Medi'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Cast(BaseStructure):
     '''Store, validate and format the CAST structure. 
@@ -1941,6 +2184,7 @@ class Cast(BaseStructure):
     - [GEDCOM CAST Structure](https://gedcom.io/terms/v7/CAST)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -1959,6 +2203,16 @@ class Cast(BaseStructure):
             class_name='Cast',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Caus', 'Date', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Caus(BaseStructure):
     '''Store, validate and format the CAUS structure. 
@@ -2038,6 +2292,7 @@ class Caus(BaseStructure):
     - [GEDCOM CAUS Structure](https://gedcom.io/terms/v7/CAUS)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -2056,6 +2311,16 @@ class Caus(BaseStructure):
             class_name='Caus',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Chan(BaseStructure):
     '''Store, validate and format the CHAN structure. 
@@ -2105,6 +2370,7 @@ class Chan(BaseStructure):
     - [GEDCOM CHAN Structure](https://gedcom.io/terms/v7/CHAN)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.NONE
     
     def __init__(self, subs: Any) -> None:
         super().__init__(
@@ -2123,6 +2389,15 @@ class Chan(BaseStructure):
             class_name='Chan',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset(['DateExact'])
+    single_set: ClassVar[frozenset[str]] = frozenset(['DateExact'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['DateExact', 'Note', 'Snote'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+    
 
 class Chil(BaseStructure):
     '''Store, validate and format the CHIL structure. 
@@ -2157,6 +2432,7 @@ class Chil(BaseStructure):
     - [GEDCOM CHIL Structure](https://gedcom.io/terms/v7/CHIL)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.INDIVIDUAL_XREF
     
     def __init__(self, value: IndividualXref, subs: Any = None) -> None:
         super().__init__(
@@ -2175,6 +2451,16 @@ class Chil(BaseStructure):
             class_name='Chil',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Phrase'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Phrase'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        self._validate_xref(IndividualXref, Msg.NOT_INDIVIDUAL_XREF, str)
+    
 
 class Chr(BaseStructure):
     '''Store, validate and format the CHR structure. 
@@ -2236,6 +2522,7 @@ class Chr(BaseStructure):
     - [GEDCOM CHR Structure](https://gedcom.io/terms/v7/CHR)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.Y_OR_NULL
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -2254,6 +2541,16 @@ class Chr(BaseStructure):
             class_name='Chr',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Caus', 'Date', 'Famc', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Famc', 'Fax', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.y_or_null(self.value, self.class_name)
+    
 
 class Chra(BaseStructure):
     '''Store, validate and format the CHRA structure. 
@@ -2314,6 +2611,7 @@ class Chra(BaseStructure):
     - [GEDCOM CHRA Structure](https://gedcom.io/terms/v7/CHRA)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.Y_OR_NULL
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -2332,6 +2630,16 @@ class Chra(BaseStructure):
             class_name='Chra',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Caus', 'Date', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.y_or_null(self.value, self.class_name)
+    
 
 class City(BaseStructure):
     '''Store, validate and format the CITY structure. 
@@ -2360,6 +2668,7 @@ class City(BaseStructure):
     - [GEDCOM CITY Structure](https://gedcom.io/terms/v7/CITY)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -2378,6 +2687,16 @@ class City(BaseStructure):
             class_name='City',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Conf(BaseStructure):
     '''Store, validate and format the CONF structure. 
@@ -2438,6 +2757,7 @@ class Conf(BaseStructure):
     - [GEDCOM CONF Structure](https://gedcom.io/terms/v7/CONF)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.Y_OR_NULL
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -2456,6 +2776,16 @@ class Conf(BaseStructure):
             class_name='Conf',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Caus', 'Date', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.y_or_null(self.value, self.class_name)
+    
 
 class Conl(BaseStructure):
     '''Store, validate and format the CONL structure. 
@@ -2499,6 +2829,7 @@ class Conl(BaseStructure):
     - [GEDCOM CONL Structure](https://gedcom.io/terms/v7/CONL)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.NONE
     
     def __init__(self, subs: Any = None) -> None:
         super().__init__(
@@ -2517,6 +2848,15 @@ class Conl(BaseStructure):
             class_name='Conl',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Date', 'Plac', 'Temp', 'OrdStat'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Date', 'Note', 'Plac', 'Snote', 'Sour', 'Temp', 'OrdStat'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+    
 
 class Copr(BaseStructure):
     '''Store, validate and format the COPR structure. 
@@ -2546,6 +2886,7 @@ class Copr(BaseStructure):
     - [GEDCOM COPR Structure](https://gedcom.io/terms/v7/COPR)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -2564,6 +2905,16 @@ class Copr(BaseStructure):
             class_name='Copr',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Corp(BaseStructure):
     '''Store, validate and format the CORP structure. 
@@ -2602,6 +2953,7 @@ class Corp(BaseStructure):
     - [GEDCOM CORP Structure](https://gedcom.io/terms/v7/CORP)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -2620,6 +2972,16 @@ class Corp(BaseStructure):
             class_name='Corp',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Email', 'Fax', 'Phon', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Crea(BaseStructure):
     '''Store, validate and format the CREA structure. 
@@ -2663,6 +3025,7 @@ class Crea(BaseStructure):
     - [GEDCOM CREA Structure](https://gedcom.io/terms/v7/CREA)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.NONE
     
     def __init__(self, subs: Any) -> None:
         super().__init__(
@@ -2681,6 +3044,15 @@ class Crea(BaseStructure):
             class_name='Crea',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset(['DateExact'])
+    single_set: ClassVar[frozenset[str]] = frozenset(['DateExact'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['DateExact'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+    
 
 class Crem(BaseStructure):
     '''Store, validate and format the CREM structure. 
@@ -2741,6 +3113,7 @@ class Crem(BaseStructure):
     - [GEDCOM CREM Structure](https://gedcom.io/terms/v7/CREM)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.Y_OR_NULL
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -2759,6 +3132,16 @@ class Crem(BaseStructure):
             class_name='Crem',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Caus', 'Date', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.y_or_null(self.value, self.class_name)
+    
 
 class Crop(BaseStructure):
     '''Store, validate and format the CROP structure. 
@@ -2815,6 +3198,7 @@ class Crop(BaseStructure):
     - [GEDCOM CROP Structure](https://gedcom.io/terms/v7/CROP)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.NONE
     
     def __init__(self, subs: Any = None) -> None:
         super().__init__(
@@ -2833,6 +3217,15 @@ class Crop(BaseStructure):
             class_name='Crop',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Height', 'Left', 'Top', 'Width'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Height', 'Left', 'Top', 'Width'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+    
 
 class Ctry(BaseStructure):
     '''Store, validate and format the CTRY structure. 
@@ -2861,6 +3254,7 @@ class Ctry(BaseStructure):
     - [GEDCOM CTRY Structure](https://gedcom.io/terms/v7/CTRY)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -2879,6 +3273,16 @@ class Ctry(BaseStructure):
             class_name='Ctry',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class DataEvenDate(BaseStructure):
     '''Store, validate and format the DATE structure. 
@@ -2913,6 +3317,7 @@ class DataEvenDate(BaseStructure):
     - [GEDCOM DATE Structure](https://gedcom.io/terms/v7/DATA-EVEN-DATE)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.DATE_PERIOD
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -2931,6 +3336,16 @@ class DataEvenDate(BaseStructure):
             class_name='DataEvenDate',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Phrase'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Phrase'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.date_period(self.value, self.class_name, specs)
+    
 
 class DataEven(BaseStructure):
     '''Store, validate and format the EVEN structure. 
@@ -3017,6 +3432,7 @@ class DataEven(BaseStructure):
     - [GEDCOM EVEN Structure](https://gedcom.io/terms/v7/DATA-EVEN)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.LIST_ENUM
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -3035,6 +3451,16 @@ class DataEven(BaseStructure):
             class_name='DataEven',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['DataEvenDate', 'Plac'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['DataEvenDate', 'Plac'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.enum(self.value, self.class_name, self.enum_tags, self.enumset_key, specs)
+    
 
 class Data(BaseStructure):
     '''Store, validate and format the DATA structure. 
@@ -3073,6 +3499,7 @@ class Data(BaseStructure):
     - [GEDCOM DATA Structure](https://gedcom.io/terms/v7/DATA)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.NONE
     
     def __init__(self, subs: Any = None) -> None:
         super().__init__(
@@ -3091,6 +3518,15 @@ class Data(BaseStructure):
             class_name='Data',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Agnc'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Agnc', 'DataEven', 'Note', 'Snote'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+    
 
 class DateExact(BaseStructure):
     '''Store, validate and format the DATE structure. 
@@ -3128,6 +3564,7 @@ class DateExact(BaseStructure):
     - [GEDCOM DATE Structure](https://gedcom.io/terms/v7/DATE-exact)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.DATE_EXACT
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -3146,6 +3583,16 @@ class DateExact(BaseStructure):
             class_name='DateExact',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Time'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Time'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.date_exact(self.value, self.class_name)
+    
 
 class Date(BaseStructure):
     '''Store, validate and format the DATE structure. 
@@ -3265,6 +3712,7 @@ class Date(BaseStructure):
     - [GEDCOM DATE Structure](https://gedcom.io/terms/v7/DATE)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.DATE
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -3283,6 +3731,16 @@ class Date(BaseStructure):
             class_name='Date',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Phrase', 'Time'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Phrase', 'Time'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.date(self.value, self.class_name, specs)
+    
 
 class Deat(BaseStructure):
     '''Store, validate and format the DEAT structure. 
@@ -3343,6 +3801,7 @@ class Deat(BaseStructure):
     - [GEDCOM DEAT Structure](https://gedcom.io/terms/v7/DEAT)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.Y_OR_NULL
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -3361,6 +3820,16 @@ class Deat(BaseStructure):
             class_name='Deat',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Caus', 'Date', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.y_or_null(self.value, self.class_name)
+    
 
 class Desi(BaseStructure):
     '''Store, validate and format the DESI structure. 
@@ -3390,6 +3859,7 @@ class Desi(BaseStructure):
     - [GEDCOM DESI Structure](https://gedcom.io/terms/v7/DESI)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.SUBMITTER_XREF
     
     def __init__(self, value: SubmitterXref) -> None:
         super().__init__(
@@ -3408,6 +3878,16 @@ class Desi(BaseStructure):
             class_name='Desi',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        self._validate_xref(SubmitterXref, Msg.NOT_SUBMITTER_XREF, str)
+    
 
 class Dest(BaseStructure):
     '''Store, validate and format the DEST structure. 
@@ -3436,6 +3916,7 @@ class Dest(BaseStructure):
     - [GEDCOM DEST Structure](https://gedcom.io/terms/v7/DEST)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -3454,6 +3935,16 @@ class Dest(BaseStructure):
             class_name='Dest',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Div(BaseStructure):
     '''Store, validate and format the DIV structure. 
@@ -3515,6 +4006,7 @@ class Div(BaseStructure):
     - [GEDCOM DIV Structure](https://gedcom.io/terms/v7/DIV)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.Y_OR_NULL
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -3533,6 +4025,16 @@ class Div(BaseStructure):
             class_name='Div',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Agnc', 'Caus', 'Date', 'Husb', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type', 'Wife'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Husb', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Wife', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.y_or_null(self.value, self.class_name)
+    
 
 class Divf(BaseStructure):
     '''Store, validate and format the DIVF structure. 
@@ -3594,6 +4096,7 @@ class Divf(BaseStructure):
     - [GEDCOM DIVF Structure](https://gedcom.io/terms/v7/DIVF)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.Y_OR_NULL
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -3612,6 +4115,16 @@ class Divf(BaseStructure):
             class_name='Divf',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Agnc', 'Caus', 'Date', 'Husb', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type', 'Wife'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Husb', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Wife', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.y_or_null(self.value, self.class_name)
+    
 
 class Dscr(BaseStructure):
     '''Store, validate and format the DSCR structure. 
@@ -3671,6 +4184,7 @@ class Dscr(BaseStructure):
     - [GEDCOM DSCR Structure](https://gedcom.io/terms/v7/DSCR)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -3689,6 +4203,16 @@ class Dscr(BaseStructure):
             class_name='Dscr',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Caus', 'Date', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Educ(BaseStructure):
     '''Store, validate and format the EDUC structure. 
@@ -3748,6 +4272,7 @@ class Educ(BaseStructure):
     - [GEDCOM EDUC Structure](https://gedcom.io/terms/v7/EDUC)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -3766,6 +4291,16 @@ class Educ(BaseStructure):
             class_name='Educ',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Caus', 'Date', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Email(BaseStructure):
     '''Store, validate and format the EMAIL structure. 
@@ -3861,6 +4396,7 @@ class Email(BaseStructure):
     - [GEDCOM EMAIL Structure](https://gedcom.io/terms/v7/EMAIL)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -3879,6 +4415,16 @@ class Email(BaseStructure):
             class_name='Email',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Emig(BaseStructure):
     '''Store, validate and format the EMIG structure. 
@@ -3939,6 +4485,7 @@ class Emig(BaseStructure):
     - [GEDCOM EMIG Structure](https://gedcom.io/terms/v7/EMIG)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.Y_OR_NULL
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -3957,6 +4504,16 @@ class Emig(BaseStructure):
             class_name='Emig',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Caus', 'Date', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.y_or_null(self.value, self.class_name)
+    
 
 class Endl(BaseStructure):
     '''Store, validate and format the ENDL structure. 
@@ -4001,6 +4558,7 @@ class Endl(BaseStructure):
     - [GEDCOM ENDL Structure](https://gedcom.io/terms/v7/ENDL)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.NONE
     
     def __init__(self, subs: Any = None) -> None:
         super().__init__(
@@ -4019,6 +4577,15 @@ class Endl(BaseStructure):
             class_name='Endl',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Date', 'Plac', 'Temp', 'OrdStat'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Date', 'Note', 'Plac', 'Snote', 'Sour', 'Temp', 'OrdStat'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+    
 
 class Enga(BaseStructure):
     '''Store, validate and format the ENGA structure. 
@@ -4080,6 +4647,7 @@ class Enga(BaseStructure):
     - [GEDCOM ENGA Structure](https://gedcom.io/terms/v7/ENGA)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.Y_OR_NULL
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -4098,6 +4666,16 @@ class Enga(BaseStructure):
             class_name='Enga',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Agnc', 'Caus', 'Date', 'Husb', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type', 'Wife'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Husb', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Wife', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.y_or_null(self.value, self.class_name)
+    
 
 class ExidType(BaseStructure):
     '''Store, validate and format the TYPE structure. 
@@ -4141,6 +4719,7 @@ class ExidType(BaseStructure):
     - [GEDCOM TYPE Structure](https://gedcom.io/terms/v7/EXID-TYPE)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -4159,6 +4738,16 @@ class ExidType(BaseStructure):
             class_name='ExidType',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Exid(BaseStructure):
     '''Store, validate and format the EXID structure. 
@@ -4212,6 +4801,7 @@ class Exid(BaseStructure):
     - [GEDCOM EXID Structure](https://gedcom.io/terms/v7/EXID)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -4230,6 +4820,16 @@ class Exid(BaseStructure):
             class_name='Exid',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['ExidType'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['ExidType'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class FamCens(BaseStructure):
     '''Store, validate and format the CENS structure. 
@@ -4287,6 +4887,7 @@ class FamCens(BaseStructure):
     - [GEDCOM CENS Structure](https://gedcom.io/terms/v7/FAM-CENS)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.Y_OR_NULL
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -4305,6 +4906,16 @@ class FamCens(BaseStructure):
             class_name='FamCens',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Agnc', 'Caus', 'Date', 'Husb', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type', 'Wife'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Husb', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Wife', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.y_or_null(self.value, self.class_name)
+    
 
 class FamEven(BaseStructure):
     '''Store, validate and format the EVEN structure. 
@@ -4358,6 +4969,7 @@ class FamEven(BaseStructure):
     - [GEDCOM EVEN Structure](https://gedcom.io/terms/v7/FAM-EVEN)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str, subs: Any) -> None:
         super().__init__(
@@ -4376,6 +4988,16 @@ class FamEven(BaseStructure):
             class_name='FamEven',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset(['Type'])
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Agnc', 'Caus', 'Date', 'Husb', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type', 'Wife'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Husb', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Wife', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class FamFact(BaseStructure):
     '''Store, validate and format the FACT structure. 
@@ -4429,6 +5051,7 @@ class FamFact(BaseStructure):
     - [GEDCOM FACT Structure](https://gedcom.io/terms/v7/FAM-FACT)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str, subs: Any) -> None:
         super().__init__(
@@ -4447,6 +5070,16 @@ class FamFact(BaseStructure):
             class_name='FamFact',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset(['Type'])
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Agnc', 'Caus', 'Date', 'Husb', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type', 'Wife'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Husb', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Wife', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class FamHusb(BaseStructure):
     '''Store, validate and format the HUSB structure. 
@@ -4480,6 +5113,7 @@ class FamHusb(BaseStructure):
     - [GEDCOM HUSB Structure](https://gedcom.io/terms/v7/FAM-HUSB)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.INDIVIDUAL_XREF
     
     def __init__(self, value: IndividualXref, subs: Any = None) -> None:
         super().__init__(
@@ -4498,6 +5132,16 @@ class FamHusb(BaseStructure):
             class_name='FamHusb',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Phrase'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Phrase'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        self._validate_xref(IndividualXref, Msg.NOT_INDIVIDUAL_XREF, str)
+    
 
 class FamNchi(BaseStructure):
     '''Store, validate and format the NCHI structure. 
@@ -4555,6 +5199,7 @@ class FamNchi(BaseStructure):
     - [GEDCOM NCHI Structure](https://gedcom.io/terms/v7/FAM-NCHI)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.NON_NEGATIVE_INTEGER
     
     def __init__(self, value: int, subs: Any = None) -> None:
         super().__init__(
@@ -4573,6 +5218,16 @@ class FamNchi(BaseStructure):
             class_name='FamNchi',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Agnc', 'Caus', 'Date', 'Husb', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type', 'Wife'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Husb', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Wife', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.non_negative_integer(self.value, self.class_name)
+    
 
 class FamResi(BaseStructure):
     '''Store, validate and format the RESI structure. 
@@ -4634,6 +5289,7 @@ class FamResi(BaseStructure):
     - [GEDCOM RESI Structure](https://gedcom.io/terms/v7/FAM-RESI)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -4652,6 +5308,16 @@ class FamResi(BaseStructure):
             class_name='FamResi',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Agnc', 'Caus', 'Date', 'Husb', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type', 'Wife'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Husb', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Wife', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class FamWife(BaseStructure):
     '''Store, validate and format the WIFE structure. 
@@ -4685,6 +5351,7 @@ class FamWife(BaseStructure):
     - [GEDCOM WIFE Structure](https://gedcom.io/terms/v7/FAM-WIFE)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.INDIVIDUAL_XREF
     
     def __init__(self, value: IndividualXref, subs: Any = None) -> None:
         super().__init__(
@@ -4703,6 +5370,16 @@ class FamWife(BaseStructure):
             class_name='FamWife',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Phrase'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Phrase'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        self._validate_xref(IndividualXref, Msg.NOT_INDIVIDUAL_XREF, str)
+    
 
 class FamcAdop(BaseStructure):
     '''Store, validate and format the ADOP structure. 
@@ -4742,6 +5419,7 @@ class FamcAdop(BaseStructure):
     - [GEDCOM ADOP Structure](https://gedcom.io/terms/v7/FAMC-ADOP)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.ENUM
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -4760,6 +5438,16 @@ class FamcAdop(BaseStructure):
             class_name='FamcAdop',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Phrase'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Phrase'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.enum(self.value, self.class_name, self.enum_tags, self.enumset_key, specs)
+    
 
 class FamcStat(BaseStructure):
     '''Store, validate and format the STAT structure. 
@@ -4800,6 +5488,7 @@ class FamcStat(BaseStructure):
     - [GEDCOM STAT Structure](https://gedcom.io/terms/v7/FAMC-STAT)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.ENUM
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -4818,6 +5507,16 @@ class FamcStat(BaseStructure):
             class_name='FamcStat',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Phrase'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Phrase'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.enum(self.value, self.class_name, self.enum_tags, self.enumset_key, specs)
+    
 
 class Famc(BaseStructure):
     '''Store, validate and format the FAMC structure. 
@@ -4847,6 +5546,7 @@ class Famc(BaseStructure):
     - [GEDCOM FAMC Structure](https://gedcom.io/terms/v7/FAMC)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.FAMILY_XREF
     
     def __init__(self, value: FamilyXref) -> None:
         super().__init__(
@@ -4865,6 +5565,16 @@ class Famc(BaseStructure):
             class_name='Famc',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        self._validate_xref(FamilyXref, Msg.NOT_FAMILY_XREF, str)
+    
 
 class Fams(BaseStructure):
     '''Store, validate and format the FAMS structure. 
@@ -4900,6 +5610,7 @@ class Fams(BaseStructure):
     - [GEDCOM FAMS Structure](https://gedcom.io/terms/v7/FAMS)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.FAMILY_XREF
     
     def __init__(self, value: FamilyXref, subs: Any = None) -> None:
         super().__init__(
@@ -4918,6 +5629,16 @@ class Fams(BaseStructure):
             class_name='Fams',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Note', 'Snote'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        self._validate_xref(FamilyXref, Msg.NOT_FAMILY_XREF, str)
+    
 
 class Fax(BaseStructure):
     '''Store, validate and format the FAX structure. 
@@ -4999,6 +5720,7 @@ class Fax(BaseStructure):
     - [GEDCOM FAX Structure](https://gedcom.io/terms/v7/FAX)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -5017,6 +5739,16 @@ class Fax(BaseStructure):
             class_name='Fax',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Fcom(BaseStructure):
     '''Store, validate and format the FCOM structure. 
@@ -5077,6 +5809,7 @@ class Fcom(BaseStructure):
     - [GEDCOM FCOM Structure](https://gedcom.io/terms/v7/FCOM)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.Y_OR_NULL
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -5095,6 +5828,16 @@ class Fcom(BaseStructure):
             class_name='Fcom',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Caus', 'Date', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.y_or_null(self.value, self.class_name)
+    
 
 class FileTran(BaseStructure):
     '''Store, validate and format the TRAN structure. 
@@ -5196,6 +5939,7 @@ class FileTran(BaseStructure):
     - [GEDCOM TRAN Structure](https://gedcom.io/terms/v7/FILE-TRAN)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.FILE_PATH
     
     def __init__(self, value: str, subs: Any) -> None:
         super().__init__(
@@ -5214,6 +5958,16 @@ class FileTran(BaseStructure):
             class_name='FileTran',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset(['Form'])
+    single_set: ClassVar[frozenset[str]] = frozenset(['Form'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Form'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.filepath(self.value, self.class_name)
+    
 
 class File(BaseStructure):
     '''Store, validate and format the FILE structure. 
@@ -5251,6 +6005,7 @@ class File(BaseStructure):
     - [GEDCOM FILE Structure](https://gedcom.io/terms/v7/FILE)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.FILE_PATH
     
     def __init__(self, value: str, subs: Any) -> None:
         super().__init__(
@@ -5269,6 +6024,16 @@ class File(BaseStructure):
             class_name='File',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset(['Form'])
+    single_set: ClassVar[frozenset[str]] = frozenset(['Form', 'Titl'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['FileTran', 'Form', 'Titl'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.filepath(self.value, self.class_name)
+    
 
 class Form(BaseStructure):
     '''Store, validate and format the FORM structure. 
@@ -5305,6 +6070,7 @@ class Form(BaseStructure):
     - [GEDCOM FORM Structure](https://gedcom.io/terms/v7/FORM)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.MEDIA_TYPE
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -5323,6 +6089,16 @@ class Form(BaseStructure):
             class_name='Form',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Medi'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Medi'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.mediatype(self.value, self.class_name)
+    
 
 class GedcVers(BaseStructure):
     '''Store, validate and format the VERS structure. 
@@ -5354,6 +6130,7 @@ class GedcVers(BaseStructure):
     - [GEDCOM VERS Structure](https://gedcom.io/terms/v7/GEDC-VERS)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -5372,6 +6149,16 @@ class GedcVers(BaseStructure):
             class_name='GedcVers',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Gedc(BaseStructure):
     '''Store, validate and format the GEDC structure. 
@@ -5408,6 +6195,7 @@ class Gedc(BaseStructure):
     - [GEDCOM GEDC Structure](https://gedcom.io/terms/v7/GEDC)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.NONE
     
     def __init__(self, subs: Any) -> None:
         super().__init__(
@@ -5426,6 +6214,15 @@ class Gedc(BaseStructure):
             class_name='Gedc',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset(['GedcVers'])
+    single_set: ClassVar[frozenset[str]] = frozenset(['GedcVers'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['GedcVers'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+    
 
 class Givn(BaseStructure):
     '''Store, validate and format the GIVN structure. 
@@ -5454,6 +6251,7 @@ class Givn(BaseStructure):
     - [GEDCOM GIVN Structure](https://gedcom.io/terms/v7/GIVN)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -5472,6 +6270,16 @@ class Givn(BaseStructure):
             class_name='Givn',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Grad(BaseStructure):
     '''Store, validate and format the GRAD structure. 
@@ -5532,6 +6340,7 @@ class Grad(BaseStructure):
     - [GEDCOM GRAD Structure](https://gedcom.io/terms/v7/GRAD)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.Y_OR_NULL
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -5550,6 +6359,16 @@ class Grad(BaseStructure):
             class_name='Grad',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Caus', 'Date', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.y_or_null(self.value, self.class_name)
+    
 
 class HeadDate(BaseStructure):
     '''Store, validate and format the DATE structure. 
@@ -5583,6 +6402,7 @@ class HeadDate(BaseStructure):
     - [GEDCOM DATE Structure](https://gedcom.io/terms/v7/HEAD-DATE)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.DATE_EXACT
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -5601,6 +6421,16 @@ class HeadDate(BaseStructure):
             class_name='HeadDate',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Time'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Time'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.date_exact(self.value, self.class_name)
+    
 
 class HeadLang(BaseStructure):
     '''Store, validate and format the LANG structure. 
@@ -5652,6 +6482,7 @@ class HeadLang(BaseStructure):
     - [GEDCOM LANG Structure](https://gedcom.io/terms/v7/HEAD-LANG)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.LANGUAGE
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -5670,6 +6501,16 @@ class HeadLang(BaseStructure):
             class_name='HeadLang',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.language(self.value, self.class_name)
+    
 
 class HeadPlacForm(BaseStructure):
     '''Store, validate and format the FORM structure. 
@@ -5697,6 +6538,7 @@ class HeadPlacForm(BaseStructure):
     - [GEDCOM FORM Structure](https://gedcom.io/terms/v7/HEAD-PLAC-FORM)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.LIST_TEXT
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -5715,6 +6557,16 @@ class HeadPlacForm(BaseStructure):
             class_name='HeadPlacForm',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.listing(self.value, self.class_name)
+    
 
 class HeadPlac(BaseStructure):
     '''Store, validate and format the PLAC structure. 
@@ -5748,6 +6600,7 @@ class HeadPlac(BaseStructure):
     - [GEDCOM PLAC Structure](https://gedcom.io/terms/v7/HEAD-PLAC)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.NONE
     
     def __init__(self, subs: Any) -> None:
         super().__init__(
@@ -5766,6 +6619,15 @@ class HeadPlac(BaseStructure):
             class_name='HeadPlac',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset(['HeadPlacForm'])
+    single_set: ClassVar[frozenset[str]] = frozenset(['HeadPlacForm'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['HeadPlacForm'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+    
 
 class HeadSourData(BaseStructure):
     '''Store, validate and format the DATA structure. 
@@ -5803,6 +6665,7 @@ class HeadSourData(BaseStructure):
     - [GEDCOM DATA Structure](https://gedcom.io/terms/v7/HEAD-SOUR-DATA)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -5821,6 +6684,16 @@ class HeadSourData(BaseStructure):
             class_name='HeadSourData',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Copr', 'DateExact'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Copr', 'DateExact'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class HeadSour(BaseStructure):
     '''Store, validate and format the SOUR structure. 
@@ -5860,6 +6733,7 @@ class HeadSour(BaseStructure):
     - [GEDCOM SOUR Structure](https://gedcom.io/terms/v7/HEAD-SOUR)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -5878,6 +6752,16 @@ class HeadSour(BaseStructure):
             class_name='HeadSour',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Corp', 'HeadSourData', 'Name', 'Vers'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Corp', 'HeadSourData', 'Name', 'Vers'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Head(BaseStructure):
     '''Store, validate and format the HEAD structure. 
@@ -6085,6 +6969,7 @@ class Head(BaseStructure):
     - [GEDCOM HEAD Structure](https://gedcom.io/terms/v7/HEAD)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.NONE
     
     def __init__(self, subs: Any) -> None:
         super().__init__(
@@ -6103,6 +6988,15 @@ class Head(BaseStructure):
             class_name='Head',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset(['Gedc'])
+    single_set: ClassVar[frozenset[str]] = frozenset(['Copr', 'Dest', 'Gedc', 'HeadDate', 'HeadLang', 'HeadPlac', 'HeadSour', 'Note', 'Schma', 'Snote', 'Subm'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Copr', 'Dest', 'Gedc', 'HeadDate', 'HeadLang', 'HeadPlac', 'HeadSour', 'Note', 'Schma', 'Snote', 'Subm'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+    
 
 class Height(BaseStructure):
     '''Store, validate and format the HEIGHT structure. 
@@ -6162,6 +7056,7 @@ class Height(BaseStructure):
     - [GEDCOM HEIGHT Structure](https://gedcom.io/terms/v7/HEIGHT)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.NON_NEGATIVE_INTEGER
     
     def __init__(self, value: int) -> None:
         super().__init__(
@@ -6180,6 +7075,16 @@ class Height(BaseStructure):
             class_name='Height',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.non_negative_integer(self.value, self.class_name)
+    
 
 class Husb(BaseStructure):
     '''Store, validate and format the HUSB structure. 
@@ -6227,6 +7132,7 @@ class Husb(BaseStructure):
     - [GEDCOM HUSB Structure](https://gedcom.io/terms/v7/HUSB)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.NONE
     
     def __init__(self, subs: Any) -> None:
         super().__init__(
@@ -6245,6 +7151,15 @@ class Husb(BaseStructure):
             class_name='Husb',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset(['Age'])
+    single_set: ClassVar[frozenset[str]] = frozenset(['Age'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Age'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+    
 
 class Idno(BaseStructure):
     '''Store, validate and format the IDNO structure. 
@@ -6306,6 +7221,7 @@ class Idno(BaseStructure):
     - [GEDCOM IDNO Structure](https://gedcom.io/terms/v7/IDNO)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str, subs: Any) -> None:
         super().__init__(
@@ -6324,6 +7240,16 @@ class Idno(BaseStructure):
             class_name='Idno',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset(['Type'])
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Caus', 'Date', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Immi(BaseStructure):
     '''Store, validate and format the IMMI structure. 
@@ -6384,6 +7310,7 @@ class Immi(BaseStructure):
     - [GEDCOM IMMI Structure](https://gedcom.io/terms/v7/IMMI)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.Y_OR_NULL
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -6402,6 +7329,16 @@ class Immi(BaseStructure):
             class_name='Immi',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Caus', 'Date', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.y_or_null(self.value, self.class_name)
+    
 
 class IndiCens(BaseStructure):
     '''Store, validate and format the CENS structure. 
@@ -6459,6 +7396,7 @@ class IndiCens(BaseStructure):
     - [GEDCOM CENS Structure](https://gedcom.io/terms/v7/INDI-CENS)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.Y_OR_NULL
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -6477,6 +7415,16 @@ class IndiCens(BaseStructure):
             class_name='IndiCens',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Caus', 'Date', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.y_or_null(self.value, self.class_name)
+    
 
 class IndiEven(BaseStructure):
     '''Store, validate and format the EVEN structure. 
@@ -6576,6 +7524,7 @@ class IndiEven(BaseStructure):
     - [GEDCOM EVEN Structure](https://gedcom.io/terms/v7/INDI-EVEN)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str, subs: Any) -> None:
         super().__init__(
@@ -6594,6 +7543,16 @@ class IndiEven(BaseStructure):
             class_name='IndiEven',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset(['Type'])
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Caus', 'Date', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class IndiFact(BaseStructure):
     '''Store, validate and format the FACT structure. 
@@ -6679,6 +7638,7 @@ class IndiFact(BaseStructure):
     - [GEDCOM FACT Structure](https://gedcom.io/terms/v7/INDI-FACT)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str, subs: Any) -> None:
         super().__init__(
@@ -6697,6 +7657,16 @@ class IndiFact(BaseStructure):
             class_name='IndiFact',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset(['Type'])
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Caus', 'Date', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class IndiFamc(BaseStructure):
     '''Store, validate and format the FAMC structure. 
@@ -6735,6 +7705,7 @@ class IndiFamc(BaseStructure):
     - [GEDCOM FAMC Structure](https://gedcom.io/terms/v7/INDI-FAMC)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.FAMILY_XREF
     
     def __init__(self, value: FamilyXref, subs: Any = None) -> None:
         super().__init__(
@@ -6753,6 +7724,16 @@ class IndiFamc(BaseStructure):
             class_name='IndiFamc',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['FamcStat', 'Pedi'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['FamcStat', 'Note', 'Pedi', 'Snote'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        self._validate_xref(FamilyXref, Msg.NOT_FAMILY_XREF, str)
+    
 
 class IndiName(BaseStructure):
     '''Store, validate and format the NAME structure. 
@@ -6827,6 +7808,7 @@ class IndiName(BaseStructure):
     - [GEDCOM NAME Structure](https://gedcom.io/terms/v7/INDI-NAME)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.NAME
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -6845,6 +7827,16 @@ class IndiName(BaseStructure):
             class_name='IndiName',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['NameType'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Givn', 'NameTran', 'NameType', 'Nick', 'Note', 'Npfx', 'Nsfx', 'Snote', 'Sour', 'Spfx', 'Surn'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.name(self.value, self.class_name)
+    
 
 class IndiNchi(BaseStructure):
     '''Store, validate and format the NCHI structure. 
@@ -6902,6 +7894,7 @@ class IndiNchi(BaseStructure):
     - [GEDCOM NCHI Structure](https://gedcom.io/terms/v7/INDI-NCHI)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.NON_NEGATIVE_INTEGER
     
     def __init__(self, value: int, subs: Any = None) -> None:
         super().__init__(
@@ -6920,6 +7913,16 @@ class IndiNchi(BaseStructure):
             class_name='IndiNchi',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Caus', 'Date', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.non_negative_integer(self.value, self.class_name)
+    
 
 class IndiReli(BaseStructure):
     '''Store, validate and format the RELI structure. 
@@ -6980,6 +7983,7 @@ class IndiReli(BaseStructure):
     - [GEDCOM RELI Structure](https://gedcom.io/terms/v7/INDI-RELI)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -6998,6 +8002,16 @@ class IndiReli(BaseStructure):
             class_name='IndiReli',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Caus', 'Date', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class IndiResi(BaseStructure):
     '''Store, validate and format the RESI structure. 
@@ -7097,6 +8111,7 @@ class IndiResi(BaseStructure):
     - [GEDCOM RESI Structure](https://gedcom.io/terms/v7/INDI-RESI)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -7115,6 +8130,16 @@ class IndiResi(BaseStructure):
             class_name='IndiResi',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Caus', 'Date', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class IndiTitl(BaseStructure):
     '''Store, validate and format the TITL structure. 
@@ -7175,6 +8200,7 @@ class IndiTitl(BaseStructure):
     - [GEDCOM TITL Structure](https://gedcom.io/terms/v7/INDI-TITL)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -7193,6 +8219,16 @@ class IndiTitl(BaseStructure):
             class_name='IndiTitl',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Caus', 'Date', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Inil(BaseStructure):
     '''Store, validate and format the INIL structure. 
@@ -7240,6 +8276,7 @@ class Inil(BaseStructure):
     - [GEDCOM INIL Structure](https://gedcom.io/terms/v7/INIL)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.NONE
     
     def __init__(self, subs: Any = None) -> None:
         super().__init__(
@@ -7258,6 +8295,15 @@ class Inil(BaseStructure):
             class_name='Inil',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Date', 'Plac', 'Temp', 'OrdStat'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Date', 'Note', 'Plac', 'Snote', 'Sour', 'Temp', 'OrdStat'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+    
 
 class Lang(BaseStructure):
     '''Store, validate and format the LANG structure. 
@@ -7347,6 +8393,7 @@ class Lang(BaseStructure):
     - [GEDCOM LANG Structure](https://gedcom.io/terms/v7/LANG)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.LANGUAGE
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -7365,6 +8412,16 @@ class Lang(BaseStructure):
             class_name='Lang',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.language(self.value, self.class_name)
+    
 
 class Lati(BaseStructure):
     '''Store, validate and format the LATI structure. 
@@ -7432,6 +8489,7 @@ class Lati(BaseStructure):
     - [GEDCOM LATI Structure](https://gedcom.io/terms/v7/LATI)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -7450,6 +8508,17 @@ class Lati(BaseStructure):
             class_name='Lati',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+        Validate.lati(self.value, self.class_name)
+    
 
 class Left(BaseStructure):
     '''Store, validate and format the LEFT structure. 
@@ -7478,6 +8547,7 @@ class Left(BaseStructure):
     - [GEDCOM LEFT Structure](https://gedcom.io/terms/v7/LEFT)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.NON_NEGATIVE_INTEGER
     
     def __init__(self, value: int) -> None:
         super().__init__(
@@ -7496,6 +8566,16 @@ class Left(BaseStructure):
             class_name='Left',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.non_negative_integer(self.value, self.class_name)
+    
 
 class Long(BaseStructure):
     '''Store, validate and format the LONG structure. 
@@ -7563,6 +8643,7 @@ class Long(BaseStructure):
     - [GEDCOM LONG Structure](https://gedcom.io/terms/v7/LONG)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -7581,6 +8662,17 @@ class Long(BaseStructure):
             class_name='Long',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+        Validate.long(self.value, self.class_name)
+    
 
 class Map(BaseStructure):
     '''Store, validate and format the MAP structure. 
@@ -7636,6 +8728,7 @@ class Map(BaseStructure):
     - [GEDCOM MAP Structure](https://gedcom.io/terms/v7/MAP)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.NONE
     
     def __init__(self, subs: Any) -> None:
         super().__init__(
@@ -7654,6 +8747,15 @@ class Map(BaseStructure):
             class_name='Map',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset(['Lati', 'Long'])
+    single_set: ClassVar[frozenset[str]] = frozenset(['Lati', 'Long'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Lati', 'Long'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+    
 
 class Marb(BaseStructure):
     '''Store, validate and format the MARB structure. 
@@ -7715,6 +8817,7 @@ class Marb(BaseStructure):
     - [GEDCOM MARB Structure](https://gedcom.io/terms/v7/MARB)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.Y_OR_NULL
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -7733,6 +8836,16 @@ class Marb(BaseStructure):
             class_name='Marb',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Agnc', 'Caus', 'Date', 'Husb', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type', 'Wife'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Husb', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Wife', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.y_or_null(self.value, self.class_name)
+    
 
 class Marc(BaseStructure):
     '''Store, validate and format the MARC structure. 
@@ -7796,6 +8909,7 @@ class Marc(BaseStructure):
     - [GEDCOM MARC Structure](https://gedcom.io/terms/v7/MARC)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.Y_OR_NULL
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -7814,6 +8928,16 @@ class Marc(BaseStructure):
             class_name='Marc',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Agnc', 'Caus', 'Date', 'Husb', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type', 'Wife'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Husb', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Wife', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.y_or_null(self.value, self.class_name)
+    
 
 class Marl(BaseStructure):
     '''Store, validate and format the MARL structure. 
@@ -7875,6 +8999,7 @@ class Marl(BaseStructure):
     - [GEDCOM MARL Structure](https://gedcom.io/terms/v7/MARL)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.Y_OR_NULL
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -7893,6 +9018,16 @@ class Marl(BaseStructure):
             class_name='Marl',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Agnc', 'Caus', 'Date', 'Husb', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type', 'Wife'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Husb', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Wife', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.y_or_null(self.value, self.class_name)
+    
 
 class Marr(BaseStructure):
     '''Store, validate and format the MARR structure. 
@@ -7955,6 +9090,7 @@ class Marr(BaseStructure):
     - [GEDCOM MARR Structure](https://gedcom.io/terms/v7/MARR)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.Y_OR_NULL
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -7973,6 +9109,16 @@ class Marr(BaseStructure):
             class_name='Marr',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Agnc', 'Caus', 'Date', 'Husb', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type', 'Wife'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Husb', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Wife', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.y_or_null(self.value, self.class_name)
+    
 
 class Mars(BaseStructure):
     '''Store, validate and format the MARS structure. 
@@ -8036,6 +9182,7 @@ class Mars(BaseStructure):
     - [GEDCOM MARS Structure](https://gedcom.io/terms/v7/MARS)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.Y_OR_NULL
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -8054,6 +9201,16 @@ class Mars(BaseStructure):
             class_name='Mars',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Agnc', 'Caus', 'Date', 'Husb', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type', 'Wife'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Husb', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Wife', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.y_or_null(self.value, self.class_name)
+    
 
 class Medi(BaseStructure):
     '''Store, validate and format the MEDI structure. 
@@ -8160,6 +9317,7 @@ class Medi(BaseStructure):
     - [GEDCOM MEDI Structure](https://gedcom.io/terms/v7/MEDI)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.ENUM
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -8178,6 +9336,16 @@ class Medi(BaseStructure):
             class_name='Medi',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Phrase'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Phrase'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.enum(self.value, self.class_name, self.enum_tags, self.enumset_key, specs)
+    
 
 class Mime(BaseStructure):
     '''Store, validate and format the MIME structure. 
@@ -8266,6 +9434,7 @@ class Mime(BaseStructure):
     - [GEDCOM MIME Structure](https://gedcom.io/terms/v7/MIME)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.MEDIA_TYPE
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -8284,6 +9453,16 @@ class Mime(BaseStructure):
             class_name='Mime',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.mediatype(self.value, self.class_name)
+    
 
 class NameTran(BaseStructure):
     '''Store, validate and format the TRAN structure. 
@@ -8383,6 +9562,7 @@ class NameTran(BaseStructure):
     - [GEDCOM TRAN Structure](https://gedcom.io/terms/v7/NAME-TRAN)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.NAME
     
     def __init__(self, value: str, subs: Any) -> None:
         super().__init__(
@@ -8401,6 +9581,16 @@ class NameTran(BaseStructure):
             class_name='NameTran',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset(['Lang'])
+    single_set: ClassVar[frozenset[str]] = frozenset(['Lang'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Givn', 'Lang', 'Nick', 'Npfx', 'Nsfx', 'Spfx', 'Surn'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.name(self.value, self.class_name)
+    
 
 class NameType(BaseStructure):
     '''Store, validate and format the TYPE structure. 
@@ -8444,6 +9634,7 @@ class NameType(BaseStructure):
     - [GEDCOM TYPE Structure](https://gedcom.io/terms/v7/NAME-TYPE)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.ENUM
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -8462,6 +9653,16 @@ class NameType(BaseStructure):
             class_name='NameType',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Phrase'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Phrase'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.enum(self.value, self.class_name, self.enum_tags, self.enumset_key, specs)
+    
 
 class Name(BaseStructure):
     '''Store, validate and format the NAME structure. 
@@ -8491,6 +9692,7 @@ class Name(BaseStructure):
     - [GEDCOM NAME Structure](https://gedcom.io/terms/v7/NAME)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -8509,6 +9711,16 @@ class Name(BaseStructure):
             class_name='Name',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Nati(BaseStructure):
     '''Store, validate and format the NATI structure. 
@@ -8569,6 +9781,7 @@ class Nati(BaseStructure):
     - [GEDCOM NATI Structure](https://gedcom.io/terms/v7/NATI)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -8587,6 +9800,16 @@ class Nati(BaseStructure):
             class_name='Nati',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Caus', 'Date', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Natu(BaseStructure):
     '''Store, validate and format the NATU structure. 
@@ -8647,6 +9870,7 @@ class Natu(BaseStructure):
     - [GEDCOM NATU Structure](https://gedcom.io/terms/v7/NATU)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.Y_OR_NULL
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -8665,6 +9889,16 @@ class Natu(BaseStructure):
             class_name='Natu',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Caus', 'Date', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.y_or_null(self.value, self.class_name)
+    
 
 class Nick(BaseStructure):
     '''Store, validate and format the NICK structure. 
@@ -8708,6 +9942,7 @@ class Nick(BaseStructure):
     - [GEDCOM NICK Structure](https://gedcom.io/terms/v7/NICK)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -8726,6 +9961,16 @@ class Nick(BaseStructure):
             class_name='Nick',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Nmr(BaseStructure):
     '''Store, validate and format the NMR structure. 
@@ -8786,6 +10031,7 @@ class Nmr(BaseStructure):
     - [GEDCOM NMR Structure](https://gedcom.io/terms/v7/NMR)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.NON_NEGATIVE_INTEGER
     
     def __init__(self, value: int, subs: Any = None) -> None:
         super().__init__(
@@ -8804,6 +10050,16 @@ class Nmr(BaseStructure):
             class_name='Nmr',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Caus', 'Date', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.non_negative_integer(self.value, self.class_name)
+    
 
 class NoDate(BaseStructure):
     '''Store, validate and format the DATE structure. 
@@ -8838,6 +10094,7 @@ class NoDate(BaseStructure):
     - [GEDCOM DATE Structure](https://gedcom.io/terms/v7/NO-DATE)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.DATE_PERIOD
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -8856,6 +10113,16 @@ class NoDate(BaseStructure):
             class_name='NoDate',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Phrase'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Phrase'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.date_period(self.value, self.class_name, specs)
+    
 
 class No(BaseStructure):
     '''Store, validate and format the NO structure. 
@@ -8956,6 +10223,7 @@ class No(BaseStructure):
     - [GEDCOM NO Structure](https://gedcom.io/terms/v7/NO)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.ENUM
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -8974,6 +10242,16 @@ class No(BaseStructure):
             class_name='No',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['NoDate'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['NoDate', 'Note', 'Snote', 'Sour'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.enum(self.value, self.class_name, self.enum_tags, self.enumset_key, specs)
+    
 
 class NoteTran(BaseStructure):
     '''Store, validate and format the TRAN structure. 
@@ -9082,6 +10360,7 @@ class NoteTran(BaseStructure):
     - [GEDCOM TRAN Structure](https://gedcom.io/terms/v7/NOTE-TRAN)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -9100,6 +10379,16 @@ class NoteTran(BaseStructure):
             class_name='NoteTran',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Lang', 'Mime'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Lang', 'Mime'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Note(BaseStructure):
     '''Store, validate and format the NOTE structure. 
@@ -9215,6 +10504,7 @@ class Note(BaseStructure):
     - [GEDCOM NOTE Structure](https://gedcom.io/terms/v7/NOTE)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -9233,6 +10523,16 @@ class Note(BaseStructure):
             class_name='Note',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Lang', 'Mime'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Lang', 'Mime', 'NoteTran', 'Sour'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Npfx(BaseStructure):
     '''Store, validate and format the NPFX structure. 
@@ -9262,6 +10562,7 @@ class Npfx(BaseStructure):
     - [GEDCOM NPFX Structure](https://gedcom.io/terms/v7/NPFX)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -9280,6 +10581,16 @@ class Npfx(BaseStructure):
             class_name='Npfx',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Nsfx(BaseStructure):
     '''Store, validate and format the NSFX structure. 
@@ -9309,6 +10620,7 @@ class Nsfx(BaseStructure):
     - [GEDCOM NSFX Structure](https://gedcom.io/terms/v7/NSFX)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -9327,6 +10639,16 @@ class Nsfx(BaseStructure):
             class_name='Nsfx',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Obje(BaseStructure):
     '''Store, validate and format the OBJE structure. 
@@ -9424,6 +10746,7 @@ class Obje(BaseStructure):
     - [GEDCOM OBJE Structure](https://gedcom.io/terms/v7/OBJE)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.MULTIMEDIA_XREF
     
     def __init__(self, value: MultimediaXref, subs: Any = None) -> None:
         super().__init__(
@@ -9442,6 +10765,16 @@ class Obje(BaseStructure):
             class_name='Obje',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Crop', 'Titl'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Crop', 'Titl'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        self._validate_xref(MultimediaXref, Msg.NOT_MULTIMEDIA_XREF)
+    
 
 class Occu(BaseStructure):
     '''Store, validate and format the OCCU structure. 
@@ -9501,6 +10834,7 @@ class Occu(BaseStructure):
     - [GEDCOM OCCU Structure](https://gedcom.io/terms/v7/OCCU)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -9519,6 +10853,16 @@ class Occu(BaseStructure):
             class_name='Occu',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Caus', 'Date', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class OrdStat(BaseStructure):
     '''Store, validate and format the STAT structure. 
@@ -9584,6 +10928,7 @@ class OrdStat(BaseStructure):
     - [GEDCOM STAT Structure](https://gedcom.io/terms/v7/ord-STAT)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.ENUM
     
     def __init__(self, value: str, subs: Any) -> None:
         super().__init__(
@@ -9602,6 +10947,16 @@ class OrdStat(BaseStructure):
             class_name='OrdStat',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset(['DateExact'])
+    single_set: ClassVar[frozenset[str]] = frozenset(['DateExact'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['DateExact'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.enum(self.value, self.class_name, self.enum_tags, self.enumset_key, specs)
+    
 
 class Ordn(BaseStructure):
     '''Store, validate and format the ORDN structure. 
@@ -9662,6 +11017,7 @@ class Ordn(BaseStructure):
     - [GEDCOM ORDN Structure](https://gedcom.io/terms/v7/ORDN)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.Y_OR_NULL
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -9680,6 +11036,16 @@ class Ordn(BaseStructure):
             class_name='Ordn',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Caus', 'Date', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.y_or_null(self.value, self.class_name)
+    
 
 class Page(BaseStructure):
     '''Store, validate and format the PAGE structure. 
@@ -9770,6 +11136,7 @@ class Page(BaseStructure):
     - [GEDCOM PAGE Structure](https://gedcom.io/terms/v7/PAGE)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -9788,6 +11155,16 @@ class Page(BaseStructure):
             class_name='Page',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Pedi(BaseStructure):
     '''Store, validate and format the PEDI structure. 
@@ -9839,6 +11216,7 @@ class Pedi(BaseStructure):
     - [GEDCOM PEDI Structure](https://gedcom.io/terms/v7/PEDI)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.ENUM
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -9857,6 +11235,16 @@ class Pedi(BaseStructure):
             class_name='Pedi',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Phrase'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Phrase'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.enum(self.value, self.class_name, self.enum_tags, self.enumset_key, specs)
+    
 
 class Phon(BaseStructure):
     '''Store, validate and format the PHON structure. 
@@ -9947,6 +11335,7 @@ class Phon(BaseStructure):
     - [GEDCOM PHON Structure](https://gedcom.io/terms/v7/PHON)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -9965,6 +11354,16 @@ class Phon(BaseStructure):
             class_name='Phon',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Phrase(BaseStructure):
     '''Store, validate and format the PHRASE structure. 
@@ -10143,6 +11542,7 @@ class Phrase(BaseStructure):
     - [GEDCOM PHRASE Structure](https://gedcom.io/terms/v7/PHRASE)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -10161,6 +11561,16 @@ class Phrase(BaseStructure):
             class_name='Phrase',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class PlacForm(BaseStructure):
     '''Store, validate and format the FORM structure. 
@@ -10213,6 +11623,7 @@ class PlacForm(BaseStructure):
     - [GEDCOM FORM Structure](https://gedcom.io/terms/v7/PLAC-FORM)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.LIST_TEXT
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -10231,6 +11642,16 @@ class PlacForm(BaseStructure):
             class_name='PlacForm',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.listing(self.value, self.class_name)
+    
 
 class PlacTran(BaseStructure):
     '''Store, validate and format the TRAN structure. 
@@ -10325,6 +11746,7 @@ class PlacTran(BaseStructure):
     - [GEDCOM TRAN Structure](https://gedcom.io/terms/v7/PLAC-TRAN)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.LIST_TEXT
     
     def __init__(self, value: str, subs: Any) -> None:
         super().__init__(
@@ -10343,6 +11765,16 @@ class PlacTran(BaseStructure):
             class_name='PlacTran',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset(['Lang'])
+    single_set: ClassVar[frozenset[str]] = frozenset(['Lang'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Lang'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.listing(self.value, self.class_name)
+    
 
 class Plac(BaseStructure):
     '''Store, validate and format the PLAC structure. 
@@ -10532,6 +11964,7 @@ class Plac(BaseStructure):
     - [GEDCOM PLAC Structure](https://gedcom.io/terms/v7/PLAC)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.LIST_TEXT
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -10550,6 +11983,16 @@ class Plac(BaseStructure):
             class_name='Plac',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Lang', 'Map', 'PlacForm'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Exid', 'Lang', 'Map', 'Note', 'PlacForm', 'PlacTran', 'Snote'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.listing(self.value, self.class_name)
+    
 
 class Post(BaseStructure):
     '''Store, validate and format the POST structure. 
@@ -10578,6 +12021,7 @@ class Post(BaseStructure):
     - [GEDCOM POST Structure](https://gedcom.io/terms/v7/POST)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -10596,6 +12040,16 @@ class Post(BaseStructure):
             class_name='Post',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Prob(BaseStructure):
     '''Store, validate and format the PROB structure. 
@@ -10657,6 +12111,7 @@ class Prob(BaseStructure):
     - [GEDCOM PROB Structure](https://gedcom.io/terms/v7/PROB)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.Y_OR_NULL
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -10675,6 +12130,16 @@ class Prob(BaseStructure):
             class_name='Prob',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Caus', 'Date', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.y_or_null(self.value, self.class_name)
+    
 
 class Prop(BaseStructure):
     '''Store, validate and format the PROP structure. 
@@ -10735,6 +12200,7 @@ class Prop(BaseStructure):
     - [GEDCOM PROP Structure](https://gedcom.io/terms/v7/PROP)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -10753,6 +12219,16 @@ class Prop(BaseStructure):
             class_name='Prop',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Caus', 'Date', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Publ(BaseStructure):
     '''Store, validate and format the PUBL structure. 
@@ -10788,6 +12264,7 @@ class Publ(BaseStructure):
     - [GEDCOM PUBL Structure](https://gedcom.io/terms/v7/PUBL)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -10806,6 +12283,16 @@ class Publ(BaseStructure):
             class_name='Publ',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Quay(BaseStructure):
     '''Store, validate and format the QUAY structure. 
@@ -10853,6 +12340,7 @@ class Quay(BaseStructure):
     - [GEDCOM QUAY Structure](https://gedcom.io/terms/v7/QUAY)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.ENUM
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -10871,6 +12359,16 @@ class Quay(BaseStructure):
             class_name='Quay',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.enum(self.value, self.class_name, self.enum_tags, self.enumset_key, specs)
+    
 
 class RecordFam(BaseStructure):
     '''Store, validate and format the FAM structure. 
@@ -10993,6 +12491,7 @@ class RecordFam(BaseStructure):
     - [GEDCOM FAM Structure](https://gedcom.io/terms/v7/record-FAM)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.NONE
     
     def __init__(self, value: FamilyXref, subs: Any = None) -> None:
         super().__init__(
@@ -11011,6 +12510,16 @@ class RecordFam(BaseStructure):
             class_name='RecordFam',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Chan', 'Crea', 'FamHusb', 'FamWife', 'Resn'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Anul', 'Asso', 'Chan', 'Chil', 'Crea', 'Div', 'Divf', 'Enga', 'Exid', 'FamCens', 'FamEven', 'FamFact', 'FamHusb', 'FamNchi', 'FamResi', 'FamWife', 'Marb', 'Marc', 'Marl', 'Marr', 'Mars', 'No', 'Note', 'Obje', 'Refn', 'Resn', 'Slgs', 'Snote', 'Sour', 'Subm', 'Uid'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        self._validate_xref(FamilyXref, Msg.NOT_FAMILY_XREF, str)
+    
 
 class RecordIndi(BaseStructure):
     '''Store, validate and format the INDI structure. 
@@ -11159,6 +12668,7 @@ class RecordIndi(BaseStructure):
     - [GEDCOM INDI Structure](https://gedcom.io/terms/v7/record-INDI)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.NONE
     
     def __init__(self, value: IndividualXref, subs: Any = None) -> None:
         super().__init__(
@@ -11177,6 +12687,16 @@ class RecordIndi(BaseStructure):
             class_name='RecordIndi',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Chan', 'Crea', 'Resn', 'Sex'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Adop', 'Alia', 'Anci', 'Asso', 'Bapl', 'Bapm', 'Barm', 'Basm', 'Birt', 'Bles', 'Buri', 'Cast', 'Chan', 'Chr', 'Chra', 'Conf', 'Conl', 'Crea', 'Crem', 'Deat', 'Desi', 'Dscr', 'Educ', 'Emig', 'Endl', 'Exid', 'Fams', 'Fcom', 'Grad', 'Idno', 'Immi', 'IndiCens', 'IndiEven', 'IndiFact', 'IndiFamc', 'IndiName', 'IndiNchi', 'IndiReli', 'IndiResi', 'IndiTitl', 'Inil', 'Nati', 'Natu', 'Nmr', 'No', 'Note', 'Obje', 'Occu', 'Ordn', 'Prob', 'Prop', 'Refn', 'Resn', 'Reti', 'Sex', 'Slgc', 'Snote', 'Sour', 'Ssn', 'Subm', 'Uid', 'Will'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        self._validate_xref(IndividualXref, Msg.NOT_INDIVIDUAL_XREF, str)
+    
 
 class RecordObje(BaseStructure):
     '''Store, validate and format the OBJE structure. 
@@ -11224,6 +12744,7 @@ class RecordObje(BaseStructure):
     - [GEDCOM OBJE Structure](https://gedcom.io/terms/v7/record-OBJE)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.NONE
     
     def __init__(self, value: MultimediaXref, subs: Any) -> None:
         super().__init__(
@@ -11242,6 +12763,16 @@ class RecordObje(BaseStructure):
             class_name='RecordObje',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset(['File'])
+    single_set: ClassVar[frozenset[str]] = frozenset(['Chan', 'Crea', 'Resn'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Chan', 'Crea', 'Exid', 'File', 'Note', 'Refn', 'Resn', 'Snote', 'Sour', 'Uid'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        self._validate_xref(MultimediaXref, Msg.NOT_MULTIMEDIA_XREF, str)
+    
 
 class RecordRepo(BaseStructure):
     '''Store, validate and format the REPO structure. 
@@ -11295,6 +12826,7 @@ class RecordRepo(BaseStructure):
     - [GEDCOM REPO Structure](https://gedcom.io/terms/v7/record-REPO)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.NONE
     
     def __init__(self, value: RepositoryXref, subs: Any) -> None:
         super().__init__(
@@ -11313,6 +12845,16 @@ class RecordRepo(BaseStructure):
             class_name='RecordRepo',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset(['Name'])
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Chan', 'Crea', 'Name'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Chan', 'Crea', 'Email', 'Exid', 'Fax', 'Name', 'Note', 'Phon', 'Refn', 'Snote', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        self._validate_xref(RepositoryXref, Msg.NOT_REPOSITORY_XREF, str)
+    
 
 class RecordSnote(BaseStructure):
     '''Store, validate and format the SNOTE structure. 
@@ -11426,6 +12968,7 @@ class RecordSnote(BaseStructure):
     - [GEDCOM SNOTE Structure](https://gedcom.io/terms/v7/record-SNOTE)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: SharedNoteXref, subs: Any = None) -> None:
         super().__init__(
@@ -11444,6 +12987,16 @@ class RecordSnote(BaseStructure):
             class_name='RecordSnote',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Chan', 'Crea', 'Lang', 'Mime'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Chan', 'Crea', 'Exid', 'Lang', 'Mime', 'NoteTran', 'Refn', 'Sour', 'Uid'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        self._validate_xref(SharedNoteXref, Msg.NOT_SHARED_NOTE_XREF)
+    
 
 class RecordSour(BaseStructure):
     '''Store, validate and format the SOUR structure. 
@@ -11503,6 +13056,7 @@ class RecordSour(BaseStructure):
     - [GEDCOM SOUR Structure](https://gedcom.io/terms/v7/record-SOUR)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.NONE
     
     def __init__(self, value: SourceXref, subs: Any = None) -> None:
         super().__init__(
@@ -11521,6 +13075,16 @@ class RecordSour(BaseStructure):
             class_name='RecordSour',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Abbr', 'Auth', 'Chan', 'Crea', 'Data', 'Publ', 'Text', 'Titl'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Abbr', 'Auth', 'Chan', 'Crea', 'Data', 'Exid', 'Note', 'Obje', 'Publ', 'Refn', 'Repo', 'Snote', 'Text', 'Titl', 'Uid'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        self._validate_xref(SourceXref, Msg.NOT_SOURCE_XREF, str)
+    
 
 class RecordSubm(BaseStructure):
     '''Store, validate and format the SUBM structure. 
@@ -11569,6 +13133,7 @@ class RecordSubm(BaseStructure):
     - [GEDCOM SUBM Structure](https://gedcom.io/terms/v7/record-SUBM)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.NONE
     
     def __init__(self, value: SubmitterXref, subs: Any) -> None:
         super().__init__(
@@ -11587,6 +13152,16 @@ class RecordSubm(BaseStructure):
             class_name='RecordSubm',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset(['Name'])
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Chan', 'Crea', 'Name'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Chan', 'Crea', 'Email', 'Exid', 'Fax', 'Name', 'Note', 'Obje', 'Phon', 'Refn', 'Snote', 'SubmLang', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        self._validate_xref(SubmitterXref, Msg.NOT_SUBMITTER_XREF, str)
+    
 
 class Refn(BaseStructure):
     '''Store, validate and format the REFN structure. 
@@ -11634,6 +13209,7 @@ class Refn(BaseStructure):
     - [GEDCOM REFN Structure](https://gedcom.io/terms/v7/REFN)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -11652,6 +13228,16 @@ class Refn(BaseStructure):
             class_name='Refn',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Type'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Type'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Reli(BaseStructure):
     '''Store, validate and format the RELI structure. 
@@ -11730,6 +13316,7 @@ class Reli(BaseStructure):
     - [GEDCOM RELI Structure](https://gedcom.io/terms/v7/RELI)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -11748,6 +13335,16 @@ class Reli(BaseStructure):
             class_name='Reli',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Repo(BaseStructure):
     '''Store, validate and format the REPO structure. 
@@ -11789,6 +13386,7 @@ class Repo(BaseStructure):
     - [GEDCOM REPO Structure](https://gedcom.io/terms/v7/REPO)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.REPOSITORY_XREF
     
     def __init__(self, value: RepositoryXref, subs: Any = None) -> None:
         super().__init__(
@@ -11807,6 +13405,16 @@ class Repo(BaseStructure):
             class_name='Repo',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Caln', 'Note', 'Snote'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        self._validate_xref(RepositoryXref, Msg.NOT_REPOSITORY_XREF)
+    
 
 class Resn(BaseStructure):
     '''Store, validate and format the RESN structure. 
@@ -11924,6 +13532,7 @@ class Resn(BaseStructure):
     - [GEDCOM RESN Structure](https://gedcom.io/terms/v7/RESN)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.LIST_ENUM
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -11942,6 +13551,16 @@ class Resn(BaseStructure):
             class_name='Resn',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.enum(self.value, self.class_name, self.enum_tags, self.enumset_key, specs)
+    
 
 class Reti(BaseStructure):
     '''Store, validate and format the RETI structure. 
@@ -12003,6 +13622,7 @@ class Reti(BaseStructure):
     - [GEDCOM RETI Structure](https://gedcom.io/terms/v7/RETI)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.Y_OR_NULL
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -12021,6 +13641,16 @@ class Reti(BaseStructure):
             class_name='Reti',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Caus', 'Date', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.y_or_null(self.value, self.class_name)
+    
 
 class Role(BaseStructure):
     '''Store, validate and format the ROLE structure. 
@@ -12174,6 +13804,7 @@ class Role(BaseStructure):
     - [GEDCOM ROLE Structure](https://gedcom.io/terms/v7/ROLE)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.ENUM
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -12192,6 +13823,16 @@ class Role(BaseStructure):
             class_name='Role',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Phrase'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Phrase'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.enum(self.value, self.class_name, self.enum_tags, self.enumset_key, specs)
+    
 
 class Schma(BaseStructure):
     '''Store, validate and format the SCHMA structure. 
@@ -12227,6 +13868,7 @@ class Schma(BaseStructure):
     - [GEDCOM SCHMA Structure](https://gedcom.io/terms/v7/SCHMA)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.NONE
     
     def __init__(self, subs: Any = None) -> None:
         super().__init__(
@@ -12245,6 +13887,15 @@ class Schma(BaseStructure):
             class_name='Schma',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Tag'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+    
 
 class Sdate(BaseStructure):
     '''Store, validate and format the SDATE structure. 
@@ -12345,6 +13996,7 @@ class Sdate(BaseStructure):
     - [GEDCOM SDATE Structure](https://gedcom.io/terms/v7/SDATE)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.DATE
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -12363,6 +14015,16 @@ class Sdate(BaseStructure):
             class_name='Sdate',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Phrase', 'Time'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Phrase', 'Time'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.date(self.value, self.class_name, specs)
+    
 
 class Sex(BaseStructure):
     '''Store, validate and format the SEX structure. 
@@ -12406,6 +14068,7 @@ class Sex(BaseStructure):
     - [GEDCOM SEX Structure](https://gedcom.io/terms/v7/SEX)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.ENUM
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -12424,6 +14087,16 @@ class Sex(BaseStructure):
             class_name='Sex',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.enum(self.value, self.class_name, self.enum_tags, self.enumset_key, specs)
+    
 
 class Slgc(BaseStructure):
     '''Store, validate and format the SLGC structure. 
@@ -12469,6 +14142,7 @@ class Slgc(BaseStructure):
     - [GEDCOM SLGC Structure](https://gedcom.io/terms/v7/SLGC)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.NONE
     
     def __init__(self, subs: Any) -> None:
         super().__init__(
@@ -12487,6 +14161,15 @@ class Slgc(BaseStructure):
             class_name='Slgc',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset(['Famc'])
+    single_set: ClassVar[frozenset[str]] = frozenset(['Date', 'Famc', 'Plac', 'Temp', 'OrdStat'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Date', 'Famc', 'Note', 'Plac', 'Snote', 'Sour', 'Temp', 'OrdStat'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+    
 
 class Slgs(BaseStructure):
     '''Store, validate and format the SLGS structure. 
@@ -12534,6 +14217,7 @@ class Slgs(BaseStructure):
     - [GEDCOM SLGS Structure](https://gedcom.io/terms/v7/SLGS)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.NONE
     
     def __init__(self, subs: Any = None) -> None:
         super().__init__(
@@ -12552,6 +14236,15 @@ class Slgs(BaseStructure):
             class_name='Slgs',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Date', 'Plac', 'Temp', 'OrdStat'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Date', 'Note', 'Plac', 'Snote', 'Sour', 'Temp', 'OrdStat'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+    
 
 class Snote(BaseStructure):
     '''Store, validate and format the SNOTE structure. 
@@ -12653,6 +14346,7 @@ class Snote(BaseStructure):
     - [GEDCOM SNOTE Structure](https://gedcom.io/terms/v7/SNOTE)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.SHARED_NOTE_XREF
     
     def __init__(self, value: SharedNoteXref) -> None:
         super().__init__(
@@ -12671,6 +14365,16 @@ class Snote(BaseStructure):
             class_name='Snote',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        self._validate_xref(SharedNoteXref, Msg.NOT_SHARED_NOTE_XREF)
+    
 
 class SourData(BaseStructure):
     '''Store, validate and format the DATA structure. 
@@ -12704,6 +14408,7 @@ class SourData(BaseStructure):
     - [GEDCOM DATA Structure](https://gedcom.io/terms/v7/SOUR-DATA)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.NONE
     
     def __init__(self, subs: Any = None) -> None:
         super().__init__(
@@ -12722,6 +14427,15 @@ class SourData(BaseStructure):
             class_name='SourData',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Date'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Date', 'Text'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+    
 
 class SourEven(BaseStructure):
     '''Store, validate and format the EVEN structure. 
@@ -12809,6 +14523,7 @@ class SourEven(BaseStructure):
     - [GEDCOM EVEN Structure](https://gedcom.io/terms/v7/SOUR-EVEN)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.ENUM
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -12827,6 +14542,16 @@ class SourEven(BaseStructure):
             class_name='SourEven',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Phrase', 'Role'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Phrase', 'Role'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.enum(self.value, self.class_name, self.enum_tags, self.enumset_key, specs)
+    
 
 class Sour(BaseStructure):
     '''Store, validate and format the SOUR structure. 
@@ -12952,6 +14677,7 @@ class Sour(BaseStructure):
     - [GEDCOM SOUR Structure](https://gedcom.io/terms/v7/SOUR)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.SOURCE_XREF
     
     def __init__(self, value: SourceXref, subs: Any = None) -> None:
         super().__init__(
@@ -12970,6 +14696,16 @@ class Sour(BaseStructure):
             class_name='Sour',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Page', 'Quay', 'SourData', 'SourEven'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Note', 'Obje', 'Page', 'Quay', 'Snote', 'SourData', 'SourEven'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        self._validate_xref(SourceXref, Msg.NOT_SOURCE_XREF)
+    
 
 class Spfx(BaseStructure):
     '''Store, validate and format the SPFX structure. 
@@ -12998,6 +14734,7 @@ class Spfx(BaseStructure):
     - [GEDCOM SPFX Structure](https://gedcom.io/terms/v7/SPFX)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -13016,6 +14753,16 @@ class Spfx(BaseStructure):
             class_name='Spfx',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Ssn(BaseStructure):
     '''Store, validate and format the SSN structure. 
@@ -13076,6 +14823,7 @@ class Ssn(BaseStructure):
     - [GEDCOM SSN Structure](https://gedcom.io/terms/v7/SSN)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -13094,6 +14842,16 @@ class Ssn(BaseStructure):
             class_name='Ssn',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Caus', 'Date', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Stae(BaseStructure):
     '''Store, validate and format the STAE structure. 
@@ -13123,6 +14881,7 @@ class Stae(BaseStructure):
     - [GEDCOM STAE Structure](https://gedcom.io/terms/v7/STAE)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -13141,6 +14900,16 @@ class Stae(BaseStructure):
             class_name='Stae',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class SubmLang(BaseStructure):
     '''Store, validate and format the LANG structure. 
@@ -13172,6 +14941,7 @@ class SubmLang(BaseStructure):
     - [GEDCOM LANG Structure](https://gedcom.io/terms/v7/SUBM-LANG)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.LANGUAGE
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -13190,6 +14960,16 @@ class SubmLang(BaseStructure):
             class_name='SubmLang',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.language(self.value, self.class_name)
+    
 
 class Subm(BaseStructure):
     '''Store, validate and format the SUBM structure. 
@@ -13220,6 +15000,7 @@ class Subm(BaseStructure):
     - [GEDCOM SUBM Structure](https://gedcom.io/terms/v7/SUBM)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.SUBMITTER_XREF
     
     def __init__(self, value: SubmitterXref) -> None:
         super().__init__(
@@ -13238,6 +15019,16 @@ class Subm(BaseStructure):
             class_name='Subm',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        self._validate_xref(SubmitterXref, Msg.NOT_SUBMITTER_XREF, str)
+    
 
 class Surn(BaseStructure):
     '''Store, validate and format the SURN structure. 
@@ -13266,6 +15057,7 @@ class Surn(BaseStructure):
     - [GEDCOM SURN Structure](https://gedcom.io/terms/v7/SURN)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -13284,6 +15076,16 @@ class Surn(BaseStructure):
             class_name='Surn',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Tag(BaseStructure):
     '''Store, validate and format the TAG structure. 
@@ -13313,6 +15115,7 @@ class Tag(BaseStructure):
     - [GEDCOM TAG Structure](https://gedcom.io/terms/v7/TAG)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -13331,6 +15134,17 @@ class Tag(BaseStructure):
             class_name='Tag',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+        Validate.tag(self.value, self.class_name)
+    
 
 class Temp(BaseStructure):
     '''Store, validate and format the TEMP structure. 
@@ -13366,6 +15180,7 @@ class Temp(BaseStructure):
     - [GEDCOM TEMP Structure](https://gedcom.io/terms/v7/TEMP)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -13384,6 +15199,16 @@ class Temp(BaseStructure):
             class_name='Temp',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Text(BaseStructure):
     '''Store, validate and format the TEXT structure. 
@@ -13423,6 +15248,7 @@ class Text(BaseStructure):
     - [GEDCOM TEXT Structure](https://gedcom.io/terms/v7/TEXT)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -13441,6 +15267,16 @@ class Text(BaseStructure):
             class_name='Text',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Lang', 'Mime'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Lang', 'Mime'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Time(BaseStructure):
     '''Store, validate and format the TIME structure. 
@@ -13471,6 +15307,7 @@ class Time(BaseStructure):
     - [GEDCOM TIME Structure](https://gedcom.io/terms/v7/TIME)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.TIME
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -13489,6 +15326,16 @@ class Time(BaseStructure):
             class_name='Time',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.time(self.value, self.class_name)
+    
 
 class Titl(BaseStructure):
     '''Store, validate and format the TITL structure. 
@@ -13558,6 +15405,7 @@ class Titl(BaseStructure):
     - [GEDCOM TITL Structure](https://gedcom.io/terms/v7/TITL)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -13576,6 +15424,16 @@ class Titl(BaseStructure):
             class_name='Titl',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Top(BaseStructure):
     '''Store, validate and format the TOP structure. 
@@ -13604,6 +15462,7 @@ class Top(BaseStructure):
     - [GEDCOM TOP Structure](https://gedcom.io/terms/v7/TOP)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.NON_NEGATIVE_INTEGER
     
     def __init__(self, value: int) -> None:
         super().__init__(
@@ -13622,6 +15481,16 @@ class Top(BaseStructure):
             class_name='Top',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.non_negative_integer(self.value, self.class_name)
+    
 
 class Type(BaseStructure):
     '''Store, validate and format the TYPE structure. 
@@ -13756,6 +15625,7 @@ class Type(BaseStructure):
     - [GEDCOM TYPE Structure](https://gedcom.io/terms/v7/TYPE)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -13774,6 +15644,16 @@ class Type(BaseStructure):
             class_name='Type',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Uid(BaseStructure):
     '''Store, validate and format the UID structure. 
@@ -13889,6 +15769,7 @@ class Uid(BaseStructure):
     - [GEDCOM UID Structure](https://gedcom.io/terms/v7/UID)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -13907,6 +15788,16 @@ class Uid(BaseStructure):
             class_name='Uid',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Vers(BaseStructure):
     '''Store, validate and format the VERS structure. 
@@ -13935,6 +15826,7 @@ class Vers(BaseStructure):
     - [GEDCOM VERS Structure](https://gedcom.io/terms/v7/VERS)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -13953,6 +15845,16 @@ class Vers(BaseStructure):
             class_name='Vers',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
+    
 
 class Width(BaseStructure):
     '''Store, validate and format the WIDTH structure. 
@@ -13981,6 +15883,7 @@ class Width(BaseStructure):
     - [GEDCOM WIDTH Structure](https://gedcom.io/terms/v7/WIDTH)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.NON_NEGATIVE_INTEGER
     
     def __init__(self, value: int) -> None:
         super().__init__(
@@ -13999,6 +15902,16 @@ class Width(BaseStructure):
             class_name='Width',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.non_negative_integer(self.value, self.class_name)
+    
 
 class Wife(BaseStructure):
     '''Store, validate and format the WIFE structure. 
@@ -14046,6 +15959,7 @@ class Wife(BaseStructure):
     - [GEDCOM WIFE Structure](https://gedcom.io/terms/v7/WIFE)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.NONE
     
     def __init__(self, subs: Any) -> None:
         super().__init__(
@@ -14064,6 +15978,15 @@ class Wife(BaseStructure):
             class_name='Wife',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset(['Age'])
+    single_set: ClassVar[frozenset[str]] = frozenset(['Age'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Age'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+    
 
 class Will(BaseStructure):
     '''Store, validate and format the WILL structure. 
@@ -14126,6 +16049,7 @@ class Will(BaseStructure):
     - [GEDCOM WILL Structure](https://gedcom.io/terms/v7/WILL)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.Y_OR_NULL
     
     def __init__(self, value: str, subs: Any = None) -> None:
         super().__init__(
@@ -14144,6 +16068,16 @@ class Will(BaseStructure):
             class_name='Will',
         )
     
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Caus', 'Date', 'Plac', 'Reli', 'Resn', 'Sdate', 'Type'])
+    permitted_set: ClassVar[frozenset[str]] = frozenset(['Addr', 'Age', 'Agnc', 'Asso', 'Caus', 'Date', 'Email', 'Fax', 'Note', 'Obje', 'Phon', 'Plac', 'Reli', 'Resn', 'Sdate', 'Snote', 'Sour', 'Type', 'Uid', 'Www'])
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.y_or_null(self.value, self.class_name)
+    
 
 class Www(BaseStructure):
     '''Store, validate and format the WWW structure. 
@@ -14259,6 +16193,7 @@ class Www(BaseStructure):
     - [GEDCOM WWW Structure](https://gedcom.io/terms/v7/WWW)
     - [GEDCOM Specifications](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html)
     '''
+    payload_id: int = PayloadType.STRING
     
     def __init__(self, value: str) -> None:
         super().__init__(
@@ -14276,4 +16211,14 @@ class Www(BaseStructure):
             payload='http://www.w3.org/2001/XMLSchema#string',
             class_name='Www',
         )
+    
+    required_set: ClassVar[frozenset[str]] = frozenset()
+    single_set: ClassVar[frozenset[str]] = frozenset()
+    permitted_set: ClassVar[frozenset[str]] = frozenset()
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        )
+        Validate.string(self.value, self.class_name)
     
\ No newline at end of file
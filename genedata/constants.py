@@ -20,13 +20,19 @@ References:
 
 __all__ = [
     'ApproxDate',
+    'ChildStatus',
+    'DateError',
     'GedFlag',
+    'Kinship',
+    'ParentRole',
+    'PayloadType',
+    'Pedigree',
     'RangeDate',
     'RestrictDate',
 ]
 
 from dataclasses import dataclass
-from enum import Enum
+from enum import Enum, IntEnum
 from typing import ClassVar, Literal
 
 
@@ -77,24 +83,73 @@ class Default:
     CODE_SUBS: str = 'subs'
     CODE_VALUE: str = 'value'
     COLON: str = ':'
-    COLUMN_RECORDS: str = 'Records'
+    COLUMN_ABBREVIATION: str = 'Abbreviation'
+    COLUMN_AUTHOR: str = 'Author'
+    COLUMN_CALENDAR: str = 'Calendar'
     COLUMN_COUNT: str = 'Count'
+    COLUMN_DATE: str = 'Date'
+    COLUMN_EARLIEST: str = 'Earliest'
+    COLUMN_EVENT: str = 'Event'
+    COLUMN_FAMILY: str = 'Family'
+    COLUMN_GIVEN: str = 'Given'
+    COLUMN_INDIVIDUAL: str = 'Individual'
+    COLUMN_LATEST: str = 'Latest'
+    COLUMN_LATITUDE: str = 'Latitude'
+    COLUMN_LONGITUDE: str = 'Longitude'
+    COLUMN_NAME: str = 'Name'
+    COLUMN_NICKNAME: str = 'Nickname'
+    COLUMN_ORDER: str = 'Order'
+    COLUMN_PAGE: str = 'Page'
+    COLUMN_PEDIGREE: str = 'Pedigree'
+    COLUMN_PLACE: str = 'Place'
+    COLUMN_PUBLICATION: str = 'Publication'
+    COLUMN_QUALIFIER: str = 'Qualifier'
+    COLUMN_RECORD: str = 'Record'
+    COLUMN_RECORDS: str = 'Records'
+    COLUMN_ROLE: str = 'Role'
+    COLUMN_SEX: str = 'Sex'
+    COLUMN_SOURCE: str = 'Source'
+    COLUMN_STRUCTURE: str = 'Structure'
+    COLUMN_SURNAME: str = 'Surname'
+    COLUMN_TITLE: str = 'Title'
+    COLUMN_TYPE: str = 'Type'
+    COLUMN_VALUE: str = 'Value'
     COMMA: str = ','
     COMMA_REQUIRED: str = ',  # REQUIRED'
     CHOICE: int = 1
     CONT: str = 'CONT'
+    DATE_BULK_DIGITS: int = 18
+    DATE_CACHE_SIZE: int = 65536
     DATE_EXACT_SPACES: int = 2
     DATE_EXACT_MAX_SIZE: int = len('01 JAN -2000') 
+    DATE_GRAMMAR_LIMIT: int = 16
     DATE_DAY: int = 0
     DATE_MONTH: int = 0
     DATE_YEAR: int = 0
     DATE_WEEK: int = 0
     DAYS: int = 0
+    DUPLICATE_CACHE_SIZE: int = 65536
+    DUPLICATE_CHUNK_PAIRS: int = 4096
+    DUPLICATE_FLOOR: float = 0.5
+    DUPLICATE_THRESHOLD: float = 0.7
+    DUPLICATE_WINDOW_DAYS: int = 3653
+    EARTH_RADIUS_KM: float = 6371.0088
     EMPTY: str = ''
+    EPOCH_BCE: str = 'BCE'
     EQUAL: str = ' = '
     EOL: str = '\n'
     EOL_CARRIAGE_RETURN: str = '\r\n'
     EOL_DOUBLE: str = '\n\n'
+    EVENT_TAGS: frozenset[str] = frozenset(
+        [
+            'ADOP', 'ANUL', 'BAPM', 'BARM', 'BASM', 'BIRT', 'BLES', 'BURI',
+            'CAST', 'CENS', 'CHR', 'CHRA', 'CONF', 'CREM', 'DEAT', 'DIV',
+            'DIVF', 'DSCR', 'EDUC', 'EMIG', 'ENGA', 'EVEN', 'FACT', 'FCOM',
+            'GRAD', 'IDNO', 'IMMI', 'MARB', 'MARC', 'MARL', 'MARR', 'MARS',
+            'NATI', 'NATU', 'NCHI', 'NMR', 'OCCU', 'ORDN', 'PROB', 'PROP',
+            'RELI', 'RESI', 'RETI', 'SSN', 'TITL', 'WILL',
+        ]
+    )  # fmt: skip
     GED_EXT_SCHMA: str = f'{EOL}1 SCHMA{EOL}'
     GED_EXT_TAG: str = '2 TAG '
     GED_HEADER: str = f'0 HEAD{EOL}'
@@ -117,6 +172,9 @@ class Default:
         'TRLR',
     ])
     INDENT: str = '    '
+    JDN_FRENCH_R_EPOCH: int = 2375840
+    JDN_HEBREW_EPOCH: int = 347998
+    KINSHIP_MAX_PATHS: int = 16
     KIND_STANDARD: str = 'stdTag'
     KIND_EXTENDED: str = 'extTag'
     LATI_DEFAULT: float = 0.0
@@ -126,6 +184,7 @@ class Default:
     LATI_PRECISION: str = '.6f'
     LATI_SOUTH: str = 'S'
     LEFT: int = 0
+    LIFESPAN_DAYS: int = 43830
     LINE_LENGTH: int = 75
     LIST_ITEM_SEPARATOR: str = ', '
     LONG_DEFAULT: float = 0.0
@@ -137,6 +196,8 @@ class Default:
     MANY: str = 'Many'
     MIME: str = ''
     MONTHS: int = 0
+    NAME_SEARCH_LIMIT: int = 20
+    NAME_TRIGRAM_THRESHOLD: float = 0.3
     NO: str = 'No'
     NOID: str = 'NOID'
     NONE: str = 'None'
@@ -159,6 +220,8 @@ class Default:
     PLACE_FORM2: str = 'County'
     PLACE_FORM3: str = 'State'
     PLACE_FORM4: str = 'Country'
+    PLACE_GRID_DEGREES: float = 1.0
+    PLUS: str = '+'
     QUOTE_SINGLE: str = "'"
     QUOTE_DOUBLE: str = '"'
     RECORD: str = 'record'
@@ -190,6 +253,7 @@ class Default:
         'RecordSubm',
         'Trlr',
     )
+    RECORD_KEY_PREFIX: str = 'record-'
     RECORD_TYPES: tuple[str, str, str, str, str, str, str] = (
         'FAM',
         'INDI',
@@ -787,6 +851,120 @@ class RestrictDate(Enum):
     NONE = String.EMPTY
 
 
+class PayloadType(IntEnum):
+    """Small integer identifiers for the payload types of the GEDCOM specification.
+
+    Payload uris are resolved to these identifiers once so that cleaning and
+    validating a value is a table lookup rather than a comparison of uris.
+    Extension payload types are registered with identifiers after `TIME`.
+
+    Reference:
+        - [Data Types](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html#datatypes)
+    """
+
+    NONE = 0
+    STRING = 1
+    Y_OR_NULL = 2
+    NON_NEGATIVE_INTEGER = 3
+    ENUM = 4
+    LIST_ENUM = 5
+    INDIVIDUAL_XREF = 6
+    FAMILY_XREF = 7
+    LIST_TEXT = 8
+    SUBMITTER_XREF = 9
+    LANGUAGE = 10
+    DATE_PERIOD = 11
+    DATE_EXACT = 12
+    DATE = 13
+    FILE_PATH = 14
+    NAME = 15
+    AGE = 16
+    MEDIA_TYPE = 17
+    MULTIMEDIA_XREF = 18
+    REPOSITORY_XREF = 19
+    SHARED_NOTE_XREF = 20
+    SOURCE_XREF = 21
+    TIME = 22
+
+
+class DateError(IntEnum):
+    """Codes for the reason a date failed validation in `Validate.dates_bulk`.
+
+    Each code corresponds to the message the single date validators raise.
+
+    Reference:
+        - [Date](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html#date)
+    """
+
+    NONE = 0
+    NOT_STRING = 1
+    FORMAT = 2
+    SPACES = 3
+    MONTH = 4
+    DAY = 5
+    ZERO_YEAR = 6
+    EPOCH = 7
+    CALENDAR = 8
+
+
+class Kinship(IntEnum):
+    """The kinds of edges between individuals in `KinshipIndex`.
+
+    The edge runs from an individual to their parent, child or spouse.
+    """
+
+    PARENT = 0
+    CHILD = 1
+    SPOUSE = 2
+
+
+class ParentRole(IntEnum):
+    """The role of a parent in a family in `KinshipIndex`.
+
+    ANY is used for a parent linked only by FAMS and, for an adoption,
+    when both parents adopted the child.
+
+    Reference:
+        - [ADOP](https://gedcom.io/terms/v7/enumset-ADOP)
+    """
+
+    ANY = 0
+    HUSB = 1
+    WIFE = 2
+
+
+class Pedigree(IntEnum):
+    """Codes for the PEDI value of a child's link to a family.
+
+    NONE is used when the link has no PEDI substructure.
+
+    Reference:
+        - [PEDI](https://gedcom.io/terms/v7/enumset-PEDI)
+    """
+
+    NONE = 0
+    BIRTH = 1
+    ADOPTED = 2
+    FOSTER = 3
+    SEALING = 4
+    OTHER = 5
+
+
+class ChildStatus(IntEnum):
+    """Codes for the FAMC-STAT value of a child's link to a family.
+
+    NONE is used when the link has no STAT substructure.
+
+    Reference:
+        - [FAMC-STAT](https://gedcom.io/terms/v7/enumset-FAMC-STAT)
+    """
+
+    NONE = 0
+    CHALLENGED = 1
+    DISPROVEN = 2
+    PROVEN = 3
+
+
 # class MediaType(Enum):
 #     """"""
 
@@ -0,0 +1,528 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.md
+"""Find individual records that may describe the same person.
+
+Comparing every pair of individuals does not scale, so `DuplicateIndex`
+first puts each individual into blocks keyed by the Soundex code of the
+surname and a ten year window around the birth.  Only individuals sharing a
+block are scored.  The blocks are kept between calls so individuals staged
+later are only compared with the members of the blocks they join.
+
+A pair is scored from the similarity of the names, birth and death dates,
+places and parents of the two individuals.  Large batches of pairs are
+scored in a process pool.  Pairs scoring at least a threshold are joined
+into clusters.
+"""
+
+__all__ = [
+    'DuplicateCluster',
+    'DuplicateIndex',
+    'DuplicatePair',
+    'DuplicateProfile',
+]
+
+import functools
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, ClassVar, NamedTuple
+
+from genedata.constants import Default
+from genedata.methods import DateInterval
+from genedata.names import NameIndex
+from genedata.specifications70 import Specs
+
+
+class DuplicateProfile(NamedTuple):
+    """The facts of an individual compared when scoring a pair.
+
+    Args:
+        sex: The payload of the SEX substructure or the empty string.
+        words: The lower case words of the first personal name.
+        birth: The first and last Julian day numbers of the birth or None.
+        death: The first and last Julian day numbers of the death or None.
+        places: The lower case words of the places of the events.
+        parent_xrefs: The identifiers of the parents.
+        parent_names: The first personal names of the parents in lower case.
+    """
+
+    sex: str
+    words: tuple[str, ...]
+    birth: tuple[int, int] | None
+    death: tuple[int, int] | None
+    places: frozenset[str]
+    parent_xrefs: frozenset[str]
+    parent_names: frozenset[str]
+
+
+class DuplicatePair(NamedTuple):
+    """Two individuals that may be the same person.
+
+    Args:
+        first: The identifier of the individual staged first.
+        second: The identifier of the individual staged second.
+        score: The confidence from 0 to 1 that both are the same person.
+    """
+
+    first: str
+    second: str
+    score: float
+
+
+class DuplicateCluster(NamedTuple):
+    """A group of individuals that may all be the same person.
+
+    Args:
+        xrefs: The identifiers of the individuals in the order they were staged.
+        confidence: The lowest score of the pairs needed to join the cluster.
+    """
+
+    xrefs: list[str]
+    confidence: float
+
+
+class DuplicateIndex:
+    """Block, score and cluster individuals that may be duplicates.
+
+    Each feature scores from 0 to 1 and a feature missing from either
+    individual scores 0.5, so two individuals with the same name and nothing
+    else score below the default threshold.  Individuals of different sexes
+    score 0.  Dates score 1 if they may fall on the same day, dropping to 0
+    for dates `Default.DUPLICATE_WINDOW_DAYS` apart.  Names average the best
+    match of each word in the other name, where a word with the same Soundex
+    code or an initial scores 0.8.  Places score the share of the words of the
+    smaller set of places and parents whether they are the same individuals
+    or share a name.
+
+    Individuals without a birth date are only compared with undated
+    individuals of the same surname code.  A family record staged after its
+    children rescores them so their parents are compared.
+
+    Examples:
+        >>> import genedata.classes70 as gc
+        >>> from genedata.duplicates import DuplicateIndex
+        >>> index = DuplicateIndex()
+        >>> index.build(
+        ...     [
+        ...         gc.RecordIndi(gc.IndividualXref('@I1@'), [gc.IndiName('John /Smith/'), gc.Birt('', gc.Date('1850'))]),
+        ...         gc.RecordIndi(gc.IndividualXref('@I2@'), [gc.IndiName('Jon /Smyth/'), gc.Birt('', gc.Date('ABT 1851'))]),
+        ...         gc.RecordIndi(gc.IndividualXref('@I3@'), [gc.IndiName('Mary /Smith/'), gc.Birt('', gc.Date('1850'))]),
+        ...     ]
+        ... )
+        >>> index.clusters()
+        [DuplicateCluster(xrefs=['@I1@', '@I2@'], confidence=0.7299)]
+    """
+
+    keys: ClassVar[dict[str, str]] = {
+        'individual': 'record-INDI',
+        'family': 'record-FAM',
+        'name': 'INDI-NAME',
+        'famc': 'INDI-FAMC',
+        'husband': 'FAM-HUSB',
+        'wife': 'FAM-WIFE',
+        'child': 'CHIL',
+    }
+    births: ClassVar[frozenset[str]] = frozenset(['BIRT', 'CHR', 'BAPM'])
+    deaths: ClassVar[frozenset[str]] = frozenset(['DEAT', 'BURI', 'CREM'])
+    weights: ClassVar[dict[str, float]] = {
+        'names': 0.35,
+        'birth': 0.25,
+        'death': 0.1,
+        'places': 0.1,
+        'parents': 0.2,
+    }
+    missing: ClassVar[float] = 0.5
+
+    def __init__(self, specs: dict[str, dict[str, Any]] = Specs) -> None:
+        self.specs: dict[str, dict[str, Any]] = specs
+        self.person_ids: dict[str, int] = {}
+        self.person_xrefs: list[str] = []
+        self.profiles: list[DuplicateProfile | None] = []
+        self.names: list[str] = []
+        self.person_families: list[set[str]] = []
+        self.person_blocks: list[list[tuple[str, int | None]]] = []
+        self.blocks: dict[tuple[str, int | None], list[int]] = {}
+        self.family_parents: dict[str, list[str]] = {}
+        self.family_children: dict[str, set[int]] = {}
+        self.parent_families: dict[str, set[str]] = {}
+        self.pending: set[int] = set()
+        self.scores: dict[int, dict[int, float]] = {}
+
+    @staticmethod
+    def subs(structure: Any) -> list[Any]:
+        """Return the substructures of a structure as a list."""
+        if structure.subs is None:
+            return []
+        if isinstance(structure.subs, list):
+            return structure.subs
+        return [structure.subs]
+
+    def person(self, xref: str) -> int:
+        """Return the id of an individual assigning the next id if it is new."""
+        if xref not in self.person_ids:
+            self.person_ids[xref] = len(self.person_xrefs)
+            self.person_xrefs.append(xref)
+            self.profiles.append(None)
+            self.names.append(Default.EMPTY)
+            self.person_families.append(set())
+            self.person_blocks.append([])
+        return self.person_ids[xref]
+
+    def span(self, event: Any) -> tuple[int, int] | None:
+        """Return the first and last Julian day numbers of the date of an event or None."""
+        for sub in self.subs(event):
+            interval: DateInterval | None = sub.interval(self.specs)
+            if interval is None:
+                continue
+            earliest: int | None = interval.earliest
+            latest: int | None = interval.latest
+            if earliest is not None and latest is not None:
+                return earliest, latest
+            if earliest is not None:
+                return earliest, earliest + Default.DUPLICATE_WINDOW_DAYS
+            if latest is not None:
+                return latest - Default.DUPLICATE_WINDOW_DAYS, latest
+        return None
+
+    def add(self, record: Any) -> None:
+        """Add an individual or family record ignoring other records.
+
+        Individuals already added are replaced and scored again, as are the
+        children of a family and the children of the families of a parent.
+
+        Args:
+            record: A staged record.
+        """
+        xref: str = str(record.value)
+        if xref == Default.VOID_POINTER:
+            return
+        if record.key == self.keys['family']:
+            parents: list[str] = []
+            for sub in self.subs(record):
+                if str(sub.value) == Default.VOID_POINTER:
+                    continue
+                if sub.key in (self.keys['husband'], self.keys['wife']):
+                    parents.append(str(sub.value))
+                elif sub.key == self.keys['child']:
+                    child: int = self.person(str(sub.value))
+                    self.family_children.setdefault(xref, set()).add(child)
+                    self.person_families[child].add(xref)
+            for parent in self.family_parents.get(xref, []):
+                self.parent_families[parent].discard(xref)
+            for parent in parents:
+                self.parent_families.setdefault(parent, set()).add(xref)
+            self.family_parents[xref] = parents
+            self.pending.update(self.family_children.get(xref, set()))
+        elif record.key == self.keys['individual']:
+            self.individual(record, xref)
+
+    def individual(self, record: Any, xref: str) -> None:
+        """Record the facts of an individual and put it in its blocks."""
+        person: int = self.person(xref)
+        sex: str = Default.EMPTY
+        words: list[str] = []
+        birth: tuple[int, int] | None = None
+        death: tuple[int, int] | None = None
+        surname: str = Default.EMPTY
+        places: set[str] = set()
+        families: set[str] = set()
+        for sub in self.subs(record):
+            if sub.tag == 'SEX':
+                sex = str(sub.value)
+            elif sub.key == self.keys['name']:
+                if words:
+                    continue
+                name: str = str(sub.value)
+                words = NameIndex.words(name)
+                self.names[person] = Default.SPACE.join(words)
+                parts: list[str] = name.split(Default.SLASH)
+                surname = next(
+                    iter(NameIndex.words(parts[1]) if len(parts) > 2 else []),
+                    Default.EMPTY,
+                )
+                for part in self.subs(sub):
+                    if part.tag == 'SURN' and not surname:
+                        surname = next(
+                            iter(NameIndex.words(str(part.value))), Default.EMPTY
+                        )
+            elif sub.key == self.keys['famc']:
+                if str(sub.value) != Default.VOID_POINTER:
+                    families.add(str(sub.value))
+            else:
+                for part in self.subs(sub):
+                    if part.tag == 'PLAC':
+                        places.update(NameIndex.words(str(part.value)))
+                if sub.tag in self.births and birth is None:
+                    birth = self.span(sub)
+                elif sub.tag in self.deaths and death is None:
+                    death = self.span(sub)
+        for family in families:
+            self.family_children.setdefault(family, set()).add(person)
+        self.person_families[person].update(families)
+        self.profiles[person] = DuplicateProfile(
+            sex,
+            tuple(words),
+            birth,
+            death,
+            frozenset(places),
+            frozenset(),
+            frozenset(),
+        )
+        if not surname and words:
+            surname = words[-1]
+        code: str = NameIndex.soundex(surname)
+        keys: list[tuple[str, int | None]] = []
+        if birth is None:
+            keys.append((code, None))
+        else:
+            middle: int = (birth[0] + birth[1]) // 2
+            window: int = middle // Default.DUPLICATE_WINDOW_DAYS
+            half: int = (middle * 2 // Default.DUPLICATE_WINDOW_DAYS) % 2
+            keys.extend([(code, window), (code, window + (1 if half else -1))])
+        for key in self.person_blocks[person]:
+            self.blocks[key].remove(person)
+        for key in keys:
+            self.blocks.setdefault(key, []).append(person)
+        self.person_blocks[person] = keys
+        self.pending.add(person)
+        for family in self.parent_families.get(xref, set()):
+            self.pending.update(self.family_children.get(family, set()))
+
+    def build(self, records: list[Any]) -> None:
+        """Add the individual and family records of a list.
+
+        Args:
+            records: The staged records.
+        """
+        for record in records:
+            self.add(record)
+
+    def profile(self, person: int) -> DuplicateProfile | None:
+        """Return the facts of an individual with its parents filled in."""
+        profile: DuplicateProfile | None = self.profiles[person]
+        if profile is None:
+            return None
+        parents: set[str] = {
+            parent
+            for family in self.person_families[person]
+            for parent in self.family_parents.get(family, [])
+        }
+        return profile._replace(
+            parent_xrefs=frozenset(parents),
+            parent_names=frozenset(
+                self.names[self.person_ids[parent]]
+                for parent in parents
+                if parent in self.person_ids and self.names[self.person_ids[parent]]
+            ),
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=Default.DUPLICATE_CACHE_SIZE)
+    def word_score(word: str, other: str) -> float:
+        """Return how alike two words of names are from 0 to 1.
+
+        The same word scores 1 and an initial or a word with the same Soundex
+        code 0.8.  Other words score the share of their trigrams in common.
+        The scores are memoized since the same names recur across many pairs.
+        """
+        if word == other:
+            return 1.0
+        if (
+            word.startswith(other)
+            or other.startswith(word)
+            or NameIndex.soundex(word) == NameIndex.soundex(other)
+        ):
+            return 0.8
+        grams: set[str] = NameIndex.trigrams(word)
+        others: set[str] = NameIndex.trigrams(other)
+        return len(grams & others) / len(grams | others)
+
+    @staticmethod
+    def name_score(words: tuple[str, ...], others: tuple[str, ...]) -> float:
+        """Return the average best match of the words of each name in the other."""
+        if words == others:
+            return 1.0
+        table: list[list[float]] = [
+            [DuplicateIndex.word_score(word, other) for other in others]
+            for word in words
+        ]
+        forward: float = sum(map(max, table))
+        backward: float = sum(map(max, zip(*table, strict=True)))
+        return (forward / len(words) + backward / len(others)) / 2
+
+    @staticmethod
+    def date_score(span: tuple[int, int], other: tuple[int, int]) -> float:
+        """Return 1 for dates that may be the same day falling to 0 a window apart."""
+        gap: int = max(0, max(span[0], other[0]) - min(span[1], other[1]))
+        return max(0.0, 1 - gap / Default.DUPLICATE_WINDOW_DAYS)
+
+    @staticmethod
+    def score(first: DuplicateProfile, second: DuplicateProfile) -> float:
+        """Return the confidence from 0 to 1 that two individuals are the same person."""
+        if first.sex != second.sex and {first.sex, second.sex} <= {'M', 'F'}:
+            return 0.0
+        weights: dict[str, float] = DuplicateIndex.weights
+        missing: float = DuplicateIndex.missing
+        total: float = weights['names'] * (
+            DuplicateIndex.name_score(first.words, second.words)
+            if first.words and second.words
+            else missing
+        )
+        total += weights['birth'] * (
+            DuplicateIndex.date_score(first.birth, second.birth)
+            if first.birth is not None and second.birth is not None
+            else missing
+        )
+        total += weights['death'] * (
+            DuplicateIndex.date_score(first.death, second.death)
+            if first.death is not None and second.death is not None
+            else missing
+        )
+        total += weights['places'] * (
+            len(first.places & second.places)
+            / min(len(first.places), len(second.places))
+            if first.places and second.places
+            else missing
+        )
+        if first.parent_xrefs & second.parent_xrefs:
+            parents: float = 1.0
+        elif first.parent_names and second.parent_names:
+            parents = len(first.parent_names & second.parent_names) / max(
+                len(first.parent_names), len(second.parent_names)
+            )
+        else:
+            parents = missing
+        return round(total + weights['parents'] * parents, 4)
+
+    @staticmethod
+    def score_pairs(
+        pairs: list[tuple[DuplicateProfile, DuplicateProfile]],
+    ) -> list[float]:
+        """Return the score of each pair of profiles."""
+        return [DuplicateIndex.score(first, second) for first, second in pairs]
+
+    def update(self, workers: int | None = None) -> None:
+        """Score the individuals added since the last update against their blocks.
+
+        Args:
+            workers: The number of processes scoring large batches of pairs,
+                which defaults to the number of processors.  One scores in
+                this process.
+        """
+        if not self.pending:
+            return
+        pairs: list[tuple[int, int]] = []
+        for person in sorted(self.pending):
+            for other in self.scores.pop(person, {}):
+                self.scores[other].pop(person, None)
+            # Pairs of two new individuals are taken once from the first of them.
+            candidates: set[int] = {
+                other
+                for key in self.person_blocks[person]
+                for other in self.blocks[key]
+                if other > person or (other < person and other not in self.pending)
+            }
+            pairs.extend(
+                (min(person, other), max(person, other))
+                for other in sorted(candidates)
+            )
+        self.pending.clear()
+        profiles: dict[int, DuplicateProfile | None] = {
+            person: self.profile(person)
+            for person in set(itertools.chain(*pairs))
+        }
+        batch: list[tuple[DuplicateProfile, DuplicateProfile]] = [
+            (profiles[first], profiles[second])  # type: ignore[misc]
+            for first, second in pairs
+        ]
+        size: int = Default.DUPLICATE_CHUNK_PAIRS
+        if workers is None:
+            workers = os.cpu_count() or 1
+        scores: list[float] = []
+        if workers > 1 and len(batch) > size:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for chunk in pool.map(
+                    self.score_pairs,
+                    [
+                        batch[start : start + size]
+                        for start in range(0, len(batch), size)
+                    ],
+                ):
+                    scores.extend(chunk)
+        else:
+            scores = self.score_pairs(batch)
+        for (first, second), score in zip(pairs, scores, strict=True):
+            if score >= Default.DUPLICATE_FLOOR:
+                self.scores.setdefault(first, {})[second] = score
+                self.scores.setdefault(second, {})[first] = score
+
+    def pairs(
+        self,
+        threshold: float = Default.DUPLICATE_THRESHOLD,
+        workers: int | None = None,
+    ) -> list[DuplicatePair]:
+        """Return the pairs of individuals scoring at least a threshold, best first.
+
+        Scores below `Default.DUPLICATE_FLOOR` are not kept.
+
+        Args:
+            threshold: The lowest score to return.
+            workers: The number of processes scoring new pairs.
+        """
+        self.update(workers)
+        found: list[DuplicatePair] = [
+            DuplicatePair(self.person_xrefs[first], self.person_xrefs[second], score)
+            for first, others in self.scores.items()
+            for second, score in others.items()
+            if first < second and score >= threshold
+        ]
+        found.sort(
+            key=lambda pair: (
+                -pair.score,
+                self.person_ids[pair.first],
+                self.person_ids[pair.second],
+            )
+        )
+        return found
+
+    def clusters(
+        self,
+        threshold: float = Default.DUPLICATE_THRESHOLD,
+        workers: int | None = None,
+    ) -> list[DuplicateCluster]:
+        """Return the groups of individuals joined by pairs scoring at least a threshold.
+
+        Clusters are joined from the best pair down, so the confidence of a
+        cluster is the score of the weakest pair needed to connect it.  The
+        most confident clusters come first.
+
+        Args:
+            threshold: The lowest score joining two individuals.
+            workers: The number of processes scoring new pairs.
+        """
+        roots: dict[int, int] = {}
+        confidence: dict[int, float] = {}
+
+        def root(person: int) -> int:
+            while roots.setdefault(person, person) != person:
+                roots[person] = roots[roots[person]]
+                person = roots[person]
+            return person
+
+        for pair in self.pairs(threshold, workers):
+            first: int = root(self.person_ids[pair.first])
+            second: int = root(self.person_ids[pair.second])
+            if first != second:
+                roots[max(first, second)] = min(first, second)
+                confidence[min(first, second)] = min(
+                    pair.score,
+                    confidence.get(first, 1.0),
+                    confidence.get(second, 1.0),
+                )
+        members: dict[int, list[str]] = {}
+        for person in sorted(roots):
+            members.setdefault(root(person), []).append(self.person_xrefs[person])
+        found: list[DuplicateCluster] = [
+            DuplicateCluster(xrefs, confidence[top]) for top, xrefs in members.items()
+        ]
+        found.sort(key=lambda cluster: -cluster.confidence)
+        return found
@@ -0,0 +1,307 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.md
+"""Export staged records as tidy tables for analysis.
+
+`Frames` walks the staged records once and appends each value to a list per
+column.  The lists become pandas DataFrames only at the end so a large
+genealogy is never held as one dictionary per row.  Day numbers are nullable
+integers and coordinates are floats, so the tables can be saved as Parquet or
+Feather without conversion.
+"""
+
+__all__ = ['Frames']
+
+import math
+from typing import Any, ClassVar
+
+import pandas as pd  # type: ignore[import-untyped]
+
+from genedata.constants import Default
+from genedata.methods import DateInterval, Input
+from genedata.specifications70 import Specs
+
+
+class Frames:
+    """Collect the columns of the individual, name, family, member, event, source and citation tables.
+
+    Each table is tidy with one row per individual, name, family, link
+    between a family and an individual, event, source record or source
+    citation.  Events are the standard individual and family events and
+    attributes and any other substructure of a record with a DATE or PLAC
+    except the CHAN and CREA timestamps and the NO assertions.
+
+    Examples:
+        >>> import genedata.classes70 as gc
+        >>> from genedata.frames import Frames
+        >>> frames = Frames()
+        >>> frames.add(gc.RecordIndi(gc.IndividualXref('@I1@'), gc.Sex('F')))
+        >>> frames.frames()['individuals']
+          Individual Sex  Name
+        0       @I1@   F  None
+    """
+
+    tables: ClassVar[dict[str, list[str]]] = {
+        'individuals': [
+            Default.COLUMN_INDIVIDUAL,
+            Default.COLUMN_SEX,
+            Default.COLUMN_NAME,
+        ],
+        'names': [
+            Default.COLUMN_INDIVIDUAL,
+            Default.COLUMN_ORDER,
+            Default.COLUMN_NAME,
+            Default.COLUMN_TYPE,
+            Default.COLUMN_GIVEN,
+            Default.COLUMN_SURNAME,
+            Default.COLUMN_NICKNAME,
+        ],
+        'families': [
+            Default.COLUMN_FAMILY,
+            Default.COLUMN_VALUE,
+        ],
+        'members': [
+            Default.COLUMN_FAMILY,
+            Default.COLUMN_INDIVIDUAL,
+            Default.COLUMN_ROLE,
+            Default.COLUMN_PEDIGREE,
+            Default.COLUMN_RECORD,
+        ],
+        'events': [
+            Default.COLUMN_RECORD,
+            Default.COLUMN_EVENT,
+            Default.COLUMN_VALUE,
+            Default.COLUMN_TYPE,
+            Default.COLUMN_DATE,
+            Default.COLUMN_EARLIEST,
+            Default.COLUMN_LATEST,
+            Default.COLUMN_QUALIFIER,
+            Default.COLUMN_CALENDAR,
+            Default.COLUMN_PLACE,
+            Default.COLUMN_LATITUDE,
+            Default.COLUMN_LONGITUDE,
+        ],
+        'sources': [
+            Default.COLUMN_SOURCE,
+            Default.COLUMN_TITLE,
+            Default.COLUMN_AUTHOR,
+            Default.COLUMN_PUBLICATION,
+            Default.COLUMN_ABBREVIATION,
+        ],
+        'citations': [
+            Default.COLUMN_RECORD,
+            Default.COLUMN_STRUCTURE,
+            Default.COLUMN_SOURCE,
+            Default.COLUMN_PAGE,
+        ],
+    }
+    events: ClassVar[frozenset[str]] = Default.EVENT_TAGS
+    skipped: ClassVar[frozenset[str]] = frozenset(['CHAN', 'CREA', 'NO'])
+    keys: ClassVar[dict[str, str]] = {
+        'individual': 'record-INDI',
+        'family': 'record-FAM',
+        'source': 'record-SOUR',
+        'name': 'INDI-NAME',
+        'name_type': 'NAME-TYPE',
+        'famc': 'INDI-FAMC',
+        'fams': 'FAMS',
+        'husband': 'FAM-HUSB',
+        'wife': 'FAM-WIFE',
+        'child': 'CHIL',
+        'citation': 'SOUR',
+    }
+    name_parts: ClassVar[dict[str, str]] = {
+        'GIVN': Default.COLUMN_GIVEN,
+        'SURN': Default.COLUMN_SURNAME,
+        'NICK': Default.COLUMN_NICKNAME,
+    }
+    source_parts: ClassVar[dict[str, str]] = {
+        'TITL': Default.COLUMN_TITLE,
+        'AUTH': Default.COLUMN_AUTHOR,
+        'PUBL': Default.COLUMN_PUBLICATION,
+        'ABBR': Default.COLUMN_ABBREVIATION,
+    }
+
+    def __init__(self, specs: dict[str, dict[str, Any]] = Specs) -> None:
+        self.specs: dict[str, dict[str, Any]] = specs
+        self.columns: dict[str, dict[str, list[Any]]] = {
+            table: {column: [] for column in columns}
+            for table, columns in self.tables.items()
+        }
+
+    @staticmethod
+    def subs(structure: Any) -> list[Any]:
+        """Return the substructures of a structure as a list."""
+        if structure.subs is None:
+            return []
+        if isinstance(structure.subs, list):
+            return structure.subs
+        return [structure.subs]
+
+    @staticmethod
+    def text(structure: Any) -> str | None:
+        """Return the payload of a structure as a string or None if there is none."""
+        if structure.value is None or structure.value == Default.EMPTY:
+            return None
+        return str(structure.value)
+
+    def append(self, table: str, *values: Any) -> None:
+        """Append a row to a table in the order of its columns."""
+        for column, value in zip(
+            self.columns[table].values(), values, strict=True
+        ):
+            column.append(value)
+
+    def add(self, record: Any) -> None:
+        """Add the rows contributed by a record ignoring records without tables.
+
+        Args:
+            record: A staged record.
+        """
+        xref: str = str(record.value)
+        if record.key == self.keys['individual']:
+            self.individual(record, xref)
+        elif record.key == self.keys['family']:
+            self.append('families', xref, self.text(record))
+            for sub in self.subs(record):
+                if str(sub.value) == Default.VOID_POINTER:
+                    continue
+                if sub.key in (
+                    self.keys['husband'],
+                    self.keys['wife'],
+                    self.keys['child'],
+                ):
+                    self.append('members', xref, str(sub.value), sub.tag, None, xref)
+        elif record.key == self.keys['source']:
+            parts: dict[str, str | None] = dict.fromkeys(self.source_parts.values())
+            for sub in self.subs(record):
+                if sub.tag in self.source_parts:
+                    parts[self.source_parts[sub.tag]] = self.text(sub)
+            self.append('sources', xref, *parts.values())
+        else:
+            return
+        self.record(record, xref, record.key != self.keys['source'])
+
+    def individual(self, record: Any, xref: str) -> None:
+        """Add the rows of the individuals, names and members tables for an individual."""
+        sex: str | None = None
+        first: str | None = None
+        order: int = 0
+        for sub in self.subs(record):
+            if sub.tag == 'SEX':
+                sex = self.text(sub)
+            elif sub.key == self.keys['name']:
+                name: str = str(sub.value).replace(Default.SLASH, Default.EMPTY)
+                if first is None:
+                    first = name
+                parts: dict[str, str | None] = dict.fromkeys(self.name_parts.values())
+                kind: str | None = None
+                for part in self.subs(sub):
+                    if part.tag in self.name_parts:
+                        parts[self.name_parts[part.tag]] = self.text(part)
+                    elif part.key == self.keys['name_type']:
+                        kind = self.text(part)
+                self.append('names', xref, order, name, kind, *parts.values())
+                order += 1
+            elif str(sub.value) == Default.VOID_POINTER:
+                continue
+            elif sub.key == self.keys['famc']:
+                pedigree: str | None = None
+                for qualifier in self.subs(sub):
+                    if qualifier.tag == 'PEDI':
+                        pedigree = self.text(qualifier)
+                self.append('members', str(sub.value), xref, sub.tag, pedigree, xref)
+            elif sub.key == self.keys['fams']:
+                self.append('members', str(sub.value), xref, sub.tag, None, xref)
+        self.append('individuals', xref, sex, first)
+
+    def record(self, record: Any, xref: str, events: bool = True) -> None:
+        """Add the rows of the events and citations tables for the substructures of a record.
+
+        Args:
+            record: An individual, family or source record.
+            xref: The identifier of the record.
+            events: Whether the record has events rather than only citations.
+        """
+        for sub in self.subs(record):
+            if sub.key == self.keys['citation']:
+                self.citation(sub, xref, record.tag)
+                continue
+            date: Any = None
+            place: Any = None
+            kind: str | None = None
+            for part in self.subs(sub):
+                if part.tag == 'DATE':
+                    date = part
+                elif part.tag == 'PLAC':
+                    place = part
+                elif part.tag == 'TYPE':
+                    kind = self.text(part)
+                elif part.key == self.keys['citation']:
+                    self.citation(part, xref, sub.tag)
+            if (
+                not events
+                or sub.tag in self.skipped
+                or (sub.tag not in self.events and date is None and place is None)
+            ):
+                continue
+            interval: DateInterval | None = None
+            if date is not None:
+                interval = date.interval(self.specs)
+            latitude: float = math.nan
+            longitude: float = math.nan
+            if place is not None:
+                for map_structure in self.subs(place):
+                    if map_structure.tag == 'MAP':
+                        for coordinate in self.subs(map_structure):
+                            if coordinate.tag == 'LATI':
+                                latitude = Input.degrees(str(coordinate.value))
+                            elif coordinate.tag == 'LONG':
+                                longitude = Input.degrees(str(coordinate.value))
+            self.append(
+                'events',
+                xref,
+                sub.tag,
+                self.text(sub),
+                kind,
+                None if date is None else self.text(date),
+                None if interval is None else interval.earliest,
+                None if interval is None else interval.latest,
+                None if interval is None else interval.qualifier,
+                None if interval is None else interval.calendar,
+                None if place is None else self.text(place),
+                latitude,
+                longitude,
+            )
+
+    def citation(self, citation: Any, xref: str, structure: str) -> None:
+        """Add a row to the citations table."""
+        page: str | None = None
+        for part in self.subs(citation):
+            if part.tag == 'PAGE':
+                page = self.text(part)
+        self.append('citations', xref, structure, str(citation.value), page)
+
+    def build(self, records: list[Any]) -> None:
+        """Add the rows contributed by every record in a list.
+
+        Args:
+            records: The staged records.
+        """
+        for record in records:
+            self.add(record)
+
+    def frames(self) -> dict[str, pd.DataFrame]:
+        """Return the collected columns as DataFrames keyed by table name."""
+        frames: dict[str, pd.DataFrame] = {}
+        for table, columns in self.columns.items():
+            data: dict[str, Any] = dict(columns)
+            if table == 'events':
+                for column in [Default.COLUMN_EARLIEST, Default.COLUMN_LATEST]:
+                    data[column] = pd.array(columns[column], dtype='Int64')
+                for column in [Default.COLUMN_LATITUDE, Default.COLUMN_LONGITUDE]:
+                    data[column] = pd.array(columns[column], dtype='float64')
+            elif table == 'names':
+                data[Default.COLUMN_ORDER] = pd.array(
+                    columns[Default.COLUMN_ORDER], dtype='int64'
+                )
+            frames[table] = pd.DataFrame(data, columns=self.tables[table])
+        return frames
@@ -18,12 +18,15 @@ for a version numer.
 
 __all__ = ['Classes', 'Tests']
 
+import hashlib
 import importlib
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from textwrap import wrap
-from typing import Any
+from typing import Any, ClassVar
 
-from genedata.constants import Default
-from genedata.methods import Names, Query
+from genedata.constants import Default, PayloadType
+from genedata.methods import Names, Payload, Query
 
 
 class Classes:
@@ -67,9 +70,11 @@ The specifications for this module are from the
     def imports() -> str:
         return f"""
 import logging
-from typing import Any
+from typing import Any, ClassVar
 
+from genedata.constants import PayloadType
 from genedata.messages import Msg
+from genedata.methods import Validate
 from genedata.structure import (
     BaseStructure,
     {Default.XREF_FAMILY},
@@ -577,6 +582,105 @@ from genedata.structure import (
         ){deprecation_line}"""
         return init_line  #''.join([init, init_line])
 
+    # The statement validating the value of each payload type in a generated `_validate` method.
+    payload_validators: ClassVar[dict[str, str]] = {
+        'http://www.w3.org/2001/XMLSchema#string': 'Validate.string(self.value, self.class_name)',
+        'Y|<NULL>': 'Validate.y_or_null(self.value, self.class_name)',
+        'http://www.w3.org/2001/XMLSchema#nonNegativeInteger': 'Validate.non_negative_integer(self.value, self.class_name)',
+        'https://gedcom.io/terms/v7/type-Enum': 'Validate.enum(self.value, self.class_name, self.enum_tags, self.enumset_key, specs)',
+        'https://gedcom.io/terms/v7/type-List#Enum': 'Validate.enum(self.value, self.class_name, self.enum_tags, self.enumset_key, specs)',
+        '@<https://gedcom.io/terms/v7/record-INDI>@': 'self._validate_xref(IndividualXref, Msg.NOT_INDIVIDUAL_XREF, str)',
+        '@<https://gedcom.io/terms/v7/record-FAM>@': 'self._validate_xref(FamilyXref, Msg.NOT_FAMILY_XREF, str)',
+        'https://gedcom.io/terms/v7/type-List#Text': 'Validate.listing(self.value, self.class_name)',
+        '@<https://gedcom.io/terms/v7/record-SUBM>@': 'self._validate_xref(SubmitterXref, Msg.NOT_SUBMITTER_XREF, str)',
+        'http://www.w3.org/2001/XMLSchema#Language': 'Validate.language(self.value, self.class_name)',
+        'https://gedcom.io/terms/v7/type-Date#period': 'Validate.date_period(self.value, self.class_name, specs)',
+        'https://gedcom.io/terms/v7/type-Date#exact': 'Validate.date_exact(self.value, self.class_name)',
+        'https://gedcom.io/terms/v7/type-Date': 'Validate.date(self.value, self.class_name, specs)',
+        'https://gedcom.io/terms/v7/type-FilePath': 'Validate.filepath(self.value, self.class_name)',
+        'https://gedcom.io/terms/v7/type-Name': 'Validate.name(self.value, self.class_name)',
+        'https://gedcom.io/terms/v7/type-Age': 'Validate.age(self.value, self.class_name)',
+        'http://www.w3.org/ns/dcat#mediaType': 'Validate.mediatype(self.value, self.class_name)',
+        '@<https://gedcom.io/terms/v7/record-OBJE>@': 'self._validate_xref(MultimediaXref, Msg.NOT_MULTIMEDIA_XREF)',
+        '@<https://gedcom.io/terms/v7/record-REPO>@': 'self._validate_xref(RepositoryXref, Msg.NOT_REPOSITORY_XREF)',
+        '@<https://gedcom.io/terms/v7/record-SNOTE>@': 'self._validate_xref(SharedNoteXref, Msg.NOT_SHARED_NOTE_XREF)',
+        '@<https://gedcom.io/terms/v7/record-SOUR>@': 'self._validate_xref(SourceXref, Msg.NOT_SOURCE_XREF)',
+        'https://gedcom.io/terms/v7/type-Time': 'Validate.time(self.value, self.class_name)',
+    }
+
+    # The statement validating records and structures that have more than a payload to check.
+    key_validators: ClassVar[dict[str, str]] = {
+        'record-FAM': 'self._validate_xref(FamilyXref, Msg.NOT_FAMILY_XREF, str)',
+        'record-INDI': 'self._validate_xref(IndividualXref, Msg.NOT_INDIVIDUAL_XREF, str)',
+        'record-OBJE': 'self._validate_xref(MultimediaXref, Msg.NOT_MULTIMEDIA_XREF, str)',
+        'record-REPO': 'self._validate_xref(RepositoryXref, Msg.NOT_REPOSITORY_XREF, str)',
+        'record-SNOTE': 'self._validate_xref(SharedNoteXref, Msg.NOT_SHARED_NOTE_XREF)',
+        'record-SOUR': 'self._validate_xref(SourceXref, Msg.NOT_SOURCE_XREF, str)',
+        'record-SUBM': 'self._validate_xref(SubmitterXref, Msg.NOT_SUBMITTER_XREF, str)',
+        'LATI': 'Validate.lati(self.value, self.class_name)',
+        'LONG': 'Validate.long(self.value, self.class_name)',
+        'TAG': 'Validate.tag(self.value, self.class_name)',
+    }
+
+    @staticmethod
+    def validate(
+        key: str,
+        specs: dict[str, dict[str, Any]],
+    ) -> str:
+        """Construct the `_validate` method of the class specialised from its specification.
+
+        The required, singular and permitted substructures are stored as
+        frozensets on the class and only the one validator that applies to
+        the payload is called.
+
+        Example:
+            >>> from genedata.generate import Classes
+            >>> from genedata.specifications70 import Specs
+            >>> print(Classes.validate('LATI', Specs))
+            <BLANKLINE>
+                required_set: ClassVar[frozenset[str]] = frozenset()
+                single_set: ClassVar[frozenset[str]] = frozenset()
+                permitted_set: ClassVar[frozenset[str]] = frozenset()
+            <BLANKLINE>
+                def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+                    self._validate_substructures(
+                        self.required_set, self.single_set, self.permitted_set
+                    )
+                    Validate.string(self.value, self.class_name)
+                    Validate.lati(self.value, self.class_name)
+
+        Args:
+            key: The key of the structure being generated.
+            specs: The dictionary of specifications.
+        """
+
+        def frozen(names: list[str]) -> str:
+            if len(names) == 0:
+                return 'frozenset()'
+            return f'frozenset({names})'
+
+        payload: str = Query.payload(key, specs)
+        checks: list[str] = []
+        if payload in Classes.payload_validators:
+            checks.append(Classes.payload_validators[payload])
+        if key in Classes.key_validators:
+            # The value of a record is checked as its cross reference identifier.
+            if key.startswith(Default.RECORD):
+                checks = []
+            checks.append(Classes.key_validators[key])
+        check_lines: str = ''.join(
+            [f'{Default.EOL}{Default.INDENT * 2}{check}' for check in checks]
+        )
+        return f"""
+    required_set: ClassVar[frozenset[str]] = {frozen(Query.required(key, specs))}
+    single_set: ClassVar[frozenset[str]] = {frozen(Query.singular(key, specs))}
+    permitted_set: ClassVar[frozenset[str]] = {frozen(Query.permitted(key, specs))}
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        self._validate_substructures(
+            self.required_set, self.single_set, self.permitted_set
+        ){check_lines}"""
+
     @staticmethod
     def generate_class(
         key: str,
@@ -604,6 +708,9 @@ from genedata.structure import (
         """
         tag: str = Query.standard_structure_tag(key, specs)
         class_name: str = Names.classname(key)
+        payload_type: str = PayloadType(
+            Payload.resolve(Query.payload(key, specs))
+        ).name
         parts: str = ''.join(
             [
                 Classes.specification(key, specs),
@@ -629,43 +736,140 @@ class {class_name}(BaseStructure):
 
     {parts}
     '''
+    payload_id: int = PayloadType.{payload_type}
     {Classes.init(key, specs)}
+    {Classes.validate(key, specs)}
     """
         return lines
 
+    @staticmethod
+    def fingerprint(
+        key: str,
+        specs: dict[str, dict[str, Any]],
+        examples: str,
+    ) -> str:
+        """Hash everything in the specification that the class for a key is generated from.
+
+        A generated class depends on the structure's own specification, its
+        enumeration set and enumerations, its examples and the specification version.
+
+        Example:
+            >>> from genedata.generate import Classes
+            >>> from genedata.specifications70 import Specs
+            >>> len(Classes.fingerprint('MAP', Specs, ''))
+            64
+
+        Args:
+            key: The key of the structure being generated.
+            specs: The dictionary of specifications.
+            examples: The examples to add to this class.
+        """
+        structure: dict[str, Any] = specs[Default.YAML_TYPE_STRUCTURE][key]
+        parts: list[Any] = [
+            specs[Default.YAML_META][Default.YAML_VERSION],
+            structure,
+            examples,
+        ]
+        if Default.YAML_ENUMERATION_SET in structure:
+            enumeration_set: dict[str, Any] = specs[
+                Default.YAML_TYPE_ENUMERATION_SET
+            ].get(Names.stem(structure[Default.YAML_ENUMERATION_SET]), {})
+            parts.append(enumeration_set)
+            for enum in enumeration_set.get(
+                Default.YAML_ENUMERATION_VALUES, []
+            ):
+                enum_key: str = Names.stem(enum)
+                parts.append(
+                    specs[Default.YAML_TYPE_ENUMERATION].get(
+                        enum_key,
+                        specs[Default.YAML_TYPE_STRUCTURE].get(enum_key),
+                    )
+                )
+        return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+    # The generated text of each class keyed by structure key
+    # together with the fingerprint of what it was generated from.
+    class_cache: ClassVar[dict[str, tuple[str, str]]] = {}
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Remove all generated classes from the class cache."""
+        Classes.class_cache.clear()
+
     @staticmethod
     def all_classes(
         specs: dict[str, dict[str, Any]],
         full_examples: dict[str, str],
+        processes: bool = False,
+        max_workers: int | None = None,
     ) -> str:
-        """Generate all classes and their documentation defined by the Structure dictionary."""
+        """Generate all classes and their documentation defined by the Structure dictionary.
 
-        lines: str = Default.EMPTY
-        class_data: str = Default.EMPTY
-        for key, _structure in specs[Default.YAML_TYPE_STRUCTURE].items():
-            if key not in Default.IGNORE:
-                examples: str = Default.EMPTY
-                if key in full_examples:
-                    examples = full_examples[key]
-                #try:
-                class_data = Classes.generate_class(
-                    key,
-                    specs,
-                    examples,
-                )
-                # except Exception:
-                #     logging.info(f'"{key}" failed to generate class.')
-                #     raise
-                lines = ''.join(
-                    [
-                        lines,
-                        class_data,
-                    ]
+        Each class is stored in the class cache with the fingerprint of the specification
+        it was generated from.  Only those classes whose fingerprint has changed since
+        the last run are generated again.
+
+        Example:
+            After the first run, a second run with an unchanged specification
+            generates nothing and returns the same module text.
+            >>> from genedata.examples70 import Examples
+            >>> from genedata.generate import Classes
+            >>> from genedata.specifications70 import Specs
+            >>> first = Classes.all_classes(Specs, Examples)
+            >>> second = Classes.all_classes(Specs, Examples)
+            >>> first == second
+            True
+
+        Args:
+            specs: The dictionary of specifications.
+            full_examples: The dictionary of examples for each key.
+            processes: If True generate the changed classes in a process pool.
+            max_workers: The maximum number of processes in the pool.
+        """
+        keys: list[str] = [
+            key
+            for key in specs[Default.YAML_TYPE_STRUCTURE]
+            if key not in Default.IGNORE
+        ]
+        examples: dict[str, str] = {
+            key: full_examples.get(key, Default.EMPTY) for key in keys
+        }
+        fingerprints: dict[str, str] = {
+            key: Classes.fingerprint(key, specs, examples[key]) for key in keys
+        }
+        stale: list[str] = [
+            key
+            for key in keys
+            if key not in Classes.class_cache
+            or Classes.class_cache[key][0] != fingerprints[key]
+        ]
+        class_data: list[str] = []
+        if processes and len(stale) > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                class_data = list(
+                    pool.map(
+                        Classes.generate_class,
+                        stale,
+                        repeat(specs),
+                        [examples[key] for key in stale],
+                        chunksize=16,
+                    )
                 )
-        return lines
+        else:
+            class_data = [
+                Classes.generate_class(key, specs, examples[key])
+                for key in stale
+            ]
+        for key, data in zip(stale, class_data, strict=True):
+            Classes.class_cache[key] = (fingerprints[key], data)
+        return ''.join([Classes.class_cache[key][1] for key in keys])
 
     @staticmethod
-    def build_all(specs: dict[str, dict[str, Any]]) -> str:
+    def build_all(
+        specs: dict[str, dict[str, Any]],
+        processes: bool = False,
+        max_workers: int | None = None,
+    ) -> str:
         """Construct the entire module containing GEDCOM structures converted to classes.
 
         To build the classes module one either needs a base directory where the yaml files
@@ -681,6 +885,8 @@ class {class_name}(BaseStructure):
 
         Args:
             specs: The specification module generated when the yaml files were loaded.
+            processes: If True generate the changed classes in a process pool.
+            max_workers: The maximum number of processes in the pool.
         """
         version: str = specs[Default.YAML_META][Default.YAML_VERSION]
         source: str = specs[Default.YAML_META][Default.YAML_SOURCE]
@@ -696,6 +902,8 @@ class {class_name}(BaseStructure):
                 Classes.all_classes(
                     specs,
                     examples.Examples,
+                    processes,
+                    max_workers,
                 ),
             ]
         )
@@ -0,0 +1,769 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.md
+"""Index the family relationships of a genealogy for traversal queries.
+
+Individuals and families point to each other through the FAMC and FAMS
+substructures of individual records and the HUSB, WIFE and CHIL substructures
+of family records.  `KinshipIndex` turns these pointers into adjacency arrays
+over integer ids so that the parents, children and spouses of an individual
+are found without searching the records.
+"""
+
+__all__ = ['KinshipEdges', 'KinshipIndex', 'KinshipLabel', 'Relationship']
+
+import math
+from typing import Any, ClassVar, NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+
+from genedata.constants import ChildStatus, Default, Kinship, ParentRole, Pedigree
+
+Integers = npt.NDArray[np.int64]
+
+
+class KinshipEdges(NamedTuple):
+    """The edges of one kind in compressed sparse row form.
+
+    The edges leaving individual `i` are at positions `indptr[i]` up to
+    `indptr[i + 1]` of the other arrays.
+
+    Args:
+        indptr: The start of each individual's edges with the total at the end.
+        indices: The individual at the other end of each edge.
+        families: The family through which the two individuals are related.
+        pedigrees: The `Pedigree` code of the child's link to the family.
+        statuses: The `ChildStatus` code of the child's link to the family.
+    """
+
+    indptr: Integers
+    indices: Integers
+    families: Integers
+    pedigrees: npt.NDArray[np.int8]
+    statuses: npt.NDArray[np.int8]
+
+
+class Relationship(NamedTuple):
+    """How a second individual is related to a first through common ancestors.
+
+    Args:
+        label: The name of the relationship of the second individual to the first.
+        up: The generations from the first individual up to the common ancestors.
+        down: The generations from the common ancestors down to the second individual.
+        ancestors: The identifiers of the nearest common ancestors.
+        paths: The identifiers along each shortest path from the first individual
+            through a common ancestor to the second.
+    """
+
+    label: str
+    up: int
+    down: int
+    ancestors: list[str]
+    paths: list[list[str]]
+
+
+class KinshipLabel:
+    """Name a relationship from the generations up to and down from a common ancestor.
+
+    Examples:
+        >>> from genedata.kinship import KinshipLabel
+        >>> KinshipLabel.name(3, 0)
+        'great-grandparent'
+        >>> KinshipLabel.name(2, 3)
+        '1st cousin once removed'
+        >>> KinshipLabel.name(1, 3, half=True)
+        'half-grandniece or half-grandnephew'
+    """
+
+    SELF: str = 'self'
+    SIBLING: str = 'sibling'
+    PARENT: ClassVar[list[str]] = ['parent']
+    CHILD: ClassVar[list[str]] = ['child']
+    NIBLING: ClassVar[list[str]] = ['niece', 'nephew']
+    PIBLING: ClassVar[list[str]] = ['aunt', 'uncle']
+    COUSIN: str = '{0} cousin'
+    GRAND: str = 'grand'
+    GREAT_GRAND: str = 'great-grand'
+    GREATS: str = '{0} great-grand'
+    HALF: str = 'half-'
+    OR: str = ' or '
+    REMOVED: ClassVar[dict[int, str]] = {1: ' once removed', 2: ' twice removed'}
+    TIMES_REMOVED: str = ' {0} times removed'
+    SUFFIXES: ClassVar[dict[int, str]] = {1: 'st', 2: 'nd', 3: 'rd'}
+    TH: str = 'th'
+
+    @staticmethod
+    def ordinal(number: int) -> str:
+        """Return a number with its English ordinal suffix."""
+        suffix: str = KinshipLabel.SUFFIXES.get(number % 10, KinshipLabel.TH)
+        if number % 100 in (11, 12, 13):
+            suffix = KinshipLabel.TH
+        return f'{number}{suffix}'
+
+    @staticmethod
+    def greats(generations: int, words: list[str], prefix: str = Default.EMPTY) -> str:
+        """Return the words preceded by grand, great-grand and so on for the generations."""
+        grand: str = Default.EMPTY
+        if generations == 1:
+            grand = KinshipLabel.GRAND
+        elif generations == 2:
+            grand = KinshipLabel.GREAT_GRAND
+        elif generations > 2:
+            grand = KinshipLabel.GREATS.format(KinshipLabel.ordinal(generations - 1))
+        return KinshipLabel.OR.join(''.join([prefix, grand, word]) for word in words)
+
+    @staticmethod
+    def name(up: int, down: int, half: bool = False) -> str:
+        """Return the name of the relationship of the second individual to the first.
+
+        Args:
+            up: The generations from the first individual up to the common ancestor.
+            down: The generations from the common ancestor down to the second individual.
+            half: Whether the two share only one of a couple of common ancestors.
+        """
+        if up == 0 and down == 0:
+            return KinshipLabel.SELF
+        if down == 0:
+            return KinshipLabel.greats(up - 1, KinshipLabel.PARENT)
+        if up == 0:
+            return KinshipLabel.greats(down - 1, KinshipLabel.CHILD)
+        prefix: str = KinshipLabel.HALF if half else Default.EMPTY
+        if up == 1 and down == 1:
+            return ''.join([prefix, KinshipLabel.SIBLING])
+        if up == 1:
+            return KinshipLabel.greats(down - 2, KinshipLabel.NIBLING, prefix)
+        if down == 1:
+            return KinshipLabel.greats(up - 2, KinshipLabel.PIBLING, prefix)
+        removed: int = abs(up - down)
+        return ''.join(
+            [
+                prefix,
+                KinshipLabel.COUSIN.format(KinshipLabel.ordinal(min(up, down) - 1)),
+                KinshipLabel.REMOVED.get(
+                    removed,
+                    KinshipLabel.TIMES_REMOVED.format(removed) if removed else Default.EMPTY,
+                ),
+            ]
+        )
+
+
+class KinshipIndex:
+    """Adjacency arrays of the parents, children and spouses of each individual.
+
+    Every individual and family receives an integer id in the order it is
+    first seen.  Adding a record only appends its family memberships so
+    records may be added one at a time as they are staged.  The adjacency
+    arrays are rebuilt from the memberships by the first lookup after a change
+    and each lookup afterwards is a slice of those arrays.
+
+    Memberships are taken from both sides, so a child linked to a family only
+    by the family's CHIL or only by the individual's FAMC is still a child of
+    the family's parents.  The PEDI and STAT of the FAMC are kept on the edges.
+
+    Examples:
+        >>> import genedata.classes70 as gc
+        >>> from genedata.build import Genealogy
+        >>> g = Genealogy()
+        >>> mother = g.individual_xref('mother')
+        >>> child = g.individual_xref('child')
+        >>> family = g.family_xref('family')
+        >>> g.stage(gc.RecordFam(family, [gc.FamWife(mother), gc.Chil(child)]))
+        >>> g.stage(gc.RecordIndi(child, gc.IndiFamc(family, gc.Pedi('ADOPTED'))))
+        >>> index = g.kinship()
+        >>> index.parents(child)
+        ['@MOTHER@']
+        >>> index.children(mother)
+        ['@CHILD@']
+        >>> Pedigree(index.edges(Kinship.PARENT).pedigrees[0]).name
+        'ADOPTED'
+    """
+
+    keys: ClassVar[dict[str, str]] = {
+        'family': 'record-FAM',
+        'individual': 'record-INDI',
+        'famc': 'INDI-FAMC',
+        'fams': 'FAMS',
+        'husband': 'FAM-HUSB',
+        'wife': 'FAM-WIFE',
+        'child': 'CHIL',
+        'pedigree': 'PEDI',
+        'status': 'FAMC-STAT',
+        'adoption': 'ADOP',
+        'adoption_famc': 'ADOP-FAMC',
+        'adopter': 'FAMC-ADOP',
+    }
+    adopters: ClassVar[dict[str, ParentRole]] = {
+        'BOTH': ParentRole.ANY,
+        'HUSB': ParentRole.HUSB,
+        'WIFE': ParentRole.WIFE,
+    }
+
+    def __init__(self) -> None:
+        self.person_ids: dict[str, int] = {}
+        self.person_xrefs: list[str] = []
+        self.family_ids: dict[str, int] = {}
+        self.family_xrefs: list[str] = []
+
+        # The family, individual and role of each parent and the family,
+        # individual, pedigree, status and adopting parent of each child
+        # as found in the records.
+        self.parent_rows: list[tuple[int, int, int]] = []
+        self.child_rows: list[tuple[int, int, int, int, int]] = []
+        self.changed: bool = True
+        self.adjacency: dict[Kinship, KinshipEdges] = {}
+        self.ancestor_bits: dict[int, npt.NDArray[np.uint8]] = {}
+        self.parent_lists: (
+            tuple[list[int], list[int], list[int], list[int]] | None
+        ) = None
+
+    @staticmethod
+    def subs(structure: Any) -> list[Any]:
+        """Return the substructures of a structure as a list."""
+        if structure.subs is None:
+            return []
+        if isinstance(structure.subs, list):
+            return structure.subs
+        return [structure.subs]
+
+    def person(self, xref: Any) -> int:
+        """Return the id of an individual assigning the next id if it is new.
+
+        Args:
+            xref: The IndividualXref or its name such as '@I1@'.
+        """
+        name: str = str(xref)
+        if name not in self.person_ids:
+            self.person_ids[name] = len(self.person_xrefs)
+            self.person_xrefs.append(name)
+        return self.person_ids[name]
+
+    def family(self, xref: Any) -> int:
+        """Return the id of a family assigning the next id if it is new.
+
+        Args:
+            xref: The FamilyXref or its name such as '@F1@'.
+        """
+        name: str = str(xref)
+        if name not in self.family_ids:
+            self.family_ids[name] = len(self.family_xrefs)
+            self.family_xrefs.append(name)
+        return self.family_ids[name]
+
+    def add(self, record: Any) -> None:
+        """Add the family memberships of an individual or family record.
+
+        An ADOP event with a FAMC makes the individual an adopted child of the
+        family's parents or only of the HUSB or WIFE named by its ADOP value.
+        Other records and pointers to the void are ignored.
+
+        Args:
+            record: A staged record.
+        """
+        if str(record.value) == Default.VOID_POINTER:
+            return
+        if record.key == self.keys['individual']:
+            person: int = self.person(record.value)
+            for sub in self.subs(record):
+                if sub.key == self.keys['adoption']:
+                    for famc in self.subs(sub):
+                        if (
+                            famc.key == self.keys['adoption_famc']
+                            and str(famc.value) != Default.VOID_POINTER
+                        ):
+                            adopter: int = ParentRole.ANY
+                            for role in self.subs(famc):
+                                if role.key == self.keys['adopter']:
+                                    adopter = self.adopters[role.value]
+                            self.child_rows.append(
+                                (
+                                    self.family(famc.value),
+                                    person,
+                                    Pedigree.ADOPTED,
+                                    ChildStatus.NONE,
+                                    adopter,
+                                )
+                            )
+                elif str(sub.value) == Default.VOID_POINTER:
+                    continue
+                elif sub.key == self.keys['fams']:
+                    self.parent_rows.append(
+                        (self.family(sub.value), person, ParentRole.ANY)
+                    )
+                elif sub.key == self.keys['famc']:
+                    pedigree: int = Pedigree.NONE
+                    status: int = ChildStatus.NONE
+                    for qualifier in self.subs(sub):
+                        if qualifier.key == self.keys['pedigree']:
+                            pedigree = Pedigree[qualifier.value]
+                        elif qualifier.key == self.keys['status']:
+                            status = ChildStatus[qualifier.value]
+                    self.child_rows.append(
+                        (
+                            self.family(sub.value),
+                            person,
+                            pedigree,
+                            status,
+                            ParentRole.ANY,
+                        )
+                    )
+        elif record.key == self.keys['family']:
+            family: int = self.family(record.value)
+            for sub in self.subs(record):
+                if str(sub.value) == Default.VOID_POINTER:
+                    continue
+                if sub.key == self.keys['husband']:
+                    self.parent_rows.append(
+                        (family, self.person(sub.value), ParentRole.HUSB)
+                    )
+                elif sub.key == self.keys['wife']:
+                    self.parent_rows.append(
+                        (family, self.person(sub.value), ParentRole.WIFE)
+                    )
+                elif sub.key == self.keys['child']:
+                    self.child_rows.append(
+                        (
+                            family,
+                            self.person(sub.value),
+                            Pedigree.NONE,
+                            ChildStatus.NONE,
+                            ParentRole.ANY,
+                        )
+                    )
+        else:
+            return
+        self.changed = True
+        self.ancestor_bits.clear()
+
+    def build(self, records: list[Any]) -> None:
+        """Add the family memberships of a list of records.
+
+        Args:
+            records: The staged records.
+        """
+        for record in records:
+            self.add(record)
+
+    @staticmethod
+    def join(left: Integers, right: Integers) -> tuple[Integers, Integers]:
+        """Return the pairs of positions in two sorted arrays with equal values.
+
+        Args:
+            left: The sorted values of the first array.
+            right: The sorted values of the second array.
+        """
+        low: Integers = np.searchsorted(right, left, side='left')
+        counts: Integers = np.searchsorted(right, left, side='right') - low
+        rows: Integers = np.repeat(np.arange(len(left)), counts)
+        starts: Integers = np.repeat(np.cumsum(counts) - counts, counts)
+        return rows, np.arange(len(rows)) - starts + np.repeat(low, counts)
+
+    def compress(
+        self,
+        sources: Integers,
+        targets: Integers,
+        families: Integers,
+        pedigrees: Integers,
+        statuses: Integers,
+    ) -> KinshipEdges:
+        """Sort edges by their source into compressed sparse row form."""
+        order: Integers = np.lexsort((targets, sources))
+        indptr: Integers = np.zeros(len(self.person_xrefs) + 1, dtype=np.int64)
+        np.cumsum(
+            np.bincount(sources, minlength=len(self.person_xrefs)),
+            out=indptr[1:],
+        )
+        return KinshipEdges(
+            indptr,
+            targets[order],
+            families[order],
+            pedigrees[order].astype(np.int8),
+            statuses[order].astype(np.int8),
+        )
+
+    @staticmethod
+    def last_rows(rows: Integers) -> Integers:
+        """Keep the last row for each family and individual of rows sorted by them."""
+        last: npt.NDArray[np.bool_] = np.ones(len(rows), dtype=bool)
+        last[:-1] = np.any(rows[1:, :2] != rows[:-1, :2], axis=1)
+        return rows[last]
+
+    def compact(self) -> None:
+        """Rebuild the adjacency arrays from the family memberships."""
+        parents: Integers = np.array(self.parent_rows, dtype=np.int64).reshape(
+            -1, 3
+        )
+        children: Integers = np.array(self.child_rows, dtype=np.int64).reshape(
+            -1, 5
+        )
+
+        # Keep one row for each parent of a family preferring the one with a role
+        # and one for each child preferring the one with a PEDI.
+        parents = self.last_rows(
+            parents[np.lexsort((parents[:, 2], parents[:, 1], parents[:, 0]))]
+        )
+        children = self.last_rows(
+            children[
+                np.lexsort(
+                    (
+                        children[:, 4],
+                        children[:, 3],
+                        children[:, 2],
+                        children[:, 1],
+                        children[:, 0],
+                    )
+                )
+            ]
+        )
+
+        # Pair the parents of each family with its children leaving out
+        # a parent who did not adopt the child and pair the parents with each other.
+        parent_rows, child_rows = self.join(parents[:, 0], children[:, 0])
+        roles: Integers = parents[parent_rows, 2]
+        adopters: Integers = children[child_rows, 4]
+        kept: npt.NDArray[np.bool_] = (
+            (adopters == ParentRole.ANY)
+            | (roles == ParentRole.ANY)
+            | (roles == adopters)
+        )
+        parent_rows, child_rows = parent_rows[kept], child_rows[kept]
+        pairs: tuple[Integers, Integers] = (
+            parents[parent_rows, 1],
+            children[child_rows, 1],
+        )
+        families: Integers = parents[parent_rows, 0]
+        pedigrees: Integers = children[child_rows, 2]
+        statuses: Integers = children[child_rows, 3]
+        first, second = self.join(parents[:, 0], parents[:, 0])
+        distinct: npt.NDArray[np.bool_] = parents[first, 1] != parents[second, 1]
+        first, second = first[distinct], second[distinct]
+        none: Integers = np.zeros(len(first), dtype=np.int64)
+        self.adjacency = {
+            Kinship.PARENT: self.compress(
+                pairs[1], pairs[0], families, pedigrees, statuses
+            ),
+            Kinship.CHILD: self.compress(
+                pairs[0], pairs[1], families, pedigrees, statuses
+            ),
+            Kinship.SPOUSE: self.compress(
+                parents[first, 1], parents[second, 1], parents[first, 0], none, none
+            ),
+        }
+        self.parent_lists = None
+        self.changed = False
+
+    def edges(self, kind: Kinship) -> KinshipEdges:
+        """Return the adjacency arrays of one kind of edge.
+
+        Args:
+            kind: Whether the edges lead to parents, children or spouses.
+        """
+        if self.changed:
+            self.compact()
+        return self.adjacency[kind]
+
+    def neighbours(self, person: int, kind: Kinship) -> Integers:
+        """Return the ids of the relatives of one kind of an individual.
+
+        Args:
+            person: The id of the individual.
+            kind: Whether to return parents, children or spouses.
+        """
+        edges: KinshipEdges = self.edges(kind)
+        return edges.indices[edges.indptr[person] : edges.indptr[person + 1]]
+
+    def relatives(self, xref: Any, kind: Kinship) -> list[str]:
+        """Return the identifiers of the relatives of one kind of an individual.
+
+        Relatives connected through more than one family are listed once.
+        An individual that is not in the index has no relatives.
+
+        Args:
+            xref: The IndividualXref or its name.
+            kind: Whether to return parents, children or spouses.
+        """
+        person: int | None = self.person_ids.get(str(xref))
+        if person is None:
+            return []
+        return [
+            self.person_xrefs[relative]
+            for relative in dict.fromkeys(self.neighbours(person, kind).tolist())
+        ]
+
+    def parents(self, xref: Any) -> list[str]:
+        """Return the identifiers of the parents of an individual."""
+        return self.relatives(xref, Kinship.PARENT)
+
+    def children(self, xref: Any) -> list[str]:
+        """Return the identifiers of the children of an individual."""
+        return self.relatives(xref, Kinship.CHILD)
+
+    def spouses(self, xref: Any) -> list[str]:
+        """Return the identifiers of the spouses of an individual."""
+        return self.relatives(xref, Kinship.SPOUSE)
+
+    def expand(self, frontier: Integers, kind: Kinship) -> Integers:
+        """Return the relatives of one kind of all individuals in a frontier.
+
+        Args:
+            frontier: The ids of the individuals.
+            kind: Whether to follow parents, children or spouses.
+        """
+        edges: KinshipEdges = self.edges(kind)
+        starts: Integers = edges.indptr[frontier]
+        counts: Integers = edges.indptr[frontier + 1] - starts
+        offsets: Integers = (
+            np.arange(counts.sum())
+            - np.repeat(np.cumsum(counts) - counts, counts)
+            + np.repeat(starts, counts)
+        )
+        return edges.indices[offsets]
+
+    def generations(
+        self, person: int, kind: Kinship, max_gen: int | None = None
+    ) -> tuple[Integers, Integers]:
+        """Return the ids and generations reached by a breadth first search.
+
+        Each individual is reported once at the first generation reaching it,
+        so an ancestor appearing on several lines of a pedigree collapse is
+        reported at the nearest one.  The starting individual is not reported.
+
+        Args:
+            person: The id of the starting individual.
+            kind: Follow parents for ancestors or children for descendants.
+            max_gen: The last generation to search or None for all of them.
+        """
+        seen: npt.NDArray[np.bool_] = np.zeros(len(self.person_xrefs), dtype=bool)
+        seen[person] = True
+        frontier: Integers = np.array([person], dtype=np.int64)
+        found: list[Integers] = []
+        levels: list[Integers] = []
+        generation: int = 0
+        while len(frontier) > 0 and (max_gen is None or generation < max_gen):
+            generation += 1
+            frontier = np.unique(self.expand(frontier, kind))
+            frontier = frontier[~seen[frontier]]
+            seen[frontier] = True
+            found.append(frontier)
+            levels.append(np.full(len(frontier), generation, dtype=np.int64))
+        if not found:
+            return np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+        return np.concatenate(found), np.concatenate(levels)
+
+    def traverse(
+        self, xref: Any, kind: Kinship, max_gen: int | None = None
+    ) -> dict[str, int]:
+        """Return the identifiers of the individuals reached with their generation.
+
+        Args:
+            xref: The IndividualXref or its name.
+            kind: Follow parents for ancestors or children for descendants.
+            max_gen: The last generation to search or None for all of them.
+        """
+        person: int | None = self.person_ids.get(str(xref))
+        if person is None:
+            return {}
+        people, levels = self.generations(person, kind, max_gen)
+        return {
+            self.person_xrefs[relative]: level
+            for relative, level in zip(people.tolist(), levels.tolist(), strict=True)
+        }
+
+    def ancestor_set(self, person: int, memoize: bool = True) -> npt.NDArray[np.uint8]:
+        """Return the ancestors of an individual as a packed bitset over the ids.
+
+        Bit `i` of the set is 1 when individual `i` is an ancestor.  With
+        `memoize` the set is kept until the next record is added so that
+        repeated queries on the same individuals only combine bitsets.
+
+        Args:
+            person: The id of the individual.
+            memoize: Whether to keep the set for later queries.
+        """
+        if self.changed:
+            self.compact()
+        bits: npt.NDArray[np.uint8] | None = self.ancestor_bits.get(person)
+        if bits is None:
+            mask: npt.NDArray[np.bool_] = np.zeros(len(self.person_xrefs), dtype=bool)
+            mask[self.generations(person, Kinship.PARENT)[0]] = True
+            bits = np.packbits(mask)
+            if memoize:
+                self.ancestor_bits[person] = bits
+        return bits
+
+    def common_ancestors(
+        self, first: Any, second: Any, memoize: bool = True
+    ) -> list[str]:
+        """Return the identifiers of the ancestors shared by two individuals.
+
+        The ancestors are listed in the order their individuals entered the index.
+
+        Args:
+            first: The IndividualXref or name of one individual.
+            second: The IndividualXref or name of the other individual.
+            memoize: Whether to keep the ancestor sets for later queries.
+        """
+        people: list[int | None] = [
+            self.person_ids.get(str(first)),
+            self.person_ids.get(str(second)),
+        ]
+        if people[0] is None or people[1] is None:
+            return []
+        shared: npt.NDArray[np.uint8] = self.ancestor_set(
+            people[0], memoize
+        ) & self.ancestor_set(people[1], memoize)
+        return [
+            self.person_xrefs[ancestor]
+            for ancestor in np.flatnonzero(
+                np.unpackbits(shared, count=len(self.person_xrefs))
+            ).tolist()
+        ]
+
+    def parent_table(self) -> tuple[list[int], list[int], list[int], list[int]]:
+        """Return the parent edges as lists for searches from one individual at a time."""
+        if self.changed:
+            self.compact()
+        if self.parent_lists is None:
+            edges: KinshipEdges = self.adjacency[Kinship.PARENT]
+            self.parent_lists = (
+                edges.indptr.tolist(),
+                edges.indices.tolist(),
+                edges.pedigrees.tolist(),
+                edges.families.tolist(),
+            )
+        return self.parent_lists
+
+    def paths(self, predecessors: dict[int, list[int]], node: int, limit: int) -> list[list[int]]:
+        """Return up to `limit` shortest paths from the start of a search to a node."""
+        if not predecessors[node]:
+            return [[node]]
+        found: list[list[int]] = []
+        for previous in predecessors[node]:
+            for path in self.paths(predecessors, previous, limit - len(found)):
+                found.append([*path, node])
+                if len(found) >= limit:
+                    return found
+        return found
+
+    def relationships(
+        self,
+        first: Any,
+        second: Any,
+        exclude: tuple[Pedigree, ...] = (),
+        max_gen: int | None = None,
+        max_paths: int = Default.KINSHIP_MAX_PATHS,
+    ) -> list[Relationship]:
+        """Return how the second individual is related to the first.
+
+        The ancestors of both individuals are searched a generation at a time
+        from whichever side has the smaller frontier.  The search stops once
+        no further generation could meet at a smaller total distance, so
+        close relatives are found without visiting distant ancestors.  Every
+        common ancestor at the smallest total distance is reported, grouped by
+        the generations up and down, with every shortest path through it.
+        A relationship is half when the two lines descend from each common
+        ancestor through different families of that ancestor.
+
+        Args:
+            first: The IndividualXref or name of the first individual.
+            second: The IndividualXref or name of the second individual.
+            exclude: Parent links with these PEDI values are not followed,
+                such as `Pedigree.ADOPTED` for blood relationships only.
+            max_gen: The most generations to search above each individual.
+            max_paths: The most paths to report through each common ancestor.
+        """
+        start: list[int | None] = [
+            self.person_ids.get(str(first)),
+            self.person_ids.get(str(second)),
+        ]
+        if start[0] is None or start[1] is None:
+            return []
+        indptr, indices, pedigrees, families = self.parent_table()
+        excluded: set[int] = {int(pedigree) for pedigree in exclude}
+        distances: list[dict[int, int]] = [{start[0]: 0}, {start[1]: 0}]
+        predecessors: list[dict[int, list[int]]] = [{start[0]: []}, {start[1]: []}]
+
+        # The families through which each ancestor is reached by a shortest path.
+        branches: list[dict[int, set[int]]] = [{}, {}]
+        frontiers: list[list[int]] = [[start[0]], [start[1]]]
+        generations: list[int] = [0, 0]
+        best: float = math.inf
+        meets: set[int] = set()
+        if start[0] == start[1]:
+            best = 0
+            meets = {start[0]}
+        while True:
+            sides: list[int] = [
+                side
+                for side in (0, 1)
+                if frontiers[side]
+                and generations[side] + 1 <= best
+                and (max_gen is None or generations[side] < max_gen)
+            ]
+            if not sides:
+                break
+            side: int = min(sides, key=lambda side: len(frontiers[side]))
+            distance: dict[int, int] = distances[side]
+            other: dict[int, int] = distances[1 - side]
+            previous: dict[int, list[int]] = predecessors[side]
+            branch: dict[int, set[int]] = branches[side]
+            generation: int = generations[side] + 1
+            frontier: list[int] = []
+            for child in frontiers[side]:
+                for edge in range(indptr[child], indptr[child + 1]):
+                    if pedigrees[edge] in excluded:
+                        continue
+                    parent: int = indices[edge]
+                    known: int | None = distance.get(parent)
+                    if known is None:
+                        distance[parent] = generation
+                        previous[parent] = [child]
+                        branch[parent] = {families[edge]}
+                        frontier.append(parent)
+                        if parent in other:
+                            total: int = generation + other[parent]
+                            if total < best:
+                                best = total
+                                meets = {parent}
+                            elif total == best:
+                                meets.add(parent)
+                    elif known == generation:
+                        branch[parent].add(families[edge])
+                        if child not in previous[parent]:
+                            previous[parent].append(child)
+            frontiers[side] = frontier
+            generations[side] = generation
+
+        # Group the common ancestors by the generations up and down.
+        groups: dict[tuple[int, int], list[int]] = {}
+        for meet in sorted(meets):
+            groups.setdefault((distances[0][meet], distances[1][meet]), []).append(meet)
+        relationships: list[Relationship] = []
+        for (up, down), ancestors in sorted(groups.items()):
+            paths: list[list[str]] = []
+            for ancestor in ancestors:
+                for upward in self.paths(predecessors[0], ancestor, max_paths):
+                    for downward in self.paths(predecessors[1], ancestor, max_paths):
+                        if len(paths) < max_paths * len(ancestors):
+                            paths.append(
+                                [
+                                    self.person_xrefs[person]
+                                    for person in upward + downward[-2::-1]
+                                ]
+                            )
+            half: bool = (
+                up > 0
+                and down > 0
+                and not any(
+                    branches[0][ancestor] & branches[1][ancestor]
+                    for ancestor in ancestors
+                )
+            )
+            relationships.append(
+                Relationship(
+                    KinshipLabel.name(up, down, half),
+                    up,
+                    down,
+                    [self.person_xrefs[ancestor] for ancestor in ancestors],
+                    paths,
+                )
+            )
+        return relationships
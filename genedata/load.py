@@ -6,18 +6,102 @@ file is created and stored in a module named `specificationXX.py` where XX is th
 number, then one generates the classes and tests for those closes using the `generate` module.
 """
 
-__all__ = ['LoadSpecs']
+__all__ = ['LoadSpecs', 'RebuildTiming']
 
 
+import time
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
 from pathlib import Path
+from typing import Any, NamedTuple
 
 from genedata.constants import Default
 from genedata.messages import Msg
 from genedata.methods import Names, Util
 
 
+class RebuildTiming(NamedTuple):
+    """Seconds taken to build the specifications module with and without the cache.
+
+    Args:
+        cold: Seconds taken when every yaml file had to be parsed.
+        warm: Seconds taken when every yaml file was found in the parse cache.
+    """
+
+    cold: float
+    warm: float
+
+
 class LoadSpecs:
-    """Read and store the GEDCOM specifications into dictionaries from yaml files."""
+    """Read and store the GEDCOM specifications into dictionaries from yaml files.
+
+    Parsed yaml files are kept in the `Util.yaml_cache` so that rebuilding
+    the specifications only parses those files which have changed since the last build.
+    """
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Remove all parsed yaml files from the cache."""
+        Util.clear_yaml_cache()
+
+    @staticmethod
+    def read_yaml_files(
+        files: list[Path], max_workers: int | None = None, processes: bool = False
+    ) -> list[dict[str, Any]]:
+        """Parse a list of yaml files using the cache and a pool of workers.
+
+        Only files that are missing from the cache or whose modification time
+        or size has changed are parsed.  These are handed to a thread pool or,
+        if `processes` is True, to a process pool.  The parsed dictionaries
+        are returned in the same order as the files.
+
+        Args:
+            files: The yaml files to parse.
+            max_workers: The maximum number of workers in the pool.  If None
+                the default of the executor is used.
+            processes: If True use a process pool rather than a thread pool.
+
+        Example:
+            The first read parses the file and stores it in the cache.
+            >>> from pathlib import Path
+            >>> from genedata.load import LoadSpecs
+            >>> file = Path('tests/data/good_calendar.yaml')
+            >>> LoadSpecs.clear_cache()
+            >>> first = LoadSpecs.read_yaml_files([file])
+            >>> from genedata.methods import Util
+            >>> str(file) in Util.yaml_cache
+            True
+
+            The second read of the unchanged file comes from the cache.
+            >>> second = LoadSpecs.read_yaml_files([file])
+            >>> first[0] is second[0]
+            True
+        """
+        signatures: dict[str, tuple[int, int]] = {
+            str(file): Util.yaml_signature(str(file)) for file in files
+        }
+        stale: list[str] = []
+        for name, signature in signatures.items():
+            cached = Util.yaml_cache.get(name)
+            if cached is None or cached[0] != signature:
+                stale.append(name)
+        parsed: list[dict[str, Any]] = []
+        if len(stale) == 1:
+            parsed = [Util.read_yaml(stale[0])]
+        elif len(stale) > 1:
+            pool: Executor = (
+                ProcessPoolExecutor(max_workers=max_workers)
+                if processes
+                else ThreadPoolExecutor(max_workers=max_workers)
+            )
+            with pool:
+                parsed = list(pool.map(Util.read_yaml, stale))
+        for name, yamldict in zip(stale, parsed, strict=True):
+            Util.yaml_cache[name] = (signatures[name], yamldict)
+        return [Util.yaml_cache[str(file)][1] for file in files]
 
     @staticmethod
     def preamble(source: str, version: str) -> str:
@@ -68,32 +152,42 @@ from typing import Any
     def dictionary(
         url: str,
         base: str,
+        max_workers: int | None = None,
+        processes: bool = False,
     ) -> str:
         """Convert an entire directory of yaml files into a dictionary.
 
         The yaml fields are found in various directories under one 
         common named directory.  This common directory is called `url`.
         The final part of the directory name is given by `base`.
+
+        The files are parsed through `read_yaml_files` so unchanged files
+        are taken from the cache and the rest are parsed concurrently.
         
         Args:
             url: The main part of the uri. 
             base: The final part of the directory name.
+            max_workers: The maximum number of workers parsing yaml files.
+            processes: If True parse the yaml files in a process pool
+                rather than a thread pool.
         """
-        lines: str = Default.BRACE_LEFT
         directory: str = f'{Names.slash(url)}{base}'
         p = Path(directory)
-        if p.exists():
-            for file in p.iterdir():
-                if file.suffix == Default.YAML_FILE_END:
-                    yamldict = Util.read_yaml(str(file))
-                    lines = (
-                        f"{lines}{Default.EOL}    '{file.stem}': {yamldict},"
-                    )
-        else:
+        if not p.exists():
             raise ValueError(Msg.DIRECTORY_NOT_FOUND.format(directory))
-        if lines == Default.BRACE_LEFT:
-            return ''.join([lines, Default.BRACE_RIGHT])
-        return ''.join([lines, Default.EOL, Default.BRACE_RIGHT])
+        files: list[Path] = [
+            file for file in p.iterdir() if file.suffix == Default.YAML_FILE_END
+        ]
+        if len(files) == 0:
+            return ''.join([Default.BRACE_LEFT, Default.BRACE_RIGHT])
+        yamldicts: list[dict[str, Any]] = LoadSpecs.read_yaml_files(
+            files, max_workers, processes
+        )
+        lines: list[str] = [Default.BRACE_LEFT]
+        for file, yamldict in zip(files, yamldicts, strict=True):
+            lines.append(f"{Default.EOL}    '{file.stem}': {yamldict},")
+        lines.extend([Default.EOL, Default.BRACE_RIGHT])
+        return ''.join(lines)
 
     @staticmethod
     def calendar_dictionary(url: str) -> str:
@@ -188,3 +282,31 @@ from typing import Any
                 LoadSpecs.together(source, version, url),
             ]
         )
+
+    @staticmethod
+    def timing(source: str, version: str, url: str) -> RebuildTiming:
+        """Time a cold and a warm build of the specifications module.
+
+        The cache is cleared before the cold build so every yaml file is parsed.
+        The warm build follows immediately so every yaml file is found in the cache.
+
+        Args:
+            source: The source of the yaml specification files.
+            version: The version of the GEDCOM specification.
+            url: The location of the local filesystem where the yaml files
+                have been downloaded.
+
+        Example:
+            >>> from genedata.load import LoadSpecs
+            >>> timing = LoadSpecs.timing('GED', '7.0', 'tests/load_test/gedtest/')
+            >>> timing.cold >= 0 and timing.warm >= 0
+            True
+        """
+        LoadSpecs.clear_cache()
+        start: float = time.perf_counter()
+        LoadSpecs.build_all(source, version, url)
+        cold: float = time.perf_counter() - start
+        start = time.perf_counter()
+        LoadSpecs.build_all(source, version, url)
+        warm: float = time.perf_counter() - start
+        return RebuildTiming(cold, warm)
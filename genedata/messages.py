@@ -141,6 +141,9 @@ class Msg:
     NOT_DATE_MONTH: str = (
         'The value "{0}" is not a date period for structure "{1}" since the month is not in the list of months {2}.'
     )
+    NOT_DATE_KIND: str = (
+        'The kind of date "{0}" is not one of "exact", "general" or "period".'
+    )
     NOT_DATE_PERIOD: str = (
         'The value "{0}" is not a date period for structure "{1}".'
     )
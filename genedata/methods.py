@@ -1,34 +1,48 @@
 # methods.py
 
 __all__ = [
+    'DateInterval',
+    'Dates',
     'Input',
     'Names',
+    'Payload',
     'Query',
     'Tagger',
     'Util',
 ]
 
+import functools
 import logging
 import math
 import re
 import urllib.request
 import zipfile
+from collections.abc import Callable, Iterable
 from pathlib import Path
 
 # from textwrap import indent
-from typing import Any, ClassVar
+from typing import Any, ClassVar, NamedTuple
 
+import numpy as np
+import numpy.typing as npt
 import requests  # type: ignore[import-untyped]
 import yaml  # type: ignore[import-untyped]
 
 # from ordered_set import OrderedSet  # type: ignore[import-not-found]
-from genedata.constants import Default
+from genedata.constants import Cal, DateError, Default, PayloadType, Value
 from genedata.messages import Msg
 from genedata.specifications70 import Specs
+from genedata.stats import GedStatistics
 
 
 class Util:
-    """Utilities to read and write yaml or ged files."""
+    """Utilities to read and write yaml or ged files.
+
+    Parsed yaml files are kept in a process-wide cache keyed by the path of the file.
+    Each entry stores the modification time and size of the file when it was parsed.
+    """
+
+    yaml_cache: ClassVar[dict[str, tuple[tuple[int, int], dict[str, Any]]]] = {}
 
     @staticmethod
     def www_status(url: str) -> str:
@@ -279,6 +293,54 @@ class Util:
             )
         return yaml_dict
 
+    @staticmethod
+    def yaml_signature(file: str) -> tuple[int, int]:
+        """Return the modification time and size of a yaml file.
+
+        These two values decide whether a cached parse of the file is still current.
+
+        Args:
+            file: The path to the file.
+        """
+        stat = Path(file).stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def read_yaml_cached(url: str) -> dict[str, Any]:
+        """Read a yaml file through the process-wide yaml cache.
+
+        A local file is parsed with `read_yaml` only if it is not in the cache
+        or if its modification time or size have changed since it was parsed.
+        Urls are always read with `read_yaml`.
+
+        The dictionary returned is shared with other readers of the same file.
+        Copy it before modifying it.
+
+        Args:
+            url: The name of the file or the internet url.
+
+        Example:
+            >>> from genedata.methods import Util
+            >>> Util.clear_yaml_cache()
+            >>> first = Util.read_yaml_cached('tests/data/good_calendar.yaml')
+            >>> second = Util.read_yaml_cached('tests/data/good_calendar.yaml')
+            >>> first is second
+            True
+        """
+        if not Path(url).is_file():
+            return Util.read_yaml(url)
+        signature: tuple[int, int] = Util.yaml_signature(url)
+        cached = Util.yaml_cache.get(url)
+        if cached is None or cached[0] != signature:
+            cached = (signature, Util.read_yaml(url))
+            Util.yaml_cache[url] = cached
+        return cached[1]
+
+    @staticmethod
+    def clear_yaml_cache() -> None:
+        """Remove all parsed yaml files from the yaml cache."""
+        Util.yaml_cache.clear()
+
     #     @staticmethod
     #     def ged_summary(ged: str) -> str:
     #         """Summarize the contents of a ged file.
@@ -821,6 +883,24 @@ class Input:
             return f'{Default.LONG_EAST}{longitude!s}'
         return f'{Default.LONG_WEST}{abs(longitude)!s}'
 
+    @staticmethod
+    def degrees(value: str) -> float:
+        """Return the signed decimal degrees of a LATI or LONG payload.
+
+        This reverses `Input.lati` and `Input.long` with south and west negative.
+
+        Example:
+            >>> from genedata.methods import Input
+            >>> Input.degrees('N10.083611'), Input.degrees('W122.5')
+            (10.083611, -122.5)
+
+        Args:
+            value: The payload such as 'N18.150944' or 'W168.150944'.
+        """
+        if value[:1] in (Default.LATI_SOUTH, Default.LONG_WEST):
+            return -float(value[1:])
+        return float(value[1:])
+
     @staticmethod
     def name(full: str, surname: str) -> str:
         """Format a personal name to meet GEDCOM name type specifications.
@@ -1778,27 +1858,15 @@ class Query:
 
         Args:
             ged: The gedcom string.
-            specification: The specification dictionary needed to identify what the records are.
-            count_column: The name of the `count` dictionary key which becomes the
+            specification: The specification dictionary whose record structures,
+                including extension records, are counted instead of the standard ones.
+            column: The name of the `count` dictionary key which becomes the
                 pandas count column name.
         """
-        data: dict[str, dict[str, int]] = {}
-        count: dict[str, int] = {}
-        searchfor: str = Default.EMPTY
-        howmany: int = 0
-        if specification is None:
-            for record in Default.RECORD_TYPES:
-                searchfor = ''.join(
-                    [
-                        Default.EOL,
-                        '0 @.*@ ',
-                        record,
-                    ]
-                )
-                howmany = len(re.findall(searchfor, ged))
-                count.update({record: howmany})
-        data.update({column: count})
-        return data
+        record_types: Iterable[str] = Default.RECORD_TYPES
+        if specification is not None:
+            record_types = GedStatistics.spec_record_types(specification)
+        return {column: GedStatistics(record_types).text(ged).summary().records}
 
     @staticmethod
     def version(ged: str) -> str:
@@ -2246,9 +2314,40 @@ class Tagger:
     #     return ordered
 
 
+class DateGrammar(NamedTuple):
+    """The calendars, months and epochs of a specification with a compiled pattern for dates.
+
+    Args:
+        number: The key of the grammar in `Validate.date_grammars`.
+        calendars: The calendar tags in the specification.
+        months: The month tags of each calendar tag.
+        epochs: The epoch tags of each calendar tag.
+        pattern: A pattern matching the forms of a general date.
+        calendar_specs: The calendar specifications the grammar was built from.
+        month_specs: The month specifications the grammar was built from.
+    """
+
+    number: int
+    calendars: list[str]
+    months: dict[str, list[str]]
+    epochs: dict[str, list[str]]
+    pattern: re.Pattern[str]
+    calendar_specs: dict[str, Any]
+    month_specs: dict[str, Any]
+
+
 class Validate:
     """Perform validation checks for strings and format strings from user input."""
 
+    # Date grammars by number and the numbers of the grammars by the identities
+    # of the calendar and month specifications and the version they were built at.
+    # The version is bumped by `date_specs_changed` whenever calendars or months
+    # are documented.  Only the last `Default.DATE_GRAMMAR_LIMIT` grammars are kept.
+    date_grammars: ClassVar[dict[int, DateGrammar]] = {}
+    date_grammar_numbers: ClassVar[dict[tuple[int, int, int], int]] = {}
+    date_grammar_count: ClassVar[int] = 0
+    date_grammar_version: ClassVar[int] = 0
+
     # Gregorian and Julian calendar days in a month. Leap years are calculated differently.
     # but the change of days in February are the same.
     month_days: ClassVar[dict[str, int]] = {
@@ -2297,36 +2396,7 @@ class Validate:
             value: The value to be formatted.
             payload: The payload specified for the value.
         """
-        match payload:
-            case 'https://gedcom.io/terms/v7/type-Age':
-                return Validate.remove_double_spaces(value.strip())
-            case (
-                'https://gedcom.io/terms/v7/type-Date#exact'
-                | 'https://gedcom.io/terms/v7/type-Date'
-                | 'https://gedcom.io/terms/v7/type-Date#period'
-            ):
-                return Validate.remove_double_spaces(value.strip()).upper()
-            case (
-                'https://gedcom.io/terms/v7/type-List#Text'
-                | 'https://gedcom.io/terms/v7/type-List#Enum'
-            ):
-                values: list[str] = value.split(Default.COMMA)
-                values_stripped: list[str] = [value.strip() for value in values]
-                return Default.LIST_ITEM_SEPARATOR.join(values_stripped).strip()
-            case (
-                'http://www.w3.org/2001/XMLSchema#Language'
-                | 'https://gedcom.io/terms/v7/type-FilePath'
-                | 'http://www.w3.org/ns/dcat#mediaType'
-            ):
-                return value.strip()
-            case (
-                'Y|<NULL>'
-                | 'https://gedcom.io/terms/v7/type-Enum'
-                | 'https://gedcom.io/terms/v7/type-Time'
-            ):
-                return value.upper().strip()
-            case _:
-                return value
+        return Payload.clean(value, Payload.resolve(payload))
 
     @staticmethod
     def date(
@@ -2482,8 +2552,13 @@ class Validate:
         if value == Default.EMPTY:
             return True
 
+        # Accept a date the compiled date grammar has already found valid.
+        grammar: DateGrammar = Validate.date_grammar(specs)
+        if Validate.date_matches(value, grammar.number):
+            return True
+
         # Get the available calendar tags.
-        calendars: list[str] = Query.calendars(specs)
+        calendars: list[str] = grammar.calendars
 
         # The Gregorian calendar is the default if no calendar is specified.
         calendar: str = Default.CALENDAR_DEFAULT
@@ -2603,7 +2678,8 @@ class Validate:
             raise ValueError(Msg.NOT_DATE_ZERO_YEAR.format(value, class_name))
 
         # Get the calendar's months and epochs.
-        months, epochs = Query.months_epoch(calendar, specs)
+        months: list[str] = grammar.months.get(calendar, [])
+        epochs: list[str] = grammar.epochs.get(calendar, [])
 
         # Only where a month has been identified perform this check.
         if subcase in [0, 1, 2, 3, 7] and month not in months:
@@ -2697,6 +2773,507 @@ class Validate:
         # If it gets this far, return True.
         return True
 
+    @staticmethod
+    def date_grammar(specs: dict[str, dict[str, Any]]) -> DateGrammar:
+        """Return the date grammar for the calendars and months of a specification.
+
+        The grammar is reused for every date validated against the same
+        calendar and month specifications until `date_specs_changed` is
+        called after calendars or months are added or changed.
+
+        Example:
+            >>> from genedata.methods import Validate
+            >>> from genedata.specifications70 import Specs
+            >>> grammar = Validate.date_grammar(Specs)
+            >>> grammar.epochs['GREGORIAN']
+            ['BCE']
+            >>> Validate.date_grammar(Specs) is grammar
+            True
+
+        Args:
+            specs: The current specifications including any extensions.
+        """
+        calendar_specs: dict[str, Any] = specs[Default.YAML_TYPE_CALENDAR]
+        month_specs: dict[str, Any] = specs[Default.YAML_TYPE_MONTH]
+        key: tuple[int, int, int] = (
+            id(calendar_specs),
+            id(month_specs),
+            Validate.date_grammar_version,
+        )
+        number: int | None = Validate.date_grammar_numbers.get(key)
+        if number is not None:
+            grammar: DateGrammar = Validate.date_grammars[number]
+            if (
+                grammar.calendar_specs is calendar_specs
+                and grammar.month_specs is month_specs
+            ):
+                return grammar
+        calendars: list[str] = Query.calendars(specs)
+        months: dict[str, list[str]] = {}
+        epochs: dict[str, list[str]] = {}
+        for calendar in [Default.CALENDAR_DEFAULT, *calendars]:
+            months[calendar], epochs[calendar] = Query.months_epoch(
+                calendar, specs
+            )
+        calendar_tags: str = '|'.join(
+            [re.escape(tag) for tag in sorted(calendars, key=len, reverse=True)]
+        )
+        if calendar_tags == Default.EMPTY:
+            calendar_tags = '(?!)'
+        pattern: re.Pattern[str] = re.compile(
+            ''.join(
+                [
+                    f'(?:(?P<calendar>{calendar_tags}) )?',
+                    '(?:(?P<day>[0-9]+) (?P<month>[A-Z0-9_]+) )?',
+                    '(?P<year>[0-9]+)',
+                    '(?: (?P<epoch>[A-Z0-9_]+))?',
+                    '|(?P<month_only>[A-Z0-9_]+) (?P<year_only>[0-9]+)',
+                ]
+            )
+        )
+        grammar = DateGrammar(
+            Validate.date_grammar_count,
+            calendars,
+            months,
+            epochs,
+            pattern,
+            calendar_specs,
+            month_specs,
+        )
+        Validate.date_grammar_count += 1
+        if len(Validate.date_grammar_numbers) >= Default.DATE_GRAMMAR_LIMIT:
+            oldest: tuple[int, int, int] = next(iter(Validate.date_grammar_numbers))
+            del Validate.date_grammars[Validate.date_grammar_numbers.pop(oldest)]
+        Validate.date_grammar_numbers[key] = grammar.number
+        Validate.date_grammars[grammar.number] = grammar
+        return grammar
+
+    @staticmethod
+    def date_specs_changed() -> None:
+        """Build new date grammars after calendars or months are added or changed.
+
+        Example:
+            >>> from genedata.methods import Validate
+            >>> from genedata.specifications70 import Specs
+            >>> grammar = Validate.date_grammar(Specs)
+            >>> Validate.date_specs_changed()
+            >>> Validate.date_grammar(Specs) is grammar
+            False
+        """
+        Validate.date_grammar_version += 1
+
+    @staticmethod
+    @functools.lru_cache(maxsize=Default.DATE_CACHE_SIZE)
+    def date_matches(value: str, grammar_number: int) -> bool:
+        """Return True if a general date is valid under a date grammar.
+
+        A False result does not mean the date is invalid, only that it must be
+        checked by `date_general` which reports why it is invalid.
+        The results are memoized for each date and grammar.
+
+        Example:
+            >>> from genedata.methods import Validate
+            >>> from genedata.specifications70 import Specs
+            >>> grammar = Validate.date_grammar(Specs)
+            >>> Validate.date_matches('JULIAN 29 FEB 1700', grammar.number)
+            False
+            >>> Validate.date_matches('JULIAN 28 FEB 1700', grammar.number)
+            True
+
+        Args:
+            value: The date value without a preface such as `ABT` or `FROM`.
+            grammar_number: The number of the date grammar from `date_grammar`.
+        """
+        grammar: DateGrammar = Validate.date_grammars[grammar_number]
+        match = grammar.pattern.fullmatch(value)
+        if match is None:
+            return False
+        calendar: str = Default.CALENDAR_DEFAULT
+        day: str | None = None
+        epoch: str | None = None
+        if match['month_only'] is not None:
+            month: str | None = match['month_only']
+            year: int = int(match['year_only'])
+        else:
+            if match['calendar'] is not None:
+                calendar = match['calendar']
+            day = match['day']
+            month = match['month']
+            year = int(match['year'])
+            epoch = match['epoch']
+        if calendar in ['GREGORIAN', 'JULIAN'] and year == 0:
+            return False
+        if month is not None and month not in grammar.months[calendar]:
+            return False
+        if day is not None and calendar in ['GREGORIAN', 'JULIAN']:
+            max_days: int = Validate.month_days[month]  # type: ignore[index]
+            if month == 'FEB' and (
+                (
+                    calendar == 'GREGORIAN'
+                    and ((year % 4 == 0 and year % 100 != 0) or year % 400 == 0)
+                )
+                or (calendar == 'JULIAN' and year % 4 == 0 and year % 100 != 0)
+            ):
+                max_days = Validate.month_days['FEB_LEAP']
+            if int(day) < 1 or int(day) > max_days:
+                return False
+        return epoch is None or epoch in grammar.epochs[calendar]
+
+    @staticmethod
+    def bulk_integers(
+        strings: npt.NDArray[np.str_], signed: bool = False
+    ) -> tuple[npt.NDArray[np.bool_], npt.NDArray[np.int64]]:
+        """Return a mask of the strings that are integers and their values.
+
+        Strings that are not integers, or have more than `Default.DATE_BULK_DIGITS`
+        digits, have the value 0.
+
+        Example:
+            >>> import numpy as np
+            >>> from genedata.methods import Validate
+            >>> Validate.bulk_integers(np.array(['12', '-4', '+3', 'X']), signed=True)
+            (array([ True,  True,  True, False]), array([12, -4,  3,  0]))
+
+        Args:
+            strings: The array of strings to convert.
+            signed: Whether a leading plus or minus sign is permitted as by `int`.
+        """
+        digits: npt.NDArray[np.str_] = strings
+        if signed:
+            for sign in [Default.HYPHEN, Default.PLUS]:
+                digits = np.where(
+                    np.char.startswith(digits, sign) & (digits == strings),
+                    np.char.replace(digits, sign, Default.EMPTY, count=1),
+                    digits,
+                )
+        found: npt.NDArray[np.bool_] = np.char.isdigit(digits) & (
+            np.char.str_len(digits) <= Default.DATE_BULK_DIGITS
+        )
+
+        # Accumulate the digits from the code points of the characters.
+        digits = np.ascontiguousarray(np.where(found, digits, '0'), dtype=np.str_)
+        width: int = digits.dtype.itemsize // 4
+        points: npt.NDArray[np.uint32] = digits.view(np.uint32).reshape(
+            len(digits), width
+        )
+        values: npt.NDArray[np.int64] = np.zeros(len(digits), dtype=np.int64)
+        for column in range(min(width, Default.DATE_BULK_DIGITS)):
+            point: npt.NDArray[np.int64] = points[:, column].astype(np.int64)
+            values = np.where(point > 0, values * 10 + point - ord('0'), values)
+        if signed:
+            values = np.where(
+                np.char.startswith(strings, Default.HYPHEN), -values, values
+            )
+        return found, values
+
+    @staticmethod
+    def bulk_month_days(
+        months: npt.NDArray[np.str_],
+        years: npt.NDArray[np.int64],
+        calendars: npt.NDArray[np.str_],
+    ) -> npt.NDArray[np.int64]:
+        """Return the maximum day of each Gregorian or Julian month from the `month_days` table.
+
+        The leap years are those used by `date_general`.  Months not in the
+        table have no days.
+
+        Args:
+            months: The month tags.
+            years: The years of the months.
+            calendars: The calendar tags of the months.
+        """
+        tags: npt.NDArray[np.str_] = np.array(sorted(Validate.month_days))
+        days: npt.NDArray[np.int64] = np.array(
+            [Validate.month_days[tag] for tag in tags], dtype=np.int64
+        )
+        index: npt.NDArray[np.intp] = np.minimum(
+            np.searchsorted(tags, months), len(tags) - 1
+        )
+        max_days: npt.NDArray[np.int64] = np.where(
+            tags[index] == months, days[index], 0
+        )
+        common: npt.NDArray[np.bool_] = (years % 4 == 0) & (years % 100 != 0)
+        leap: npt.NDArray[np.bool_] = (
+            (calendars == 'GREGORIAN') & (common | (years % 400 == 0))
+        ) | ((calendars == 'JULIAN') & common)
+        return np.where(
+            leap & (months == 'FEB'), Validate.month_days['FEB_LEAP'], max_days
+        )
+
+    @staticmethod
+    def bulk_general(
+        strings: npt.NDArray[np.str_], grammar: DateGrammar
+    ) -> npt.NDArray[np.int8]:
+        """Return the `DateError` code of each general date without a preface.
+
+        The checks are those of `date_general` applied to whole arrays.
+        An empty string is a valid date.
+
+        Args:
+            strings: The array of dates.
+            grammar: The date grammar of the specification from `date_grammar`.
+        """
+        # Split each date into at most five tokens.
+        spaces: npt.NDArray[np.int64] = np.char.count(strings, Default.SPACE)
+        tokens: list[npt.NDArray[np.str_]] = []
+        remainder: npt.NDArray[np.str_] = strings
+        for _ in range(5):
+            parts = np.char.partition(remainder, Default.SPACE)
+            tokens.append(parts[..., 0])
+            remainder = parts[..., 2]
+
+        # Locate the year, month, day and epoch following an optional calendar.
+        has_calendar: npt.NDArray[np.bool_] = np.isin(tokens[0], grammar.calendars)
+        count: npt.NDArray[np.int64] = spaces + 1 - has_calendar
+        first, second, third, fourth = (
+            np.where(has_calendar, tokens[position + 1], tokens[position])
+            for position in range(4)
+        )
+        first_digits, _ = Validate.bulk_integers(first, signed=True)
+        month_only: npt.NDArray[np.bool_] = (count == 2) & ~first_digits
+        year: npt.NDArray[np.str_] = np.select(
+            [count == 1, (count == 2) & first_digits, count == 2, count >= 3],
+            [first, first, second, third],
+            Default.EMPTY,
+        )
+        month: npt.NDArray[np.str_] = np.select(
+            [month_only, count >= 3], [first, second], Default.EMPTY
+        )
+        day: npt.NDArray[np.str_] = np.where(count >= 3, first, Default.EMPTY)
+        epoch: npt.NDArray[np.str_] = np.select(
+            [(count == 2) & first_digits, count == 4],
+            [second, fourth],
+            Default.EMPTY,
+        )
+        calendar: npt.NDArray[np.str_] = np.where(
+            has_calendar, tokens[0], Default.CALENDAR_DEFAULT
+        )
+
+        # Check the tokens.
+        year_found, years = Validate.bulk_integers(year, signed=True)
+        day_found, days = Validate.bulk_integers(day, signed=True)
+        calendar_error: npt.NDArray[np.bool_] = (
+            (spaces >= 2)
+            & ~has_calendar
+            & ~Validate.bulk_integers(tokens[0], signed=True)[0]
+        )
+        format_error: npt.NDArray[np.bool_] = (
+            np.char.startswith(strings, Default.SPACE)
+            | np.char.endswith(strings, Default.SPACE)
+            | (np.char.find(strings, Default.SPACE_DOUBLE) >= 0)
+            | (count < 1)
+            | (count > 4)
+            | (month_only & has_calendar)
+            | ~year_found
+            | ((count >= 3) & ~day_found)
+        )
+        month_error: npt.NDArray[np.bool_] = (month != Default.EMPTY) & ~np.isin(
+            np.char.add(np.char.add(calendar, Default.SPACE), month),
+            [
+                f'{tag} {name}'
+                for tag, names in grammar.months.items()
+                for name in names
+            ],
+        )
+        gregorian_julian: npt.NDArray[np.bool_] = np.isin(
+            calendar, ['GREGORIAN', 'JULIAN']
+        )
+        max_days: npt.NDArray[np.int64] = Validate.bulk_month_days(
+            month, years, calendar
+        )
+        day_error: npt.NDArray[np.bool_] = (
+            gregorian_julian
+            & (day != Default.EMPTY)
+            & ((days < 1) | (days > max_days))
+        )
+        epoch_error: npt.NDArray[np.bool_] = (epoch != Default.EMPTY) & ~np.isin(
+            np.char.add(np.char.add(calendar, Default.SPACE), epoch),
+            [
+                f'{tag} {name}'
+                for tag, names in grammar.epochs.items()
+                for name in names
+            ],
+        )
+        codes: npt.NDArray[np.int8] = np.select(
+            [
+                strings == Default.EMPTY,
+                spaces > 4,
+                calendar_error,
+                format_error,
+                gregorian_julian & (years == 0),
+                month_error,
+                day_error,
+                epoch_error,
+            ],
+            [
+                DateError.NONE,
+                DateError.SPACES,
+                DateError.CALENDAR,
+                DateError.FORMAT,
+                DateError.ZERO_YEAR,
+                DateError.MONTH,
+                DateError.DAY,
+                DateError.EPOCH,
+            ],
+            DateError.NONE,
+        ).astype(np.int8)
+        return codes
+
+    @staticmethod
+    def bulk_exact(strings: npt.NDArray[np.str_]) -> npt.NDArray[np.int8]:
+        """Return the `DateError` code of each exact date.
+
+        The checks are those of `date_exact` applied to whole arrays.
+
+        Args:
+            strings: The array of dates.
+        """
+        strings = np.ascontiguousarray(strings, dtype=np.str_)
+        points: npt.NDArray[np.uint32] = strings.view(np.uint32).reshape(
+            len(strings), strings.dtype.itemsize // 4
+        )
+        spaces: npt.NDArray[np.int64] = np.char.count(strings, Default.SPACE)
+        day_month = np.char.partition(strings, Default.SPACE)
+        month_year = np.char.partition(day_month[..., 2], Default.SPACE)
+        month: npt.NDArray[np.str_] = month_year[..., 0]
+        day_found, days = Validate.bulk_integers(day_month[..., 0], signed=True)
+        year_found, years = Validate.bulk_integers(
+            month_year[..., 2], signed=True
+        )
+        calendar: npt.NDArray[np.str_] = np.full(
+            strings.shape, Default.CALENDAR_DEFAULT
+        )
+        max_days: npt.NDArray[np.int64] = Validate.bulk_month_days(
+            month, years, calendar
+        )
+        return np.select(
+            [
+                ((points >= ord('a')) & (points <= ord('z'))).any(axis=1)
+                | ~((points >= ord('0')) & (points <= ord('9'))).any(axis=1),
+                spaces != Default.DATE_EXACT_SPACES,
+                ~day_found | ~year_found,
+                max_days == 0,
+                (days < 1) | (days > max_days),
+                years == 0,
+            ],
+            [
+                DateError.FORMAT,
+                DateError.SPACES,
+                DateError.FORMAT,
+                DateError.MONTH,
+                DateError.DAY,
+                DateError.ZERO_YEAR,
+            ],
+            DateError.NONE,
+        ).astype(np.int8)
+
+    @staticmethod
+    def dates_bulk(
+        array: Any,
+        kind: str = 'exact',
+        specs: dict[str, dict[str, Any]] = Specs,
+    ) -> tuple[npt.NDArray[np.bool_], npt.NDArray[np.int8]]:
+        """Validate an array of dates at once returning a mask of valid dates and error codes.
+
+        The kinds of dates are:
+        - `exact` checked as by `date_exact`,
+        - `general` checked as by `date` including prefaces such as `ABT` and `BET`,
+        - `period` checked as by `date_period`.
+
+        The error codes are those of `DateError` with `DateError.NONE` for a valid date.
+        Elements that are not strings have the code `DateError.NOT_STRING`.
+        A NumPy array of strings skips the check of each element's type.
+
+        Example:
+            >>> from genedata.methods import Validate
+            >>> mask, codes = Validate.dates_bulk(
+            ...     ['1 JAN 2000', '30 FEB 2000', '1 JAN 0', None]
+            ... )
+            >>> mask
+            array([ True, False, False, False])
+            >>> codes
+            array([0, 5, 6, 1], dtype=int8)
+            >>> mask, codes = Validate.dates_bulk(
+            ...     ['ABT 1850', 'BET 1800 AND 1810', 'JULIAN 5 FEB 1700', '0'],
+            ...     kind='general',
+            ... )
+            >>> codes
+            array([0, 0, 0, 6], dtype=int8)
+
+        Args:
+            array: A sequence or NumPy array of dates.
+            kind: Which kind of date the array holds.
+            specs: The current specifications including any extensions.
+        """
+        values: npt.NDArray[Any] = (
+            array if isinstance(array, np.ndarray) else np.array(array, dtype=object)
+        )
+        shape: tuple[int, ...] = values.shape
+        values = values.ravel()
+        if len(values) == 0:
+            return np.zeros(shape, dtype=bool), np.zeros(shape, dtype=np.int8)
+        is_string: npt.NDArray[np.bool_] = np.ones(len(values), dtype=bool)
+        if values.dtype.kind != 'U':
+            is_string = np.fromiter(
+                (isinstance(value, str) for value in values),
+                dtype=bool,
+                count=len(values),
+            )
+        strings: npt.NDArray[np.str_] = np.where(
+            is_string, values, Default.EMPTY
+        ).astype(np.str_)
+
+        # Validate each distinct date once.
+        strings, inverse = np.unique(strings, return_inverse=True)
+        codes: npt.NDArray[np.int8]
+        match kind:
+            case 'exact':
+                codes = Validate.bulk_exact(strings)
+            case 'general' | 'period':
+                grammar: DateGrammar = Validate.date_grammar(specs)
+                preface, _, remainder = np.moveaxis(
+                    np.char.partition(strings, Default.SPACE), -1, 0
+                )
+                if kind == 'general':
+                    single: npt.NDArray[np.bool_] = np.isin(
+                        preface, ['ABT', 'AFT', 'BEF', 'CAL', 'EST', 'TO']
+                    )
+                    first: npt.NDArray[np.str_] = np.where(
+                        single, remainder, strings
+                    )
+                    second: npt.NDArray[np.str_] = np.full(
+                        strings.shape, Default.EMPTY
+                    )
+                    for tag, separator in [('BET', ' AND '), ('FROM', ' TO ')]:
+                        pair = np.char.partition(remainder, separator)
+                        first = np.where(preface == tag, pair[..., 0], first)
+                        second = np.where(preface == tag, pair[..., 2], second)
+                    codes = Validate.bulk_general(first, grammar)
+                else:
+                    to_split = np.char.partition(strings, 'TO ')
+                    first = np.char.strip(
+                        np.char.replace(to_split[..., 0], 'FROM ', Default.EMPTY)
+                    )
+                    second = to_split[..., 2]
+                    codes = np.where(
+                        (strings != Default.EMPTY)
+                        & ~np.char.startswith(strings, 'TO')
+                        & ~np.char.startswith(strings, 'FROM'),
+                        DateError.FORMAT,
+                        Validate.bulk_general(first, grammar),
+                    ).astype(np.int8)
+                codes = np.where(
+                    codes == DateError.NONE,
+                    Validate.bulk_general(second, grammar),
+                    codes,
+                ).astype(np.int8)
+            case _:
+                raise ValueError(Msg.NOT_DATE_KIND.format(kind))
+        codes = np.where(
+            is_string, codes[inverse], DateError.NOT_STRING
+        ).astype(np.int8)
+        return (codes == DateError.NONE).reshape(shape), codes.reshape(shape)
+
     @staticmethod
     def date_period(
         value: Any, class_name: str, specs: dict[str, dict[str, Any]]
@@ -2781,6 +3358,42 @@ class Validate:
         # Reject a value that is not a string otherwise accept it.
         return Validate.string(value, class_name)
 
+    @staticmethod
+    def lati(value: Any, class_name: str) -> bool:
+        """Validate a latitude beginning with `N` or `S` and within the latitude range."""
+
+        # Reject a value that does not begin with `N` or `S`.
+        if isinstance(value, str) and value[0] not in [
+            Default.LATI_NORTH,
+            Default.LATI_SOUTH,
+        ]:
+            raise ValueError(
+                Msg.LATI_NORTH_SOUTH.format(
+                    value[0],
+                    value,
+                    Default.LATI_NORTH,
+                    Default.LATI_SOUTH,
+                    class_name,
+                )
+            )
+
+        # Reject a value outside of the latitude range.
+        if isinstance(value, str) and (
+            float(value[1:]) > Default.LATI_HIGH
+            or float(value[1:]) < Default.LATI_LOW
+        ):
+            raise ValueError(
+                Msg.LATI_RANGE.format(
+                    value,
+                    Default.LATI_LOW,
+                    Default.LATI_HIGH,
+                    class_name,
+                )
+            )
+
+        # If it gets this far, return True.
+        return True
+
     @staticmethod
     def listing(value: Any, class_name: str) -> bool:
         """Validate a string listing with optional ', ' delimiter."""
@@ -2788,6 +3401,42 @@ class Validate:
         # Reject a value that is not a string otherwise accept it.
         return Validate.string(value, class_name)
 
+    @staticmethod
+    def long(value: Any, class_name: str) -> bool:
+        """Validate a longitude beginning with `E` or `W` and within the longitude range."""
+
+        # Reject a value that does not begin with `E` or `W`.
+        if isinstance(value, str) and value[0] not in [
+            Default.LONG_EAST,
+            Default.LONG_WEST,
+        ]:
+            raise ValueError(
+                Msg.LONG_EAST_WEST.format(
+                    value[0],
+                    value,
+                    Default.LONG_EAST,
+                    Default.LONG_WEST,
+                    class_name,
+                )
+            )
+
+        # Reject a value outside of the longitude range.
+        if isinstance(value, str) and (
+            float(value[1:]) > Default.LONG_HIGH
+            or float(value[1:]) < Default.LONG_LOW
+        ):
+            raise ValueError(
+                Msg.LONG_RANGE.format(
+                    value,
+                    Default.LONG_LOW,
+                    Default.LONG_HIGH,
+                    class_name,
+                )
+            )
+
+        # If it gets this far, return True.
+        return True
+
     @staticmethod
     def mediatype(value: Any, class_name: str) -> bool:
         """Validate a string listing with a single required '/' delimiter."""
@@ -2865,6 +3514,22 @@ class Validate:
         # If it gets this far, return True.
         return True
 
+    @staticmethod
+    def tag(value: Any, class_name: str) -> bool:
+        """Validate the value of a TAG structure as a tag and a uri separated by one space.
+
+        Args:
+            value: The payload of the class.
+            class_name: The name of the class with the payload.
+        """
+
+        # Reject a value that does not have exactly one space.
+        if isinstance(value, str) and value.count(Default.SPACE) != 1:
+            raise ValueError(Msg.TAG_SPACES.format(value))
+
+        # If it gets this far, return True.
+        return True
+
     @staticmethod
     def time(value: Any, class_name: str) -> bool:
         """Verify that the time value conforms to specifications.
@@ -2960,3 +3625,579 @@ class Validate:
 
         # If it gets this far, return True.
         return True
+
+
+class DateInterval(NamedTuple):
+    """The range of Julian day numbers covered by a date value.
+
+    An open end, as in `BEF 1900` or `FROM 1900`, is None.
+
+    Args:
+        earliest: The Julian day number of the first day the date may fall on.
+        latest: The Julian day number of the last day the date may fall on.
+        qualifier: The preface of the date such as `ABT`, `BET` or `FROM` or the empty string.
+        calendar: The calendar of the first date in the value.
+    """
+
+    earliest: int | None
+    latest: int | None
+    qualifier: str
+    calendar: str
+
+
+class Dates:
+    """Convert GEDCOM dates to intervals of Julian day numbers.
+
+    The Julian day number counts days from noon on 1 January 4713 BCE in the
+    Julian calendar.  Converting dates in any of the standard calendars to
+    this number lets them be sorted and compared without parsing the text again.
+
+    Dates in extension calendars have no interval.
+
+    Reference:
+        - [GEDCOM Date](https://gedcom.io/specifications/FamilySearchGEDCOMv7.html#date)
+        - [Julian Day](https://en.wikipedia.org/wiki/Julian_day)
+    """
+
+    # The number of each month tag in the standard calendars.
+    month_numbers: ClassVar[dict[str, dict[str, int]]] = {
+        calendar.value: {
+            tag: int(number)
+            for number, tag in definition[Value.MONTH_NAMES].items()
+        }
+        for calendar, definition in Cal.CALENDARS.items()
+    }
+    month_days: ClassVar[list[int]] = [
+        0,
+        31,
+        28,
+        31,
+        30,
+        31,
+        30,
+        31,
+        31,
+        30,
+        31,
+        30,
+        31,
+    ]
+
+    @staticmethod
+    def isleap(year: int, calendar: str = Default.CALENDAR_DEFAULT) -> bool:
+        """Return True if the year has a leap day in the calendar.
+
+        The years of the Gregorian and Julian calendars are astronomical years
+        so 1 BCE is the year 0.  The French Republican calendar uses the
+        leap years 3, 7 and 11 that were in use and continues the pattern.
+
+        Example:
+            >>> from genedata.methods import Dates
+            >>> Dates.isleap(1900), Dates.isleap(1900, 'JULIAN')
+            (False, True)
+
+        Args:
+            year: The year of the date.
+            calendar: The tag of the calendar.
+        """
+        match calendar:
+            case 'GREGORIAN':
+                return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+            case 'JULIAN':
+                return year % 4 == 0
+            case 'FRENCH_R':
+                return (year + 1) % 4 == 0
+            case 'HEBREW':
+                return (7 * year + 1) % 19 < 7
+            case _:
+                return False
+
+    @staticmethod
+    def hebrew_elapsed_days(year: int) -> int:
+        """Return the days from the Hebrew epoch to the molad of Tishrei of the year.
+
+        Args:
+            year: The Hebrew year.
+        """
+        months: int = (235 * year - 234) // 19
+        parts: int = 12084 + 13753 * months
+        days: int = 29 * months + parts // 25920
+        if (3 * (days + 1)) % 7 < 3:
+            days += 1
+        return days
+
+    @staticmethod
+    @functools.lru_cache(maxsize=Default.DATE_CACHE_SIZE)
+    def hebrew_new_year(year: int) -> int:
+        """Return the Julian day number of 1 Tishrei of the Hebrew year.
+
+        Example:
+            >>> from genedata.methods import Dates
+            >>> Dates.hebrew_new_year(5785)
+            2460587
+
+        Args:
+            year: The Hebrew year.
+        """
+        previous: int = Dates.hebrew_elapsed_days(year - 1)
+        current: int = Dates.hebrew_elapsed_days(year)
+        following: int = Dates.hebrew_elapsed_days(year + 1)
+        delay: int = 0
+        if following - current == 356:
+            delay = 2
+        elif current - previous == 382:
+            delay = 1
+        return Default.JDN_HEBREW_EPOCH + current + delay
+
+    @staticmethod
+    def hebrew_month_days(year: int) -> list[int]:
+        """Return the days in each month of a Hebrew year starting with Tishrei.
+
+        The first item is a placeholder so that the list is indexed by the month number.
+        ADR has no days in a year that is not a leap year.
+
+        Args:
+            year: The Hebrew year.
+        """
+        length: int = Dates.hebrew_new_year(year + 1) - Dates.hebrew_new_year(year)
+        return [
+            0,
+            30,
+            30 if length % 10 == 5 else 29,
+            29 if length % 10 == 3 else 30,
+            29,
+            30,
+            30 if Dates.isleap(year, 'HEBREW') else 0,
+            29,
+            30,
+            29,
+            30,
+            29,
+            30,
+            29,
+        ]
+
+    @staticmethod
+    def days_in_month(
+        year: int, month: int, calendar: str = Default.CALENDAR_DEFAULT
+    ) -> int:
+        """Return the number of days in the month of a year.
+
+        The Hebrew month ADR in a year without it is treated as ADS.
+
+        Example:
+            >>> from genedata.methods import Dates
+            >>> Dates.days_in_month(2024, 2), Dates.days_in_month(3, 13, 'FRENCH_R')
+            (29, 6)
+
+        Args:
+            year: The year, which is astronomical for the Gregorian and Julian calendars.
+            month: The number of the month in the calendar starting at 1.
+            calendar: The tag of the calendar.
+        """
+        match calendar:
+            case 'GREGORIAN' | 'JULIAN':
+                if month == 2 and Dates.isleap(year, calendar):
+                    return 29
+                return Dates.month_days[month]
+            case 'FRENCH_R':
+                if month == 13:
+                    return 6 if Dates.isleap(year, calendar) else 5
+                return 30
+            case _:
+                days: list[int] = Dates.hebrew_month_days(year)
+                if days[month] == 0:
+                    return days[month + 1]
+                return days[month]
+
+    @staticmethod
+    def jdn(
+        year: int, month: int, day: int, calendar: str = Default.CALENDAR_DEFAULT
+    ) -> int:
+        """Return the Julian day number of a date.
+
+        Examples:
+            >>> from genedata.methods import Dates
+            >>> Dates.jdn(2000, 1, 1)
+            2451545
+
+            The French Republican calendar started on 22 September 1792.
+            >>> Dates.jdn(1, 1, 1, 'FRENCH_R') == Dates.jdn(1792, 9, 22)
+            True
+
+        Args:
+            year: The year, which is astronomical for the Gregorian and Julian calendars.
+            month: The number of the month in the calendar starting at 1.
+            day: The day of the month starting at 1.
+            calendar: The tag of the calendar.
+
+        Reference:
+            - [Converting Gregorian calendar date to Julian Day Number](https://en.wikipedia.org/wiki/Julian_day#Converting_Gregorian_calendar_date_to_Julian_Day_Number)
+        """
+        match calendar:
+            case 'GREGORIAN' | 'JULIAN':
+                shift: int = (14 - month) // 12
+                years: int = year + 4800 - shift
+                months: int = month + 12 * shift - 3
+                days: int = day + (153 * months + 2) // 5 + 365 * years + years // 4
+                if calendar == 'JULIAN':
+                    return days - 32083
+                return days - years // 100 + years // 400 - 32045
+            case 'FRENCH_R':
+                return (
+                    Default.JDN_FRENCH_R_EPOCH
+                    + 365 * (year - 1)
+                    + year // 4
+                    + 30 * (month - 1)
+                    + day
+                    - 1
+                )
+            case _:
+                month_days: list[int] = Dates.hebrew_month_days(year)
+                if month_days[month] == 0:
+                    month += 1
+                return Dates.hebrew_new_year(year) + sum(month_days[:month]) + day - 1
+
+    @staticmethod
+    def span(
+        value: str, specs: dict[str, dict[str, Any]] = Specs
+    ) -> DateInterval | None:
+        """Return the interval covered by a date without a preface.
+
+        A year covers every day of the year and a month every day of the month.
+        A date with a year 0, a day not in its month or an epoch its calendar
+        does not have is invalid and has no interval.
+
+        Examples:
+            >>> from genedata.methods import Dates
+            >>> Dates.span('FEB 2024')
+            DateInterval(earliest=2460342, latest=2460370, qualifier='', calendar='GREGORIAN')
+            >>> Dates.span('31 FEB 1900') is None
+            True
+
+        Args:
+            value: The date such as `JULIAN 5 FEB 1700` or `2000 BCE`.
+            specs: The current specifications including any extensions.
+        """
+        grammar: DateGrammar = Validate.date_grammar(specs)
+        match = grammar.pattern.fullmatch(value)
+        if match is None:
+            return None
+        calendar: str = Default.CALENDAR_DEFAULT
+        day: str | None = None
+        epoch: str | None = None
+        if match['month_only'] is not None:
+            month: str | None = match['month_only']
+            year: int = int(match['year_only'])
+        else:
+            if match['calendar'] is not None:
+                calendar = match['calendar']
+            day = match['day']
+            month = match['month']
+            year = int(match['year'])
+            epoch = match['epoch']
+
+        # Check that the calendar, month and epoch are known and convert the year to an astronomical year.
+        months: dict[str, int] | None = Dates.month_numbers.get(calendar)
+        if (
+            months is None
+            or year == 0
+            or (month is not None and month not in months)
+        ):
+            return None
+        if epoch is not None:
+            if epoch not in grammar.epochs.get(calendar, []):
+                return None
+            year = 1 - year
+
+        # Check that the day is in the month.
+        if (
+            day is not None
+            and month is not None
+            and not 1 <= int(day) <= Dates.days_in_month(year, months[month], calendar)
+        ):
+            return None
+
+        # Find the first and last day covered by the date.
+        if month is None:
+            earliest: int = Dates.jdn(year, 1, 1, calendar)
+            latest: int = Dates.jdn(year + 1, 1, 1, calendar) - 1
+        elif day is None:
+            earliest = Dates.jdn(year, months[month], 1, calendar)
+            latest = (
+                earliest + Dates.days_in_month(year, months[month], calendar) - 1
+            )
+        else:
+            earliest = Dates.jdn(year, months[month], int(day), calendar)
+            latest = earliest
+        return DateInterval(earliest, latest, Default.EMPTY, calendar)
+
+    @staticmethod
+    def interval(
+        value: str, specs: dict[str, dict[str, Any]] = Specs
+    ) -> DateInterval | None:
+        """Return the interval of Julian day numbers covered by a date value.
+
+        The interval is None for an empty value, an invalid value, a range
+        whose second date ends before its first date starts or a value in an
+        extension calendar.
+
+        Examples:
+            An approximate date covers the same days as the date itself.
+            >>> from genedata.methods import Dates
+            >>> Dates.interval('ABT 12 MAR 1850')
+            DateInterval(earliest=2396829, latest=2396829, qualifier='ABT', calendar='GREGORIAN')
+
+            A range covers the days from the first date to the second.
+            >>> Dates.interval('BET 1800 AND 1810')
+            DateInterval(earliest=2378497, latest=2382513, qualifier='BET', calendar='GREGORIAN')
+
+            A date before another has no earliest day.
+            >>> Dates.interval('BEF JULIAN 5 FEB 1700')
+            DateInterval(earliest=None, latest=2342017, qualifier='BEF', calendar='JULIAN')
+
+        Args:
+            value: The payload of a `Date`, `DateExact` or `DataEvenDate` structure.
+            specs: The current specifications including any extensions.
+        """
+        if value == Default.EMPTY:
+            return None
+
+        # Partition the date value into a possible preface and the date value.
+        preface, _, remainder = value.partition(Default.SPACE)
+        first: DateInterval | None = None
+        second: DateInterval | None = None
+        match preface:
+            case 'ABT' | 'CAL' | 'EST':
+                first = Dates.span(remainder, specs)
+                if first is None:
+                    return None
+                return first._replace(qualifier=preface)
+            case 'BEF' | 'TO':
+                first = Dates.span(remainder, specs)
+                if first is None:
+                    return None
+                latest: int = first.latest  # type: ignore[assignment]
+                if preface == 'BEF':
+                    latest = first.earliest - 1  # type: ignore[operator]
+                return DateInterval(None, latest, preface, first.calendar)
+            case 'AFT':
+                first = Dates.span(remainder, specs)
+                if first is None:
+                    return None
+                return DateInterval(
+                    first.latest + 1,  # type: ignore[operator]
+                    None,
+                    preface,
+                    first.calendar,
+                )
+            case 'BET':
+                between_date, _, and_date = remainder.partition(' AND ')
+                first = Dates.span(between_date, specs)
+                second = Dates.span(and_date, specs)
+                if (
+                    first is None
+                    or second is None
+                    or first.earliest > second.latest  # type: ignore[operator]
+                ):
+                    return None
+                return DateInterval(
+                    first.earliest, second.latest, preface, first.calendar
+                )
+            case 'FROM':
+                from_date, _, to_date = remainder.partition(' TO ')
+                first = Dates.span(from_date, specs)
+                if first is None:
+                    return None
+                if to_date == Default.EMPTY:
+                    return DateInterval(
+                        first.earliest, None, preface, first.calendar
+                    )
+                second = Dates.span(to_date, specs)
+                if second is None or first.earliest > second.latest:  # type: ignore[operator]
+                    return None
+                return DateInterval(
+                    first.earliest, second.latest, preface, first.calendar
+                )
+            case _:
+                return Dates.span(value, specs)
+
+
+class Payload:
+    """Resolve payload uris to small integer identifiers that dispatch to cleaners and validators.
+
+    A payload uri is resolved once with `resolve` when a structure is constructed
+    or an extension is registered.  Cleaning and validating the value of the
+    structure is then a lookup in the `cleaners` and `validators` tables.
+
+    The validators take the structure and the specification dictionary.
+    Those for the standard payload types are added by the `structure` module
+    which defines the cross reference identifier classes some of them check.
+
+    New payload types from extensions are added with `register` and removed
+    with `unregister`.
+
+    Example:
+        >>> from genedata.constants import PayloadType
+        >>> from genedata.methods import Payload
+        >>> Payload.resolve('https://gedcom.io/terms/v7/type-Date') is PayloadType.DATE
+        True
+        >>> Payload.clean(' abt  1900 ', PayloadType.DATE)
+        'ABT 1900'
+    """
+
+    @staticmethod
+    def clean_age(value: str) -> str:
+        """Remove surrounding and double spaces from an age."""
+        return Validate.remove_double_spaces(value.strip())
+
+    @staticmethod
+    def clean_date(value: str) -> str:
+        """Remove surrounding and double spaces from a date and capitalize it."""
+        return Validate.remove_double_spaces(value.strip()).upper()
+
+    @staticmethod
+    def clean_list(value: str) -> str:
+        """Separate the items of a list by a comma and a single space."""
+        values: list[str] = value.split(Default.COMMA)
+        values_stripped: list[str] = [item.strip() for item in values]
+        return Default.LIST_ITEM_SEPARATOR.join(values_stripped).strip()
+
+    @staticmethod
+    def clean_strip(value: str) -> str:
+        """Remove surrounding spaces."""
+        return value.strip()
+
+    @staticmethod
+    def clean_upper(value: str) -> str:
+        """Remove surrounding spaces and capitalize the value."""
+        return value.upper().strip()
+
+    ids: ClassVar[dict[str, int]] = {
+        'http://www.w3.org/2001/XMLSchema#string': PayloadType.STRING,
+        'Y|<NULL>': PayloadType.Y_OR_NULL,
+        'http://www.w3.org/2001/XMLSchema#nonNegativeInteger': PayloadType.NON_NEGATIVE_INTEGER,
+        'https://gedcom.io/terms/v7/type-Enum': PayloadType.ENUM,
+        'https://gedcom.io/terms/v7/type-List#Enum': PayloadType.LIST_ENUM,
+        '@<https://gedcom.io/terms/v7/record-INDI>@': PayloadType.INDIVIDUAL_XREF,
+        '@<https://gedcom.io/terms/v7/record-FAM>@': PayloadType.FAMILY_XREF,
+        'https://gedcom.io/terms/v7/type-List#Text': PayloadType.LIST_TEXT,
+        '@<https://gedcom.io/terms/v7/record-SUBM>@': PayloadType.SUBMITTER_XREF,
+        'http://www.w3.org/2001/XMLSchema#Language': PayloadType.LANGUAGE,
+        'https://gedcom.io/terms/v7/type-Date#period': PayloadType.DATE_PERIOD,
+        'https://gedcom.io/terms/v7/type-Date#exact': PayloadType.DATE_EXACT,
+        'https://gedcom.io/terms/v7/type-Date': PayloadType.DATE,
+        'https://gedcom.io/terms/v7/type-FilePath': PayloadType.FILE_PATH,
+        'https://gedcom.io/terms/v7/type-Name': PayloadType.NAME,
+        'https://gedcom.io/terms/v7/type-Age': PayloadType.AGE,
+        'http://www.w3.org/ns/dcat#mediaType': PayloadType.MEDIA_TYPE,
+        '@<https://gedcom.io/terms/v7/record-OBJE>@': PayloadType.MULTIMEDIA_XREF,
+        '@<https://gedcom.io/terms/v7/record-REPO>@': PayloadType.REPOSITORY_XREF,
+        '@<https://gedcom.io/terms/v7/record-SNOTE>@': PayloadType.SHARED_NOTE_XREF,
+        '@<https://gedcom.io/terms/v7/record-SOUR>@': PayloadType.SOURCE_XREF,
+        'https://gedcom.io/terms/v7/type-Time': PayloadType.TIME,
+    }
+
+    cleaners: ClassVar[dict[int, Callable[[str], str]]] = {
+        PayloadType.AGE: clean_age,
+        PayloadType.DATE_EXACT: clean_date,
+        PayloadType.DATE: clean_date,
+        PayloadType.DATE_PERIOD: clean_date,
+        PayloadType.LIST_TEXT: clean_list,
+        PayloadType.LIST_ENUM: clean_list,
+        PayloadType.LANGUAGE: clean_strip,
+        PayloadType.FILE_PATH: clean_strip,
+        PayloadType.MEDIA_TYPE: clean_strip,
+        PayloadType.Y_OR_NULL: clean_upper,
+        PayloadType.ENUM: clean_upper,
+        PayloadType.TIME: clean_upper,
+    }
+
+    validators: ClassVar[
+        dict[int, Callable[[Any, dict[str, dict[str, Any]]], Any]]
+    ] = {}
+
+    @staticmethod
+    def resolve(payload: str) -> int:
+        """Return the identifier of a payload uri or `PayloadType.NONE` if it is not registered.
+
+        Args:
+            payload: The payload uri from the specification.
+        """
+        return Payload.ids.get(payload, PayloadType.NONE)
+
+    @staticmethod
+    def clean(value: str, payload_id: int) -> str:
+        """Clean a value with the cleaner registered for its payload identifier.
+
+        Args:
+            value: The value to be cleaned.
+            payload_id: The identifier of the payload of the value.
+        """
+        cleaner: Callable[[str], str] | None = Payload.cleaners.get(payload_id)
+        if cleaner is None:
+            return value
+        return cleaner(value)
+
+    @staticmethod
+    def register(
+        payload: str,
+        validator: Callable[[Any, dict[str, dict[str, Any]]], Any]
+        | None = None,
+        cleaner: Callable[[str], str] | None = None,
+    ) -> int:
+        """Register a payload uri with an optional validator and cleaner returning its identifier.
+
+        A payload uri that is already registered keeps its identifier, but
+        the validator or cleaner provided replace those already registered.
+
+        Example:
+            An extension payload type requiring an even integer could be registered as follows.
+            >>> from genedata.methods import Payload
+            >>> def even(structure, specs):
+            ...     if structure.value % 2 != 0:
+            ...         raise ValueError(f'{structure.value} is not even.')
+            >>> even_id = Payload.register('https://example.com/type-Even', even)
+            >>> Payload.resolve('https://example.com/type-Even') == even_id
+            True
+            >>> Payload.unregister('https://example.com/type-Even')
+
+        Args:
+            payload: The payload uri.
+            validator: A function of the structure and the specification dictionary
+                raising a ValueError if the value of the structure is not valid.
+            cleaner: A function returning a cleaned copy of a string value.
+        """
+        payload_id: int = Payload.ids.get(payload, PayloadType.NONE)
+        if payload_id == PayloadType.NONE:
+            payload_id = max(Payload.ids.values()) + 1
+            Payload.ids[payload] = payload_id
+        if validator is not None:
+            Payload.validators[payload_id] = validator
+        if cleaner is not None:
+            Payload.cleaners[payload_id] = cleaner
+        return payload_id
+
+    @staticmethod
+    def unregister(payload: str) -> None:
+        """Remove an extension payload uri with its validator and cleaner.
+
+        The standard payload types cannot be removed.
+
+        Example:
+            >>> from genedata.constants import PayloadType
+            >>> from genedata.methods import Payload
+            >>> _ = Payload.register('https://example.com/type-Odd')
+            >>> Payload.unregister('https://example.com/type-Odd')
+            >>> Payload.resolve('https://example.com/type-Odd') is PayloadType.NONE
+            True
+
+        Args:
+            payload: The payload uri.
+        """
+        payload_id: int = Payload.ids.get(payload, PayloadType.NONE)
+        if payload_id <= max(PayloadType):
+            return
+        del Payload.ids[payload]
+        Payload.validators.pop(payload_id, None)
+        Payload.cleaners.pop(payload_id, None)
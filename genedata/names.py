@@ -0,0 +1,275 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.md
+"""Index the personal names of a genealogy for interactive search.
+
+Each personal name is split into lower case words without accents or the
+slashes around the surname.  `NameIndex` maps those words to the individuals
+who carry them and keeps a sorted vocabulary for prefix lookups, Soundex codes
+for names that sound alike and trigrams for misspelled names.
+"""
+
+__all__ = ['NameIndex', 'NameMatch']
+
+import bisect
+import heapq
+import re
+import unicodedata
+from typing import Any, ClassVar, NamedTuple
+
+from genedata.constants import Default
+
+
+class NameMatch(NamedTuple):
+    """An individual found by a name search.
+
+    Args:
+        xref: The identifier of the individual.
+        name: The first personal name recorded for the individual.
+        score: How well the name matches from 0 to the number of query words.
+    """
+
+    xref: str
+    name: str
+    score: float
+
+
+class NameIndex:
+    """Find individuals by exact, prefix, phonetic or fuzzy name matches.
+
+    The words of the NAME payload and of its GIVN, SURN and NICK
+    substructures are indexed, along with those of each TRAN translation.
+    Every word of the query is compared with the indexed words and the best
+    score for each is added up for the individuals carrying them.  An exact
+    match scores 1, a prefix 0.8, a word with the same Soundex code 0.6 and a
+    word sharing trigrams up to 0.5 times their similarity.
+
+    Examples:
+        >>> from genedata.names import NameIndex
+        >>> NameIndex.soundex('Robert'), NameIndex.soundex('Rupert')
+        ('R163', 'R163')
+        >>> NameIndex.words('José /de la Cruz/')
+        ['jose', 'de', 'la', 'cruz']
+    """
+
+    keys: ClassVar[dict[str, str]] = {
+        'individual': 'record-INDI',
+        'name': 'INDI-NAME',
+        'translation': 'NAME-TRAN',
+    }
+    parts: ClassVar[frozenset[str]] = frozenset(['GIVN', 'SURN', 'NICK'])
+    scores: ClassVar[dict[str, float]] = {
+        'exact': 1.0,
+        'prefix': 0.8,
+        'phonetic': 0.6,
+        'fuzzy': 0.5,
+    }
+    codes: ClassVar[dict[str, str]] = {
+        letter: digit
+        for letters, digit in [
+            ('bfpv', '1'),
+            ('cgjkqsxz', '2'),
+            ('dt', '3'),
+            ('l', '4'),
+            ('mn', '5'),
+            ('r', '6'),
+        ]
+        for letter in letters
+    }
+    separators: ClassVar[re.Pattern[str]] = re.compile(r'[\W\d_]+')
+
+    def __init__(self) -> None:
+        self.person_ids: dict[str, int] = {}
+        self.person_xrefs: list[str] = []
+        self.person_names: list[str] = []
+        self.people: dict[str, set[int]] = {}
+        self.sounds: dict[str, set[str]] = {}
+        self.grams: dict[str, set[str]] = {}
+        self.gram_counts: dict[str, int] = {}
+        self.vocabulary: list[str] = []
+        self.changed: bool = False
+
+    @staticmethod
+    def words(name: str) -> list[str]:
+        """Return the lower case words of a name without accents or slashes.
+
+        Args:
+            name: A personal name such as 'Jim /Smith/'.
+        """
+        plain: str = ''.join(
+            character
+            for character in unicodedata.normalize('NFKD', name.casefold())
+            if not unicodedata.combining(character)
+        )
+        return [word for word in NameIndex.separators.split(plain) if word]
+
+    @staticmethod
+    def soundex(word: str) -> str:
+        """Return the American Soundex code of a word or '' if it has no ASCII letters.
+
+        Args:
+            word: A lower or upper case word.
+        """
+        letters: list[str] = [
+            letter for letter in word.lower() if 'a' <= letter <= 'z'
+        ]
+        if not letters:
+            return Default.EMPTY
+        code: str = letters[0].upper()
+        last: str = NameIndex.codes.get(letters[0], Default.EMPTY)
+        for letter in letters[1:]:
+            digit: str = NameIndex.codes.get(letter, Default.EMPTY)
+            if digit and digit != last:
+                code = ''.join([code, digit])
+                if len(code) == 4:
+                    break
+            if letter not in 'hw':
+                last = digit
+        return code.ljust(4, '0')
+
+    @staticmethod
+    def trigrams(word: str) -> set[str]:
+        """Return the trigrams of a word padded so short words have some."""
+        padded: str = f'  {word} '
+        return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+    @staticmethod
+    def subs(structure: Any) -> list[Any]:
+        """Return the substructures of a structure as a list."""
+        if structure.subs is None:
+            return []
+        if isinstance(structure.subs, list):
+            return structure.subs
+        return [structure.subs]
+
+    def names(self, record: Any) -> list[str]:
+        """Return the name strings of an individual record to be indexed.
+
+        Args:
+            record: A staged individual record.
+        """
+        found: list[str] = []
+        for name in self.subs(record):
+            if name.key != self.keys['name']:
+                continue
+            found.append(str(name.value))
+            for part in self.subs(name):
+                if part.tag in self.parts:
+                    found.append(str(part.value))
+                elif part.key == self.keys['translation']:
+                    found.append(str(part.value))
+                    found.extend(
+                        str(sub.value)
+                        for sub in self.subs(part)
+                        if sub.tag in self.parts
+                    )
+        return found
+
+    def add(self, record: Any) -> None:
+        """Index the names of an individual record ignoring other records.
+
+        Args:
+            record: A staged record.
+        """
+        if record.key != self.keys['individual']:
+            return
+        names: list[str] = self.names(record)
+        if not names:
+            return
+        xref: str = str(record.value)
+        person: int | None = self.person_ids.get(xref)
+        if person is None:
+            person = len(self.person_xrefs)
+            self.person_ids[xref] = person
+            self.person_xrefs.append(xref)
+            self.person_names.append(names[0].replace(Default.SLASH, Default.EMPTY))
+        for name in names:
+            for word in self.words(name):
+                people: set[int] | None = self.people.get(word)
+                if people is None:
+                    people = self.people[word] = set()
+                    self.sounds.setdefault(self.soundex(word), set()).add(word)
+                    grams: set[str] = self.trigrams(word)
+                    self.gram_counts[word] = len(grams)
+                    for gram in grams:
+                        self.grams.setdefault(gram, set()).add(word)
+                    self.changed = True
+                people.add(person)
+
+    def build(self, records: list[Any]) -> None:
+        """Index the names of every individual record in a list.
+
+        Args:
+            records: The staged records.
+        """
+        for record in records:
+            self.add(record)
+
+    def matches(self, word: str, fuzzy: bool = True) -> dict[str, float]:
+        """Return the indexed words matching a query word with their scores.
+
+        Args:
+            word: A lower case query word without accents.
+            fuzzy: Whether to include words sharing trigrams.
+        """
+        if self.changed:
+            self.vocabulary = sorted(self.people)
+            self.changed = False
+        found: dict[str, float] = {}
+        if fuzzy:
+            grams: set[str] = self.trigrams(word)
+            shared: dict[str, int] = {}
+            for gram in grams:
+                for other in self.grams.get(gram, ()):
+                    shared[other] = shared.get(other, 0) + 1
+            for other, count in shared.items():
+                similarity: float = count / (
+                    len(grams) + self.gram_counts[other] - count
+                )
+                if similarity >= Default.NAME_TRIGRAM_THRESHOLD:
+                    found[other] = self.scores['fuzzy'] * similarity
+        for other in self.sounds.get(self.soundex(word), ()):
+            found[other] = self.scores['phonetic']
+        position: int = bisect.bisect_left(self.vocabulary, word)
+        while position < len(self.vocabulary):
+            other = self.vocabulary[position]
+            if not other.startswith(word):
+                break
+            found[other] = self.scores['prefix']
+            position += 1
+        if word in self.people:
+            found[word] = self.scores['exact']
+        return found
+
+    def search(
+        self,
+        query: str,
+        limit: int = Default.NAME_SEARCH_LIMIT,
+        fuzzy: bool = True,
+    ) -> list[NameMatch]:
+        """Return the individuals whose names best match a query.
+
+        Args:
+            query: One or more words of a name in any case, such as 'smith jim'.
+            limit: The most individuals to return.
+            fuzzy: Whether to include words that only share trigrams.
+        """
+        totals: dict[int, float] = {}
+        for word in dict.fromkeys(self.words(query)):
+            best: dict[int, float] = {}
+            for other, score in self.matches(word, fuzzy).items():
+                for person in self.people[other]:
+                    if score > best.get(person, 0.0):
+                        best[person] = score
+            for person, score in best.items():
+                totals[person] = totals.get(person, 0.0) + score
+        ranked: list[tuple[float, int]] = heapq.nlargest(
+            limit,
+            ((score, -person) for person, score in totals.items()),
+        )
+        return [
+            NameMatch(
+                self.person_xrefs[-person],
+                self.person_names[-person],
+                round(score, 6),
+            )
+            for score, person in ranked
+        ]
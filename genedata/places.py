@@ -0,0 +1,353 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.md
+"""Index the mapped places of a genealogy for map queries.
+
+The LATI and LONG payloads under the MAP of each PLAC are parsed once into
+arrays of signed decimal degrees.  `PlaceIndex` sorts the distinct places by
+the cell of a latitude and longitude grid they fall in, so a bounding box or
+a circle only looks at the places in the cells it touches.  Events refer to
+their place by position so many events at one place share a single point.
+"""
+
+__all__ = ['PlaceIndex', 'PlaceMatch']
+
+import math
+from typing import Any, ClassVar, NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+
+from genedata.constants import Default
+from genedata.methods import Input
+
+Floats = npt.NDArray[np.float64]
+Integers = npt.NDArray[np.int64]
+
+
+class PlaceMatch(NamedTuple):
+    """An event found by a map query.
+
+    Args:
+        xref: The identifier of the individual or family.
+        event: The tag of the event such as 'BIRT'.
+        place: The PLAC payload of the event.
+        latitude: The latitude in decimal degrees with south negative.
+        longitude: The longitude in decimal degrees with west negative.
+        km: The great circle distance from the point of the query or None for boxes.
+    """
+
+    xref: str
+    event: str
+    place: str
+    latitude: float
+    longitude: float
+    km: float | None
+
+
+class PlaceIndex:
+    """Find events by bounding box, by distance from a point or by the nearest places.
+
+    Coordinates may be given as decimal degrees, such as those returned by
+    `Input.to_decimal`, or as LATI and LONG payloads such as 'N18.150944'.
+
+    Examples:
+        >>> import genedata.classes70 as gc
+        >>> from genedata.places import PlaceIndex
+        >>> index = PlaceIndex()
+        >>> index.add(
+        ...     gc.RecordIndi(
+        ...         gc.IndividualXref('@I1@'),
+        ...         gc.Birt('', gc.Plac('Boston', gc.Map([gc.Lati('N42.36'), gc.Long('W71.06')]))),
+        ...     )
+        ... )
+        >>> [match.place for match in index.within(41.82, -71.41, 100)]
+        ['Boston']
+        >>> index.box(40, -75, 41, -70)
+        []
+    """
+
+    keys: ClassVar[frozenset[str]] = frozenset(['record-INDI', 'record-FAM'])
+
+    def __init__(self, cell: float = Default.PLACE_GRID_DEGREES) -> None:
+        self.cell: float = cell
+        self.columns: int = math.ceil(360 / cell)
+        self.rows_count: int = math.ceil(180 / cell)
+        self.place_ids: dict[tuple[str, float, float], int] = {}
+        self.place_names: list[str] = []
+        self.place_points: list[tuple[float, float]] = []
+        self.record_ids: dict[str, int] = {}
+        self.record_xrefs: list[str] = []
+        self.event_rows: list[tuple[int, str, int]] = []
+        self.changed: bool = False
+        self.latitudes: Floats = np.zeros(0)
+        self.longitudes: Floats = np.zeros(0)
+        self.order: Integers = np.zeros(0, dtype=np.int64)
+        self.cell_starts: Integers = np.zeros(
+            self.rows_count * self.columns + 1, dtype=np.int64
+        )
+        self.event_starts: Integers = np.zeros(1, dtype=np.int64)
+        self.event_order: Integers = np.zeros(0, dtype=np.int64)
+
+    @staticmethod
+    def subs(structure: Any) -> list[Any]:
+        """Return the substructures of a structure as a list."""
+        if structure.subs is None:
+            return []
+        if isinstance(structure.subs, list):
+            return structure.subs
+        return [structure.subs]
+
+    @staticmethod
+    def degrees(value: float | str) -> float:
+        """Return decimal degrees from a number or a LATI or LONG payload."""
+        if isinstance(value, str):
+            return Input.degrees(value)
+        return float(value)
+
+    def coordinates(self, place: Any) -> tuple[float, float] | None:
+        """Return the latitude and longitude under the MAP of a PLAC or None."""
+        for map_structure in self.subs(place):
+            if map_structure.tag == 'MAP':
+                latitude: float | None = None
+                longitude: float | None = None
+                for coordinate in self.subs(map_structure):
+                    if coordinate.tag == 'LATI':
+                        latitude = Input.degrees(str(coordinate.value))
+                    elif coordinate.tag == 'LONG':
+                        longitude = Input.degrees(str(coordinate.value))
+                if latitude is not None and longitude is not None:
+                    return latitude, longitude
+        return None
+
+    def add(self, record: Any) -> None:
+        """Add the events with mapped places of an individual or family record.
+
+        Args:
+            record: A staged record.
+        """
+        if record.key not in self.keys:
+            return
+        xref: str = str(record.value)
+        for event in self.subs(record):
+            for place in self.subs(event):
+                if place.tag != 'PLAC':
+                    continue
+                point: tuple[float, float] | None = self.coordinates(place)
+                if point is None:
+                    continue
+                key: tuple[str, float, float] = (str(place.value), *point)
+                if key not in self.place_ids:
+                    self.place_ids[key] = len(self.place_names)
+                    self.place_names.append(key[0])
+                    self.place_points.append(point)
+                if xref not in self.record_ids:
+                    self.record_ids[xref] = len(self.record_xrefs)
+                    self.record_xrefs.append(xref)
+                self.event_rows.append(
+                    (self.record_ids[xref], event.tag, self.place_ids[key])
+                )
+                self.changed = True
+
+    def build(self, records: list[Any]) -> None:
+        """Add the events with mapped places of every record in a list.
+
+        Args:
+            records: The staged records.
+        """
+        for record in records:
+            self.add(record)
+
+    def cells(self, latitudes: Floats, longitudes: Floats) -> Integers:
+        """Return the grid cell of each point."""
+        rows: Integers = np.clip(
+            ((latitudes + 90) // self.cell).astype(np.int64), 0, self.rows_count - 1
+        )
+        columns: Integers = np.clip(
+            ((longitudes + 180) // self.cell).astype(np.int64), 0, self.columns - 1
+        )
+        return rows * self.columns + columns
+
+    def compact(self) -> None:
+        """Sort the places by grid cell and group the events by place."""
+        points: Floats = np.array(self.place_points, dtype=np.float64).reshape(-1, 2)
+        cells: Integers = self.cells(points[:, 0], points[:, 1])
+        self.order = np.argsort(cells, kind='stable')
+        self.latitudes = points[self.order, 0]
+        self.longitudes = points[self.order, 1]
+        self.cell_starts = np.searchsorted(
+            cells[self.order], np.arange(self.rows_count * self.columns + 1)
+        )
+        places: Integers = np.array(
+            [row[2] for row in self.event_rows], dtype=np.int64
+        )
+        self.event_order = np.argsort(places, kind='stable')
+        self.event_starts = np.searchsorted(
+            places[self.event_order], np.arange(len(self.place_names) + 1)
+        )
+        self.changed = False
+
+    def candidates(
+        self, south: float, west: float, north: float, east: float
+    ) -> Integers:
+        """Return the sorted positions of the places in the cells a box touches.
+
+        A box whose west edge is east of its east edge crosses the antimeridian.
+        When both edges fall in the same column every column is scanned once.
+        """
+        if self.changed:
+            self.compact()
+        first_row, last_row = (
+            int(np.clip((value + 90) // self.cell, 0, self.rows_count - 1))
+            for value in (south, north)
+        )
+        first, last = (
+            int(np.clip((value + 180) // self.cell, 0, self.columns - 1))
+            for value in (west, east)
+        )
+        spans: list[tuple[int, int]] = [(first, last)]
+        if west > east:
+            spans = (
+                [(0, self.columns - 1)]
+                if first <= last
+                else [(first, self.columns - 1), (0, last)]
+            )
+        pieces: list[Integers] = [
+            np.arange(
+                self.cell_starts[row * self.columns + start],
+                self.cell_starts[row * self.columns + end + 1],
+            )
+            for row in range(first_row, last_row + 1)
+            for start, end in spans
+        ]
+        if not pieces:
+            return np.zeros(0, dtype=np.int64)
+        return np.concatenate(pieces)
+
+    def distances(self, latitude: float, longitude: float, positions: Integers) -> Floats:
+        """Return the great circle distances in km from a point to the places at positions."""
+        latitude_1: float = math.radians(latitude)
+        latitudes: Floats = np.radians(self.latitudes[positions])
+        half: Floats = np.sin((latitudes - latitude_1) / 2) ** 2 + math.cos(
+            latitude_1
+        ) * np.cos(latitudes) * (
+            np.sin(np.radians(self.longitudes[positions] - longitude) / 2) ** 2
+        )
+        return 2 * Default.EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(half, 0, 1)))
+
+    def circle(self, latitude: float, longitude: float, km: float) -> tuple[Integers, Floats]:
+        """Return the positions of the places within a distance of a point and their distances."""
+        spread: float = math.degrees(km / Default.EARTH_RADIUS_KM)
+        south: float = latitude - spread
+        north: float = latitude + spread
+        if south <= -90 or north >= 90 or spread >= 180:
+            west, east = -180.0, 180.0
+        else:
+            width: float = math.degrees(
+                math.asin(
+                    min(1.0, math.sin(math.radians(spread)) / math.cos(math.radians(latitude)))
+                )
+            )
+            west = (longitude - width + 180) % 360 - 180
+            east = (longitude + width + 180) % 360 - 180
+            if width >= 180:
+                west, east = -180.0, 180.0
+        positions: Integers = self.candidates(south, west, north, east)
+        distances: Floats = self.distances(latitude, longitude, positions)
+        keep: npt.NDArray[np.bool_] = distances <= km
+        return positions[keep], distances[keep]
+
+    def matches(self, positions: Integers, distances: Floats | None = None) -> list[PlaceMatch]:
+        """Return the events at the places at positions in the order of the positions."""
+        found: list[PlaceMatch] = []
+        for index, position in enumerate(positions.tolist()):
+            place: int = int(self.order[position])
+            km: float | None = None if distances is None else float(distances[index])
+            for event in self.event_order[
+                self.event_starts[place] : self.event_starts[place + 1]
+            ].tolist():
+                record, tag, _ = self.event_rows[event]
+                found.append(
+                    PlaceMatch(
+                        self.record_xrefs[record],
+                        tag,
+                        self.place_names[place],
+                        self.place_points[place][0],
+                        self.place_points[place][1],
+                        km,
+                    )
+                )
+        return found
+
+    def box(
+        self,
+        south: float | str,
+        west: float | str,
+        north: float | str,
+        east: float | str,
+    ) -> list[PlaceMatch]:
+        """Return the events at places inside a bounding box.
+
+        Args:
+            south: The southern edge.
+            west: The western edge, which is east of `east` if the box crosses
+                the antimeridian.
+            north: The northern edge.
+            east: The eastern edge.
+        """
+        bounds: list[float] = [self.degrees(value) for value in (south, west, north, east)]
+        positions: Integers = self.candidates(*bounds)
+        latitudes: Floats = self.latitudes[positions]
+        longitudes: Floats = self.longitudes[positions]
+        inside: npt.NDArray[np.bool_] = (latitudes >= bounds[0]) & (latitudes <= bounds[2])
+        if bounds[1] <= bounds[3]:
+            inside &= (longitudes >= bounds[1]) & (longitudes <= bounds[3])
+        else:
+            inside &= (longitudes >= bounds[1]) | (longitudes <= bounds[3])
+        return self.matches(positions[inside])
+
+    def within(
+        self, latitude: float | str, longitude: float | str, km: float
+    ) -> list[PlaceMatch]:
+        """Return the events at places within a distance of a point, nearest first.
+
+        Args:
+            latitude: The latitude of the point.
+            longitude: The longitude of the point.
+            km: The greatest great circle distance in kilometres.
+        """
+        if self.changed:
+            self.compact()
+        positions, distances = self.circle(
+            self.degrees(latitude), self.degrees(longitude), km
+        )
+        order: Integers = np.argsort(distances, kind='stable')
+        return self.matches(positions[order], distances[order])
+
+    def nearest(
+        self,
+        latitude: float | str,
+        longitude: float | str,
+        count: int = 1,
+    ) -> list[PlaceMatch]:
+        """Return the events at the nearest places to a point, nearest first.
+
+        The search radius starts at one grid cell and doubles until `count`
+        places are found, so every place closer than the last one returned is
+        included.
+
+        Args:
+            latitude: The latitude of the point.
+            longitude: The longitude of the point.
+            count: The number of distinct places to return.
+        """
+        if self.changed:
+            self.compact()
+        point: tuple[float, float] = (self.degrees(latitude), self.degrees(longitude))
+        km: float = math.radians(self.cell) * Default.EARTH_RADIUS_KM
+        half_circumference: float = math.pi * Default.EARTH_RADIUS_KM
+        while True:
+            positions, distances = self.circle(*point, km)
+            if len(positions) >= count or km >= half_circumference:
+                break
+            km *= 2
+        order: Integers = np.argsort(distances, kind='stable')[:count]
+        return self.matches(positions[order], distances[order])
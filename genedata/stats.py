@@ -0,0 +1,202 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.md
+"""Collect statistics about the lines of a GEDCOM file in one streaming pass.
+
+Each line is split once into its level, optional cross-reference identifier,
+tag and payload.  `GedStatistics` counts records, tags by level, payload
+sizes, extension tags and cross-reference identifiers block by block so a
+file of any size is read once without being held in memory.
+"""
+
+__all__ = ['GedStatistics', 'GedSummary']
+
+import re
+from collections import Counter
+from collections.abc import Iterable
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, ClassVar, NamedTuple
+
+from genedata.constants import Default
+
+
+class GedSummary(NamedTuple):
+    """The statistics of a GEDCOM file.
+
+    Args:
+        lines: The number of non-empty lines.
+        records: The number of level 0 lines of each record type.
+        tags: The number of lines with each tag at each level.
+        max_depth: The deepest level of any line.
+        payload_sizes: The number of payloads whose length in characters falls in
+            each range, such as '0', '1', '2-3' or '4-7'.
+        extensions: The number of lines with each extension tag.
+        xrefs: The number of cross-reference identifiers defined on level 0 lines.
+        pointers: The number of payloads pointing to a record.
+        void_pointers: The number of payloads pointing to `@VOID@`.
+        malformed: The number of lines without a numeric level and a tag.
+    """
+
+    lines: int
+    records: dict[str, int]
+    tags: dict[int, dict[str, int]]
+    max_depth: int
+    payload_sizes: dict[str, int]
+    extensions: dict[str, int]
+    xrefs: int
+    pointers: int
+    void_pointers: int
+    malformed: int
+
+
+class GedStatistics:
+    """Count the records, tags and payloads of GEDCOM lines as they are read.
+
+    The text is taken in blocks of whole lines.  One regular expression splits
+    every line of a block into its level, tag and payload and the counters are
+    updated from the matches at once rather than line by line.
+
+    Examples:
+        >>> from genedata.stats import GedStatistics
+        >>> ged = '0 HEAD\\n1 GEDC\\n2 VERS 7.0\\n0 @I1@ INDI\\n1 _UID 12\\n1 FAMC @VOID@\\n0 TRLR'
+        >>> summary = GedStatistics().text(ged).summary()
+        >>> summary.records['INDI'], summary.max_depth, summary.extensions
+        (1, 2, {'_UID': 1})
+        >>> summary.payload_sizes
+        {'0': 4, '2-3': 2, '4-7': 1}
+
+    Args:
+        record_types: The tags of the record types to count.
+    """
+
+    line: ClassVar[re.Pattern[str]] = re.compile(
+        r'\n *(\d+) (?:@[^@\n ]+@ )?([^ \n]+) ?([^\n]*)'
+    )
+    nonempty: ClassVar[re.Pattern[str]] = re.compile(r'\n[^\n]')
+    xref: ClassVar[str] = f'{Default.EOL}0 {Default.ATSIGN}'
+    block: ClassVar[int] = 1 << 22
+
+    def __init__(
+        self, record_types: Iterable[str] = Default.RECORD_TYPES
+    ) -> None:
+        self.record_types: list[str] = list(record_types)
+        self.line_count: int = 0
+        self.tags: Counter[tuple[str, str]] = Counter()
+        self.sizes: Counter[int] = Counter()
+        self.xrefs: int = 0
+        self.pointers: int = 0
+        self.void_pointers: int = 0
+        self.malformed: int = 0
+
+    def chunk(self, text: str) -> 'GedStatistics':
+        """Count the lines of a block of text that ends at the end of a line.
+
+        Args:
+            text: One or more whole lines.
+        """
+        if '\r' in text:
+            text = text.replace(Default.EOL_CARRIAGE_RETURN, Default.EOL)
+        text = ''.join([Default.EOL, text.lstrip('\ufeff')])
+        matches: list[tuple[str, str, str]] = self.line.findall(text)
+        lines: int = len(self.nonempty.findall(text))
+        self.line_count += lines
+        self.malformed += lines - len(matches)
+        self.xrefs += text.count(self.xref)
+        self.tags.update(map(itemgetter(0, 1), matches))
+        payloads: list[str] = list(map(itemgetter(2), matches))
+        self.sizes.update(map(int.bit_length, map(len, payloads)))
+        pointers: list[str] = [
+            payload
+            for payload in payloads
+            if payload[:1] == Default.ATSIGN
+            and payload[-1:] == Default.ATSIGN
+            and len(payload) > 2
+            and payload[1] != Default.ATSIGN
+        ]
+        self.void_pointers += pointers.count(Default.VOID_POINTER)
+        self.pointers += len(pointers) - pointers.count(Default.VOID_POINTER)
+        return self
+
+    def text(self, ged: str) -> 'GedStatistics':
+        """Count the lines of a GEDCOM string in blocks of whole lines."""
+        start: int = 0
+        while start < len(ged):
+            end: int = ged.find(Default.EOL, start + self.block)
+            end = len(ged) if end < 0 else end + 1
+            self.chunk(ged[start:end])
+            start = end
+        return self
+
+    def lines(self, lines: Iterable[str]) -> 'GedStatistics':
+        """Count each line of an iterable of lines with or without their line endings."""
+        batch: list[str] = []
+        for line in lines:
+            batch.append(line.rstrip(Default.EOL_CARRIAGE_RETURN))
+            if len(batch) >= self.block >> 6:
+                self.chunk(Default.EOL.join(batch))
+                batch = []
+        if batch:
+            self.chunk(Default.EOL.join(batch))
+        return self
+
+    def file(self, name: str) -> 'GedStatistics':
+        """Count the lines of a GEDCOM file reading one block at a time."""
+        rest: str = Default.EMPTY
+        with Path(name).open(encoding='utf-8-sig') as ged:
+            while block := ged.read(self.block):
+                head, _, tail = ''.join([rest, block]).rpartition(Default.EOL)
+                self.chunk(head)
+                rest = tail
+        if rest:
+            self.chunk(rest)
+        return self
+
+    @staticmethod
+    def size_range(bits: int) -> str:
+        """Return the range of lengths whose bit length is `bits`, such as '4-7' for 3."""
+        if bits <= 1:
+            return str(bits)
+        return f'{1 << (bits - 1)}-{(1 << bits) - 1}'
+
+    def summary(self) -> GedSummary:
+        """Return the statistics of the lines counted so far."""
+        levels: dict[int, dict[str, int]] = {}
+        extensions: Counter[str] = Counter()
+        for (level, tag), count in sorted(
+            self.tags.items(), key=lambda item: (int(item[0][0]), item[0][1])
+        ):
+            levels.setdefault(int(level), {})[tag] = count
+            if tag[:1] == Default.UNDERLINE:
+                extensions[tag] += count
+        records: dict[str, int] = levels.get(0, {})
+        return GedSummary(
+            lines=self.line_count,
+            records={tag: records.get(tag, 0) for tag in self.record_types},
+            tags=levels,
+            max_depth=max(levels, default=0),
+            payload_sizes={
+                self.size_range(bits): count
+                for bits, count in sorted(self.sizes.items())
+            },
+            extensions=dict(sorted(extensions.items())),
+            xrefs=self.xrefs,
+            pointers=self.pointers,
+            void_pointers=self.void_pointers,
+            malformed=self.malformed,
+        )
+
+    @staticmethod
+    def spec_record_types(specification: dict[str, dict[str, Any]]) -> list[str]:
+        """Return the sorted tags of the record structures in a specification.
+
+        Args:
+            specification: The specification dictionary including any extensions.
+        """
+        return sorted(
+            {
+                str(definition[Default.YAML_STANDARD_TAG])
+                for key, definition in specification[
+                    Default.YAML_TYPE_STRUCTURE
+                ].items()
+                if key.startswith(Default.RECORD_KEY_PREFIX)
+            }
+        )
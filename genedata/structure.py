@@ -15,12 +15,19 @@ __all__ = [
 ]
 
 import collections
-import logging
+from collections.abc import Callable
 from typing import Any, Literal, NamedTuple, Self
 
-from genedata.constants import Default
+from genedata.constants import Default, PayloadType
 from genedata.messages import Msg
-from genedata.methods import Names, Tagger, Validate
+from genedata.methods import (
+    DateInterval,
+    Dates,
+    Names,
+    Payload,
+    Tagger,
+    Validate,
+)
 from genedata.specifications70 import Specs
 
 AnyList = Any | list[Any] | None
@@ -30,6 +37,10 @@ StrList = str | list[str] | None
 SubsType = Any | list[Any] | None
 YNull = Literal['Y'] | None
 
+DATE_PAYLOADS: frozenset[int] = frozenset(
+    [PayloadType.DATE, PayloadType.DATE_EXACT, PayloadType.DATE_PERIOD]
+)
+
 
 class Xref:
     """Assign an extension cross-reference type to a string.
@@ -310,11 +321,17 @@ ExtType = Any | list[Any] | None
 class BaseStructure:
     """The base class for structures with only substructures and extensions.
 
+    The identifier of the payload is a class attribute set by the generator
+    so it is resolved once per class rather than once per structure.  A
+    structure with a payload but no identifier resolves its payload uri.
+
     Args:
         value: The value associated with the tag.
         subs: One or more substructures permitted by the structure.
     """
 
+    payload_id: int = PayloadType.NONE
+
     def __init__(
         self,
         value: str | int | Xref | None = None,
@@ -336,8 +353,10 @@ class BaseStructure:
         # Process value argument
         self.value: str | int | Xref | None = value
         self.payload: str = payload
+        if payload and self.payload_id == PayloadType.NONE:
+            self.payload_id = Payload.resolve(payload)
         if isinstance(self.value, str):
-            self.value = Validate.clean_value(self.value, self.payload)
+            self.value = Payload.clean(self.value, self.payload_id)
         self.code_value: str = Default.EMPTY
         if isinstance(self.value, str):
             self.code_value = Names.quote_text(self.value)
@@ -390,35 +409,108 @@ class BaseStructure:
         # Identify which cross reference identifier opened the record.
         self.originator: Xref = Void.XREF
 
+        # The date value and its interval once `interval` has computed it.
+        self.date_interval: tuple[str, DateInterval | None] | None = None
+
     def validate(self, specs: dict[str, dict[str, Any]] = Specs) -> bool:
-        """Validate the stored value."""
+        """Validate the stored value and those of all substructures.
 
-        # Does it have all required substructures?
-        for name in self.required:
-            if name not in self.counted:
-                raise ValueError(
-                    Msg.MISSING_REQUIRED.format(self.required, self.class_name)
+        The structure itself is validated by `_validate`.  Generated classes
+        replace the generic `_validate` with one specialised from their
+        specification.
+        """
+        self._validate(specs)
+
+        # Check if all subs validate.
+        if self.subs is not None:
+            if isinstance(self.subs, list):
+                for sub in self.subs:
+                    sub.validate(specs=specs)
+            else:
+                self.subs.validate(specs=specs)
+        return True
+
+    def _validate(self, specs: dict[str, dict[str, Any]]) -> None:
+        """Validate this structure, but not its substructures, from its attributes.
+
+        This generic validation is used by extensions.
+
+        Args:
+            specs: The specification dictionary.
+        """
+        self._validate_substructures(
+            frozenset(self.required),
+            frozenset(self.single),
+            frozenset(self.permitted),
+        )
+        self._validate_payload(specs)
+
+        # Do records have the correct class?
+        match self.key:
+            case 'record-FAM':
+                self._validate_xref(FamilyXref, Msg.NOT_FAMILY_XREF, str)
+            case 'record-INDI':
+                self._validate_xref(
+                    IndividualXref, Msg.NOT_INDIVIDUAL_XREF, str
                 )
+            case 'record-OBJE':
+                self._validate_xref(
+                    MultimediaXref, Msg.NOT_MULTIMEDIA_XREF, str
+                )
+            case 'record-REPO':
+                self._validate_xref(
+                    RepositoryXref, Msg.NOT_REPOSITORY_XREF, str
+                )
+            case 'record-SOUR':
+                self._validate_xref(SourceXref, Msg.NOT_SOURCE_XREF, str)
+            case 'record-SUBM':
+                self._validate_xref(SubmitterXref, Msg.NOT_SUBMITTER_XREF, str)
+
+        # Is value formatted correctly for its structure specification?
+        match self.class_name:
+            case 'Lati':
+                Validate.lati(self.value, self.class_name)
+            case 'Long':
+                Validate.long(self.value, self.class_name)
+            case 'Tag':
+                Validate.tag(self.value, self.class_name)
+
+    def _validate_substructures(
+        self,
+        required: frozenset[str],
+        single: frozenset[str],
+        permitted: frozenset[str],
+    ) -> None:
+        """Validate the substructures against the class names that are required, singular or permitted.
+
+        Args:
+            required: The class names of the required substructures.
+            single: The class names of substructures that may appear only once.
+            permitted: The class names of the permitted substructures.
+        """
+
+        # Does it have all required substructures?
+        if not required.issubset(self.counted):
+            raise ValueError(
+                Msg.MISSING_REQUIRED.format(self.required, self.class_name)
+            )
 
         # Does a single substructure appear only once?
-        for name in self.single:
-            if name in self.counted and self.counted[name] > 1:
+        for name, count in self.counted.items():
+            if count > 1 and name in single:
                 raise ValueError(
                     Msg.ONLY_ONE_PERMITTED.format(name, self.class_name)
                 )
 
         # Are there substructures not in the permitted list of substructures?
-        for name in self.counted:
-            if (
-                name != 'Ext'
-                and self.permitted != []
-                and name not in self.permitted
-            ):
-                raise ValueError(
-                    Msg.NOT_PERMITTED.format(
-                        name, self.permitted, self.class_name
+        if len(permitted) > 0:
+            for name in self.counted:
+                if name != 'Ext' and name not in permitted:
+                    raise ValueError(
+                        Msg.NOT_PERMITTED.format(
+                            name, self.permitted, self.class_name
+                        )
                     )
-                )
 
         # Are there extension substructures that do not have this class as a superstructure?
         if self.subs is not None and isinstance(self.subs, list):
@@ -439,270 +531,79 @@ class BaseStructure:
                 Msg.NOT_SUPERSTRUCTURE.format(self.class_name, self.subs.tag)
             )
 
-        # Does the value have the required data type?
-        match self.payload:
-            # Verify the value is a string.
-            case 'http://www.w3.org/2001/XMLSchema#string':
-                # A shared note has its text incorporated in the SharedNoteXref,
-                # so just verify that the value is a SharedNoteXref.
-                if self.key == 'record-SNOTE':
-                    if not isinstance(self.value, SharedNoteXref):
-                        raise ValueError(
-                            Msg.NOT_SHARED_NOTE_XREF.format(
-                                repr(self.value), self.class_name
-                            )
-                        )
-
-                # If the value is not an instance of SharedNoteXref, check that it is a string.
-                else:
-                    Validate.string(self.value, self.class_name)
-
-            # Verify that the value is either `Y` or `''`, but not ``.
-            case 'Y|<NULL>':
-                Validate.y_or_null(self.value, self.class_name)
-
-            # Verify that the value is a non-negative integer.
-            case 'http://www.w3.org/2001/XMLSchema#nonNegativeInteger':
-                Validate.non_negative_integer(self.value, self.class_name)
-
-            # Verify a value is in the enumeration set.
-            # Do this also for a list of enumberation values.
-            case (
-                'https://gedcom.io/terms/v7/type-Enum'
-                | 'https://gedcom.io/terms/v7/type-List#Enum'
-            ):
-                Validate.enum(
-                    self.value,
-                    self.class_name,
-                    self.enum_tags,
-                    self.enumset_key,
-                    specs,
-                )
-
-            # Verify that the value is an instance of IndividualXref.
-            case '@<https://gedcom.io/terms/v7/record-INDI>@':
-                if not isinstance(self.value, IndividualXref):
-                    raise ValueError(
-                        Msg.NOT_INDIVIDUAL_XREF.format(
-                            str(self.value), self.class_name
-                        )
-                    )
-
-            # Verify that the value is an instance of FamilyXref.
-            case '@<https://gedcom.io/terms/v7/record-FAM>@':
-                if not isinstance(self.value, FamilyXref):
-                    raise ValueError(
-                        Msg.NOT_FAMILY_XREF.format(
-                            str(self.value), self.class_name
-                        )
-                    )
-
-            # Verify the value is a listing with items separated by `, `.
-            case 'https://gedcom.io/terms/v7/type-List#Text':
-                Validate.listing(self.value, self.class_name)
-
-            # Verify that the value is an instance of SubmitterXref.
-            case '@<https://gedcom.io/terms/v7/record-SUBM>@':
-                if not isinstance(self.value, SubmitterXref):
-                    raise ValueError(
-                        Msg.NOT_SUBMITTER_XREF.format(
-                            str(self.value), self.class_name
-                        )
-                    )
-
-            # Verify the value meets the language specification.
-            case 'http://www.w3.org/2001/XMLSchema#Language':
-                Validate.language(self.value, self.class_name)
-
-            # Verify the value meets the date period specifications
-            case 'https://gedcom.io/terms/v7/type-Date#period':
-                Validate.date_period(self.value, self.class_name, specs)
-
-            # Verify the value meets the date exact specifications.
-            case 'https://gedcom.io/terms/v7/type-Date#exact':
-                Validate.date_exact(self.value, self.class_name)
-
-            # Verify the value meets the general date specifications.
-            case 'https://gedcom.io/terms/v7/type-Date':
-                Validate.date(self.value, self.class_name, specs)
-
-            # Verify the value meets the file path specifications.
-            case 'https://gedcom.io/terms/v7/type-FilePath':
-                Validate.filepath(self.value, self.class_name)
-
-            # Verify the value meets the personal name specifications.
-            case 'https://gedcom.io/terms/v7/type-Name':
-                Validate.name(self.value, self.class_name)
-
-            # Verify that the value meets the age specifications.
-            case 'https://gedcom.io/terms/v7/type-Age':
-                Validate.age(self.value, self.class_name)
-
-            # Verify the media type meets the specifications.
-            case 'http://www.w3.org/ns/dcat#mediaType':
-                Validate.mediatype(self.value, self.class_name)
-
-            # Verify that the value is an instance of MultimediaXref.
-            case '@<https://gedcom.io/terms/v7/record-OBJE>@':
-                if not isinstance(self.value, MultimediaXref):
-                    raise ValueError(
-                        Msg.NOT_MULTIMEDIA_XREF.format(
-                            repr(self.value), self.class_name
-                        )
-                    )
-
-            # Verify that the value is an instance of RepositoryXref.
-            case '@<https://gedcom.io/terms/v7/record-REPO>@':
-                if not isinstance(self.value, RepositoryXref):
-                    raise ValueError(
-                        Msg.NOT_REPOSITORY_XREF.format(
-                            repr(self.value), self.class_name
-                        )
-                    )
-
-            # Verify that the value is an instance of SharedNoteXref.
-            case '@<https://gedcom.io/terms/v7/record-SNOTE>@':
-                if not isinstance(self.value, SharedNoteXref):
-                    raise ValueError(
-                        Msg.NOT_SHARED_NOTE_XREF.format(
-                            repr(self.value), self.class_name
-                        )
-                    )
-
-            # Verify that the value is an instance of SourceXref.
-            case '@<https://gedcom.io/terms/v7/record-SOUR>@':
-                if not isinstance(self.value, SourceXref):
-                    raise ValueError(
-                        Msg.NOT_SOURCE_XREF.format(
-                            repr(self.value), self.class_name
-                        )
-                    )
-
-            # Verify that the data type meets the time specifications.
-            case 'https://gedcom.io/terms/v7/type-Time':
-                Validate.time(self.value, self.class_name)
-
-        # Do records have the correct class?
-        match self.key:
-            case 'record-FAM':
-                if not isinstance(self.value, FamilyXref):
-                    raise ValueError(
-                        Msg.NOT_FAMILY_XREF.format(
-                            str(self.value), self.class_name
-                        )
-                    )
-            case 'record-INDI':
-                if not isinstance(self.value, IndividualXref):
-                    raise ValueError(
-                        Msg.NOT_INDIVIDUAL_XREF.format(
-                            str(self.value), self.class_name
-                        )
-                    )
-            case 'record-OBJE':
-                if not isinstance(self.value, MultimediaXref):
-                    raise ValueError(
-                        Msg.NOT_MULTIMEDIA_XREF.format(
-                            str(self.value), self.class_name
-                        )
-                    )
-            case 'record-REPO':
-                if not isinstance(self.value, RepositoryXref):
-                    raise ValueError(
-                        Msg.NOT_REPOSITORY_XREF.format(
-                            str(self.value), self.class_name
-                        )
-                    )
-            # case 'record-SNOTE':
-            #     if not isinstance(self.value, SharedNoteXref):
-            #         raise ValueError(
-            #             Msg.NOT_SHARED_NOTE_XREF.format(
-            #                 str(self.value), self.class_name
-            #             )
-            #         )
-            case 'record-SOUR':
-                if not isinstance(self.value, SourceXref):
-                    raise ValueError(
-                        Msg.NOT_SOURCE_XREF.format(
-                            str(self.value), self.class_name
-                        )
-                    )
-            case 'record-SUBM':
-                if not isinstance(self.value, SubmitterXref):
-                    raise ValueError(
-                        Msg.NOT_SUBMITTER_XREF.format(
-                            str(self.value), self.class_name
-                        )
-                    )
-
-        # Is value formatted correctly for its structure specification?
-        match self.class_name:
-            case 'Lati':
-                logging.info('entered lati')
-                if isinstance(self.value, str) and self.value[0] not in [
-                    Default.LATI_NORTH,
-                    Default.LATI_SOUTH,
-                ]:
-                    raise ValueError(
-                        Msg.LATI_NORTH_SOUTH.format(
-                            self.value[0],
-                            self.value,
-                            Default.LATI_NORTH,
-                            Default.LATI_SOUTH,
-                            self.class_name,
-                        )
-                    )
-                if isinstance(self.value, str) and (
-                    float(self.value[1:]) > Default.LATI_HIGH
-                    or float(self.value[1:]) < Default.LATI_LOW
-                ):
-                    raise ValueError(
-                        Msg.LATI_RANGE.format(
-                            self.value,
-                            Default.LATI_LOW,
-                            Default.LATI_HIGH,
-                            self.class_name,
-                        )
-                    )
-            case 'Long':
-                if isinstance(self.value, str) and self.value[0] not in [
-                    Default.LONG_EAST,
-                    Default.LONG_WEST,
-                ]:
-                    raise ValueError(
-                        Msg.LONG_EAST_WEST.format(
-                            self.value[0],
-                            self.value,
-                            Default.LONG_EAST,
-                            Default.LONG_WEST,
-                            self.class_name,
-                        )
-                    )
-                if isinstance(self.value, str) and (
-                    float(self.value[1:]) > Default.LONG_HIGH
-                    or float(self.value[1:]) < Default.LONG_LOW
-                ):
-                    raise ValueError(
-                        Msg.LONG_RANGE.format(
-                            self.value,
-                            Default.LONG_LOW,
-                            Default.LONG_HIGH,
-                            self.class_name,
-                        )
-                    )
-            case 'Tag':
-                if isinstance(self.value, str):
-                    spaces: int = self.value.count(Default.SPACE)
-                    if spaces != 1:
-                        raise ValueError(Msg.TAG_SPACES.format(self.value))
-
-        # Check if all subs validate.
-        if self.subs is not None:
-            if isinstance(self.subs, list):
-                for sub in self.subs:
-                    sub.validate(specs=specs)
-            else:
-                self.subs.validate(specs=specs)
-        return True
+    def _validate_xref(
+        self,
+        xref_type: type[Xref],
+        message: str,
+        show: Callable[[Any], str] = repr,
+    ) -> None:
+        """Validate that the value is a cross reference identifier of the required type.
+
+        Args:
+            xref_type: The type of cross reference identifier required.
+            message: The message to report if the value is not of that type.
+            show: The function displaying the value in the message.
+        """
+        if not isinstance(self.value, xref_type):
+            raise ValueError(message.format(show(self.value), self.class_name))
+
+    def _validate_payload(self, specs: dict[str, dict[str, Any]]) -> None:
+        """Validate that the value has the data type required by the payload.
+
+        The validator is looked up by the payload identifier in `Payload.validators`.
+
+        Args:
+            specs: The specification dictionary.
+        """
+        validator = Payload.validators.get(self.payload_id)
+        if validator is not None:
+            validator(self, specs)
+
+    def interval(
+        self, specs: dict[str, dict[str, Any]] = Specs
+    ) -> DateInterval | None:
+        """Return the interval of Julian day numbers covered by a date payload.
+
+        The interval is computed once for the value and kept on the structure.
+        Structures whose payload is not a date have no interval.
+
+        Example:
+            >>> import genedata.classes70 as gc
+            >>> gc.Date('ABT 12 MAR 1850').interval()
+            DateInterval(earliest=2396829, latest=2396829, qualifier='ABT', calendar='GREGORIAN')
+
+        Args:
+            specs: The specification dictionary.
+        """
+        if self.payload_id not in DATE_PAYLOADS or not isinstance(self.value, str):
+            return None
+        if self.date_interval is None or self.date_interval[0] != self.value:
+            self.date_interval = (self.value, Dates.interval(self.value, specs))
+        return self.date_interval[1]
+
+    def intervals(
+        self, specs: dict[str, dict[str, Any]] = Specs
+    ) -> list[tuple[str, DateInterval]]:
+        """Return the class name and interval of this structure and its substructures with dates.
+
+        Example:
+            >>> import genedata.classes70 as gc
+            >>> gc.Birt('', gc.Date('1900')).intervals()
+            [('Date', DateInterval(earliest=2415021, latest=2415385, qualifier='', calendar='GREGORIAN'))]
+
+        Args:
+            specs: The specification dictionary.
+        """
+        found: list[tuple[str, DateInterval]] = []
+        interval: DateInterval | None = self.interval(specs)
+        if interval is not None:
+            found.append((self.class_name, interval))
+        if isinstance(self.subs, list):
+            for sub in self.subs:
+                found.extend(sub.intervals(specs))
+        elif self.subs is not None:
+            found.extend(self.subs.intervals(specs))
+        return found
 
     def ged(
         self,
@@ -892,6 +793,83 @@ class BaseStructure:
         )
 
 
+# The validators of the standard payload types.
+Payload.validators.update(
+    {
+        # A shared note has its text incorporated in the SharedNoteXref,
+        # so just verify that the value is a SharedNoteXref.
+        PayloadType.STRING: lambda node, specs: (
+            node._validate_xref(SharedNoteXref, Msg.NOT_SHARED_NOTE_XREF)
+            if node.key == 'record-SNOTE'
+            else Validate.string(node.value, node.class_name)
+        ),
+        PayloadType.Y_OR_NULL: lambda node, specs: Validate.y_or_null(
+            node.value, node.class_name
+        ),
+        PayloadType.NON_NEGATIVE_INTEGER: lambda node, specs: (
+            Validate.non_negative_integer(node.value, node.class_name)
+        ),
+        PayloadType.ENUM: lambda node, specs: Validate.enum(
+            node.value, node.class_name, node.enum_tags, node.enumset_key, specs
+        ),
+        PayloadType.LIST_ENUM: lambda node, specs: Validate.enum(
+            node.value, node.class_name, node.enum_tags, node.enumset_key, specs
+        ),
+        PayloadType.INDIVIDUAL_XREF: lambda node, specs: node._validate_xref(
+            IndividualXref, Msg.NOT_INDIVIDUAL_XREF, str
+        ),
+        PayloadType.FAMILY_XREF: lambda node, specs: node._validate_xref(
+            FamilyXref, Msg.NOT_FAMILY_XREF, str
+        ),
+        PayloadType.LIST_TEXT: lambda node, specs: Validate.listing(
+            node.value, node.class_name
+        ),
+        PayloadType.SUBMITTER_XREF: lambda node, specs: node._validate_xref(
+            SubmitterXref, Msg.NOT_SUBMITTER_XREF, str
+        ),
+        PayloadType.LANGUAGE: lambda node, specs: Validate.language(
+            node.value, node.class_name
+        ),
+        PayloadType.DATE_PERIOD: lambda node, specs: Validate.date_period(
+            node.value, node.class_name, specs
+        ),
+        PayloadType.DATE_EXACT: lambda node, specs: Validate.date_exact(
+            node.value, node.class_name
+        ),
+        PayloadType.DATE: lambda node, specs: Validate.date(
+            node.value, node.class_name, specs
+        ),
+        PayloadType.FILE_PATH: lambda node, specs: Validate.filepath(
+            node.value, node.class_name
+        ),
+        PayloadType.NAME: lambda node, specs: Validate.name(
+            node.value, node.class_name
+        ),
+        PayloadType.AGE: lambda node, specs: Validate.age(
+            node.value, node.class_name
+        ),
+        PayloadType.MEDIA_TYPE: lambda node, specs: Validate.mediatype(
+            node.value, node.class_name
+        ),
+        PayloadType.MULTIMEDIA_XREF: lambda node, specs: node._validate_xref(
+            MultimediaXref, Msg.NOT_MULTIMEDIA_XREF
+        ),
+        PayloadType.REPOSITORY_XREF: lambda node, specs: node._validate_xref(
+            RepositoryXref, Msg.NOT_REPOSITORY_XREF
+        ),
+        PayloadType.SHARED_NOTE_XREF: lambda node, specs: node._validate_xref(
+            SharedNoteXref, Msg.NOT_SHARED_NOTE_XREF
+        ),
+        PayloadType.SOURCE_XREF: lambda node, specs: node._validate_xref(
+            SourceXref, Msg.NOT_SOURCE_XREF
+        ),
+        PayloadType.TIME: lambda node, specs: Validate.time(
+            node.value, node.class_name
+        ),
+    }
+)
+
+
 class ExtensionAttributes(NamedTuple):
     id: int = 0
     key: str = Default.EMPTY
@@ -908,6 +886,7 @@ class ExtensionAttributes(NamedTuple):
     permitted: list[str] | None = None
     enumset_key: str = Default.EMPTY
     enum_tags: list[str] | None = None
+    payload_id: int = PayloadType.NONE
 
 
 class Ext(BaseStructure):
@@ -919,6 +898,7 @@ class Ext(BaseStructure):
         value: str | int | Xref,
         subs: SubsType,
     ):
+        self.payload_id = attributes.payload_id
         super().__init__(
             value=value,
             subs=subs,
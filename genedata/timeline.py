@@ -0,0 +1,304 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.md
+"""Index the dated events of a genealogy for timeline queries.
+
+Every event or attribute of an individual or family record with a dated
+payload, such as BIRT, DEAT, MARR or RESI, becomes an interval of Julian day
+numbers.  Other dated substructures such as CHAN, CREA and NO are skipped.
+Each individual with a birth or death also gets a LIFE interval from birth to
+death so questions like who was alive in 1850 need no scan of the records.
+
+`TimelineIndex` keeps the intervals sorted by their start in an implicit
+interval tree: the sorted arrays are the in-order traversal of a complete
+binary tree whose nodes carry the largest and smallest end in their subtree.
+A query visits O(log n) nodes and reports whole subtrees as slices, so it
+takes O(log n + k) for k results.
+"""
+
+__all__ = ['TimelineEvent', 'TimelineIndex']
+
+from typing import Any, ClassVar, NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+
+from genedata.constants import Default
+from genedata.methods import Dates, DateInterval
+from genedata.specifications70 import Specs
+
+Integers = npt.NDArray[np.int64]
+
+
+class TimelineEvent(NamedTuple):
+    """An event found by a timeline query.
+
+    Args:
+        xref: The identifier of the individual or family.
+        kind: The tag of the event such as 'BIRT' or 'LIFE'.
+        earliest: The first Julian day number the event may cover.
+        latest: The last Julian day number the event may cover.
+    """
+
+    xref: str
+    kind: str
+    earliest: int
+    latest: int
+
+
+class TimelineIndex:
+    """Find the events overlapping a day or a range of days.
+
+    Open ends of dates, as in `BEF 1900` or `FROM 1900`, reach to the start
+    or end of time.  A LIFE interval without a known birth starts
+    `Default.LIFESPAN_DAYS` before the death and one without a known death
+    ends that many days after the birth.
+
+    Examples:
+        >>> import genedata.classes70 as gc
+        >>> from genedata.timeline import TimelineIndex
+        >>> index = TimelineIndex()
+        >>> index.add(gc.RecordIndi(gc.IndividualXref('I1'), gc.Birt('', gc.Date('1820'))))
+        >>> [event.kind for event in index.overlapping('1850')]
+        ['LIFE']
+        >>> index.overlapping('1800')
+        []
+    """
+
+    LIFE: ClassVar[str] = 'LIFE'
+    events: ClassVar[frozenset[str]] = Default.EVENT_TAGS
+    births: ClassVar[frozenset[str]] = frozenset(['BIRT', 'CHR', 'BAPM'])
+    deaths: ClassVar[frozenset[str]] = frozenset(['DEAT', 'BURI', 'CREM'])
+    records: ClassVar[frozenset[str]] = frozenset(['record-INDI', 'record-FAM'])
+    first_day: ClassVar[int] = int(np.iinfo(np.int64).min)
+    last_day: ClassVar[int] = int(np.iinfo(np.int64).max)
+    leaf_level: ClassVar[int] = 6
+
+    def __init__(self, specs: dict[str, dict[str, Any]] = Specs) -> None:
+        self.specs: dict[str, dict[str, Any]] = specs
+        self.record_ids: dict[str, int] = {}
+        self.record_xrefs: list[str] = []
+        self.kind_ids: dict[str, int] = {}
+        self.kind_names: list[str] = []
+        self.rows: list[tuple[int, int, int, int]] = []
+        self.changed: bool = False
+        self.size: int = 0
+        self.levels: int = 0
+        self.starts: Integers = np.zeros(0, dtype=np.int64)
+        self.ends: Integers = np.zeros(0, dtype=np.int64)
+        self.record_column: Integers = np.zeros(0, dtype=np.int64)
+        self.kind_column: Integers = np.zeros(0, dtype=np.int64)
+        self.max_ends: list[int] = []
+        self.min_ends: list[int] = []
+        self.start_list: list[int] = []
+        self.end_list: list[int] = []
+
+    @staticmethod
+    def subs(structure: Any) -> list[Any]:
+        """Return the substructures of a structure as a list."""
+        if structure.subs is None:
+            return []
+        if isinstance(structure.subs, list):
+            return structure.subs
+        return [structure.subs]
+
+    def kind(self, name: str) -> int:
+        """Return the id of an event tag assigning the next id if it is new."""
+        if name not in self.kind_ids:
+            self.kind_ids[name] = len(self.kind_names)
+            self.kind_names.append(name)
+        return self.kind_ids[name]
+
+    def bounds(self, day: int | str) -> tuple[int, int]:
+        """Return the first and last Julian day numbers of a day or a date.
+
+        Args:
+            day: A Julian day number or a GEDCOM date such as '1850' or 'BEF 1900'.
+        """
+        if isinstance(day, int):
+            return day, day
+        interval: DateInterval | None = Dates.interval(day, self.specs)
+        if interval is None:
+            return self.last_day, self.first_day
+        return (
+            self.first_day if interval.earliest is None else interval.earliest,
+            self.last_day if interval.latest is None else interval.latest,
+        )
+
+    def add(self, record: Any) -> None:
+        """Add the dated events and attributes of an individual or family record.
+
+        Other records, other substructures and events without a date in a
+        standard calendar are ignored.
+
+        Args:
+            record: A staged record.
+        """
+        if record.key not in self.records:
+            return
+        xref: str = str(record.value)
+        if xref not in self.record_ids:
+            self.record_ids[xref] = len(self.record_xrefs)
+            self.record_xrefs.append(xref)
+        identifier: int = self.record_ids[xref]
+        born: list[int] = []
+        died: list[int] = []
+        for event in self.subs(record):
+            if event.tag not in self.events:
+                continue
+            for sub in self.subs(event):
+                interval: DateInterval | None = sub.interval(self.specs)
+                if interval is None or (
+                    interval.earliest is None and interval.latest is None
+                ):
+                    continue
+                start: int = (
+                    self.first_day if interval.earliest is None else interval.earliest
+                )
+                end: int = self.last_day if interval.latest is None else interval.latest
+                self.rows.append((start, end, identifier, self.kind(event.tag)))
+                if event.tag in self.births:
+                    born.append(start if interval.earliest is not None else end)
+                elif event.tag in self.deaths:
+                    died.append(end if interval.latest is not None else start)
+                break
+        if born or died:
+            start = min(born) if born else max(died) - Default.LIFESPAN_DAYS
+            end = max(died) if died else min(born) + Default.LIFESPAN_DAYS
+            if start <= end:
+                self.rows.append((start, end, identifier, self.kind(self.LIFE)))
+        self.changed = True
+
+    def build(self, records: list[Any]) -> None:
+        """Add the dated events of every record in a list.
+
+        Args:
+            records: The staged records.
+        """
+        for record in records:
+            self.add(record)
+
+    def compact(self) -> None:
+        """Sort the intervals by start and compute the subtree bounds of the tree."""
+        table: Integers = np.array(self.rows, dtype=np.int64).reshape(-1, 4)
+        order: Integers = np.lexsort((table[:, 1], table[:, 0]))
+        table = table[order]
+        self.size = len(table)
+        self.levels = max(self.size - 1, 0).bit_length()
+        padded: int = (1 << (self.levels + 1)) - 1
+        self.starts = table[:, 0]
+        self.ends = table[:, 1]
+        self.record_column = table[:, 2]
+        self.kind_column = table[:, 3]
+
+        # Pad to a complete tree with empty intervals that start after every query.
+        starts: Integers = np.full(padded, self.last_day, dtype=np.int64)
+        max_ends: Integers = np.full(padded, self.first_day, dtype=np.int64)
+        min_ends: Integers = np.full(padded, self.last_day, dtype=np.int64)
+        starts[: self.size] = self.starts
+        max_ends[: self.size] = self.ends
+        min_ends[: self.size] = self.ends
+        for level in range(1, self.levels + 1):
+            nodes: Integers = np.arange((1 << level) - 1, padded, 1 << (level + 1))
+            step: int = 1 << (level - 1)
+            max_ends[nodes] = np.maximum(
+                max_ends[nodes],
+                np.maximum(max_ends[nodes - step], max_ends[nodes + step]),
+            )
+            min_ends[nodes] = np.minimum(
+                min_ends[nodes],
+                np.minimum(min_ends[nodes - step], min_ends[nodes + step]),
+            )
+        self.start_list = starts.tolist()
+        self.end_list = self.ends.tolist()
+        self.max_ends = max_ends.tolist()
+        self.min_ends = min_ends.tolist()
+        self.changed = False
+
+    def search(self, first: int, last: int) -> Integers:
+        """Return the positions in start order of the intervals overlapping a range.
+
+        Args:
+            first: The first Julian day number of the range.
+            last: The last Julian day number of the range.
+        """
+        if self.changed:
+            self.compact()
+        if self.size == 0 or first > last:
+            return np.zeros(0, dtype=np.int64)
+        starts: list[int] = self.start_list
+        slices: list[Integers] = []
+        stack: list[tuple[int, int]] = [((1 << self.levels) - 1, self.levels)]
+        while stack:
+            node, level = stack.pop()
+            low: int = node - (1 << level) + 1
+            if self.max_ends[node] < first or starts[low] > last:
+                continue
+            high: int = node + (1 << level) - 1
+            high = min(high, self.size - 1)
+            if starts[high] <= last and self.min_ends[node] >= first:
+                slices.append(np.arange(low, high + 1))
+                continue
+            if level <= self.leaf_level:
+                # Filter small subtrees at once rather than node by node.
+                slices.append(
+                    low
+                    + np.flatnonzero(
+                        (self.starts[low : high + 1] <= last)
+                        & (self.ends[low : high + 1] >= first)
+                    )
+                )
+                continue
+            if node < self.size and starts[node] <= last and self.end_list[node] >= first:
+                slices.append(np.array([node], dtype=np.int64))
+            if level > 0:
+                step: int = 1 << (level - 1)
+                stack.append((node + step, level - 1))
+                stack.append((node - step, level - 1))
+        if not slices:
+            return np.zeros(0, dtype=np.int64)
+        return np.sort(np.concatenate(slices))
+
+    def overlapping(
+        self,
+        first: int | str,
+        last: int | str | None = None,
+        kinds: list[str] | None = None,
+    ) -> list[TimelineEvent]:
+        """Return the events overlapping a day or range of days in order of their start.
+
+        Args:
+            first: The first day as a Julian day number or a GEDCOM date.
+            last: The last day, which defaults to the end of `first`.
+            kinds: The event tags to keep such as ['MARR'] or all if None.
+        """
+        if self.changed:
+            self.compact()
+        start, end = self.bounds(first)
+        if last is not None:
+            end = self.bounds(last)[1]
+        positions: Integers = self.search(start, end)
+        if kinds is not None:
+            wanted: list[int] = [
+                self.kind_ids[kind] for kind in kinds if kind in self.kind_ids
+            ]
+            positions = positions[np.isin(self.kind_column[positions], wanted)]
+        return [
+            TimelineEvent(
+                self.record_xrefs[record], self.kind_names[kind], earliest, latest
+            )
+            for record, kind, earliest, latest in zip(
+                self.record_column[positions].tolist(),
+                self.kind_column[positions].tolist(),
+                self.starts[positions].tolist(),
+                self.ends[positions].tolist(),
+                strict=True,
+            )
+        ]
+
+    def alive(self, first: int | str, last: int | str | None = None) -> list[str]:
+        """Return the individuals whose lives overlap a day or range of days.
+
+        Args:
+            first: The first day as a Julian day number or a GEDCOM date.
+            last: The last day, which defaults to the end of `first`.
+        """
+        return [event.xref for event in self.overlapping(first, last, [self.LIFE])]
@@ -0,0 +1,76 @@
+# calendar_benchmark.py
+"""Compare the throughput of calendar conversion and validation with cached tables.
+
+`Tables.build` constructs the lookup tables of a calendar.  `Tables.get`
+returns them from the cache.  `Methods.to_day_numbers` and
+`Methods.from_day_numbers` convert arrays of dates with the cached tables
+and `CalendarDefinition.validate` checks a single date against them.
+`CalendarDefinition.validate_many` checks arrays of dates at once.
+
+Run this from the root of the repository:
+    python -m tests.benchmarks.calendar_benchmark
+"""
+
+import time
+
+import numpy as np
+
+from calendars.calendars import CalendarDefinition, Tables
+from calendars.french_revolution_calendars import CalendarsFrenchRevolution
+from calendars.gregorian_calendars import CalendarsGregorian
+from calendars.julian_calendars import CalendarsJulian
+from calendars.methods import Methods
+
+CALENDARS: list[CalendarDefinition] = [
+    CalendarsGregorian.GREGORIAN,
+    CalendarsJulian.JULIAN,
+    CalendarsFrenchRevolution.FRENCH_R,
+]
+
+
+def run(count: int = 1000000) -> dict[str, float]:
+    """Return the tables built or dates handled per second for each calendar.
+
+    Args:
+        count: The number of day numbers to convert for each calendar.
+    """
+    day_numbers: np.ndarray = np.arange(2375840, 2375840 + count, dtype=np.int64)
+    rates: dict[str, float] = {}
+    for calendar in CALENDARS:
+        start: float = time.perf_counter()
+        for _ in range(1000):
+            Tables.build(calendar)
+        rates[f'{calendar.name} build'] = 1000 / (time.perf_counter() - start)
+        start = time.perf_counter()
+        for _ in range(1000):
+            Tables.get(calendar)
+        rates[f'{calendar.name} cached'] = 1000 / (time.perf_counter() - start)
+        start = time.perf_counter()
+        dates = Methods.from_day_numbers(day_numbers, calendar)
+        rates[f'{calendar.name} from'] = count / (time.perf_counter() - start)
+        start = time.perf_counter()
+        Methods.to_day_numbers(dates.years, dates.months, dates.days, calendar)
+        rates[f'{calendar.name} to'] = count / (time.perf_counter() - start)
+        sample: int = min(count, 100000)
+        start = time.perf_counter()
+        for year, month, day in zip(
+            dates.years[:sample].tolist(),
+            dates.months[:sample].tolist(),
+            dates.days[:sample].tolist(),
+            strict=True,
+        ):
+            calendar.validate(year, month, day)
+        rates[f'{calendar.name} validate'] = sample / (
+            time.perf_counter() - start
+        )
+        start = time.perf_counter()
+        calendar.validate_many(dates.years, dates.months, dates.days)
+        rates[f'{calendar.name} validate many'] = count / (
+            time.perf_counter() - start
+        )
+    return rates
+
+
+if __name__ == '__main__':
+    for name, rate in run().items():
+        print(f'{name:>32}: {rate:,.0f} per second')  # noqa: T201
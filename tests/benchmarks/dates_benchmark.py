@@ -0,0 +1,66 @@
+# dates_benchmark.py
+"""Compare the throughput of validating dates one at a time and in bulk.
+
+`Validate.date` and `Validate.date_exact` check a single string.
+`Validate.dates_bulk` checks a whole array of strings with NumPy.
+
+Run this from the root of the repository:
+    python -m tests.benchmarks.dates_benchmark
+"""
+
+import time
+
+from genedata.methods import Validate
+from genedata.specifications70 import Specs
+
+MONTHS: list[str] = ['JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN']
+
+
+def dates(count: int) -> list[str]:
+    """Construct `count` distinct exact dates some of which are invalid."""
+    values: list[str] = []
+    year: int = 1000
+    while len(values) < count:
+        values.extend(
+            [f'{day} {month} {year}' for month in MONTHS for day in (1, 29, 31)]
+        )
+        year += 1
+    return values[:count]
+
+
+def run(count: int = 100000) -> dict[str, float]:
+    """Return the dates validated per second singly and in bulk.
+
+    Args:
+        count: The number of dates to validate of each kind.
+    """
+    exact: list[str] = dates(count)
+    general: list[str] = [f'ABT {value}' for value in exact]
+    rates: dict[str, float] = {}
+    start: float = time.perf_counter()
+    for value in exact:
+        try:
+            Validate.date_exact(value, 'DateExact')
+        except ValueError:
+            pass
+    rates['exact'] = count / (time.perf_counter() - start)
+    start = time.perf_counter()
+    Validate.dates_bulk(exact, kind='exact')
+    rates['exact bulk'] = count / (time.perf_counter() - start)
+    Validate.date_matches.cache_clear()
+    start = time.perf_counter()
+    for value in general:
+        try:
+            Validate.date(value, 'Date', Specs)
+        except ValueError:
+            pass
+    rates['general'] = count / (time.perf_counter() - start)
+    start = time.perf_counter()
+    Validate.dates_bulk(general, kind='general')
+    rates['general bulk'] = count / (time.perf_counter() - start)
+    return rates
+
+
+if __name__ == '__main__':
+    for name, rate in run().items():
+        print(f'{name:>12}: {rate:,.0f} dates/second')  # noqa: T201
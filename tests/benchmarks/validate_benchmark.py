@@ -0,0 +1,88 @@
+# validate_benchmark.py
+"""Compare the throughput of generic and generated structure validation.
+
+The generic validation in `BaseStructure._validate` interprets the lists
+of required, singular and permitted substructures and matches the payload
+on every node.  The generated classes replace it with a `_validate` method
+specialised from their specification.
+
+Run this from the root of the repository:
+    python -m tests.benchmarks.validate_benchmark
+"""
+
+import time
+from typing import Any
+
+import genedata.classes70 as gc
+from genedata.build import Genealogy
+from genedata.specifications70 import Specs
+from genedata.structure import BaseStructure
+
+
+def nodes(count: int) -> list[Any]:
+    """Construct a list of every node in `count` individual records."""
+    g = Genealogy()
+    structures: list[Any] = []
+    for number in range(count):
+        indi = g.individual_xref(f'I{number}')
+        record = gc.RecordIndi(
+            indi,
+            [
+                gc.IndiName(
+                    f'John /Smith{number}/',
+                    [gc.Givn('John'), gc.Surn(f'Smith{number}')],
+                ),
+                gc.Sex('M'),
+                gc.Birt(
+                    'Y',
+                    [
+                        gc.Date('12 MAR 1850'),
+                        gc.Plac(
+                            'Paris, France',
+                            [
+                                gc.Map(
+                                    [gc.Lati('N48.8566'), gc.Long('E2.3522')]
+                                )
+                            ],
+                        ),
+                    ],
+                ),
+                gc.Deat('Y', [gc.Date('ABT 1910')]),
+            ],
+        )
+        stack: list[Any] = [record]
+        while stack:
+            node = stack.pop()
+            structures.append(node)
+            if isinstance(node.subs, list):
+                stack.extend(node.subs)
+            elif node.subs is not None:
+                stack.append(node.subs)
+    return structures
+
+
+def run(count: int = 2000, repeat: int = 5) -> dict[str, float]:
+    """Return the nodes validated per second by the generic and generated methods.
+
+    Args:
+        count: The number of individual records to construct.
+        repeat: The number of times each node is validated.
+    """
+    structures: list[Any] = nodes(count)
+    start: float = time.perf_counter()
+    for _ in range(repeat):
+        for node in structures:
+            BaseStructure._validate(node, Specs)
+    generic: float = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for node in structures:
+            node._validate(Specs)
+    generated: float = time.perf_counter() - start
+    total: int = len(structures) * repeat
+    return {'generic': total / generic, 'generated': total / generated}
+
+
+if __name__ == '__main__':
+    for name, rate in run().items():
+        print(f'{name:>10}: {rate:,.0f} nodes/second')  # noqa: T201
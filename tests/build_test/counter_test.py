@@ -90,3 +90,30 @@ def test_reused_identifier() -> None:
         ValueError, match=Msg.XREF_EXISTS.format('@JOE@', ' joe ')
     ):
         a._counter(a.individual_xreflist, ' joe ')
+
+
+def test_bulk_identifiers_match_single() -> None:
+    """Test that bulk identifiers are those created one at a time."""
+    a = Genealogy()
+    b = Genealogy()
+    names = ['', 'adam', '', 'eve', '']
+    assert [str(xref) for xref in a.individual_xrefs(names)] == [
+        str(b.individual_xref(name)) for name in names
+    ]
+    assert a.individual_xreflist == b.individual_xreflist
+    assert a.xref_counter == b.xref_counter
+
+
+def test_bulk_identifiers_are_all_or_nothing() -> None:
+    """Test that no bulk identifier is created if one already exists."""
+    a = Genealogy()
+    a.family_xref('smith')
+    with pytest.raises(
+        ValueError, match=Msg.XREF_EXISTS.format('@SMITH@', 'smith')
+    ):
+        a.family_xrefs(['', 'jones', 'smith'])
+    with pytest.raises(ValueError, match=Msg.XREF_EXISTS.format(Void.NAME, 'void')):
+        a.individual_xrefs(['void'])
+    assert a.family_xreflist == [Void.NAME, '@SMITH@']
+    assert a.xref_counter == 1
+    assert [str(xref) for xref in a.family_xrefs(['', 'jones'])] == ['@1@', '@JONES@']
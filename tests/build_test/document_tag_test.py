@@ -318,3 +318,43 @@ def test_void_xref_record() -> None:
     g = Genealogy('tests/data/ged_examples/extension-record-void.ged')
     g.ged_to_code()
     assert len(g.ged_ext_tags) > 0
+
+
+def test_document_tags_batch() -> None:
+    g = Genealogy()
+    tags = g.document_tags(
+        [
+            ('_MYGREGORIAN', 'tests/data/extension_tests/calendars/cal-_MYGREGORIAN.yaml'),
+            ('_MYJAN', 'tests/data/extension_tests/months/month-_MYJAN.yaml'),
+        ]
+    )
+    assert [tag.id for tag in tags] == [1, 2]
+    assert 'month-_MYJAN' in g.specification[Default.YAML_TYPE_MONTH]
+
+
+def test_document_tags_duplicate_in_batch() -> None:
+    g = Genealogy()
+    with pytest.raises(
+        ValueError,
+        match=re.escape(
+            Msg.YAML_FILE_HAS_BEEN_USED.format(
+                'tests/data/extension_tests/months/month-_MYJAN.yaml'
+            )
+        ),
+    ):
+        g.document_tags(
+            [
+                ('_MYJAN', 'tests/data/extension_tests/months/month-_MYJAN.yaml'),
+                ('_YOURJAN', 'tests/data/extension_tests/months/month-_MYJAN.yaml'),
+            ]
+        )
+
+
+def test_document_tags_cache_not_shared() -> None:
+    g = Genealogy()
+    h = Genealogy()
+    g.document_tag('_MYJAN', 'tests/data/extension_tests/months/month-_MYJAN.yaml')
+    h.document_tag('_MYJAN', 'tests/data/extension_tests/months/month-_MYJAN.yaml')
+    assert g.ged_ext_tags[0][14] == h.ged_ext_tags[0][14]
+    g.ged_ext_tags[0][14]['changed'] = True
+    assert 'changed' not in h.ged_ext_tags[0][14]
@@ -0,0 +1,162 @@
+# duplicates_test.py
+"""Test the detection of duplicate individuals.
+
+1. Check that blocking keeps every close pair a full comparison would score.
+
+2. Check scoring, clustering and scoring in a process pool.
+
+3. Check that records staged after the index is built are scored against their blocks.
+"""
+
+import itertools
+import random
+
+import genedata.classes70 as gc
+from genedata.build import Genealogy
+from genedata.constants import Default
+from genedata.duplicates import DuplicateIndex
+
+
+def person(
+    xref: str, name: str, birth: str = '', place: str = '', sex: str = ''
+) -> gc.RecordIndi:
+    subs: list[object] = [gc.IndiName(name)]
+    if sex:
+        subs.append(gc.Sex(sex))
+    if birth or place:
+        event: list[object] = []
+        if birth:
+            event.append(gc.Date(birth))
+        if place:
+            event.append(gc.Plac(place))
+        subs.append(gc.Birt('', event))
+    return gc.RecordIndi(gc.IndividualXref(xref), subs)
+
+
+# 1. Check that blocking keeps every close pair a full comparison would score.
+def test_blocking_keeps_close_pairs() -> None:
+    generator = random.Random(0)
+    given = ['John', 'Jon', 'Mary', 'Marie', 'William', 'Will']
+    surnames = ['Smith', 'Smyth', 'Jones', 'Johns', 'Brown', 'Braun']
+    index = DuplicateIndex()
+    for number in range(300):
+        index.add(
+            person(
+                f'@I{number}@',
+                f'{generator.choice(given)} /{generator.choice(surnames)}/',
+                str(generator.randint(1840, 1870)),
+            )
+        )
+    found = {(pair.first, pair.second) for pair in index.pairs()}
+    for first, second in itertools.combinations(range(300), 2):
+        one = index.profile(first)
+        two = index.profile(second)
+        assert one is not None and two is not None and one.birth and two.birth
+        close = (
+            abs(sum(one.birth) - sum(two.birth)) // 2
+            <= Default.DUPLICATE_WINDOW_DAYS // 2
+            and index.person_blocks[first][0][0] == index.person_blocks[second][0][0]
+        )
+        if close and DuplicateIndex.score(one, two) >= Default.DUPLICATE_THRESHOLD:
+            assert (f'@I{first}@', f'@I{second}@') in found
+    assert len(found) < 300 * 299 // 2
+
+
+# 2. Check scoring, clustering and scoring in a process pool.
+def test_scores() -> None:
+    index = DuplicateIndex()
+    index.build(
+        [
+            person('@I1@', 'John /Smith/', '1850', 'Boston, Massachusetts'),
+            person('@I2@', 'J /Smith/', 'ABT 1850', 'Boston'),
+            person('@I3@', 'John /Smith/', '1850', 'Boston', 'F'),
+            person('@I4@', 'John /Smith/', '1850', 'Boston', 'M'),
+        ]
+    )
+    scores = {(pair.first, pair.second): pair.score for pair in index.pairs(0)}
+    assert scores[('@I1@', '@I4@')] > scores[('@I1@', '@I2@')]
+    assert ('@I3@', '@I4@') not in scores
+    assert index.clusters() == [
+        index.clusters()[0]._replace(xrefs=['@I1@', '@I2@', '@I3@', '@I4@'])
+    ]
+    assert index.clusters()[0].confidence == min(
+        scores[('@I1@', '@I2@')], scores[('@I1@', '@I3@')]
+    )
+
+
+def test_clusters_are_separate() -> None:
+    index = DuplicateIndex()
+    index.build(
+        [
+            person('@A1@', 'Ann /Brown/', '1801'),
+            person('@A2@', 'Anne /Braun/', '1801'),
+            person('@B1@', 'Bob /Brown/', '1830'),
+            person('@B2@', 'Robert /Brown/', '1830'),
+            person('@B3@', 'Bob /Brown/', '1830'),
+        ]
+    )
+    assert [cluster.xrefs for cluster in index.clusters()] == [
+        ['@B1@', '@B3@'],
+        ['@A1@', '@A2@'],
+    ]
+    assert [cluster.xrefs for cluster in index.clusters(0.6)] == [
+        ['@A1@', '@A2@'],
+        ['@B1@', '@B2@', '@B3@'],
+    ]
+
+
+def test_process_pool_matches_serial() -> None:
+    records = [
+        person(f'@I{number}@', f'John{number % 7} /Smith/', '1850')
+        for number in range(100)
+    ]
+    serial = DuplicateIndex()
+    serial.build(records)
+    pooled = DuplicateIndex()
+    pooled.build(records)
+    assert len(records) * 99 // 2 > Default.DUPLICATE_CHUNK_PAIRS
+    assert pooled.pairs(0.6, workers=2) == serial.pairs(0.6, workers=1)
+
+
+# 3. Check that records staged after the index is built are scored against their blocks.
+def test_incremental_staging() -> None:
+    g = Genealogy()
+    jim = g.individual_xref('jim')
+    g.stage(person(str(jim), 'Jim /Smith/', '1850', 'Salem'))
+    assert g.duplicate_clusters() == []
+    jimmy = g.individual_xref('jimmy')
+    g.stage(person(str(jimmy), 'Jimmy /Smyth/', '1851', 'Salem'))
+    g.stage(person(str(g.individual_xref('ann')), 'Ann /Jones/', '1851', 'Salem'))
+    assert [cluster.xrefs for cluster in g.duplicate_clusters()] == [
+        ['@JIM@', '@JIMMY@']
+    ]
+    before = g.duplicates().pairs(0)[0].score
+    father = g.individual_xref('father')
+    g.stage(person(str(father), 'Tom /Smith/', '1820'))
+    g.stage(
+        gc.RecordFam(
+            g.family_xref('family'),
+            [gc.FamHusb(father), gc.Chil(jim), gc.Chil(jimmy)],
+        )
+    )
+    assert g.duplicates().pending == {0, 1, 3}
+    assert g.duplicates().pairs(0)[0].score > before
+
+
+def test_incremental_matches_batch() -> None:
+    records: list[object] = [
+        gc.RecordFam(gc.FamilyXref('@F1@'), gc.FamHusb(gc.IndividualXref('@P1@'))),
+        gc.RecordFam(gc.FamilyXref('@F2@'), gc.FamHusb(gc.IndividualXref('@P2@'))),
+    ]
+    for xref, family in [('@A@', '@F1@'), ('@B@', '@F2@')]:
+        child = person(xref, 'John /Smith/', '1850')
+        child.subs.append(gc.IndiFamc(gc.FamilyXref(family)))
+        records.append(child)
+    records.extend([person('@P1@', 'Tom /Smith/'), person('@P2@', 'Bob /Jones/')])
+    incremental = DuplicateIndex()
+    for record in records:
+        incremental.add(record)
+        incremental.pairs(0)
+    batch = DuplicateIndex()
+    batch.build(records)
+    assert incremental.pairs(0) == batch.pairs(0)
@@ -0,0 +1,143 @@
+# frames_test.py
+"""Test the export of staged records as DataFrames.
+
+1. Check the individual, name and member tables.
+
+2. Check the events table with dates, places and coordinates.
+
+3. Check the source and citation tables.
+"""
+
+import math
+
+import pandas as pd
+
+import genedata.classes70 as gc
+from genedata.build import Genealogy
+from genedata.methods import Input
+
+
+def rows(frame: pd.DataFrame) -> list[tuple[object, ...]]:
+    """Return the rows of a frame with missing values as None."""
+    return [
+        tuple(None if pd.isna(value) else value for value in row)
+        for row in frame.itertuples(index=False, name=None)
+    ]
+
+
+def genealogy() -> Genealogy:
+    g = Genealogy()
+    jim = g.individual_xref('jim')
+    ann = g.individual_xref('ann')
+    family = g.family_xref('family')
+    source = g.source_xref('census')
+    g.stage(
+        gc.RecordIndi(
+            jim,
+            [
+                gc.IndiName('Jim /Smith/', [gc.Givn('Jim'), gc.Surn('Smith')]),
+                gc.IndiName('Jimmy /Smith/', gc.NameType('AKA')),
+                gc.Sex('M'),
+                gc.Birt(
+                    '',
+                    [
+                        gc.Date('ABT 1840'),
+                        gc.Plac(
+                            'Boston',
+                            gc.Map([gc.Lati('N42.36'), gc.Long('W71.06')]),
+                        ),
+                        gc.Sour(source, gc.Page('p. 4')),
+                    ],
+                ),
+                gc.Fams(family),
+            ],
+        )
+    )
+    g.stage(
+        gc.RecordIndi(
+            ann, [gc.IndiFamc(family, gc.Pedi('ADOPTED')), gc.Deat('Y')]
+        )
+    )
+    g.stage(
+        gc.RecordFam(
+            family, [gc.FamHusb(jim), gc.Chil(ann), gc.Sour(source)]
+        )
+    )
+    g.stage(gc.RecordSour(source, [gc.Titl('Census'), gc.Auth('Bureau')]))
+    return g
+
+
+# 1. Check the individual, name and member tables.
+def test_individuals_and_names() -> None:
+    frames = genealogy().to_frames()
+    assert rows(frames['individuals']) == [
+        ('@JIM@', 'M', 'Jim Smith'),
+        ('@ANN@', None, None),
+    ]
+    assert rows(frames['names']) == [
+        ('@JIM@', 0, 'Jim Smith', None, 'Jim', 'Smith', None),
+        ('@JIM@', 1, 'Jimmy Smith', 'AKA', None, None, None),
+    ]
+
+
+def test_members() -> None:
+    members = genealogy().to_frames()['members']
+    assert rows(members) == [
+        ('@FAMILY@', '@JIM@', 'FAMS', None, '@JIM@'),
+        ('@FAMILY@', '@ANN@', 'FAMC', 'ADOPTED', '@ANN@'),
+        ('@FAMILY@', '@JIM@', 'HUSB', None, '@FAMILY@'),
+        ('@FAMILY@', '@ANN@', 'CHIL', None, '@FAMILY@'),
+    ]
+
+
+# 2. Check the events table with dates, places and coordinates.
+def test_events() -> None:
+    events = genealogy().to_frames()['events']
+    assert events['Event'].tolist() == ['BIRT', 'DEAT']
+    assert events['Value'].isna().tolist() == [True, False]
+    assert str(events['Earliest'].dtype) == 'Int64'
+    assert events['Earliest'].isna().tolist() == [False, True]
+    assert events['Qualifier'][0] == 'ABT'
+    assert events['Latitude'][0] == Input.degrees('N42.36')
+    assert events['Longitude'][0] == -71.06
+    assert math.isnan(events['Latitude'][1])
+
+
+def test_events_skip_timestamps_and_assertions() -> None:
+    g = Genealogy()
+    g.stage(
+        gc.RecordFam(
+            g.family_xref('family'),
+            [
+                gc.Marr('', gc.Date('1820')),
+                gc.No('DIV', gc.NoDate('FROM 1800 TO 1850')),
+                gc.Chan(gc.DateExact('27 MAR 2022')),
+                gc.Crea(gc.DateExact('27 MAR 2022')),
+            ],
+        )
+    )
+    assert g.to_frames()['events']['Event'].tolist() == ['MARR']
+
+
+def test_empty() -> None:
+    frames = Genealogy().to_frames()
+    assert sorted(frames) == [
+        'citations',
+        'events',
+        'families',
+        'individuals',
+        'members',
+        'names',
+        'sources',
+    ]
+    assert all(len(frame) == 0 for frame in frames.values())
+
+
+# 3. Check the source and citation tables.
+def test_sources_and_citations() -> None:
+    frames = genealogy().to_frames()
+    assert rows(frames['sources']) == [('@CENSUS@', 'Census', 'Bureau', None, None)]
+    assert rows(frames['citations']) == [
+        ('@JIM@', 'BIRT', '@CENSUS@', 'p. 4'),
+        ('@FAMILY@', 'FAM', '@CENSUS@', None),
+    ]
@@ -0,0 +1,309 @@
+# kinship_test.py
+"""Test the index of parents, children and spouses built from staged records.
+
+1. Check that links are taken from both individual and family records.
+
+2. Check that PEDI and STAT qualifiers are kept on the edges.
+
+3. Check that records staged after the index is built are added to it.
+
+4. Check ancestors, descendants and common ancestors.
+
+5. Check the names and paths of relationships.
+"""
+
+import genedata.classes70 as gc
+from genedata.build import Genealogy
+from genedata.constants import ChildStatus, Kinship, Pedigree
+
+
+def family_tree() -> tuple[Genealogy, dict[str, object]]:
+    g = Genealogy()
+    xrefs: dict[str, object] = {
+        name: g.individual_xref(name)
+        for name in ['father', 'mother', 'stepmother', 'son', 'daughter']
+    }
+    first = g.family_xref('first')
+    second = g.family_xref('second')
+    xrefs['first'] = first
+    xrefs['second'] = second
+    g.stage(
+        gc.RecordFam(
+            first,
+            [
+                gc.FamHusb(xrefs['father']),
+                gc.FamWife(xrefs['mother']),
+                gc.Chil(xrefs['son']),
+            ],
+        )
+    )
+    g.stage(gc.RecordFam(second, gc.FamHusb(xrefs['father'])))
+    g.stage(gc.RecordIndi(xrefs['stepmother'], gc.Fams(second)))
+    g.stage(
+        gc.RecordIndi(
+            xrefs['daughter'],
+            [
+                gc.IndiFamc(first),
+                gc.IndiFamc(
+                    second, [gc.Pedi('ADOPTED'), gc.FamcStat('PROVEN')]
+                ),
+            ],
+        )
+    )
+    return g, xrefs
+
+
+# 1. Check that links are taken from both individual and family records.
+def test_parents_from_both_sides() -> None:
+    g, xrefs = family_tree()
+    index = g.kinship()
+    assert index.parents(xrefs['son']) == ['@FATHER@', '@MOTHER@']
+    assert index.parents(xrefs['daughter']) == [
+        '@FATHER@',
+        '@MOTHER@',
+        '@STEPMOTHER@',
+    ]
+    assert index.children(xrefs['stepmother']) == ['@DAUGHTER@']
+    assert index.children(xrefs['father']) == ['@SON@', '@DAUGHTER@']
+
+
+def test_spouses() -> None:
+    g, xrefs = family_tree()
+    index = g.kinship()
+    assert index.spouses(xrefs['father']) == ['@MOTHER@', '@STEPMOTHER@']
+    assert index.spouses(xrefs['mother']) == ['@FATHER@']
+    assert index.spouses(xrefs['son']) == []
+
+
+def test_unknown_individual() -> None:
+    g, _ = family_tree()
+    assert g.kinship().parents('@NOBODY@') == []
+
+
+def test_empty_index() -> None:
+    g = Genealogy()
+    edges = g.kinship().edges(Kinship.CHILD)
+    assert edges.indptr.tolist() == [0]
+    assert len(edges.indices) == 0
+
+
+# 2. Check that PEDI and STAT qualifiers are kept on the edges.
+def test_qualifiers() -> None:
+    g, xrefs = family_tree()
+    index = g.kinship()
+    daughter = index.person(xrefs['daughter'])
+    edges = index.edges(Kinship.PARENT)
+    start, end = edges.indptr[daughter], edges.indptr[daughter + 1]
+    qualifiers = {
+        (
+            index.person_xrefs[person],
+            index.family_xrefs[family],
+            Pedigree(pedigree),
+            ChildStatus(status),
+        )
+        for person, family, pedigree, status in zip(
+            edges.indices[start:end].tolist(),
+            edges.families[start:end].tolist(),
+            edges.pedigrees[start:end].tolist(),
+            edges.statuses[start:end].tolist(),
+            strict=True,
+        )
+    }
+    assert qualifiers == {
+        ('@FATHER@', '@FIRST@', Pedigree.NONE, ChildStatus.NONE),
+        ('@MOTHER@', '@FIRST@', Pedigree.NONE, ChildStatus.NONE),
+        ('@FATHER@', '@SECOND@', Pedigree.ADOPTED, ChildStatus.PROVEN),
+        ('@STEPMOTHER@', '@SECOND@', Pedigree.ADOPTED, ChildStatus.PROVEN),
+    }
+
+
+# 3. Check that records staged after the index is built are added to it.
+def test_incremental_stage() -> None:
+    g, xrefs = family_tree()
+    index = g.kinship()
+    assert index.children(xrefs['son']) == []
+    grandchild = g.individual_xref('grandchild')
+    third = g.family_xref('third')
+    g.stage(gc.RecordFam(third, [gc.FamHusb(xrefs['son']), gc.Chil(grandchild)]))
+    assert g.kinship() is index
+    assert index.children(xrefs['son']) == ['@GRANDCHILD@']
+    assert index.parents(grandchild) == ['@SON@']
+
+
+# 4. Check ancestors, descendants and common ancestors.
+def collapsed_tree() -> tuple[Genealogy, dict[str, object]]:
+    """Build a pedigree where two first cousins have a child."""
+    g = Genealogy()
+    xrefs: dict[str, object] = {
+        name: g.individual_xref(name)
+        for name in ['grandfather', 'grandmother', 'uncle', 'aunt', 'cousin1', 'cousin2', 'child']
+    }
+    for parents, children in [
+        (['grandfather', 'grandmother'], ['uncle', 'aunt']),
+        (['uncle'], ['cousin1']),
+        (['aunt'], ['cousin2']),
+        (['cousin1', 'cousin2'], ['child']),
+    ]:
+        g.stage(
+            gc.RecordFam(
+                g.family_xref(),
+                [gc.FamHusb(xrefs[parent]) for parent in parents[:1]]
+                + [gc.FamWife(xrefs[parent]) for parent in parents[1:]]
+                + [gc.Chil(xrefs[child]) for child in children],
+            )
+        )
+    return g, xrefs
+
+
+def test_ancestors_pedigree_collapse() -> None:
+    g, xrefs = collapsed_tree()
+    assert g.ancestors(xrefs['child']) == {
+        '@COUSIN1@': 1,
+        '@COUSIN2@': 1,
+        '@UNCLE@': 2,
+        '@AUNT@': 2,
+        '@GRANDFATHER@': 3,
+        '@GRANDMOTHER@': 3,
+    }
+    assert g.ancestors(xrefs['child'], max_gen=2) == {
+        '@COUSIN1@': 1,
+        '@COUSIN2@': 1,
+        '@UNCLE@': 2,
+        '@AUNT@': 2,
+    }
+    assert g.ancestors(xrefs['grandfather']) == {}
+    assert g.ancestors('@NOBODY@') == {}
+
+
+def test_descendants() -> None:
+    g, xrefs = collapsed_tree()
+    assert g.descendants(xrefs['grandmother'], max_gen=2) == {
+        '@UNCLE@': 1,
+        '@AUNT@': 1,
+        '@COUSIN1@': 2,
+        '@COUSIN2@': 2,
+    }
+    assert g.descendants(xrefs['uncle']) == {'@COUSIN1@': 1, '@CHILD@': 2}
+
+
+def test_common_ancestors_memoized() -> None:
+    g, xrefs = collapsed_tree()
+    index = g.kinship()
+    assert g.common_ancestors(xrefs['cousin1'], xrefs['cousin2']) == [
+        '@GRANDFATHER@',
+        '@GRANDMOTHER@',
+    ]
+    assert len(index.ancestor_bits) == 2
+    assert g.common_ancestors(xrefs['uncle'], xrefs['cousin2'], memoize=False) == [
+        '@GRANDFATHER@',
+        '@GRANDMOTHER@',
+    ]
+    assert len(index.ancestor_bits) == 2
+
+
+def test_common_ancestors_after_stage() -> None:
+    g, xrefs = collapsed_tree()
+    assert g.common_ancestors(xrefs['uncle'], xrefs['cousin1']) == [
+        '@GRANDFATHER@',
+        '@GRANDMOTHER@',
+    ]
+    great = g.individual_xref('great')
+    g.stage(gc.RecordFam(g.family_xref(), [gc.FamHusb(great), gc.Chil(xrefs['grandfather'])]))
+    assert g.kinship().ancestor_bits == {}
+    assert g.common_ancestors(xrefs['uncle'], xrefs['cousin1']) == [
+        '@GRANDFATHER@',
+        '@GRANDMOTHER@',
+        '@GREAT@',
+    ]
+
+
+# 5. Check the names and paths of relationships.
+def test_relationship_siblings() -> None:
+    g, xrefs = family_tree()
+    relationships = g.relationships(xrefs['son'], xrefs['daughter'])
+    assert [(r.label, r.up, r.down) for r in relationships] == [('sibling', 1, 1)]
+    assert relationships[0].ancestors == ['@FATHER@', '@MOTHER@']
+    assert relationships[0].paths == [
+        ['@SON@', '@FATHER@', '@DAUGHTER@'],
+        ['@SON@', '@MOTHER@', '@DAUGHTER@'],
+    ]
+
+
+def test_relationship_half_siblings_by_blood() -> None:
+    g, xrefs = family_tree()
+    half = g.individual_xref('half')
+    third = g.family_xref('third')
+    g.stage(gc.RecordIndi(half, gc.IndiFamc(third)))
+    g.stage(gc.RecordFam(third, gc.FamWife(xrefs['mother'])))
+    assert g.relationships(xrefs['son'], half)[0].label == 'half-sibling'
+    step = g.relationships(xrefs['stepmother'], xrefs['daughter'])
+    assert [(r.label, r.ancestors) for r in step] == [('child', ['@STEPMOTHER@'])]
+    assert g.relationships(
+        xrefs['stepmother'], xrefs['daughter'], exclude=(Pedigree.ADOPTED,)
+    ) == []
+
+
+def test_relationship_siblings_with_one_recorded_parent() -> None:
+    g = Genealogy()
+    mother = g.individual_xref('mother')
+    first = g.individual_xref('first')
+    second = g.individual_xref('second')
+    family = g.family_xref('family')
+    g.stage(gc.RecordFam(family, [gc.FamWife(mother), gc.Chil(first), gc.Chil(second)]))
+    assert g.relationships(first, second)[0].label == 'sibling'
+    nephew = g.individual_xref('nephew')
+    g.stage(
+        gc.RecordFam(g.family_xref('next'), [gc.FamHusb(second), gc.Chil(nephew)])
+    )
+    assert g.relationships(first, nephew)[0].label == 'niece or nephew'
+    other = g.individual_xref('other')
+    g.stage(
+        gc.RecordFam(g.family_xref('second_marriage'), [gc.FamWife(mother), gc.Chil(other)])
+    )
+    assert g.relationships(first, other)[0].label == 'half-sibling'
+    assert g.relationships(nephew, other)[0].label == 'half-aunt or half-uncle'
+
+
+def test_relationship_cousins_removed() -> None:
+    g, xrefs = collapsed_tree()
+    assert g.relationships(xrefs['cousin1'], xrefs['cousin2'])[0].label == (
+        '1st cousin'
+    )
+    first = g.relationships(xrefs['uncle'], xrefs['cousin2'])[0]
+    assert (first.label, first.up, first.down) == ('niece or nephew', 1, 2)
+    second = g.relationships(xrefs['child'], xrefs['aunt'])[0]
+    assert second.label == 'grandparent'
+    assert g.relationships(xrefs['child'], xrefs['child'])[0].label == 'self'
+    assert g.relationships(xrefs['child'], '@NOBODY@') == []
+
+
+def test_relationship_pedigree_collapse() -> None:
+    g, xrefs = collapsed_tree()
+    relationship = g.relationships(xrefs['grandfather'], xrefs['child'])[0]
+    assert relationship.label == 'great-grandchild'
+    assert relationship.paths == [
+        ['@GRANDFATHER@', '@UNCLE@', '@COUSIN1@', '@CHILD@'],
+        ['@GRANDFATHER@', '@AUNT@', '@COUSIN2@', '@CHILD@'],
+    ]
+
+
+def test_relationship_adoption_by_one_parent() -> None:
+    g = Genealogy()
+    husband = g.individual_xref('husband')
+    wife = g.individual_xref('wife')
+    adopted = g.individual_xref('adopted')
+    family = g.family_xref('family')
+    g.stage(gc.RecordFam(family, [gc.FamHusb(husband), gc.FamWife(wife)]))
+    g.stage(
+        gc.RecordIndi(
+            adopted,
+            [
+                gc.IndiFamc(family, gc.Pedi('ADOPTED')),
+                gc.Adop('', gc.AdopFamc(family, gc.FamcAdop('HUSB'))),
+            ],
+        )
+    )
+    assert g.kinship().parents(adopted) == ['@HUSBAND@']
+    assert g.relationships(husband, adopted)[0].label == 'child'
+    assert g.relationships(wife, adopted) == []
+    assert g.relationships(husband, adopted, exclude=(Pedigree.ADOPTED,)) == []
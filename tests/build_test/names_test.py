@@ -0,0 +1,98 @@
+# names_test.py
+"""Test the search index of personal names.
+
+1. Check exact, prefix, phonetic and fuzzy matches and their ranking.
+
+2. Check that name parts and translations are indexed.
+
+3. Check that records staged after the index is built are added to it.
+"""
+
+import genedata.classes70 as gc
+from genedata.build import Genealogy
+from genedata.names import NameIndex
+
+
+def people() -> tuple[Genealogy, dict[str, object]]:
+    g = Genealogy()
+    xrefs: dict[str, object] = {
+        name: g.individual_xref(name)
+        for name in ['smith', 'smyth', 'smithson', 'jones', 'garcia']
+    }
+    g.stage(gc.RecordIndi(xrefs['smith'], gc.IndiName('John /Smith/')))
+    g.stage(gc.RecordIndi(xrefs['smyth'], gc.IndiName('Jane /Smyth/')))
+    g.stage(gc.RecordIndi(xrefs['smithson'], gc.IndiName('Mary /Smithson/')))
+    g.stage(
+        gc.RecordIndi(
+            xrefs['jones'],
+            gc.IndiName('Robert /Jones/', [gc.Givn('Robert'), gc.Nick('Bob')]),
+        )
+    )
+    g.stage(
+        gc.RecordIndi(
+            xrefs['garcia'],
+            gc.IndiName(
+                'José /García/',
+                gc.NameTran('Iosif /Garsia/', [gc.Lang('ru'), gc.Surn('Garsia')]),
+            ),
+        )
+    )
+    return g, xrefs
+
+
+# 1. Check exact, prefix, phonetic and fuzzy matches and their ranking.
+def test_exact_before_prefix() -> None:
+    g, _ = people()
+    assert [(m.xref, m.score) for m in g.search_names('smith')] == [
+        ('@SMITH@', 1.0),
+        ('@SMITHSON@', 0.8),
+        ('@SMYTH@', 0.6),
+    ]
+
+
+def test_phonetic_without_fuzzy() -> None:
+    g, _ = people()
+    assert [m.xref for m in g.search_names('smyth', fuzzy=False)] == [
+        '@SMYTH@',
+        '@SMITH@',
+    ]
+
+
+def test_fuzzy_misspelling() -> None:
+    g, _ = people()
+    assert g.search_names('msithson', fuzzy=False) == []
+    assert g.search_names('msithson')[0].xref == '@SMITHSON@'
+
+
+def test_words_add_up_and_limit() -> None:
+    g, _ = people()
+    matches = g.search_names('JOHN smith', limit=2)
+    assert [(m.xref, m.score) for m in matches] == [
+        ('@SMITH@', 2.0),
+        ('@SMYTH@', 1.2),
+    ]
+
+
+def test_soundex() -> None:
+    assert [
+        NameIndex.soundex(word)
+        for word in ['Ashcraft', 'Tymczak', 'Pfister', 'Lee', 'ß']
+    ] == ['A261', 'T522', 'P236', 'L000', '']
+
+
+# 2. Check that name parts and translations are indexed.
+def test_nickname_and_translation() -> None:
+    g, xrefs = people()
+    assert g.search_names('bob')[0].xref == '@JONES@'
+    assert g.search_names('garsia')[0].name == 'José García'
+    assert g.search_names('garcia jose')[0].score == 2.0
+
+
+# 3. Check that records staged after the index is built are added to it.
+def test_incremental_stage() -> None:
+    g, _ = people()
+    index = g.names()
+    assert g.search_names('smithers', fuzzy=False) == []
+    g.stage(gc.RecordIndi(g.individual_xref('new'), gc.IndiName('Waylon /Smithers/')))
+    assert g.names() is index
+    assert g.search_names('smithers', fuzzy=False)[0].xref == '@NEW@'
@@ -0,0 +1,177 @@
+# places_test.py
+"""Test the spatial index of mapped places.
+
+1. Check box and distance queries against a scan of every place.
+
+2. Check places taken from individual and family records.
+
+3. Check that records staged after the index is built are added to it.
+"""
+
+import math
+import random
+
+import pytest
+
+import genedata.classes70 as gc
+from genedata.build import Genealogy
+from genedata.constants import Default
+from genedata.methods import Input
+from genedata.places import PlaceIndex
+
+
+def haversine(latitude: float, longitude: float, other: tuple[float, float]) -> float:
+    first = math.radians(latitude)
+    second = math.radians(other[0])
+    half = (
+        math.sin((second - first) / 2) ** 2
+        + math.cos(first)
+        * math.cos(second)
+        * math.sin(math.radians(other[1] - longitude) / 2) ** 2
+    )
+    return 2 * Default.EARTH_RADIUS_KM * math.asin(math.sqrt(min(1.0, half)))
+
+
+def scattered(seed: int, count: int, cell: float = 1.0) -> PlaceIndex:
+    generator = random.Random(seed)
+    index = PlaceIndex(cell)
+    index.record_xrefs.append('@I1@')
+    for place in range(count):
+        point = (generator.uniform(-90, 90), generator.uniform(-180, 180))
+        index.place_names.append(str(place))
+        index.place_points.append(point)
+        index.event_rows.append((0, 'BIRT', place))
+    index.changed = True
+    return index
+
+
+# 1. Check box and distance queries against a scan of every place.
+@pytest.mark.parametrize(('count', 'cell'), [(0, 1.0), (1, 1.0), (400, 1.0), (400, 7.5)])
+def test_box_matches_scan(count: int, cell: float) -> None:
+    index = scattered(count, count, cell)
+    generator = random.Random(count + 1)
+    for _ in range(100):
+        south = generator.uniform(-90, 80)
+        north = south + generator.uniform(0, 40)
+        west = generator.uniform(-180, 180)
+        east = generator.uniform(-180, 180)
+        found = {match.place for match in index.box(south, west, north, east)}
+        assert found == {
+            str(place)
+            for place, (latitude, longitude) in enumerate(index.place_points)
+            if south <= latitude <= north
+            and (
+                west <= longitude <= east
+                if west <= east
+                else longitude >= west or longitude <= east
+            )
+        }
+
+
+@pytest.mark.parametrize(('count', 'cell'), [(0, 1.0), (1, 1.0), (400, 1.0), (400, 7.5)])
+def test_within_matches_scan(count: int, cell: float) -> None:
+    index = scattered(count, count, cell)
+    generator = random.Random(count + 2)
+    for _ in range(100):
+        latitude = generator.choice([generator.uniform(-90, 90), 89.5, -89.9])
+        longitude = generator.choice([generator.uniform(-180, 180), 179.9, -179.9])
+        km = generator.choice([10.0, 500.0, 3000.0, 25000.0])
+        found = index.within(latitude, longitude, km)
+        assert [match.km for match in found] == sorted(match.km for match in found)
+        assert {match.place for match in found} == {
+            str(place)
+            for place, point in enumerate(index.place_points)
+            if haversine(latitude, longitude, point) <= km
+        }
+
+
+@pytest.mark.parametrize('count', [1, 3, 50])
+def test_nearest_matches_scan(count: int) -> None:
+    index = scattered(count, 300)
+    generator = random.Random(count)
+    for _ in range(50):
+        latitude = generator.uniform(-90, 90)
+        longitude = generator.uniform(-180, 180)
+        expected = sorted(
+            haversine(latitude, longitude, point) for point in index.place_points
+        )[:count]
+        found = [match.km for match in index.nearest(latitude, longitude, count)]
+        assert found == pytest.approx(expected)
+
+
+def test_empty_index() -> None:
+    index = PlaceIndex()
+    assert index.box(-90, -180, 90, 180) == []
+    assert index.within(0, 0, 25000) == []
+    assert index.nearest(0, 0) == []
+
+
+def test_antimeridian_box_in_one_column() -> None:
+    index = PlaceIndex()
+    index.record_xrefs.append('@I1@')
+    index.place_names.append('East')
+    index.place_points.append((10.0, -139.1))
+    index.event_rows.append((0, 'BIRT', 0))
+    index.changed = True
+    assert [(match.xref, match.event) for match in index.box(0, -139.3, 20, -139.8)] == [
+        ('@I1@', 'BIRT')
+    ]
+
+
+def test_coordinates_as_payloads() -> None:
+    index = scattered(5, 50)
+    latitude, longitude = index.place_points[0]
+    payloads = (
+        f'{"N" if latitude >= 0 else "S"}{abs(latitude)}',
+        f'{"E" if longitude >= 0 else "W"}{abs(longitude)}',
+    )
+    assert Input.degrees(payloads[0]) == latitude
+    assert index.nearest(*payloads)[0].place == '0'
+
+
+# 2. Check places taken from individual and family records.
+def mapped(name: str, latitude: str, longitude: str) -> gc.Plac:
+    return gc.Plac(name, gc.Map([gc.Lati(latitude), gc.Long(longitude)]))
+
+
+def test_events_share_places() -> None:
+    g = Genealogy()
+    jim = g.individual_xref('jim')
+    jane = g.individual_xref('jane')
+    family = g.family_xref('family')
+    g.stage(
+        gc.RecordIndi(
+            jim,
+            [
+                gc.Birt('', mapped('Boston', 'N42.36', 'W71.06')),
+                gc.Deat('', gc.Plac('Nowhere')),
+            ],
+        )
+    )
+    g.stage(gc.RecordIndi(jane, gc.Birt('', mapped('Boston', 'N42.36', 'W71.06'))))
+    g.stage(gc.RecordFam(family, gc.Marr('', mapped('Salem', 'N42.52', 'W70.9'))))
+    assert g.places().place_names == ['Boston', 'Salem']
+    assert [(match.xref, match.event) for match in g.near(42.36, -71.06, 30)] == [
+        ('@JIM@', 'BIRT'),
+        ('@JANE@', 'BIRT'),
+        ('@FAMILY@', 'MARR'),
+    ]
+    assert [match.km for match in g.in_box(42, -72, 43, -71)] == [None, None]
+
+
+def test_nothing_mapped() -> None:
+    g = Genealogy()
+    g.stage(gc.RecordIndi(g.individual_xref('jim'), gc.Birt('', gc.Plac('Nowhere'))))
+    assert g.near(42.36, -71.06, 30) == []
+    assert g.nearest_places(42.36, -71.06) == []
+    assert g.in_box(42, -72, 43, -71) == []
+
+
+# 3. Check that records staged after the index is built are added to it.
+def test_incremental_staging() -> None:
+    g = Genealogy()
+    g.stage(gc.RecordIndi(g.individual_xref('jim'), gc.Birt('', mapped('Suva', 'S18.14', 'E178.44'))))
+    assert [match.place for match in g.nearest_places(-17, -179)] == ['Suva']
+    g.stage(gc.RecordIndi(g.individual_xref('jane'), gc.Birt('', mapped('Apia', 'S13.83', 'W171.76'))))
+    assert [match.place for match in g.nearest_places(-17, -179, 2)] == ['Suva', 'Apia']
+    assert [match.xref for match in g.in_box(-20, 170, -10, -170)] == ['@JIM@', '@JANE@']
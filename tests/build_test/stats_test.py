@@ -0,0 +1,92 @@
+# stats_test.py
+"""Test the single pass statistics of ged files.
+
+1. Check that record counts agree with a scan for each record type.
+
+2. Check tags by level, payload sizes, extensions and pointers.
+
+3. Check that files are read one line at a time.
+"""
+
+import re
+
+import pytest
+
+from genedata.build import Genealogy
+from genedata.constants import Default
+from genedata.methods import Query, Util
+from genedata.stats import GedStatistics
+
+maximal: str = 'tests/data/ged_examples/maximal70.ged'
+voidptr: str = 'tests/data/ged_examples/voidptr.ged'
+
+
+# 1. Check that record counts agree with a scan for each record type.
+@pytest.mark.parametrize('file', [maximal, voidptr])
+def test_record_counts_match_scan(file: str) -> None:
+    ged = Util.read_ged(file)
+    expected = {
+        record: len(re.findall(f'\n0 @[^@]+@ {record}[ \n]', ged))
+        for record in Default.RECORD_TYPES
+    }
+    assert Query.record_counts(ged) == {'Count': expected}
+
+
+def test_query_record_counts() -> None:
+    assert Genealogy(voidptr).query_record_counts()['Count']['INDI'] == 2
+
+
+def test_record_counts_extension_specification() -> None:
+    specification = {
+        'structure': {
+            'record-INDI': {'standard tag': 'INDI'},
+            'record-_LOC': {'standard tag': '_LOC'},
+            'NAME': {'standard tag': 'NAME'},
+        }
+    }
+    ged = '0 HEAD\n0 @L1@ _LOC\n0 @I1@ INDI\n0 @L2@ _LOC\n0 TRLR'
+    assert Query.record_counts(ged, specification, 'Records') == {
+        'Records': {'INDI': 1, '_LOC': 2}
+    }
+
+
+# 2. Check tags by level, payload sizes, extensions and pointers.
+def test_summary() -> None:
+    summary = GedStatistics().lines(Genealogy(voidptr).ged_file.splitlines()).summary()
+    assert summary.records['INDI'] == 2
+    assert summary.records['FAM'] == 1
+    assert summary.tags[1]['FAMS'] == 3
+    assert summary.tags[2] == {'NOTE': 1, 'PEDI': 1, 'VERS': 1}
+    assert summary.max_depth == 2
+    assert summary.xrefs == 3
+    assert summary.pointers == 4
+    assert summary.void_pointers == 3
+    assert summary.extensions == {}
+    assert sum(summary.payload_sizes.values()) == summary.lines
+
+
+def test_extensions_and_malformed() -> None:
+    ged = '0 HEAD\r\n1 _EXT one\r\n2 _EXT two\r\n\r\nnot a line\r\n1\r\n0 TRLR\r\n'
+    summary = GedStatistics().text(ged).summary()
+    assert summary.lines == 6
+    assert summary.malformed == 2
+    assert summary.extensions == {'_EXT': 2}
+    assert summary.tags == {0: {'HEAD': 1, 'TRLR': 1}, 1: {'_EXT': 1}, 2: {'_EXT': 1}}
+
+
+def test_size_ranges() -> None:
+    assert [GedStatistics.size_range(bits) for bits in range(5)] == [
+        '0',
+        '1',
+        '2-3',
+        '4-7',
+        '8-15',
+    ]
+
+
+# 3. Check that files are read one line at a time.
+def test_stats_from_file() -> None:
+    g = Genealogy()
+    assert g.stats().lines == 0
+    assert g.stats(maximal) == GedStatistics().text(Util.read_ged(maximal)).summary()
+    assert g.stats(maximal).records['SNOTE'] == 2
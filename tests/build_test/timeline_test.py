@@ -0,0 +1,138 @@
+# timeline_test.py
+"""Test the interval index of dated events.
+
+1. Check stabbing and range queries against a scan of every interval.
+
+2. Check events and lives taken from individual and family records.
+
+3. Check that records staged after the index is built are added to it.
+"""
+
+import random
+
+import pytest
+
+import genedata.classes70 as gc
+from genedata.build import Genealogy
+from genedata.methods import Dates
+from genedata.timeline import TimelineIndex
+
+
+# 1. Check stabbing and range queries against a scan of every interval.
+@pytest.mark.parametrize('count', [0, 1, 2, 7, 8, 9, 500])
+def test_search_matches_scan(count: int) -> None:
+    generator = random.Random(count)
+    index = TimelineIndex()
+    index.kind('BIRT')
+    for record in range(count):
+        start = generator.randint(0, 1000)
+        end = start + generator.choice([0, 1, 30, 400])
+        if generator.random() < 0.05:
+            end = index.last_day
+        if generator.random() < 0.05:
+            start = index.first_day
+        index.rows.append((start, end, record, 0))
+    index.changed = True
+    for _ in range(200):
+        first = generator.randint(-10, 1100)
+        last = first + generator.choice([0, 5, 200])
+        found = index.search(first, last).tolist()
+        assert found == sorted(found)
+        assert set(found) == {
+            position
+            for position in range(index.size)
+            if index.starts[position] <= last and index.ends[position] >= first
+        }
+
+
+def test_empty_range() -> None:
+    index = TimelineIndex()
+    index.rows.append((10, 20, 0, 0))
+    index.changed = True
+    assert index.search(20, 10).tolist() == []
+
+
+# 2. Check events and lives taken from individual and family records.
+def people() -> Genealogy:
+    g = Genealogy()
+    g.stage(
+        gc.RecordIndi(
+            g.individual_xref('old'),
+            [gc.Birt('', gc.Date('1790')), gc.Deat('', gc.Date('BEF 1851'))],
+        )
+    )
+    g.stage(
+        gc.RecordIndi(
+            g.individual_xref('young'),
+            [gc.Chr('', gc.Date('ABT 1840')), gc.IndiResi('Boston', gc.Date('FROM 1860'))],
+        )
+    )
+    g.stage(gc.RecordIndi(g.individual_xref('undated'), gc.Birt('')))
+    g.stage(gc.RecordFam(g.family_xref('family'), gc.Marr('', gc.Date('1865'))))
+    return g
+
+
+def test_alive() -> None:
+    g = people()
+    assert g.alive('1850') == ['@OLD@', '@YOUNG@']
+    assert g.alive('1852') == ['@YOUNG@']
+    assert g.alive('1700', '1789') == []
+    assert g.alive(Dates.jdn(1790, 1, 1)) == ['@OLD@']
+
+
+def test_death_before_birth() -> None:
+    g = Genealogy()
+    g.stage(
+        gc.RecordIndi(
+            g.individual_xref('wrong'),
+            [gc.Birt('', gc.Date('1900')), gc.Deat('', gc.Date('1800'))],
+        )
+    )
+    assert [event.kind for event in g.events('1800', '1900')] == ['DEAT', 'BIRT']
+    assert TimelineIndex.LIFE not in g.timeline().kind_ids
+
+
+def test_open_ended_events() -> None:
+    g = people()
+    assert [(event.xref, event.kind) for event in g.events('1900')] == [
+        ('@YOUNG@', 'LIFE'),
+        ('@YOUNG@', 'RESI'),
+    ]
+    assert [(event.xref, event.kind) for event in g.events('2000')] == [
+        ('@YOUNG@', 'RESI'),
+    ]
+    assert [event.kind for event in g.events('1000', '1800', ['DEAT'])] == ['DEAT']
+
+
+def test_kinds_in_decade() -> None:
+    g = people()
+    assert [event.xref for event in g.events('1860', '1869', ['MARR'])] == [
+        '@FAMILY@'
+    ]
+    assert g.events('1860', '1869', ['BURI']) == []
+
+
+def test_skips_other_dated_substructures() -> None:
+    g = Genealogy()
+    g.stage(
+        gc.RecordFam(
+            g.family_xref('family'),
+            [
+                gc.No('MARR', gc.NoDate('FROM 1800 TO 1850')),
+                gc.Chan(gc.DateExact('27 MAR 2022')),
+                gc.Crea(gc.DateExact('27 MAR 2022')),
+            ],
+        )
+    )
+    assert g.events('1820') == []
+    assert g.events('2022') == []
+
+
+# 3. Check that records staged after the index is built are added to it.
+def test_incremental_stage() -> None:
+    g = people()
+    index = g.timeline()
+    assert g.alive('1970') == []
+    g.stage(gc.RecordIndi(g.individual_xref('new'), gc.Birt('', gc.Date('1969'))))
+    assert g.timeline() is index
+    assert g.alive('1970') == ['@NEW@']
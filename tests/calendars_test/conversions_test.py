@@ -0,0 +1,124 @@
+# conversions_test.py
+"""Test the conversion of day numbers to and from the dates of several calendars.
+
+1. Check that dates convert back to the day numbers they came from.
+
+2. Check the epochs and cycles of the calendar definitions.
+"""
+
+import numpy as np
+import pytest
+
+from calendars.calendars import CalendarDefinition, Tables
+from calendars.french_revolution_calendars import CalendarsFrenchRevolution
+from calendars.gregorian_calendars import CalendarsGregorian
+from calendars.hebraic_calendars import CalendarsHebraic
+from calendars.julian_calendars import CalendarsJulian
+from calendars.methods import Methods
+
+CALENDARS: list[CalendarDefinition] = [
+    CalendarsGregorian.GREGORIAN,
+    CalendarsJulian.JULIAN,
+    CalendarsFrenchRevolution.FRENCH_R,
+    CalendarsHebraic.HEBREW,
+]
+
+
+# 1. Check that dates convert back to the day numbers they came from.
+@pytest.mark.parametrize('calendar', CALENDARS, ids=lambda calendar: calendar.name)
+def test_round_trip(calendar: CalendarDefinition) -> None:
+    generator = np.random.default_rng(0)
+    start = max(Methods.epoch(calendar), 1000000)
+    day_numbers = np.concatenate(
+        [
+            np.arange(2451000, 2451000 + 3000, dtype=np.int64),
+            generator.integers(start, 3000000, 5000),
+        ]
+    )
+    dates = Methods.convert(day_numbers, calendar)[calendar.name]
+    assert (dates.years != 0).all()
+    assert ((dates.months >= 1) & (dates.months < len(calendar.months))).all()
+    assert (dates.days >= 1).all()
+    assert Methods.to_day_numbers(
+        dates.years, dates.months, dates.days, calendar
+    ).tolist() == day_numbers.tolist()
+
+
+@pytest.mark.parametrize(
+    'calendar',
+    [CalendarsGregorian.GREGORIAN, CalendarsJulian.JULIAN],
+    ids=lambda calendar: calendar.name,
+)
+def test_round_trip_before_epoch(calendar: CalendarDefinition) -> None:
+    day_numbers = np.arange(
+        Methods.epoch(calendar) - 2000, Methods.epoch(calendar) + 2000, dtype=np.int64
+    )
+    dates = Methods.from_day_numbers(day_numbers, calendar)
+    assert (dates.years != 0).all()
+    assert dates.years[0] == -6
+    assert Methods.to_day_numbers(
+        dates.years, dates.months, dates.days, calendar
+    ).tolist() == day_numbers.tolist()
+
+
+def test_gregorian_matches_iso() -> None:
+    iso = np.arange('1582-10-15', '2100-01-01', 37, dtype='datetime64[D]')
+    dates = Methods.convert(iso)['Gregorian']
+    expected = [value.split('-') for value in np.datetime_as_string(iso).tolist()]
+    assert [
+        [f'{year:04d}', f'{month:02d}', f'{day:02d}']
+        for year, month, day in zip(
+            dates.years.tolist(),
+            dates.months.tolist(),
+            dates.days.tolist(),
+            strict=True,
+        )
+    ] == expected
+
+
+def test_convert_several_calendars() -> None:
+    converted = Methods.convert(['2000-01-01'], *CALENDARS)
+    assert {
+        name: (int(dates.years[0]), int(dates.months[0]), int(dates.days[0]))
+        for name, dates in converted.items()
+    } == {
+        'Gregorian': (2000, 1, 1),
+        'Julian': (1999, 12, 19),
+        'French Revolution': (208, 4, 9),
+        'Hebrew': (5760, 4, 23),
+    }
+
+
+# 2. Check the epochs and cycles of the calendar definitions.
+def test_gregorian_cycle() -> None:
+    calendar = CalendarsGregorian.GREGORIAN
+    assert Tables.count(calendar.years.days_in_cycle) == 146097
+    assert calendar.tables().cycle_starts[-1] == 146097
+    first = Methods.from_day_numbers(np.array([2451545]), calendar)
+    later = Methods.from_day_numbers(np.array([2451545 + 146097]), calendar)
+    assert (later.years - first.years).tolist() == [400]
+    assert (later.months.tolist(), later.days.tolist()) == ([1], [1])
+
+
+def test_french_revolution_epoch() -> None:
+    calendar = CalendarsFrenchRevolution.FRENCH_R
+    assert Methods.epoch(calendar) == 2375840
+    assert [
+        Methods.date_item(iso, calendar)[1]
+        for iso in ['1792-09-22', '1795-09-22', '1795-09-23']
+    ] == ['0001-01-01', '0003-13-06', '0004-01-01']
+
+
+def test_hebrew_epoch() -> None:
+    calendar = CalendarsHebraic.HEBREW
+    assert Methods.epoch(calendar) == 347998
+    assert Methods.hebrew_new_years(np.array([1]), calendar).tolist() == [347998]
+    assert Methods.date_item('2024-10-03', calendar) == ['Hebrew', '5785-01-01']
+    assert Methods.date_item('2025-09-23', calendar) == ['Hebrew', '5786-01-01']
+
+
+def test_no_rule() -> None:
+    with pytest.raises(ValueError, match='no conversion rules'):
+        Methods.from_day_numbers(
+            np.array([2451545]), CalendarsGregorian.GREGORIAN_EMPTY
+        )
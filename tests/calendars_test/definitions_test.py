@@ -0,0 +1,147 @@
+# definitions_test.py
+"""Test the methods of calendar definitions.
+
+1. Check the days in the months of each year against converted dates.
+
+2. Check the validation of single dates.
+
+3. Check the validation of arrays of dates against single dates.
+"""
+
+import numpy as np
+import pytest
+
+from calendars.calendars import CalendarDefinition, CalendarError, Tables
+from calendars.french_revolution_calendars import CalendarsFrenchRevolution
+from calendars.gregorian_calendars import CalendarsGregorian
+from calendars.hebraic_calendars import CalendarsHebraic
+from calendars.julian_calendars import CalendarsJulian
+from calendars.methods import Methods
+
+CALENDARS: list[CalendarDefinition] = [
+    CalendarsGregorian.GREGORIAN,
+    CalendarsJulian.JULIAN,
+    CalendarsFrenchRevolution.FRENCH_R,
+    CalendarsHebraic.HEBREW,
+]
+
+
+def last_days(calendar: CalendarDefinition) -> dict[tuple[int, int], int]:
+    """Return the last day of each month of the converted days of 40 years."""
+    dates = Methods.convert(
+        np.arange(2440588, 2440588 + 40 * 366, dtype=np.int64), calendar
+    )[calendar.name]
+    found: dict[tuple[int, int], int] = {}
+    for year, month, day in zip(
+        dates.years.tolist(), dates.months.tolist(), dates.days.tolist(), strict=True
+    ):
+        found[(year, month)] = max(found.get((year, month), 0), day)
+    return found
+
+
+# 1. Check the days in the months of each year against converted dates.
+@pytest.mark.parametrize('calendar', CALENDARS, ids=lambda calendar: calendar.name)
+def test_days_in_month_matches_conversion(calendar: CalendarDefinition) -> None:
+    found = last_days(calendar)
+    years = sorted({year for year, _ in found})[1:-1]
+    for year in years:
+        for month in range(1, len(calendar.months)):
+            assert calendar.days_in_month(month, year) == found.get((year, month), 0)
+
+
+def test_hebrew_year_lengths() -> None:
+    calendar = CalendarsHebraic.HEBREW
+    years = np.arange(5700, 5800, dtype=np.int64)
+    lengths = Methods.hebrew_new_years(years + 1, calendar) - Methods.hebrew_new_years(
+        years, calendar
+    )
+    assert set(lengths.tolist()) == {353, 354, 355, 383, 384, 385}
+    assert (
+        Methods.hebrew_month_days(years, calendar).sum(axis=1) == lengths
+    ).all()
+
+
+def test_hebrew_validate() -> None:
+    calendar = CalendarsHebraic.HEBREW
+    assert calendar.validate(5785, 2, 30)
+    assert calendar.validate(5784, 6, 30)
+    assert calendar.validate(5784, 3, 29)
+    with pytest.raises(ValueError, match='greater than the number of days'):
+        calendar.validate(5785, 6, 1)
+    with pytest.raises(ValueError, match='greater than the number of days'):
+        calendar.validate(5784, 3, 30)
+
+
+# 2. Check the validation of single dates.
+def test_gregorian_validate() -> None:
+    calendar = CalendarsGregorian.GREGORIAN
+    assert calendar.validate(2000, 2, 29)
+    assert calendar.validate(-1, 2, 29)
+    with pytest.raises(ValueError, match='greater than the number of days'):
+        calendar.validate(1900, 2, 29)
+    with pytest.raises(ValueError, match='no 0 year'):
+        calendar.validate(0, 1, 1)
+    with pytest.raises(ValueError, match='greater than the number of months'):
+        calendar.validate(2000, 13, 1)
+    with pytest.raises(ValueError, match='less than 1'):
+        calendar.validate(2000, 0, 1)
+    with pytest.raises(ValueError, match='less than 1'):
+        calendar.validate(2000, 1, 0)
+
+
+def test_tables() -> None:
+    calendar = CalendarsJulian.JULIAN
+    assert Tables.count(calendar.years.days_in_cycle) == 1461
+    assert calendar.tables().cycle_starts.tolist() == [0, 365, 730, 1095, 1461]
+    assert calendar.tables().month_starts[:, 2].tolist() == [59, 60]
+    assert Tables.rules[calendar.name].month == 2
+    with pytest.raises(ValueError, match='no conversion rules'):
+        Methods.to_day_numbers([1], [1], [1], CalendarsGregorian.GREGORIAN_EMPTY)
+
+
+# 3. Check the validation of arrays of dates against single dates.
+@pytest.mark.parametrize('calendar', CALENDARS, ids=lambda calendar: calendar.name)
+def test_validate_many_matches_validate(calendar: CalendarDefinition) -> None:
+    generator = np.random.default_rng(len(calendar.name))
+    base = 5780 if calendar.name == 'Hebrew' else 0
+    years = generator.integers(base - 5, base + 10, 3000)
+    months = generator.integers(-1, len(calendar.months) + 1, 3000)
+    days = generator.integers(-1, 33, 3000)
+    expected: list[bool] = []
+    for year, month, day in zip(
+        years.tolist(), months.tolist(), days.tolist(), strict=True
+    ):
+        try:
+            expected.append(calendar.validate(year, month, day))
+        except ValueError:
+            expected.append(False)
+    valid, _ = calendar.validate_many(years, months, days)
+    assert valid.tolist() == expected
+
+
+def test_validate_many_hebrew_years() -> None:
+    calendar = CalendarsHebraic.HEBREW
+    years = list(range(5780, 5790))
+    starts = Methods.hebrew_new_years(np.array(years + [5790]), calendar)
+    lengths = np.diff(starts).tolist()
+    cheshvan, _ = calendar.validate_many(years, [2] * 10, [30] * 10)
+    kislev, _ = calendar.validate_many(years, [3] * 10, [30] * 10)
+    adar, _ = calendar.validate_many(years, [6] * 10, [1] * 10)
+    assert cheshvan.tolist() == [length % 10 == 5 for length in lengths]
+    assert kislev.tolist() == [length % 10 != 3 for length in lengths]
+    assert adar.tolist() == [length > 380 for length in lengths]
+    assert cheshvan[years.index(5785)]
+
+
+def test_validate_many_codes() -> None:
+    valid, codes = CalendarsGregorian.GREGORIAN.validate_many(
+        [2000, 2000, 2000, 0, 1900], [0, 1, 13, 1, 2], [1, 0, 1, 1, 29]
+    )
+    assert not valid.any()
+    assert codes.tolist() == [
+        CalendarError.MONTH,
+        CalendarError.DAY,
+        CalendarError.MONTH,
+        CalendarError.ZERO,
+        CalendarError.DAY,
+    ]
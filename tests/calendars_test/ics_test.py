@@ -0,0 +1,87 @@
+# ics_test.py
+"""Test the ICS export of calendar days.
+
+1. Check the events written across several blocks of days.
+
+2. Check the event ids with and without a namespace.
+"""
+
+import io
+import uuid
+
+import numpy as np
+
+from calendars.calendars import Constants
+from calendars.french_revolution_calendars import CalendarsFrenchRevolution
+from calendars.hebraic_calendars import CalendarsHebraic
+from calendars.methods import Methods
+
+
+def fields(text: str, name: str) -> list[str]:
+    """Return the values of the lines of an ICS text starting with a field name."""
+    return [
+        line[len(name) :] for line in text.splitlines() if line.startswith(name)
+    ]
+
+
+# 1. Check the events written across several blocks of days.
+def test_stream_blocks() -> None:
+    calendar = CalendarsHebraic.HEBREW
+    file = io.StringIO()
+    days = Constants.ICS_BLOCK * 2 + 10
+    end = str(np.datetime64('2000-01-01') + days - 1)
+    assert calendar.ics_stream('2000-01-01', end, file) == days
+    text = file.getvalue()
+    assert text.startswith(Constants.ICS_BEGIN_CALENDAR)
+    assert text.endswith(Constants.ICS_END_CALENDAR)
+    assert text.count(Constants.ICS_BEGIN_DAY) == days
+    starts = fields(text, Constants.ICS_DAY_START)
+    ends = fields(text, Constants.ICS_DAY_END)
+    expected = [
+        stamp.replace('-', '')
+        for stamp in np.datetime_as_string(
+            np.datetime64('2000-01-01') + np.arange(days + 1)
+        ).tolist()
+    ]
+    assert starts == expected[:-1]
+    assert ends == expected[1:]
+    dates = Methods.convert([np.datetime64(end)], calendar)[calendar.name]
+    assert fields(text, Constants.ICS_SUMMARY)[-1] == (
+        f'{dates.days[0]} {calendar.months[dates.months[0]].name} {dates.years[0]}'
+    )
+
+
+def test_named_days() -> None:
+    calendar = CalendarsFrenchRevolution.FRENCH_R
+    text = calendar.ics('1792-09-22', '1792-09-24')
+    assert fields(text, Constants.ICS_SUMMARY) == [
+        '1 Vendémiaire 1:Raisin',
+        '2 Vendémiaire 1:Safran',
+        '3 Vendémiaire 1:Châtaigne',
+    ]
+
+
+def test_empty_range() -> None:
+    file = io.StringIO()
+    assert CalendarsHebraic.HEBREW.ics_stream('2000-01-02', '2000-01-01', file) == 0
+    assert file.getvalue() == ''.join(
+        [Constants.ICS_BEGIN_CALENDAR, Constants.ICS_END_CALENDAR]
+    )
+
+
+# 2. Check the event ids with and without a namespace.
+def test_namespace_ids_repeat() -> None:
+    calendar = CalendarsFrenchRevolution.FRENCH_R
+    first = calendar.ics('1800-01-01', '1800-03-01', uuid.NAMESPACE_URL)
+    second = calendar.ics('1800-01-01', '1800-03-01', uuid.NAMESPACE_URL)
+    assert first == second
+    assert fields(first, Constants.ICS_UID)[0] == str(
+        uuid.uuid5(uuid.NAMESPACE_URL, f'{calendar.name}:2378497')
+    )
+
+
+def test_random_ids_differ() -> None:
+    calendar = CalendarsFrenchRevolution.FRENCH_R
+    first = fields(calendar.ics('1800-01-01', '1800-03-01'), Constants.ICS_UID)
+    second = fields(calendar.ics('1800-01-01', '1800-03-01'), Constants.ICS_UID)
+    assert len(set(first + second)) == len(first) * 2
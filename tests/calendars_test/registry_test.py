@@ -0,0 +1,77 @@
+# registry_test.py
+"""Test the registry of calendar definitions.
+
+1. Check the lookup and lazy import of registered calendars.
+
+2. Check the cached conversions of day numbers.
+"""
+
+import sys
+
+import numpy as np
+import pytest
+
+from calendars.gregorian_calendars import CalendarsGregorian
+from calendars.methods import Methods
+from calendars.registry import CalendarLocation, Registry
+
+
+# 1. Check the lookup and lazy import of registered calendars.
+def test_get() -> None:
+    Registry.clear()
+    assert Registry.names() == ['FRENCH_R', 'GREGORIAN', 'HEBREW', 'JULIAN']
+    assert Registry.get('GREGORIAN') is CalendarsGregorian.GREGORIAN
+    assert Registry.get('JULIAN').name == 'Julian'
+    assert set(Registry.loaded) == {'GREGORIAN', 'JULIAN'}
+
+
+def test_lazy_import(monkeypatch: pytest.MonkeyPatch) -> None:
+    Registry.clear()
+    monkeypatch.delitem(sys.modules, 'calendars.hebraic_calendars', raising=False)
+    assert Registry.get('HEBREW').name == 'Hebrew'
+    assert 'calendars.hebraic_calendars' in sys.modules
+    Registry.clear()
+
+
+def test_unknown() -> None:
+    with pytest.raises(ValueError, match='not one of the registered calendars'):
+        Registry.get('MAYAN')
+
+
+def test_register() -> None:
+    Registry.clear()
+    location = CalendarLocation(
+        'calendars.gregorian_calendars', 'CalendarsGregorian', 'GREGORIAN_EMPTY'
+    )
+    try:
+        Registry.register('GREGORIAN_EMPTY', location)
+        assert Registry.get('GREGORIAN_EMPTY') is CalendarsGregorian.GREGORIAN_EMPTY
+    finally:
+        Registry.locations.pop('GREGORIAN_EMPTY')
+        Registry.clear()
+    assert 'GREGORIAN_EMPTY' not in Registry.names()
+
+
+# 2. Check the cached conversions of day numbers.
+@pytest.mark.parametrize('name', ['FRENCH_R', 'GREGORIAN', 'HEBREW', 'JULIAN'])
+def test_date_matches_convert(name: str) -> None:
+    Registry.clear()
+    day_numbers = np.arange(2451545, 2451545 + 400, dtype=np.int64)
+    dates = Methods.from_day_numbers(day_numbers, Registry.get(name))
+    assert [Registry.date(day, name) for day in day_numbers.tolist()] == list(
+        zip(
+            dates.years.tolist(),
+            dates.months.tolist(),
+            dates.days.tolist(),
+            strict=True,
+        )
+    )
+
+
+def test_date_cache() -> None:
+    Registry.clear()
+    Registry.date(2460587, 'HEBREW')
+    assert Registry.date(2460587, 'HEBREW') == (5785, 1, 1)
+    assert Registry.date.cache_info().hits == 1
+    Registry.clear()
+    assert Registry.date.cache_info().currsize == 0
@@ -0,0 +1,100 @@
+# readwrite_test.py
+"""Test the date conversions of chronologies.
+
+1. Check the array conversions of labelled dates to astronomical years.
+
+2. Check the change of the calendar of a chronology.
+"""
+
+import numpy as np
+import pandas as pd  # type: ignore[import-untyped]
+import pytest
+
+from chronodata.readwrite import Base, Calendar, Key
+
+
+# 1. Check the array conversions of labelled dates to astronomical years.
+def test_to_datetime64_array() -> None:
+    dates = Base().to_datetime64_array(
+        ['2024 AD', '0005-03-01 BC', '1 BCE', '1066', ' 44 bc ', '0010-06 CE', '1 BP']
+    )
+    assert np.datetime_as_string(dates).tolist() == [
+        '2024-01-01',
+        '-004-03-01',
+        '0000-01-01',
+        '1066-01-01',
+        '-043-01-01',
+        '0010-06-01',
+        '0000-01-01',
+    ]
+
+
+def test_to_datetime64_array_keeps_leap_day_and_time() -> None:
+    dates = Base().to_datetime64_array(
+        pd.Series(['0005-02-29 BC', '0001-12-31T18:30 BC'])
+    )
+    assert np.datetime_as_string(dates).tolist() == [
+        '-004-02-29T00:00',
+        '0000-12-31T18:30',
+    ]
+
+
+def test_to_datetime64_array_empty() -> None:
+    assert Base().to_datetime64_array([]).dtype == np.dtype('datetime64[D]')
+
+
+def test_to_datetime64_array_unknown_labels() -> None:
+    with pytest.raises(ValueError, match='unrecognized labels  AH,  BCX'):
+        Base().to_datetime64_array(['1 BCX', '1400 AH', '1 BC', '1400 AH'])
+
+
+def test_numericdate_array() -> None:
+    dates = ['0004-03-01 BC', '0001-12-31 BC', '2000-02-29 AD']
+    assert (
+        Base().numericdate_array(pd.Series(dates))
+        == Base().to_datetime64_array(dates)
+    ).all()
+
+
+def test_daysinyear_array() -> None:
+    assert Base().daysinyear_array(
+        ['1900 AD', '2000 AD', '1 BC', '4 BC', '5 BC', '101 BC']
+    ).tolist() == [365, 366, 366, 365, 366, 365]
+    assert Base().daysinyear_array(
+        np.array(['2024-05-01', '-100-01-01'], dtype='datetime64[D]')
+    ).tolist() == [366, 365]
+
+
+# 2. Check the change of the calendar of a chronology.
+def test_to_relabels_dates() -> None:
+    chron = Base()
+    chron.chron[Key.PERIODS] = {
+        'Bronze Age': {Key.BEGIN: 'about 3300 BC', Key.END: '1200 BC'},
+        'Reign': {Key.BEGIN: '0044-03-15 BC', Key.END: 'unknown'},
+    }
+    chron.chron[Key.EVENTS] = {
+        'Flood': {Key.DATE: '2348 BC'},
+        'Coronation': {Key.DATE: '0800-12-25 AD'},
+        'Undated': {},
+    }
+    chron.to(Calendar.SECULAR)
+    assert chron.chron[Key.PERIODS] == {
+        'Bronze Age': {Key.BEGIN: 'about 3300 BCE', Key.END: '1200 BCE'},
+        'Reign': {Key.BEGIN: '0044-03-15 BCE', Key.END: 'unknown'},
+    }
+    assert chron.chron[Key.EVENTS] == {
+        'Flood': {Key.DATE: '2348 BCE'},
+        'Coronation': {Key.DATE: '0800-12-25 CE'},
+        'Undated': {},
+    }
+    assert chron.chron[Key.CAL] == Calendar.SECULAR
+    assert chron.chron[Key.CAL] is not Calendar.SECULAR
+    chron.to(Calendar.GREGORIAN)
+    assert chron.chron[Key.PERIODS]['Bronze Age'][Key.BEGIN] == 'about 3300 BC'
+    assert chron.chron[Key.EVENTS]['Coronation'][Key.DATE] == '0800-12-25 AD'
+
+
+def test_to_without_dates() -> None:
+    chron = Base()
+    chron.to(Calendar.SECULAR)
+    assert chron.chron[Key.CAL] == Calendar.SECULAR
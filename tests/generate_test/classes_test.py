@@ -1,6 +1,9 @@
 # classes_test.py
 """Test the functionality of the Classes class in the load module."""
 
+from copy import deepcopy
+from typing import Any
+
 from genedata.constants import Default
 from genedata.examples70 import Examples
 from genedata.generate import Classes
@@ -142,3 +145,34 @@ def test_all_listing_with_empty_dictionary() -> None:
     all_list: str = Default.EMPTY
     all_list = Classes.all_listing({})
     assert len(all_list) == 0
+
+
+def test_all_classes_regenerates_changed_key() -> None:
+    """Regenerate only the class whose specification changed."""
+    Classes.clear_cache()
+    specs: dict[str, dict[str, Any]] = deepcopy(Specs)
+    first: str = Classes.all_classes(specs, Examples)
+    unchanged: str = Classes.class_cache['LATI'][1]
+    specs[Default.YAML_TYPE_STRUCTURE]['MAP'][Default.YAML_SPECIFICATION] = [
+        'A changed specification.'
+    ]
+    second: str = Classes.all_classes(specs, Examples)
+    assert first != second
+    assert 'A changed specification.' in Classes.class_cache['MAP'][1]
+    assert Classes.class_cache['LATI'][1] is unchanged
+
+
+def test_all_classes_process_pool() -> None:
+    """Generate the classes in a process pool."""
+    Classes.clear_cache()
+    serial: str = Classes.all_classes(Specs, Examples)
+    Classes.clear_cache()
+    pooled: str = Classes.all_classes(Specs, Examples, processes=True)
+    assert serial == pooled
+
+
+def test_validate_record_checks_xref() -> None:
+    """A record checks its value as a cross reference identifier rather than its payload."""
+    validate: str = Classes.validate('record-SNOTE', Specs)
+    assert 'SharedNoteXref' in validate
+    assert 'Validate.string' not in validate
@@ -1,5 +1,7 @@
 """Test the functionality of the LoadSpecs class in the load module."""
 
+import os
+from pathlib import Path
 from typing import Any
 
 import pytest
@@ -116,3 +118,45 @@ def test_empty_uri() -> None:
         all_list: dict[str, dict[str, Any]] = eval(  # noqa: F841
             LoadSpecs.uri_dictionary(empty_directory)
         )
+
+
+def test_cached_calendar_retrieval() -> None:
+    """Retrieve the calendar dictionary a second time from the cache."""
+    LoadSpecs.clear_cache()
+    cold: str = LoadSpecs.calendar_dictionary(directory)
+    warm: str = LoadSpecs.calendar_dictionary(directory)
+    assert cold == warm
+
+
+def test_process_pool_retrieval() -> None:
+    """Retrieve the calendar dictionary using a process pool."""
+    LoadSpecs.clear_cache()
+    threads: str = LoadSpecs.calendar_dictionary(directory)
+    LoadSpecs.clear_cache()
+    processes: str = LoadSpecs.dictionary(
+        directory, Default.URL_CALENDAR, processes=True
+    )
+    assert threads == processes
+
+
+def test_changed_file_is_parsed_again(tmp_path: Any) -> None:
+    """Parse a yaml file again after it has been modified."""
+    LoadSpecs.clear_cache()
+    source: Path = Path(f'{directory}{Default.URL_CALENDAR}cal-GREGORIAN.yaml')
+    target: Path = tmp_path / 'cal-GREGORIAN.yaml'
+    target.write_text(source.read_text(encoding='utf-8'), encoding='utf-8')
+    first: dict[str, Any] = LoadSpecs.read_yaml_files([target])[0]
+    target.write_text(
+        source.read_text(encoding='utf-8').replace('Gregorian', 'Changed'),
+        encoding='utf-8',
+    )
+    os.utime(target, ns=(0, 0))
+    second: dict[str, Any] = LoadSpecs.read_yaml_files([target])[0]
+    assert first is not second
+
+
+def test_timing() -> None:
+    """Time a cold and a warm build of the specifications."""
+    timing = LoadSpecs.timing('GED', '7.0', directory)
+    assert timing.cold >= 0
+    assert timing.warm >= 0
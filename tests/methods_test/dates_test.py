@@ -0,0 +1,133 @@
+# dates_test.py
+"""Test the conversion of dates to intervals of Julian day numbers.
+
+1. Check Dates.jdn() against known dates in each calendar.
+
+2. Check Dates.interval() for each preface.
+
+3. Check the interval cached on date structures.
+"""
+
+import pytest
+
+import genedata.classes70 as gc
+from genedata.methods import DateInterval, Dates
+
+
+# 1. Check Dates.jdn() against known dates in each calendar.
+@pytest.mark.parametrize(
+    'date,gregorian',
+    [
+        ((1700, 2, 5, 'JULIAN'), (1700, 2, 15)),
+        ((1582, 10, 4, 'JULIAN'), (1582, 10, 14)),
+        ((1, 1, 1, 'FRENCH_R'), (1792, 9, 22)),
+        ((12, 1, 1, 'FRENCH_R'), (1803, 9, 24)),
+        ((5784, 1, 1, 'HEBREW'), (2023, 9, 16)),
+        ((5784, 7, 14, 'HEBREW'), (2024, 3, 24)),
+        ((5785, 8, 15, 'HEBREW'), (2025, 4, 13)),
+    ],
+)
+def test_jdn(
+    date: tuple[int, int, int, str], gregorian: tuple[int, int, int]
+) -> None:
+    assert Dates.jdn(*date) == Dates.jdn(*gregorian)
+
+
+def test_hebrew_adar_in_common_year() -> None:
+    assert Dates.jdn(5785, 6, 1, 'HEBREW') == Dates.jdn(5785, 7, 1, 'HEBREW')
+
+
+# 2. Check Dates.interval() for each preface.
+@pytest.mark.parametrize(
+    'value,expected',
+    [
+        ('', None),
+        ('1 JAN 2000', DateInterval(2451545, 2451545, '', 'GREGORIAN')),
+        ('2000 BCE', DateInterval(990941, 991305, '', 'GREGORIAN')),
+        ('EST FEB 2024', DateInterval(2460342, 2460370, 'EST', 'GREGORIAN')),
+        ('AFT 1899', DateInterval(2415021, None, 'AFT', 'GREGORIAN')),
+        ('TO 1900', DateInterval(None, 2415385, 'TO', 'GREGORIAN')),
+        ('FROM 1900', DateInterval(2415021, None, 'FROM', 'GREGORIAN')),
+        (
+            'FROM 1900 TO 1910',
+            DateInterval(2415021, 2419037, 'FROM', 'GREGORIAN'),
+        ),
+        (
+            'BET JULIAN 1 JAN 1700 AND 1 JAN 1701',
+            DateInterval(2341983, 2342338, 'BET', 'JULIAN'),
+        ),
+        ('HEBREW 1 ADR 5785', DateInterval(2460736, 2460736, '', 'HEBREW')),
+        ('_CAL 1900', None),
+    ],
+)
+def test_interval(value: str, expected: DateInterval | None) -> None:
+    assert Dates.interval(value) == expected
+
+
+@pytest.mark.parametrize(
+    'value',
+    [
+        '31 FEB 1900',
+        '29 FEB 1900',
+        '0 JAN 1900',
+        'ABT 31 APR 1900',
+        '0',
+        '0 BCE',
+        'HEBREW 40 TSH 5784',
+        'HEBREW 30 KSL 5784',
+        'FRENCH_R 1 VEND 5 BCE',
+        'FRENCH_R 6 COMP 4',
+        'BET 1900 AND 1800',
+        'FROM 1900 TO 1800',
+        'FROM 2 JAN 1900 TO 1 JAN 1900',
+    ],
+)
+def test_invalid_interval(value: str) -> None:
+    assert Dates.interval(value) is None
+
+
+@pytest.mark.parametrize(
+    'value',
+    [
+        '29 FEB 2000',
+        'JULIAN 29 FEB 1700',
+        'FRENCH_R 6 COMP 3',
+        'HEBREW 30 KSL 5785',
+        'BET 1 JAN 1900 AND 1 JAN 1900',
+    ],
+)
+def test_edge_interval(value: str) -> None:
+    interval = Dates.interval(value)
+    assert interval is not None
+    assert interval.earliest <= interval.latest  # type: ignore[operator]
+
+
+# 3. Check the interval cached on date structures.
+def test_structure_interval_cached() -> None:
+    date = gc.Date('ABT 1900')
+    first = date.interval()
+    assert first is not None
+    assert date.interval() is first
+    date.value = 'ABT 1901'
+    assert date.interval() == DateInterval(
+        2415386, 2415750, 'ABT', 'GREGORIAN'
+    )
+
+
+def test_structure_interval_not_date() -> None:
+    assert gc.Note('1900').interval() is None
+
+
+@pytest.mark.parametrize(
+    'structure',
+    [
+        gc.Date('1 JAN 2000'),
+        gc.DateExact('1 JAN 2000'),
+        gc.DataEvenDate('FROM 1 JAN 2000 TO 1 JAN 2000'),
+        gc.HeadDate('1 JAN 2000'),
+    ],
+)
+def test_date_structures(structure: gc.BaseStructure) -> None:
+    interval = structure.interval()
+    assert interval is not None
+    assert (interval.earliest, interval.latest) == (2451545, 2451545)
@@ -2,12 +2,14 @@
 """Tests to cover the Validate class."""
 
 import re
+from copy import deepcopy
 
+import numpy as np
 import pytest
 
 import genedata.classes70 as gc
 from genedata.build import Genealogy
-from genedata.constants import Default
+from genedata.constants import DateError, Default
 from genedata.messages import Msg
 from genedata.methods import Validate
 from genedata.specifications70 import Specs
@@ -448,6 +450,131 @@ def test_bad_date_month_day_leapyear_julian_zero() -> None:
         Validate.date_general('JULIAN 0 FEB 2000', 'Date', Specs)
 
 
+def test_date_general_memoized() -> None:
+    Validate.date_matches.cache_clear()
+    assert Validate.date_general('JULIAN 1 MAR 1700', 'Date', Specs)
+    assert Validate.date_general('JULIAN 1 MAR 1700', 'Date', Specs)
+    info = Validate.date_matches.cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+
+
+def test_date_general_invalid_not_memoized() -> None:
+    Validate.date_matches.cache_clear()
+    for _ in range(2):
+        with pytest.raises(
+            ValueError,
+            match=Msg.NOT_DATE_ZERO_YEAR.format('JULIAN 0', 'Date'),
+        ):
+            Validate.date_general('JULIAN 0', 'Date', Specs)
+
+
+def test_date_grammar_extension_calendar() -> None:
+    specs = deepcopy(Specs)
+    specs[Default.YAML_TYPE_CALENDAR]['cal-_TEST'] = {
+        Default.YAML_URI: 'https://example.com/cal-_TEST',
+        Default.YAML_EXTENSION_TAGS: ['_TEST'],
+        Default.YAML_MONTHS: [],
+        Default.YAML_EPOCHS: [],
+    }
+    grammar = Validate.date_grammar(specs)
+    assert grammar is not Validate.date_grammar(Specs)
+    assert '_TEST' in grammar.calendars
+    assert Validate.date_general('_TEST 2000', 'Date', specs)
+
+
+# dates_bulk tests
+@pytest.mark.parametrize(
+    'kind,values',
+    [
+        (
+            'exact',
+            [
+                '1 JAN 2000',
+                '29 FEB 1900',
+                '29 FEB 2000',
+                '1 jan 2000',
+                '1 XYZ 2000',
+                '1 JAN -5',
+                '29 FEB -4',
+                '+1 JAN 2000',
+                '1 JAN -0',
+                '-5',
+            ],
+        ),
+        (
+            'general',
+            [
+                'ABT 12 MAR 1850',
+                'BET 1800 AND 1810',
+                'JULIAN 29 FEB 1700',
+                'GREGORIAN 0',
+                'FRENCH_R 1 VEND 12',
+                'HEBREW TSH 5785',
+                'XYZ 1 JAN 2000',
+                '2000 BCE',
+                'FROM 1900 TO 31 APR 1901',
+                '',
+                '-5',
+                '1 JAN -5',
+                'GREGORIAN 1 JAN -5',
+                'ABT -5',
+                'BET -5 AND +5',
+                '-0',
+                '--5',
+                '-1 JAN 2000',
+            ],
+        ),
+        (
+            'period',
+            ['FROM 1900 TO 1910', 'TO 1900', 'ABT 1900', 'FROM 0', '', 'FROM -5 TO 5'],
+        ),
+    ],
+)
+def test_dates_bulk_matches_single(kind: str, values: list[str]) -> None:
+    single = {
+        'exact': lambda value: Validate.date_exact(value, 'Date'),
+        'general': lambda value: Validate.date(value, 'Date', Specs),
+        'period': lambda value: Validate.date_period(value, 'Date', Specs),
+    }[kind]
+    expected: list[bool] = []
+    for value in values:
+        try:
+            expected.append(single(value))
+        except ValueError:
+            expected.append(False)
+    mask, _ = Validate.dates_bulk(values, kind=kind)
+    assert mask.tolist() == expected
+
+
+def test_dates_bulk_codes() -> None:
+    mask, codes = Validate.dates_bulk(
+        ['1 JAN 2000', '1 JAN', '1 XYZ 2000', '31 APR 2000', '1 JAN 0', 5]
+    )
+    assert mask.tolist() == [True, False, False, False, False, False]
+    assert codes.tolist() == [
+        DateError.NONE,
+        DateError.SPACES,
+        DateError.MONTH,
+        DateError.DAY,
+        DateError.ZERO_YEAR,
+        DateError.NOT_STRING,
+    ]
+
+
+def test_dates_bulk_shape() -> None:
+    mask, codes = Validate.dates_bulk(
+        np.array([['1900', 'ABT 1900'], ['', 'JAN 0']]), kind='general'
+    )
+    assert mask.shape == (2, 2)
+    assert codes[1, 1] == DateError.ZERO_YEAR
+
+
+def test_dates_bulk_bad_kind() -> None:
+    with pytest.raises(ValueError, match=Msg.NOT_DATE_KIND.format('age')):
+        Validate.dates_bulk(['1900'], kind='age')
+
+
 # date_period tests
 def test_date_period_from_to() -> None:
     assert Validate.date_period('FROM 1 JAN 2000 TO 1 JAN 2001', 'Date', Specs)
@@ -805,3 +932,33 @@ def test_bad_y_or_null_3() -> None:
         ValueError, match=Msg.NOT_STRING.format(repr(1), 'Name')
     ):
         Validate.y_or_null(1, 'Name')
+
+
+def test_date_grammar_changed_calendar_contents() -> None:
+    assert Validate.date_general('100 BCE', 'Date', Specs)
+    specs = deepcopy(Specs)
+    specs[Default.YAML_TYPE_CALENDAR]['cal-GREGORIAN'][Default.YAML_EPOCHS] = []
+    grammar = Validate.date_grammar(specs)
+    Validate.date_specs_changed()
+    assert Validate.date_grammar(specs) is not grammar
+    assert Validate.date_grammar(specs) is not Validate.date_grammar(Specs)
+    with pytest.raises(ValueError):  # noqa: PT011
+        Validate.date_general('100 BCE', 'Date', specs)
+
+
+def test_date_grammar_documented_calendar() -> None:
+    g = Genealogy()
+    grammar = Validate.date_grammar(g.specification)
+    assert Validate.date_grammar(g.specification) is grammar
+    g.document_tag('_MYCAL', 'tests/data/good_calendar.yaml')
+    assert Validate.date_grammar(g.specification) is not grammar
+
+
+def test_date_grammar_limit() -> None:
+    grammars = [
+        Validate.date_grammar(deepcopy(Specs))
+        for _ in range(Default.DATE_GRAMMAR_LIMIT + 2)
+    ]
+    assert len(Validate.date_grammars) <= Default.DATE_GRAMMAR_LIMIT
+    assert grammars[0].number not in Validate.date_grammars
+    assert Validate.date_grammars[grammars[-1].number] is grammars[-1]
@@ -1,13 +1,15 @@
 # basicstructure_test.py
 """Tests to cover the BasicStructure class."""
 
+from typing import Any
 
 import pytest
 
 import genedata.classes70 as gc
 from genedata.build import Genealogy
 from genedata.messages import Msg
-from genedata.structure import Ext
+from genedata.methods import Payload
+from genedata.structure import Ext, ExtensionAttributes
 
 
 def test_y_null_data_type_validation_y() -> None:
@@ -140,3 +142,50 @@ def test_superstructure_check_sub_not_list() -> None:
         match=Msg.NOT_SUPERSTRUCTURE.format(m.class_name, '_DATE')
     ):
         m.validate()
+
+
+def test_registered_extension_payload() -> None:
+    def even(structure: Any, specs: dict[str, dict[str, Any]]) -> None:
+        if int(structure.value) % 2 != 0:
+            raise ValueError(f'"{structure.value}" is not even.')
+
+    payload: str = 'https://example.com/type-EvenNumber'
+    payload_id: int = Payload.register(payload, even, str.strip)
+    try:
+        attributes = ExtensionAttributes(
+            id=1,
+            key='_EVEN',
+            tag='_EVEN',
+            yaml_file='',
+            yaml_type='structure',
+            required=[],
+            single=[],
+            permitted=[],
+            enumset_key='',
+            enum_tags=[],
+            payload=payload,
+            supers=0,
+            superstructures=None,
+            supers_required=[],
+            supers_single=[],
+        )
+        m = Ext(attributes, ' 4 ', [])
+        assert m.payload_id == payload_id
+        assert m.value == '4'
+        assert m.validate()
+        with pytest.raises(ValueError, match='"3" is not even.'):
+            Ext(attributes, '3', []).validate()
+    finally:
+        Payload.unregister(payload)
+    assert payload not in Payload.ids
+    assert payload_id not in Payload.validators
+    assert payload_id not in Payload.cleaners
+
+
+def test_generated_payload_ids() -> None:
+    for name in gc.__all__:
+        cls = getattr(gc, name)
+        assert 'payload_id' in vars(cls)
+    m = gc.Date(' abt  1900 ')
+    assert m.payload_id == Payload.resolve(m.payload)
+    assert m.value == 'ABT 1900'